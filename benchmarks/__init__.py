@@ -0,0 +1,9 @@
+"""Offline benchmarks for gemini-tts-tool.
+
+Run with ``python -m benchmarks.run`` (or ``make bench``). Scenarios use a
+deterministic stand-in for ``genai.Client``, so they measure this tool's own
+overhead and concurrency without credentials, network or quota.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
@@ -0,0 +1,165 @@
+"""Deterministic stand-in for genai.Client.
+
+FakeClient answers generate_content, generate_content_stream and their
+client.aio counterparts with synthetic PCM whose duration follows the length
+of the request text. Latency and jitter are simulated with sleeps drawn from
+a seeded random generator, so runs are repeatable.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from gemini_tts_tool.core.estimate import CHARS_PER_SECOND
+from gemini_tts_tool.utils import SAMPLE_RATE, SAMPLE_WIDTH
+
+# Streamed responses carry this much audio each
+STREAM_CHUNK_SECONDS = 0.5
+
+
+@dataclass
+class _InlineData:
+    data: bytes
+    mime_type: str = "audio/L16;codec=pcm;rate=24000"
+
+
+@dataclass
+class _Part:
+    inline_data: _InlineData | None
+
+
+@dataclass
+class _Content:
+    parts: list[_Part]
+
+
+@dataclass
+class _Candidate:
+    content: _Content
+
+
+@dataclass
+class FakeResponse:
+    """The subset of GenerateContentResponse read by the synthesizer."""
+
+    candidates: list[_Candidate] = field(default_factory=list)
+
+    @classmethod
+    def with_audio(cls, data: bytes) -> FakeResponse:
+        """Create a response carrying one inline audio part."""
+        return cls([_Candidate(_Content([_Part(_InlineData(data))]))])
+
+
+class _Models:
+    def __init__(self, client: FakeClient) -> None:
+        self._client = client
+
+    def generate_content(self, **request: Any) -> FakeResponse:
+        audio_data = self._client.audio_for(request)
+        time.sleep(self._client.next_latency())
+        return FakeResponse.with_audio(audio_data)
+
+    def generate_content_stream(self, **request: Any) -> Iterator[FakeResponse]:
+        audio_data = self._client.audio_for(request)
+        latency = self._client.next_latency()
+        step = round(STREAM_CHUNK_SECONDS * SAMPLE_RATE) * SAMPLE_WIDTH
+        pieces = [audio_data[i : i + step] for i in range(0, len(audio_data), step)]
+        for piece in pieces:
+            # The simulated generation time is spread evenly over the chunks
+            time.sleep(latency / len(pieces))
+            yield FakeResponse.with_audio(piece)
+
+
+class _AsyncModels:
+    def __init__(self, client: FakeClient) -> None:
+        self._client = client
+
+    async def generate_content(self, **request: Any) -> FakeResponse:
+        audio_data = self._client.audio_for(request)
+        await asyncio.sleep(self._client.next_latency())
+        return FakeResponse.with_audio(audio_data)
+
+
+class _Aio:
+    def __init__(self, client: FakeClient) -> None:
+        self.models = _AsyncModels(client)
+
+
+class FakeClient:
+    """A genai.Client replacement returning synthetic speech.
+
+    Example:
+        >>> client = FakeClient(latency=0.8, jitter=0.2)
+        >>> audio = synthesize_speech(client, "Hello world")  # ~0.8s, 0.7s of audio
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+        chars_per_second: float = CHARS_PER_SECOND,
+    ) -> None:
+        """Initialize the fake backend.
+
+        Args:
+            latency: Mean simulated time per request, in seconds
+            jitter: Fraction of the latency added or removed at random (0 to 1)
+            seed: Seed of the latency generator
+            chars_per_second: Speaking rate that sets the audio duration
+        """
+        if latency < 0 or not 0 <= jitter <= 1:
+            raise ValueError("latency must be >= 0 and jitter between 0 and 1")
+        self.latency = latency
+        self.jitter = jitter
+        self.chars_per_second = chars_per_second
+        self.models = _Models(self)
+        self.aio = _Aio(self)
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def next_latency(self) -> float:
+        """Draw the simulated latency of one request."""
+        with self._lock:
+            self.requests += 1
+            if not self.latency:
+                return 0.0
+            spread = self._random.uniform(-self.jitter, self.jitter)
+        return self.latency * (1 + spread)
+
+    def audio_for(self, request: dict[str, Any]) -> bytes:
+        """Return synthetic PCM for a generate_content request.
+
+        Raises:
+            ValueError: If the request lacks the fields the API requires
+        """
+        if not request.get("model") or not request.get("contents") or "config" not in request:
+            raise ValueError("Request needs model, contents and config")
+        characters = sum(len(str(content)) for content in request["contents"])
+        return tone(characters / self.chars_per_second)
+
+
+def tone(seconds: float) -> bytes:
+    """Return a 440 Hz test tone in the Gemini TTS PCM format."""
+    frames = round(seconds * SAMPLE_RATE)
+    return (_TONE_PERIOD * (frames // _TONE_FRAMES + 1))[: frames * SAMPLE_WIDTH]
+
+
+# 440 Hz does not divide 24 kHz evenly; one 11-cycle period (600 frames) does
+_TONE_FRAMES = 600
+_TONE_PERIOD = struct.pack(
+    f"<{_TONE_FRAMES}h",
+    *(round(8000 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE)) for i in range(_TONE_FRAMES)),
+)
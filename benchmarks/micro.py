@@ -0,0 +1,116 @@
+"""Micro-benchmarks of per-request preparation costs.
+
+Each comparison times the work done for every API request the way it was
+done before the request-config cache and constant-time lookups, and the
+way it is done now. No client is involved.
+
+Usage:
+    python -m benchmarks.micro              # 10,000 calls per measurement
+    python -m benchmarks.micro -n 100000
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import click
+
+from gemini_tts_tool.core.synthesizer import multi_voice_config, speech_config
+from gemini_tts_tool.core.voices import MODELS, VOICES, validate_model, validate_voice
+
+# The last voice in the catalog is the worst case for a list scan
+VOICE = VOICES[-1]
+MODEL = MODELS["pro"]
+SPEAKERS = (("Host", "Kore"), ("Guest", "Puck"))
+
+
+def _scan_voice() -> str:
+    if VOICE not in VOICES:
+        raise ValueError(VOICE)
+    return VOICE
+
+
+def _scan_model() -> str:
+    if MODEL in MODELS:
+        return MODELS[MODEL]
+    if MODEL in MODELS.values():
+        return MODEL
+    raise ValueError(MODEL)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """The same per-request step done the old way (before) and the new way (after)."""
+
+    name: str
+    before: Callable[[], Any]
+    after: Callable[[], Any]
+
+
+COMPARISONS = (
+    Comparison("voice lookup", _scan_voice, lambda: validate_voice(VOICE)),
+    Comparison("model lookup", _scan_model, lambda: validate_model(MODEL)),
+    Comparison(
+        "speech config",
+        lambda: speech_config.__wrapped__(VOICE),
+        lambda: speech_config(VOICE),
+    ),
+    Comparison(
+        "multi-voice config",
+        lambda: multi_voice_config.__wrapped__(SPEAKERS),
+        lambda: multi_voice_config(SPEAKERS),
+    ),
+)
+
+
+# Steps taken by every single-voice request
+SINGLE_VOICE_STEPS = ("voice lookup", "model lookup", "speech config")
+
+
+@dataclass(frozen=True)
+class Timing:
+    """Microseconds per call of a comparison."""
+
+    name: str
+    before_us: float
+    after_us: float
+
+    @property
+    def saved_us(self) -> float:
+        """Microseconds saved per call."""
+        return self.before_us - self.after_us
+
+
+def measure(comparison: Comparison, number: int) -> Timing:
+    """Time both sides of a comparison, best of three runs of number calls each."""
+    comparison.after()  # Fill the cache so only steady-state calls are timed
+
+    def per_call(fn: Callable[[], Any]) -> float:
+        return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+    return Timing(comparison.name, per_call(comparison.before), per_call(comparison.after))
+
+
+@click.command()
+@click.option("--number", "-n", type=click.IntRange(min=1), default=10_000, show_default=True)
+def main(number: int) -> None:
+    """Compare per-request preparation before and after config caching."""
+    click.echo(f"{'step':<20} {'before':>11} {'after':>11} {'saved':>11}")
+    timings = [measure(comparison, number) for comparison in COMPARISONS]
+    for timing in timings:
+        click.echo(
+            f"{timing.name:<20} {timing.before_us:>8.2f} us {timing.after_us:>8.2f} us "
+            f"{timing.saved_us:>8.2f} us"
+        )
+    total = sum(timing.saved_us for timing in timings if timing.name in SINGLE_VOICE_STEPS)
+    click.echo(f"\nSaved per single-voice request: {total:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+"""Benchmark scenarios and command line entry point.
+
+Every scenario runs the public API end to end (validation, request
+building, chunking, concurrency, response parsing and output writing)
+against FakeClient. With the default zero latency the timings are this
+tool's own overhead; with --latency and --jitter they show how well
+concurrency hides API latency.
+
+Usage:
+    python -m benchmarks.run                        # all scenarios
+    python -m benchmarks.run -s chunked -n 50       # one scenario, 50 iterations
+    python -m benchmarks.run --latency 0.5 --jitter 0.2
+    python -m benchmarks.run --json bench.json      # save results as a baseline
+    python -m benchmarks.run --baseline bench.json  # exit 1 on a regression
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import click
+
+from benchmarks.fake_client import FakeClient, tone
+from gemini_tts_tool.core.batch import BatchItem, run_batch
+from gemini_tts_tool.core.dialogue import synthesize_dialogue
+from gemini_tts_tool.core.encoders import save_audio
+from gemini_tts_tool.core.retry import NO_RETRY
+from gemini_tts_tool.core.synthesizer import (
+    stream_speech,
+    synthesize_multi_voice,
+    synthesize_speech,
+)
+from gemini_tts_tool.utils import CHANNELS, SAMPLE_RATE, SAMPLE_WIDTH, write_wav_stream
+
+# Allowed slowdown of the median before --baseline reports a regression
+DEFAULT_THRESHOLD = 0.25
+
+SENTENCE = "The quick brown fox jumps over the lazy dog while the narrator keeps a steady pace."
+
+# ~40 paragraphs, ~10 requests at the chunk size used below
+DOCUMENT = "\n\n".join(f"Paragraph {i}. " + " ".join([SENTENCE] * 4) for i in range(1, 41))
+CHUNK_TOKENS = 350
+
+DIALOGUE = "\n".join(f"{speaker}: {SENTENCE}" for speaker in ["Host", "Guest"] * 4)
+PANEL = "\n".join(f"{speaker}: {SENTENCE}" for speaker in ["Host", "Alice", "Bob", "Carol"] * 3)
+BATCH_ROWS = 16
+
+BYTES_PER_SECOND = SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A benchmark workload.
+
+    run receives the fake client and a scratch directory and returns the
+    PCM bytes produced.
+    """
+
+    name: str
+    description: str
+    run: Callable[[FakeClient, Path], int]
+
+
+def _single(client: FakeClient, work_dir: Path) -> int:
+    return len(synthesize_speech(client, SENTENCE, retry_policy=NO_RETRY))  # type: ignore[arg-type]
+
+
+def _chunked(client: FakeClient, work_dir: Path) -> int:
+    audio_data = synthesize_speech(
+        client,  # type: ignore[arg-type]
+        DOCUMENT,
+        max_chunk_tokens=CHUNK_TOKENS,
+        max_workers=4,
+        retry_policy=NO_RETRY,
+    )
+    return len(audio_data)
+
+
+def _stream(client: FakeClient, work_dir: Path) -> int:
+    chunks = stream_speech(
+        client,  # type: ignore[arg-type]
+        DOCUMENT,
+        max_chunk_tokens=CHUNK_TOKENS,
+        retry_policy=NO_RETRY,
+    )
+    return write_wav_stream(chunks, work_dir / "stream.wav")
+
+
+def _multi_voice(client: FakeClient, work_dir: Path) -> int:
+    return len(synthesize_multi_voice(client, DIALOGUE, retry_policy=NO_RETRY))  # type: ignore[arg-type]
+
+
+def _dialogue(client: FakeClient, work_dir: Path) -> int:
+    return len(synthesize_dialogue(client, PANEL, retry_policy=NO_RETRY))  # type: ignore[arg-type]
+
+
+def _batch(client: FakeClient, work_dir: Path) -> int:
+    items = [
+        BatchItem(line=i + 1, text=f"Row {i}. {SENTENCE}", output=work_dir / f"row-{i}.wav")
+        for i in range(BATCH_ROWS)
+    ]
+    results = run_batch(client, items, retry_policy=NO_RETRY)  # type: ignore[arg-type]
+    failed = [result for result in results if not result.ok]
+    if failed:
+        raise RuntimeError(f"Batch row failed: {failed[0].error}")
+    return sum(round(result.audio_seconds * BYTES_PER_SECOND) for result in results)
+
+
+_TEN_MINUTES = tone(600)
+
+
+def _save_wav(client: FakeClient, work_dir: Path) -> int:
+    save_audio(_TEN_MINUTES, work_dir / "long.wav")
+    return len(_TEN_MINUTES)
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("single", "One short single-voice request", _single),
+        Scenario("chunked", "Long document, ~10 chunks on 4 workers", _chunked),
+        Scenario("stream", "Long document streamed into a WAV file", _stream),
+        Scenario("multi-voice", "Two-speaker dialogue in one request", _multi_voice),
+        Scenario("dialogue", "Four-speaker panel split into segments", _dialogue),
+        Scenario("batch", f"{BATCH_ROWS}-row batch written to WAV files", _batch),
+        Scenario("save-wav", "Write 10 minutes of PCM as WAV (no API)", _save_wav),
+    )
+}
+
+
+@dataclass(frozen=True)
+class Result:
+    """Timings of one scenario, in seconds per iteration."""
+
+    name: str
+    iterations: int
+    requests: int
+    mean: float
+    p50: float
+    p95: float
+    audio_seconds: float
+
+    @property
+    def per_request(self) -> float | None:
+        """Median time per API request."""
+        return self.p50 / self.requests if self.requests else None
+
+    @property
+    def speedup(self) -> float:
+        """Seconds of audio produced per second of wall time."""
+        return self.audio_seconds / self.p50 if self.p50 else math.inf
+
+
+def run_scenario(scenario: Scenario, client: FakeClient, iterations: int) -> Result:
+    """Run a scenario once to warm up, then time it iterations times.
+
+    Args:
+        scenario: Workload to run
+        client: Fake backend
+        iterations: Number of timed runs
+
+    Returns:
+        Timings of the timed runs
+    """
+    with tempfile.TemporaryDirectory(prefix="gemini-tts-bench-") as tmp:
+        work_dir = Path(tmp)
+        # The warm-up pays one-off costs such as importing the SDK types
+        scenario.run(client, work_dir)
+
+        timings = []
+        requests_before = client.requests
+        for _ in range(iterations):
+            start = time.perf_counter()
+            audio_bytes = scenario.run(client, work_dir)
+            timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    return Result(
+        name=scenario.name,
+        iterations=iterations,
+        requests=(client.requests - requests_before) // iterations,
+        mean=sum(timings) / iterations,
+        p50=timings[(iterations - 1) // 2],
+        p95=timings[min(iterations - 1, math.ceil(0.95 * iterations) - 1)],
+        audio_seconds=audio_bytes / BYTES_PER_SECOND,
+    )
+
+
+def find_regressions(
+    results: list[Result], baseline: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """Compare median timings with a saved baseline.
+
+    Args:
+        results: Current results
+        baseline: Document written by --json
+        threshold: Allowed relative slowdown (0.25 = 25% slower)
+
+    Returns:
+        One message per scenario slower than the baseline allows
+    """
+    previous = baseline.get("scenarios", {})
+    regressions = []
+    for result in results:
+        before = previous.get(result.name, {}).get("p50")
+        if before and result.p50 > before * (1 + threshold):
+            regressions.append(
+                f"{result.name}: median {_ms(result.p50)} vs {_ms(before)} in the baseline "
+                f"(+{(result.p50 / before - 1) * 100:.0f}%)"
+            )
+    return regressions
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f} ms"
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "-s",
+    "names",
+    multiple=True,
+    type=click.Choice(list(SCENARIOS)),
+    help="Scenario to run (repeatable; default: all)",
+)
+@click.option("--iterations", "-n", type=click.IntRange(min=1), default=20, show_default=True)
+@click.option(
+    "--latency",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Simulated seconds per API request",
+)
+@click.option(
+    "--jitter",
+    type=click.FloatRange(0, 1),
+    default=0.0,
+    show_default=True,
+    help="Random fraction of the latency added or removed",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Latency random seed")
+@click.option("--json", "json_path", type=click.Path(), help="Write results to this file")
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True),
+    help="Results file to compare with; exit 1 if a scenario got slower",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    help="Allowed slowdown of the median compared with --baseline",
+)
+def main(
+    names: tuple[str, ...],
+    iterations: int,
+    latency: float,
+    jitter: float,
+    seed: int,
+    json_path: str | None,
+    baseline: str | None,
+    threshold: float,
+) -> None:
+    """Benchmark synthesis against a deterministic fake Gemini backend."""
+    client = FakeClient(latency=latency, jitter=jitter, seed=seed)
+    click.echo(f"latency={latency}s jitter={jitter} iterations={iterations}\n")
+    click.echo(
+        f"{'scenario':<12} {'requests':>8} {'median':>11} {'p95':>11} "
+        f"{'per request':>12} {'audio/wall':>11}"
+    )
+
+    results = []
+    for name in names or SCENARIOS:
+        result = run_scenario(SCENARIOS[name], client, iterations)
+        results.append(result)
+        per_request = _ms(result.per_request) if result.per_request is not None else "-"
+        click.echo(
+            f"{result.name:<12} {result.requests:>8} {_ms(result.p50):>11} "
+            f"{_ms(result.p95):>11} {per_request:>12} {result.speedup:>10.0f}x"
+        )
+
+    if json_path:
+        document = {
+            "settings": {"latency": latency, "jitter": jitter, "iterations": iterations},
+            "scenarios": {result.name: asdict(result) for result in results},
+        }
+        Path(json_path).write_text(json.dumps(document, indent=2) + "\n")
+
+    if baseline:
+        previous = json.loads(Path(baseline).read_text())
+        settings = previous.get("settings", {})
+        if (settings.get("latency"), settings.get("jitter")) != (latency, jitter):
+            click.echo("Warning: the baseline used a different --latency/--jitter", err=True)
+        regressions = find_regressions(results, previous, threshold)
+        for message in regressions:
+            click.echo(f"✗ Regression: {message}", err=True)
+        if regressions:
+            sys.exit(1)
+        click.echo(f"✓ No regressions compared with {baseline}", err=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,60 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 
-# Public API exports for library usage
-from gemini_tts_tool.core.client import create_client
-from gemini_tts_tool.core.synthesizer import synthesize_multi_voice, synthesize_speech
-from gemini_tts_tool.core.voices import MODELS, VOICES
+if TYPE_CHECKING:
+    from gemini_tts_tool.core.client import create_client, get_client
+    from gemini_tts_tool.core.dialogue import synthesize_dialogue
+    from gemini_tts_tool.core.markup import synthesize_markup
+    from gemini_tts_tool.core.synthesizer import (
+        async_synthesize_multi_voice,
+        async_synthesize_speech,
+        synthesize_multi_voice,
+        synthesize_speech,
+    )
+    from gemini_tts_tool.core.voices import MODELS, VOICES
+
+# Public API exports for library usage, imported on first access so that
+# importing the package (e.g. for the CLI) stays cheap
+_EXPORTS = {
+    "create_client": "gemini_tts_tool.core.client",
+    "get_client": "gemini_tts_tool.core.client",
+    "synthesize_speech": "gemini_tts_tool.core.synthesizer",
+    "synthesize_multi_voice": "gemini_tts_tool.core.synthesizer",
+    "async_synthesize_speech": "gemini_tts_tool.core.synthesizer",
+    "async_synthesize_multi_voice": "gemini_tts_tool.core.synthesizer",
+    "synthesize_dialogue": "gemini_tts_tool.core.dialogue",
+    "synthesize_markup": "gemini_tts_tool.core.markup",
+    "VOICES": "gemini_tts_tool.core.voices",
+    "MODELS": "gemini_tts_tool.core.voices",
+}
 
 __all__ = [
     "create_client",
+    "get_client",
     "synthesize_speech",
     "synthesize_multi_voice",
+    "async_synthesize_speech",
+    "async_synthesize_multi_voice",
+    "synthesize_dialogue",
+    "synthesize_markup",
     "VOICES",
     "MODELS",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -4,14 +4,48 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import importlib
+from typing import Any
+
 import click
 
-from gemini_tts_tool.commands.list_commands import list_models, list_voices
-from gemini_tts_tool.commands.multi_voice_command import multi_voice
-from gemini_tts_tool.commands.synthesize_command import synthesize
+# Command name -> "module:attribute"; modules are imported only when needed
+LAZY_COMMANDS = {
+    "synthesize": "gemini_tts_tool.commands.synthesize_command:synthesize",
+    "multi-voice": "gemini_tts_tool.commands.multi_voice_command:multi_voice",
+    "batch": "gemini_tts_tool.commands.batch_command:batch",
+    "audition": "gemini_tts_tool.commands.audition_command:audition",
+    "cache": "gemini_tts_tool.commands.cache_commands:cache",
+    "serve": "gemini_tts_tool.commands.serve_command:serve",
+    "watch": "gemini_tts_tool.commands.watch_command:watch",
+    "list-voices": "gemini_tts_tool.commands.list_commands:list_voices",
+    "list-models": "gemini_tts_tool.commands.list_commands:list_models",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a command's module only when it is looked up.
+
+    Running one command imports just that command's module, which keeps
+    startup cheap for commands that never touch the API.
+    """
+
+    def __init__(self, *args: Any, lazy_commands: dict[str, str], **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attribute = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
 
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version="1.0.0")
 @click.pass_context
 def main(ctx: click.Context) -> None:
@@ -25,6 +59,7 @@ def main(ctx: click.Context) -> None:
     Authentication:
       Set GEMINI_API_KEY or GOOGLE_API_KEY environment variable.
       Get your API key from: https://aistudio.google.com/app/apikey
+      Set GEMINI_API_KEYS='key1,key2' to balance requests across several keys.
 
     \b
     For Vertex AI:
@@ -36,6 +71,11 @@ def main(ctx: click.Context) -> None:
     Examples:
       gemini-tts-tool synthesize "Hello world" -o greeting.wav
       gemini-tts-tool multi-voice --input-file dialogue.txt -o podcast.wav
+      gemini-tts-tool batch prompts.jsonl -j 8
+      gemini-tts-tool audition "Welcome to the show" -o auditions
+      gemini-tts-tool serve --port 8080
+      gemini-tts-tool watch scripts/
+      gemini-tts-tool cache info
       gemini-tts-tool list-voices
       gemini-tts-tool list-models
 
@@ -43,17 +83,11 @@ def main(ctx: click.Context) -> None:
     For detailed help on each command:
       gemini-tts-tool synthesize --help
       gemini-tts-tool multi-voice --help
+      gemini-tts-tool batch --help
     """
     # Initialize context object for passing client between commands
     ctx.ensure_object(dict)
 
 
-# Register commands
-main.add_command(synthesize)
-main.add_command(multi_voice)
-main.add_command(list_voices)
-main.add_command(list_models)
-
-
 if __name__ == "__main__":
     main()
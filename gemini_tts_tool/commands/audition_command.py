@@ -0,0 +1,232 @@
+"""Audition command implementation.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import sys
+
+import click
+
+from gemini_tts_tool.core.audition import (
+    DEFAULT_AUDITION_CONCURRENCY,
+    INDEX_NAME,
+    AuditionResult,
+    run_audition,
+    select_voices,
+)
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.client import AuthenticationError, get_client
+from gemini_tts_tool.core.encoders import get_encoder
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.pool import apply_quota
+from gemini_tts_tool.core.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from gemini_tts_tool.core.synthesizer import read_stdin
+from gemini_tts_tool.core.voices import DEFAULT_MODEL
+from gemini_tts_tool.utils import AudioError, expand_path
+
+
+@click.command(name="audition")
+@click.argument("text", required=False)
+@click.option(
+    "--stdin",
+    "-s",
+    is_flag=True,
+    help="Read text from stdin",
+)
+@click.option(
+    "--voices",
+    default="all",
+    show_default=True,
+    help="Voices to audition: 'all', a list such as 'Kore,Puck', or a pattern such as 'A*'",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    required=True,
+    help="Directory for one audio file per voice and index.json (required)",
+)
+@click.option(
+    "--format",
+    "audio_format",
+    type=click.Choice(["wav", "flac", "ogg", "mp3", "m4a"]),
+    default="wav",
+    show_default=True,
+    help="Audio format of the voice files",
+)
+@click.option(
+    "--model",
+    default=DEFAULT_MODEL,
+    help="TTS model (default: flash). Options: flash, pro, or full model name",
+)
+@click.option(
+    "--style",
+    help="Style instructions (e.g., 'Speak cheerfully and energetically')",
+)
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    default=DEFAULT_AUDITION_CONCURRENCY,
+    show_default=True,
+    help="Number of voices synthesized at the same time",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Synthesize every voice again instead of reusing cached audio",
+)
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=DEFAULT_RETRY_POLICY.max_attempts - 1,
+    show_default=True,
+    help="Retry rate-limited and transient API failures this many times",
+)
+@click.option(
+    "--rpm",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Requests per minute quota, per API key or project (default: unlimited)",
+)
+@click.option(
+    "--metrics",
+    "show_metrics",
+    is_flag=True,
+    help="Print a JSON summary of API latency, throughput and retries to stderr",
+)
+@click.option(
+    "--verbose",
+    "-V",
+    is_flag=True,
+    help="Show verbose output",
+)
+@click.pass_context
+def audition(
+    ctx: click.Context,
+    text: str | None,
+    stdin: bool,
+    voices: str,
+    output_dir: str,
+    audio_format: str,
+    model: str,
+    style: str | None,
+    concurrency: int,
+    no_cache: bool,
+    max_retries: int,
+    rpm: float | None,
+    show_metrics: bool,
+    verbose: bool,
+) -> None:
+    """Synthesize one line with many voices to compare them.
+
+    Every selected voice is synthesized concurrently through one client and
+    saved as OUTPUT_DIR/<Voice>.<format>. OUTPUT_DIR/index.json lists each
+    voice with its file, audio duration and latency. Audio is cached, so
+    auditioning the same line again (e.g. with more voices) only calls the
+    API for voices not heard before.
+
+    Examples:
+
+    \b
+        # All 30 voices
+        gemini-tts-tool audition "Welcome to the show" -o auditions
+
+    \b
+        # A shortlist, with a style
+        gemini-tts-tool audition "Welcome!" -o auditions --voices Kore,Puck,Zephyr \\
+            --style "Speak warmly"
+
+    \b
+        # Every voice starting with A, as MP3
+        gemini-tts-tool audition "Welcome!" -o auditions --voices 'A*' --format mp3
+    """
+    metrics: MetricsRecorder | None = None
+    try:
+        # Fail before any API call if the format can't be written
+        get_encoder(audio_format)
+        selected = select_voices(voices)
+
+        if stdin:
+            text = read_stdin()
+        if not text or not text.strip():
+            raise click.UsageError("No input provided. Provide TEXT argument or use --stdin")
+
+        output_path = expand_path(output_dir)
+        if verbose:
+            click.echo(f"Voices: {', '.join(selected)}", err=True)
+            click.echo(f"Concurrency: {concurrency}", err=True)
+
+        # One pooled client for every voice
+        client = ctx.obj.get("client") if ctx.obj else None
+        if not client:
+            client = get_client()
+        client, rate_limiter = apply_quota(client, rpm)
+
+        cache = None if no_cache else AudioCache()
+        metrics = MetricsRecorder() if show_metrics else None
+        completed = 0
+
+        def on_result(result: AuditionResult) -> None:
+            nonlocal completed
+            completed += 1
+            if not result.ok:
+                click.echo(
+                    f"✗ [{completed}/{len(selected)}] {result.voice}: {result.error}", err=True
+                )
+            elif verbose:
+                click.echo(f"✓ [{completed}/{len(selected)}] {result.voice}", err=True)
+
+        results = run_audition(
+            client,
+            text,
+            selected,
+            output_path,
+            model=model,
+            system_instruction=style,
+            audio_format=audio_format,
+            concurrency=concurrency,
+            on_result=on_result,
+            cache=cache,
+            retry_policy=RetryPolicy(max_attempts=max_retries + 1),
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+        )
+
+        click.echo(f"{'Voice':<14} {'Duration':>9} {'Latency':>9}  File")
+        for result in results:
+            if result.ok:
+                click.echo(
+                    f"{result.voice:<14} {result.audio_seconds:>8.2f}s "
+                    f"{result.latency_seconds:>8.2f}s  {result.output}"
+                )
+            else:
+                click.echo(f"{result.voice:<14} {'failed':>9} {'':>9}  {result.error}")
+
+        failed = sum(1 for result in results if not result.ok)
+        if verbose and cache:
+            click.echo(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)", err=True)
+        click.echo(
+            f"{'✓' if not failed else '✗'} Audition complete: "
+            f"{len(results) - failed} voice(s), {failed} failed. "
+            f"Index: {output_path / INDEX_NAME}",
+            err=True,
+        )
+        if failed:
+            sys.exit(1)
+
+    except (OSError, AuthenticationError, AudioError, ValueError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except click.UsageError:
+        raise
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        if verbose:
+            import traceback
+
+            traceback.print_exc()
+        sys.exit(1)
+    finally:
+        # Also reported for failed runs, where latency and retries matter most
+        if metrics:
+            click.echo(metrics.to_json(), err=True)
@@ -0,0 +1,269 @@
+"""Batch command implementation.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import sys
+
+import click
+
+from gemini_tts_tool.core.batch import (
+    DEFAULT_CONCURRENCY,
+    BatchResult,
+    estimate_batch,
+    read_manifest,
+    run_batch,
+    write_report,
+)
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.client import AuthenticationError, get_client
+from gemini_tts_tool.core.estimate import format_estimate
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.pool import apply_quota, format_backend_stats
+from gemini_tts_tool.core.postprocess import NORMALIZE_MODES, PostProcess
+from gemini_tts_tool.core.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from gemini_tts_tool.utils import AudioError, expand_path
+
+
+@click.command(name="batch")
+@click.argument("manifest")
+@click.option(
+    "--output-dir",
+    help="Base directory for relative output paths (default: manifest directory)",
+)
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Number of rows synthesized concurrently",
+)
+@click.option(
+    "--encode-workers",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Processes that post-process and encode audio (0: on the synthesis threads)",
+)
+@click.option(
+    "--normalize",
+    type=click.Choice(NORMALIZE_MODES),
+    help="Normalize the peak level or the loudness (RMS) of each row (needs numpy)",
+)
+@click.option(
+    "--target-dbfs",
+    type=click.FloatRange(max=0),
+    help="Normalization target in dBFS (default: -1 for peak, -20 for loudness)",
+)
+@click.option(
+    "--trim-silence",
+    is_flag=True,
+    help="Remove leading and trailing silence from each row (needs numpy)",
+)
+@click.option(
+    "--report",
+    help="Per-row JSONL result report (default: <manifest>.report.jsonl)",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Serve repeated requests from the on-disk audio cache (see: cache info)",
+)
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=DEFAULT_RETRY_POLICY.max_attempts - 1,
+    show_default=True,
+    help="Retry rate-limited and transient API failures this many times",
+)
+@click.option(
+    "--rpm",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Requests per minute quota, per API key or project (default: unlimited)",
+)
+@click.option(
+    "--tpm",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Input tokens per minute quota, per API key or project (default: unlimited)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Report requests, tokens, audio duration and cost without synthesizing",
+)
+@click.option(
+    "--count-tokens",
+    is_flag=True,
+    help="With --dry-run, count input tokens with the API instead of estimating",
+)
+@click.option(
+    "--metrics",
+    "show_metrics",
+    is_flag=True,
+    help="Print a JSON summary of API latency, throughput and retries to stderr",
+)
+@click.option(
+    "--verbose",
+    "-V",
+    is_flag=True,
+    help="Show verbose output",
+)
+@click.pass_context
+def batch(
+    ctx: click.Context,
+    manifest: str,
+    output_dir: str | None,
+    concurrency: int,
+    encode_workers: int,
+    normalize: str | None,
+    target_dbfs: float | None,
+    trim_silence: bool,
+    report: str | None,
+    use_cache: bool,
+    max_retries: int,
+    rpm: float | None,
+    tpm: float | None,
+    dry_run: bool,
+    count_tokens: bool,
+    show_metrics: bool,
+    verbose: bool,
+) -> None:
+    """Synthesize many prompts from a JSONL or CSV manifest.
+
+    MANIFEST is a .jsonl or .csv file with one row per output file. Each row
+    needs "text" and "output" and may set "voice", "model" and "style". All rows
+    share a single client and up to --concurrency rows run at the same time.
+    Rate-limited (429) and transient server errors are retried with backoff;
+    set --rpm/--tpm to your quota to avoid hitting the limits at all. With
+    several API keys or projects (GEMINI_API_KEYS, GEMINI_VERTEX_BACKENDS)
+    rows are spread across them and the quota applies to each one.
+
+    Examples:
+
+    \b
+        # Synthesize every row of a JSONL manifest
+        gemini-tts-tool batch prompts.jsonl
+
+    \b
+        # Eight concurrent requests, outputs under ./audio
+        gemini-tts-tool batch prompts.csv --output-dir audio -j 8
+
+    \b
+        # Stay within a free-tier quota of 10 requests per minute
+        gemini-tts-tool batch prompts.jsonl --rpm 10
+
+    \b
+        # Normalize loudness and encode in four worker processes
+        gemini-tts-tool batch episodes.jsonl --encode-workers 4 --normalize loudness
+
+    \b
+        # Preview requests, tokens, duration and cost without synthesizing
+        gemini-tts-tool batch prompts.jsonl --dry-run
+
+    \b
+    Manifest format (prompts.jsonl):
+        {"text": "Welcome!", "voice": "Kore", "output": "welcome.wav"}
+        {"text": "Goodbye!", "style": "Speak warmly", "output": "bye.wav"}
+
+    \b
+    Manifest format (prompts.csv):
+        text,voice,model,style,output
+        Welcome!,Kore,flash,,welcome.wav
+    """
+    metrics: MetricsRecorder | None = None
+    try:
+        manifest_path = expand_path(manifest)
+        items = read_manifest(manifest_path, expand_path(output_dir) if output_dir else None)
+        if not items:
+            raise ValueError(f"Manifest contains no rows: {manifest_path}")
+
+        report_path = expand_path(report) if report else manifest_path.with_suffix(".report.jsonl")
+        postprocess = PostProcess(
+            normalize=normalize, target_dbfs=target_dbfs, trim_silence=trim_silence
+        )
+
+        if verbose:
+            click.echo(f"Rows: {len(items)}", err=True)
+            click.echo(f"Concurrency: {concurrency}", err=True)
+            if encode_workers:
+                click.echo(f"Encode workers: {encode_workers}", err=True)
+
+        # One pooled client for the whole batch
+        client = ctx.obj.get("client") if ctx.obj else None
+
+        if dry_run:
+            # Plan only; count_tokens requests are not synthesis calls
+            estimate = estimate_batch(
+                items, client=(client or get_client()) if count_tokens else None
+            )
+            click.echo("\n".join(format_estimate(estimate, per_request=verbose)))
+            return
+
+        if not client:
+            client = get_client()
+
+        cache = AudioCache() if use_cache else None
+        retry_policy = RetryPolicy(max_attempts=max_retries + 1)
+        client, rate_limiter = apply_quota(client, rpm, tpm)
+        metrics = MetricsRecorder() if show_metrics else None
+        completed = 0
+
+        def on_result(result: BatchResult) -> None:
+            nonlocal completed
+            completed += 1
+            if result.ok:
+                if verbose:
+                    click.echo(f"✓ [{completed}/{len(items)}] {result.output}", err=True)
+            else:
+                click.echo(
+                    f"✗ [{completed}/{len(items)}] line {result.line}: {result.error}", err=True
+                )
+
+        results = run_batch(
+            client,
+            items,
+            concurrency=concurrency,
+            on_result=on_result,
+            cache=cache,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+            postprocess=postprocess,
+            encode_workers=encode_workers,
+        )
+        write_report(results, report_path)
+
+        failed = sum(1 for result in results if not result.ok)
+        if verbose and cache:
+            click.echo(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)", err=True)
+        if verbose:
+            for line in format_backend_stats(client):
+                click.echo(line, err=True)
+        shared = sum(1 for result in results if result.shared)
+        if shared:
+            click.echo(f"Identical rows: {shared} reused audio (requests saved)", err=True)
+        click.echo(
+            f"{'✓' if not failed else '✗'} Batch complete: "
+            f"{len(results) - failed} succeeded, {failed} failed. Report: {report_path}",
+            err=True,
+        )
+        if failed:
+            sys.exit(1)
+
+    except (OSError, AuthenticationError, AudioError, ValueError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        if verbose:
+            import traceback
+
+            traceback.print_exc()
+        sys.exit(1)
+    finally:
+        # Also reported for failed runs, where latency and retries matter most
+        if metrics:
+            click.echo(metrics.to_json(), err=True)
@@ -0,0 +1,95 @@
+"""Cache commands for inspecting and managing the on-disk audio cache.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import sys
+
+import click
+
+from gemini_tts_tool.core.cache import AudioCache, format_size, parse_size
+
+
+@click.group(name="cache")
+def cache() -> None:
+    """Inspect and manage the on-disk audio cache.
+
+    The cache is used by synthesize, multi-voice and batch when --cache is
+    given. It lives in $GEMINI_TTS_CACHE_DIR (default: ~/.cache/gemini-tts-tool).
+
+    Examples:
+
+    \b
+        gemini-tts-tool cache info
+        gemini-tts-tool cache prune --max-size 200MB
+        gemini-tts-tool cache clear --yes
+    """
+
+
+@cache.command(name="info")
+def cache_info() -> None:
+    """Show cache location, size and number of entries.
+
+    Example:
+
+    \b
+        gemini-tts-tool cache info
+    """
+    stats = AudioCache().stats()
+    click.echo(f"Directory: {stats.directory}")
+    click.echo(f"Entries:   {stats.entries}")
+    click.echo(f"Size:      {format_size(stats.total_bytes)} / {format_size(stats.max_bytes)}")
+
+
+@cache.command(name="prune")
+@click.option(
+    "--max-size",
+    help="Evict least recently used entries until the cache fits (e.g. 500MB, 2GB)",
+)
+@click.option(
+    "--older-than-days",
+    type=click.FloatRange(min=0),
+    help="Evict entries not used for this many days",
+)
+def cache_prune(max_size: str | None, older_than_days: float | None) -> None:
+    """Evict least recently used entries.
+
+    Without options, evicts down to the default size limit (1 GB).
+
+    Examples:
+
+    \b
+        gemini-tts-tool cache prune --max-size 200MB
+        gemini-tts-tool cache prune --older-than-days 30
+    """
+    try:
+        max_bytes = parse_size(max_size) if max_size else None
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    audio_cache = AudioCache()
+    older_than = older_than_days * 86400 if older_than_days is not None else None
+    removed = audio_cache.prune(max_bytes=max_bytes, older_than=older_than)
+    stats = audio_cache.stats()
+    click.echo(
+        f"✓ Removed {removed} entries. Cache size: {format_size(stats.total_bytes)}", err=True
+    )
+
+
+@cache.command(name="clear")
+@click.option("--yes", "-y", is_flag=True, help="Do not ask for confirmation")
+def cache_clear(yes: bool) -> None:
+    """Remove all cached audio.
+
+    Example:
+
+    \b
+        gemini-tts-tool cache clear --yes
+    """
+    audio_cache = AudioCache()
+    if not yes:
+        click.confirm(f"Remove all cached audio in {audio_cache.directory}?", abort=True)
+    removed = audio_cache.clear()
+    click.echo(f"✓ Removed {removed} entries", err=True)
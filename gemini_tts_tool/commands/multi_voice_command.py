@@ -5,13 +5,29 @@ and has been reviewed and tested by a human.
 """
 
 import sys
+from contextlib import nullcontext
 
 import click
+from click.core import ParameterSource
 
-from gemini_tts_tool.core.client import AuthenticationError, create_client
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.client import AuthenticationError, get_client
+from gemini_tts_tool.core.dialogue import (
+    DEFAULT_TURN_GAP,
+    MAX_SPEAKERS_PER_REQUEST,
+    apply_numbered_voices,
+    detect_speakers,
+    parse_speaker_voices,
+    synthesize_dialogue,
+)
+from gemini_tts_tool.core.encoders import get_encoder, save_audio
+from gemini_tts_tool.core.estimate import estimate_dialogue, format_estimate
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.postprocess import NORMALIZE_MODES, PostProcess
+from gemini_tts_tool.core.retry import DEFAULT_RETRY_POLICY, RetryPolicy
 from gemini_tts_tool.core.synthesizer import SynthesisError, synthesize_multi_voice
 from gemini_tts_tool.core.voices import DEFAULT_MODEL
-from gemini_tts_tool.utils import AudioError, expand_path, read_file, save_audio_wav
+from gemini_tts_tool.utils import AudioError, expand_path, read_file, validate_output_format
 
 
 @click.command(name="multi-voice")
@@ -24,7 +40,7 @@ from gemini_tts_tool.utils import AudioError, expand_path, read_file, save_audio
     "--output",
     "-o",
     required=True,
-    help="Output audio file path (required)",
+    help="Output audio file path: .wav, .flac, .ogg, .mp3 or .m4a (required)",
 )
 @click.option(
     "--speaker1-voice",
@@ -36,6 +52,20 @@ from gemini_tts_tool.utils import AudioError, expand_path, read_file, save_audio
     default="Puck",
     help="Voice for second speaker (default: Puck)",
 )
+@click.option(
+    "--speaker-voice",
+    "speaker_voice_pairs",
+    multiple=True,
+    metavar="NAME=VOICE",
+    help="Voice for a named speaker (repeatable, any number of speakers)",
+)
+@click.option(
+    "--gap",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_TURN_GAP,
+    show_default=True,
+    help="Silence in seconds between segments (only for dialogues synthesized in segments)",
+)
 @click.option(
     "--model",
     default=DEFAULT_MODEL,
@@ -45,6 +75,57 @@ from gemini_tts_tool.utils import AudioError, expand_path, read_file, save_audio
     "--style",
     help="Style instructions (e.g., 'Make Speaker1 excited, Speaker2 thoughtful')",
 )
+@click.option(
+    "--normalize",
+    type=click.Choice(NORMALIZE_MODES),
+    help="Normalize the peak level or the loudness (RMS) of the audio (needs numpy)",
+)
+@click.option(
+    "--target-dbfs",
+    type=click.FloatRange(max=0),
+    help="Normalization target in dBFS (default: -1 for peak, -20 for loudness)",
+)
+@click.option(
+    "--trim-silence",
+    is_flag=True,
+    help="Remove leading and trailing silence (needs numpy)",
+)
+@click.option(
+    "--crossfade",
+    type=click.FloatRange(min=0),
+    default=0,
+    metavar="MS",
+    help="Crossfade joins between dialogue segments by MS milliseconds (needs numpy)",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Serve repeated requests from the on-disk audio cache (see: cache info)",
+)
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=DEFAULT_RETRY_POLICY.max_attempts - 1,
+    show_default=True,
+    help="Retry rate-limited and transient API failures this many times",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Report requests, tokens, audio duration and cost without synthesizing",
+)
+@click.option(
+    "--count-tokens",
+    is_flag=True,
+    help="With --dry-run, count input tokens with the API instead of estimating",
+)
+@click.option(
+    "--metrics",
+    "show_metrics",
+    is_flag=True,
+    help="Print a JSON summary of API latency, throughput and retries to stderr",
+)
 @click.option(
     "--verbose",
     "-V",
@@ -58,15 +139,36 @@ def multi_voice(
     output: str,
     speaker1_voice: str,
     speaker2_voice: str,
+    speaker_voice_pairs: tuple[str, ...],
+    gap: float,
     model: str,
     style: str | None,
+    normalize: str | None,
+    target_dbfs: float | None,
+    trim_silence: bool,
+    crossfade: float,
+    use_cache: bool,
+    max_retries: int,
+    dry_run: bool,
+    count_tokens: bool,
+    show_metrics: bool,
     verbose: bool,
 ) -> None:
     """Synthesize multi-speaker dialogue using Gemini TTS.
 
-    Creates audio with distinct voices for up to 2 speakers. Speaker names are
+    Creates audio with distinct voices for each speaker. Speaker names are
     automatically detected from dialogue labels in the format "SpeakerName: text".
 
+    A dialogue of 2 speakers is a single request: --speaker1-voice and
+    --speaker2-voice go to the speakers in sorted order of their names, and
+    --gap is ignored. Dialogues with more than 2 speakers (or with
+    --speaker-voice) are split into segments of at most 2 speakers, which are
+    synthesized in parallel and joined in script order with --gap seconds of
+    silence. There, --speaker-voice takes precedence, --speaker1-voice and
+    --speaker2-voice (if given) go to the first two speakers to talk, and
+    other speakers get Kore, Puck, Charon, Aoede, Fenrir and Leda in order of
+    appearance.
+
     Examples:
 
     \b
@@ -83,24 +185,32 @@ def multi_voice(
         gemini-tts-tool multi-voice --input-file dialogue.txt -o styled.wav \\
             --style "Make Speaker1 sound excited, Speaker2 sound thoughtful"
 
+    \b
+        # Panel with four speakers
+        gemini-tts-tool multi-voice --input-file panel.txt -o panel.wav \\
+            --speaker-voice Host=Zephyr --speaker-voice Alice=Aoede --gap 0.5
+
+    \b
+        # Fade segments in and out, trim and normalize the peak level
+        gemini-tts-tool multi-voice --input-file panel.txt -o panel.wav \\
+            --crossfade 30 --trim-silence --normalize peak
+
     \b
     Dialogue file format (dialogue.txt):
         Host: Welcome to today's show!
         Guest: Thanks for having me!
         Host: Let's get started.
     """
+    metrics: MetricsRecorder | None = None
     try:
         # Validate output format
-        if not output.lower().endswith(".wav"):
-            raise ValueError(
-                f"Output file must end with .wav extension. Got: {output}\n\n"
-                "What to do:\n"
-                "  Change your output file to have a .wav extension:\n"
-                "  • gemini-tts-tool multi-voice --input-file dialogue.txt -o podcast.wav\n"
-                "  • gemini-tts-tool multi-voice --input-file dialogue.txt "
-                "-o ~/audio/output.wav\n\n"
-                "Note: Currently only WAV format is supported."
-            )
+        get_encoder(validate_output_format(output))
+        postprocess = PostProcess(
+            normalize=normalize,
+            target_dbfs=target_dbfs,
+            trim_silence=trim_silence,
+            crossfade_ms=crossfade,
+        )
 
         # Read dialogue file
         if verbose:
@@ -120,29 +230,93 @@ def multi_voice(
                 click.echo(f"Style: {style}", err=True)
             click.echo(f"Dialogue length: {len(dialogue)} characters", err=True)
 
-        # Create client
+        speaker_voices = parse_speaker_voices(speaker_voice_pairs)
+        speakers = detect_speakers(dialogue)
+        segmented = bool(speaker_voices) or len(speakers) > MAX_SPEAKERS_PER_REQUEST
+        if segmented:
+            # Explicit numbered voices still apply to the first two speakers
+            speaker_voices = apply_numbered_voices(
+                speakers,
+                speaker_voices,
+                *(
+                    voice if _given(ctx, name) else None
+                    for name, voice in (
+                        ("speaker1_voice", speaker1_voice),
+                        ("speaker2_voice", speaker2_voice),
+                    )
+                ),
+            )
+        elif _given(ctx, "gap"):
+            # Shared flags stay usable across scripts of any size
+            click.echo(
+                "Note: --gap is ignored: a 2-speaker dialogue is synthesized in one request",
+                err=True,
+            )
+
+        # Use the client from context or the shared pooled client
         client = ctx.obj.get("client") if ctx.obj else None
+
+        if dry_run:
+            # Plan only; count_tokens requests are not synthesis calls
+            estimate = estimate_dialogue(
+                dialogue,
+                speaker_voices=speaker_voices,
+                model=model,
+                system_instruction=style,
+                client=(client or get_client()) if count_tokens else None,
+            )
+            click.echo("\n".join(format_estimate(estimate)))
+            return
+
         if not client:
-            client = create_client()
+            client = get_client()
+
+        cache = AudioCache() if use_cache else None
+        retry_policy = RetryPolicy(max_attempts=max_retries + 1)
+        metrics = MetricsRecorder() if show_metrics else None
 
         # Synthesize
         if verbose:
             click.echo("Synthesizing multi-voice dialogue...", err=True)
 
-        audio_data = synthesize_multi_voice(
-            client=client,
-            dialogue=dialogue,
-            speaker1_voice=speaker1_voice,
-            speaker2_voice=speaker2_voice,
-            model=model,
-            system_instruction=style,
-        )
+        if segmented:
+            if verbose:
+                click.echo(f"Speakers: {len(speakers)} (segmented)", err=True)
+            audio_data = synthesize_dialogue(
+                client=client,
+                dialogue=dialogue,
+                speaker_voices=speaker_voices,
+                model=model,
+                system_instruction=style,
+                gap=gap,
+                cache=cache,
+                retry_policy=retry_policy,
+                metrics=metrics,
+                postprocess=postprocess,
+            )
+        else:
+            audio_data = synthesize_multi_voice(
+                client=client,
+                dialogue=dialogue,
+                speaker1_voice=speaker1_voice,
+                speaker2_voice=speaker2_voice,
+                model=model,
+                system_instruction=style,
+                cache=cache,
+                retry_policy=retry_policy,
+                metrics=metrics,
+                postprocess=postprocess,
+            )
+
+        if verbose and cache:
+            click.echo(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)", err=True)
 
         # Save audio
         if verbose:
             click.echo(f"Saving audio to {output_path}...", err=True)
 
-        save_audio_wav(audio_data, output_path)
+        with metrics.writing(output_path) if metrics else nullcontext():
+            save_audio(audio_data, output_path)
 
         # Success message
         click.echo(f"✓ Multi-voice dialogue synthesized successfully: {output_path}", err=True)
@@ -157,6 +331,8 @@ def multi_voice(
     ) as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
+    except click.UsageError:
+        raise
     except Exception as e:
         click.echo(f"Unexpected error: {e}", err=True)
         if verbose:
@@ -164,3 +340,12 @@ def multi_voice(
 
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Also reported for failed runs, where latency and retries matter most
+        if metrics:
+            click.echo(metrics.to_json(), err=True)
+
+
+def _given(ctx: click.Context, name: str) -> bool:
+    """Whether an option was set by the user rather than left at its default."""
+    return ctx.get_parameter_source(name) not in (None, ParameterSource.DEFAULT)
@@ -0,0 +1,166 @@
+"""Serve command implementation.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import sys
+
+import click
+
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.client import AuthenticationError, get_client
+from gemini_tts_tool.core.pool import apply_quota, format_backend_stats
+from gemini_tts_tool.core.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from gemini_tts_tool.core.scheduler import format_scheduler_stats
+from gemini_tts_tool.core.server import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    SynthesisServer,
+)
+
+
+@click.command(name="serve")
+@click.option(
+    "--host",
+    default=DEFAULT_HOST,
+    show_default=True,
+    help="Interface to listen on",
+)
+@click.option(
+    "--port",
+    "-p",
+    type=click.IntRange(0, 65535),
+    default=DEFAULT_PORT,
+    show_default=True,
+    help="Port to listen on",
+)
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="API requests in flight across all connections; more requests wait by priority",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Serve repeated requests from the on-disk audio cache (see: cache info)",
+)
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=DEFAULT_RETRY_POLICY.max_attempts - 1,
+    show_default=True,
+    help="Retry rate-limited and transient API failures this many times",
+)
+@click.option(
+    "--rpm",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Requests per minute quota, per API key or project (default: unlimited)",
+)
+@click.option(
+    "--tpm",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Input tokens per minute quota, per API key or project (default: unlimited)",
+)
+@click.option(
+    "--metrics",
+    "show_metrics",
+    is_flag=True,
+    help="Print a JSON summary of API latency, throughput and retries on shutdown",
+)
+@click.option(
+    "--verbose",
+    "-V",
+    is_flag=True,
+    help="Log every request",
+)
+@click.pass_context
+def serve(
+    ctx: click.Context,
+    host: str,
+    port: int,
+    concurrency: int,
+    use_cache: bool,
+    max_retries: int,
+    rpm: float | None,
+    tpm: float | None,
+    show_metrics: bool,
+    verbose: bool,
+) -> None:
+    """Run a local HTTP server for synthesis with a warm client.
+
+    Keeps one client (and its connections) alive across requests, so callers
+    skip interpreter start, SDK import and TLS setup. Identical requests that
+    arrive while one is in flight share a single API call. Responses are WAV
+    audio; errors are JSON objects with an "error" field.
+
+    Requests are queued by "priority" (interactive, normal or bulk; default
+    normal): interactive ones are dispatched first, and bulk work only uses
+    spare quota and never the last free request slot. A request with a
+    "deadline" (seconds) that isn't done in time fails with 504.
+
+    \b
+    Endpoints:
+        POST /synthesize    {"text": ..., "voice": ..., "model": ..., "style": ...,
+                             "priority": ..., "deadline": ...}
+        POST /multi-voice   {"dialogue": ..., "speaker1_voice": ..., "speaker2_voice": ...,
+                             "speaker_voices": {...}, "gap": ..., "model": ..., "style": ...}
+        GET  /health
+        GET  /metrics       Latency, throughput, retry and queue metrics (Prometheus format)
+
+    Examples:
+
+    \b
+        # Start the server on localhost:8080
+        gemini-tts-tool serve
+
+    \b
+        # Request speech
+        curl -s localhost:8080/synthesize -d '{"text": "Hello world"}' -o hello.wav
+
+    \b
+        # An interactive prompt that is only useful within 5 seconds
+        curl -s localhost:8080/synthesize -o reply.wav \\
+            -d '{"text": "Your order shipped.", "priority": "interactive", "deadline": 5}'
+    """
+    try:
+        # Use the client from context or the shared pooled client
+        client = ctx.obj.get("client") if ctx.obj else None
+        if not client:
+            client = get_client()
+        client, rate_limiter = apply_quota(client, rpm, tpm)
+
+        server = SynthesisServer(
+            client,
+            host=host,
+            port=port,
+            cache=AudioCache() if use_cache else None,
+            retry_policy=RetryPolicy(max_attempts=max_retries + 1),
+            rate_limiter=rate_limiter,
+            verbose=verbose,
+            concurrency=concurrency,
+        )
+    except (OSError, AuthenticationError, ValueError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✓ Serving on http://{host}:{server.server_port} (Ctrl+C to stop)", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if verbose:
+            click.echo(f"Coalesced requests: {server.coalescer.coalesced}", err=True)
+            for line in format_scheduler_stats(server.scheduler.stats()):
+                click.echo(line, err=True)
+            for line in format_backend_stats(client):
+                click.echo(line, err=True)
+        if show_metrics:
+            click.echo(server.metrics.to_json(), err=True)
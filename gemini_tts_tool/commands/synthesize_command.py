@@ -5,13 +5,34 @@ and has been reviewed and tested by a human.
 """
 
 import sys
+from contextlib import nullcontext
 
 import click
 
-from gemini_tts_tool.core.client import AuthenticationError, create_client
-from gemini_tts_tool.core.synthesizer import SynthesisError, read_stdin, synthesize_speech
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.chunker import DEFAULT_MAX_CHUNK_TOKENS, split_text
+from gemini_tts_tool.core.client import AuthenticationError, get_client
+from gemini_tts_tool.core.encoders import get_encoder, save_audio, write_audio_stream
+from gemini_tts_tool.core.estimate import estimate_markup, estimate_speech, format_estimate
+from gemini_tts_tool.core.job import JobSegment, SynthesisJob
+from gemini_tts_tool.core.markup import Pause, compile_markup, synthesize_markup
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.postprocess import NORMALIZE_MODES, PostProcess
+from gemini_tts_tool.core.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from gemini_tts_tool.core.synthesizer import (
+    DEFAULT_MAX_WORKERS,
+    SynthesisError,
+    read_stdin,
+    stream_speech,
+    synthesize_speech,
+)
 from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE
-from gemini_tts_tool.utils import AudioError, expand_path, save_audio_wav
+from gemini_tts_tool.utils import (
+    AudioError,
+    expand_path,
+    validate_output_format,
+    write_wav_stream,
+)
 
 
 @click.command(name="synthesize")
@@ -32,7 +53,7 @@ from gemini_tts_tool.utils import AudioError, expand_path, save_audio_wav
     "--output",
     "-o",
     required=True,
-    help="Output audio file path (required)",
+    help="Output file: .wav, .flac, .ogg, .mp3 or .m4a (required, '-' for WAV on stdout)",
 )
 @click.option(
     "--voice",
@@ -48,6 +69,85 @@ from gemini_tts_tool.utils import AudioError, expand_path, save_audio_wav
     "--style",
     help="Style instructions (e.g., 'Speak cheerfully and energetically')",
 )
+@click.option(
+    "--max-chunk-tokens",
+    type=click.IntRange(1, 8192),
+    default=DEFAULT_MAX_CHUNK_TOKENS,
+    show_default=True,
+    help="Split longer text into chunks of at most this many tokens",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_WORKERS,
+    show_default=True,
+    help="Number of chunks to synthesize concurrently",
+)
+@click.option(
+    "--markup",
+    is_flag=True,
+    help="Interpret [pause 500ms], [voice NAME], [style ...] and [segment] directives",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Write audio progressively as it is generated (lower time-to-first-audio)",
+)
+@click.option(
+    "--work-dir",
+    help="Save each synthesized chunk here; rerunning resumes an interrupted run",
+)
+@click.option(
+    "--normalize",
+    type=click.Choice(NORMALIZE_MODES),
+    help="Normalize the peak level or the loudness (RMS) of the audio (needs numpy)",
+)
+@click.option(
+    "--target-dbfs",
+    type=click.FloatRange(max=0),
+    help="Normalization target in dBFS (default: -1 for peak, -20 for loudness)",
+)
+@click.option(
+    "--trim-silence",
+    is_flag=True,
+    help="Remove leading and trailing silence (needs numpy)",
+)
+@click.option(
+    "--crossfade",
+    type=click.FloatRange(min=0),
+    default=0,
+    metavar="MS",
+    help="Crossfade joins between chunks or segments by MS milliseconds (needs numpy)",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Serve repeated requests from the on-disk audio cache (see: cache info)",
+)
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=DEFAULT_RETRY_POLICY.max_attempts - 1,
+    show_default=True,
+    help="Retry rate-limited and transient API failures this many times",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Report requests, tokens, audio duration and cost without synthesizing",
+)
+@click.option(
+    "--count-tokens",
+    is_flag=True,
+    help="With --dry-run, count input tokens with the API instead of estimating",
+)
+@click.option(
+    "--metrics",
+    "show_metrics",
+    is_flag=True,
+    help="Print a JSON summary of API latency, throughput and retries to stderr",
+)
 @click.option(
     "--verbose",
     "-V",
@@ -64,6 +164,20 @@ def synthesize(
     voice: str,
     model: str,
     style: str | None,
+    max_chunk_tokens: int,
+    workers: int,
+    markup: bool,
+    stream: bool,
+    work_dir: str | None,
+    normalize: str | None,
+    target_dbfs: float | None,
+    trim_silence: bool,
+    crossfade: float,
+    use_cache: bool,
+    max_retries: int,
+    dry_run: bool,
+    count_tokens: bool,
+    show_metrics: bool,
     verbose: bool,
 ) -> None:
     """Synthesize speech from text using Gemini TTS.
@@ -88,17 +202,58 @@ def synthesize(
     \b
         # Using pro model
         gemini-tts-tool synthesize "High quality" -o pro.wav --model pro
+
+    \b
+        # Long text is chunked and synthesized in parallel
+        gemini-tts-tool synthesize --stdin -o chapter.wav --workers 8 < chapter.txt
+
+    \b
+        # Even out a long narration: crossfade chunks, trim, normalize loudness
+        gemini-tts-tool synthesize --stdin -o chapter.mp3 --crossfade 20 \\
+            --trim-silence --normalize loudness < chapter.txt
+
+    \b
+        # Exact pauses and a second voice from markup directives
+        gemini-tts-tool synthesize --markup -o intro.wav \\
+            "Welcome. [pause 800ms] [voice Kore] [style Whisper] Thanks for listening."
+
+    \b
+        # Preview requests, tokens, duration and cost without synthesizing
+        gemini-tts-tool synthesize --stdin -o book.mp3 --dry-run < book.txt
+
+    \b
+        # Resumable audiobook: rerun the same command after an interruption
+        gemini-tts-tool synthesize --stdin -o book.mp3 --work-dir book.work < book.txt
+
+    \b
+        # Report time to first audio, latency and real-time factor
+        gemini-tts-tool synthesize "Hello" -o hello.wav --stream --metrics
+
+    \b
+        # Stream into a player while audio is still being generated
+        gemini-tts-tool synthesize "Hello" -o - --stream | ffplay -nodisp -autoexit -
     """
+    metrics: MetricsRecorder | None = None
     try:
         # Validate output format
-        if not output.lower().endswith(".wav"):
+        to_stdout = output == "-"
+        if not to_stdout:
+            # Fail before any API call if the format can't be written
+            get_encoder(validate_output_format(output))
+        if stream and work_dir:
+            raise ValueError("--stream cannot be combined with --work-dir")
+        postprocess = PostProcess(
+            normalize=normalize,
+            target_dbfs=target_dbfs,
+            trim_silence=trim_silence,
+            crossfade_ms=crossfade,
+        )
+        if markup and (stream or work_dir):
+            raise ValueError("--markup cannot be combined with --stream or --work-dir")
+        if postprocess.enabled and (stream or work_dir):
             raise ValueError(
-                f"Output file must end with .wav extension. Got: {output}\n\n"
-                "What to do:\n"
-                "  Change your output file to have a .wav extension:\n"
-                "  • gemini-tts-tool synthesize 'Hello' -o output.wav\n"
-                "  • gemini-tts-tool synthesize 'Hello' -o ~/audio/greeting.wav\n\n"
-                "Note: Currently only WAV format is supported."
+                "--normalize, --trim-silence and --crossfade need the whole audio; "
+                "they cannot be combined with --stream or --work-dir"
             )
 
         # Determine input source (priority: stdin > input_text > text)
@@ -120,7 +275,7 @@ def synthesize(
             raise ValueError("Input text cannot be empty")
 
         # Expand output path
-        output_path = expand_path(output)
+        output_path = None if to_stdout else expand_path(output)
 
         if verbose:
             click.echo(f"Model: {model}", err=True)
@@ -128,34 +283,152 @@ def synthesize(
             if style:
                 click.echo(f"Style: {style}", err=True)
             click.echo(f"Text length: {len(input_text_final)} characters", err=True)
+            if markup:
+                plan = compile_markup(input_text_final, voice, style)
+                pauses = sum(1 for step in plan if isinstance(step, Pause))
+                click.echo(f"Markup: {len(plan) - pauses} segment(s), {pauses} pause(s)", err=True)
+            else:
+                planned = split_text(input_text_final, max_chunk_tokens)
+                if len(planned) > 1:
+                    click.echo(f"Chunks: {len(planned)} (workers: {workers})", err=True)
+                if len(set(planned)) < len(planned):
+                    saved = len(planned) - len(set(planned))
+                    click.echo(f"Repeated chunks: {saved} (requests saved)", err=True)
 
-        # Create client from context or create new one
+        # Use the client from context or the shared pooled client
         client = ctx.obj.get("client") if ctx.obj else None
+
+        if dry_run:
+            # Plan only; count_tokens requests are not synthesis calls
+            estimate_plan = estimate_markup if markup else estimate_speech
+            estimate = estimate_plan(
+                input_text_final,
+                voice=voice,
+                model=model,
+                system_instruction=style,
+                max_chunk_tokens=max_chunk_tokens,
+                client=(client or get_client()) if count_tokens else None,
+            )
+            click.echo("\n".join(format_estimate(estimate)))
+            return
+
         if not client:
-            client = create_client()
+            client = get_client()
+
+        cache = AudioCache() if use_cache else None
+        retry_policy = RetryPolicy(max_attempts=max_retries + 1)
+        metrics = MetricsRecorder() if show_metrics else None
+        # Time spent writing output files (stdout and streamed writes are not timed)
+        writing = metrics.writing(output_path) if metrics and output_path else nullcontext()
 
         # Synthesize
         if verbose:
             click.echo("Synthesizing speech...", err=True)
 
-        audio_data = synthesize_speech(
-            client=client,
-            text=input_text_final,
-            voice=voice,
-            model=model,
-            system_instruction=style,
-        )
+        if stream:
+            # Write each chunk as soon as it arrives
+            if verbose:
+                click.echo(f"Streaming audio to {output_path or 'stdout'}...", err=True)
 
-        # Save audio
-        if verbose:
-            click.echo(f"Saving audio to {output_path}...", err=True)
+            chunks = stream_speech(
+                client=client,
+                text=input_text_final,
+                voice=voice,
+                model=model,
+                system_instruction=style,
+                max_chunk_tokens=max_chunk_tokens,
+                cache=cache,
+                retry_policy=retry_policy,
+                metrics=metrics,
+            )
+            if output_path and output_path.suffix.lower() != ".wav":
+                written = write_audio_stream(chunks, output_path)
+            else:
+                # WAV grows in place as audio arrives, so a file can be played while written
+                written = write_wav_stream(chunks, output_path)
+            if metrics:
+                metrics.record_write(written)
+        elif work_dir:
+            job = SynthesisJob(
+                expand_path(work_dir),
+                input_text_final,
+                voice=voice,
+                model=model,
+                system_instruction=style,
+                max_chunk_tokens=max_chunk_tokens,
+            )
+            total = len(job.segments)
+            if verbose:
+                done = total - len(job.pending())
+                click.echo(f"Work dir: {job.work_dir} ({done}/{total} chunks done)", err=True)
+
+            def report(segment: JobSegment) -> None:
+                click.echo(f"  Saved chunk {segment.index + 1}/{total}", err=True)
+
+            job.run(
+                client,
+                max_workers=workers,
+                cache=cache,
+                retry_policy=retry_policy,
+                on_segment=report if verbose else None,
+                metrics=metrics,
+            )
+
+            # Assemble from the saved chunks without loading them all
+            if verbose:
+                click.echo(f"Saving audio to {output_path or 'stdout'}...", err=True)
+            if output_path:
+                with writing:
+                    job.save(output_path)
+            else:
+                write_wav_stream(job.iter_audio(), None)
+        else:
+            if markup:
+                audio_data = synthesize_markup(
+                    client=client,
+                    document=input_text_final,
+                    voice=voice,
+                    model=model,
+                    system_instruction=style,
+                    max_chunk_tokens=max_chunk_tokens,
+                    max_workers=workers,
+                    cache=cache,
+                    retry_policy=retry_policy,
+                    metrics=metrics,
+                    postprocess=postprocess,
+                )
+            else:
+                audio_data = synthesize_speech(
+                    client=client,
+                    text=input_text_final,
+                    voice=voice,
+                    model=model,
+                    system_instruction=style,
+                    max_chunk_tokens=max_chunk_tokens,
+                    max_workers=workers,
+                    cache=cache,
+                    retry_policy=retry_policy,
+                    metrics=metrics,
+                    postprocess=postprocess,
+                )
+
+            # Save audio
+            if verbose:
+                click.echo(f"Saving audio to {output_path or 'stdout'}...", err=True)
+
+            if output_path:
+                with writing:
+                    save_audio(audio_data, output_path)
+            else:
+                write_wav_stream([audio_data], None)
 
-        save_audio_wav(audio_data, output_path)
+        if verbose and cache:
+            click.echo(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)", err=True)
 
         # Success message
-        click.echo(f"✓ Speech synthesized successfully: {output_path}", err=True)
+        click.echo(f"✓ Speech synthesized successfully: {output_path or 'stdout'}", err=True)
 
-    except (AuthenticationError, SynthesisError, AudioError, ValueError) as e:
+    except (OSError, AuthenticationError, SynthesisError, AudioError, ValueError) as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
     except Exception as e:
@@ -165,3 +438,7 @@ def synthesize(
 
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Also reported for failed runs, where latency and retries matter most
+        if metrics:
+            click.echo(metrics.to_json(), err=True)
@@ -0,0 +1,239 @@
+"""Watch command implementation.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.client import AuthenticationError, get_client
+from gemini_tts_tool.core.dialogue import DEFAULT_TURN_GAP, parse_speaker_voices
+from gemini_tts_tool.core.encoders import get_encoder
+from gemini_tts_tool.core.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from gemini_tts_tool.core.synthesizer import DEFAULT_MAX_WORKERS
+from gemini_tts_tool.core.voices import DEFAULT_MODEL
+from gemini_tts_tool.core.watch import (
+    DEFAULT_PATTERN,
+    DEFAULT_POLL_INTERVAL,
+    RenderResult,
+    ScriptRenderer,
+    open_watcher,
+    watch_scripts,
+)
+from gemini_tts_tool.utils import AudioError, expand_path
+
+
+@click.command(name="watch")
+@click.argument("directory")
+@click.option(
+    "--pattern",
+    "-p",
+    default=DEFAULT_PATTERN,
+    show_default=True,
+    help="Glob pattern of the dialogue scripts to watch",
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    help="Directory for the audio files (default: next to each script)",
+)
+@click.option(
+    "--format",
+    "audio_format",
+    type=click.Choice(["wav", "flac", "ogg", "mp3", "m4a"]),
+    default="wav",
+    show_default=True,
+    help="Audio format of the rendered scripts",
+)
+@click.option(
+    "--speaker-voice",
+    "speaker_voice_pairs",
+    multiple=True,
+    metavar="NAME=VOICE",
+    help="Voice for a named speaker (repeatable); others get Kore, Puck, Charon, ...",
+)
+@click.option(
+    "--gap",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_TURN_GAP,
+    show_default=True,
+    help="Silence in seconds between turns",
+)
+@click.option(
+    "--model",
+    default=DEFAULT_MODEL,
+    help="TTS model (default: flash). Options: flash, pro, or full model name",
+)
+@click.option(
+    "--style",
+    help="Style instructions, applied to every turn",
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_WORKERS,
+    show_default=True,
+    help="Number of changed turns synthesized concurrently",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Keep turn audio in memory only instead of also in the on-disk cache",
+)
+@click.option(
+    "--max-retries",
+    type=click.IntRange(min=0),
+    default=DEFAULT_RETRY_POLICY.max_attempts - 1,
+    show_default=True,
+    help="Retry rate-limited and transient API failures this many times",
+)
+@click.option(
+    "--poll",
+    is_flag=True,
+    help="Poll for changes instead of using inotify (e.g. on network file systems)",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.1),
+    default=DEFAULT_POLL_INTERVAL,
+    show_default=True,
+    help="Seconds between checks for changes",
+)
+@click.option(
+    "--once",
+    is_flag=True,
+    help="Render every script once and exit instead of watching",
+)
+@click.option(
+    "--verbose",
+    "-V",
+    is_flag=True,
+    help="Show verbose output",
+)
+@click.pass_context
+def watch(
+    ctx: click.Context,
+    directory: str,
+    pattern: str,
+    output_dir: str | None,
+    audio_format: str,
+    speaker_voice_pairs: tuple[str, ...],
+    gap: float,
+    model: str,
+    style: str | None,
+    workers: int,
+    no_cache: bool,
+    max_retries: int,
+    poll: bool,
+    interval: float,
+    once: bool,
+    verbose: bool,
+) -> None:
+    """Re-synthesize dialogue scripts whenever they are saved.
+
+    Every script in DIRECTORY matching --pattern is rendered to audio, then
+    DIRECTORY is watched (inotify on Linux, polling elsewhere). When a
+    script is saved, only its new or edited turns are synthesized; the
+    audio of unchanged turns is reused and the output file is rebuilt.
+
+    Scripts use the multi-voice format ("SpeakerName: text"). Each turn is
+    synthesized with its speaker's voice as a request of its own, so an
+    edit never re-synthesizes its neighbours. Give every speaker a
+    --speaker-voice to keep voices fixed when speakers are added.
+
+    Examples:
+
+    \b
+        # Render episode scripts next to them and re-render on every save
+        gemini-tts-tool watch scripts/
+
+    \b
+        # Fixed voices, MP3 output in another directory
+        gemini-tts-tool watch scripts/ -o audio/ --format mp3 \\
+            --speaker-voice Host=Zephyr --speaker-voice Guest=Aoede
+
+    \b
+        # Render once (e.g. in CI) without watching
+        gemini-tts-tool watch scripts/ --once
+    """
+    failed = 0
+    try:
+        # Fail before any API call if the format can't be written
+        get_encoder(audio_format)
+        speaker_voices = parse_speaker_voices(speaker_voice_pairs)
+        directory_path = expand_path(directory)
+        output_path = expand_path(output_dir) if output_dir else None
+
+        client = ctx.obj.get("client") if ctx.obj else None
+        if not client:
+            client = get_client()
+
+        cache = None if no_cache else AudioCache()
+        renderer = ScriptRenderer(
+            client,
+            speaker_voices=speaker_voices,
+            model=model,
+            system_instruction=style,
+            gap=gap,
+            max_workers=workers,
+            cache=cache,
+            retry_policy=RetryPolicy(max_attempts=max_retries + 1),
+        )
+
+        def on_render(result: RenderResult) -> None:
+            click.echo(
+                f"✓ {result.output}: {result.synthesized} turn(s) synthesized, "
+                f"{result.reused} reused, {result.audio_seconds:.1f}s audio "
+                f"in {result.elapsed_seconds:.1f}s",
+                err=True,
+            )
+
+        def on_error(script: Path, error: Exception) -> None:
+            nonlocal failed
+            failed += 1
+            click.echo(f"✗ {script}: {error}", err=True)
+
+        watcher = None
+        if not once:
+            watcher = open_watcher(directory_path, pattern, polling=poll)
+            click.echo(
+                f"Watching {directory_path}/{pattern} ({watcher.name}, Ctrl+C to stop)", err=True
+            )
+        elif verbose:
+            click.echo(f"Rendering {directory_path}/{pattern}", err=True)
+
+        watch_scripts(
+            renderer,
+            directory_path,
+            pattern=pattern,
+            output_dir=output_path,
+            audio_format=audio_format,
+            watcher=watcher,
+            interval=interval,
+            once=once,
+            on_render=on_render,
+            on_error=on_error,
+        )
+        if verbose and cache:
+            click.echo(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)", err=True)
+
+    except KeyboardInterrupt:
+        pass
+    except (OSError, AuthenticationError, AudioError, ValueError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Unexpected error: {e}", err=True)
+        if verbose:
+            import traceback
+
+            traceback.print_exc()
+        sys.exit(1)
+
+    if once and failed:
+        sys.exit(1)
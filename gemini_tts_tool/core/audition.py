@@ -0,0 +1,208 @@
+"""Voice audition: one text synthesized with many voices at once.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from gemini_tts_tool.core.batch import BatchItem, BatchResult, run_batch
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.retry import RateLimiter, RetryPolicy
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, VOICES, validate_model, validate_voice
+
+if TYPE_CHECKING:
+    from google import genai
+
+# Voices synthesized at the same time
+DEFAULT_AUDITION_CONCURRENCY = 10
+
+# Index written next to the audio files
+INDEX_NAME = "index.json"
+
+
+@dataclass(frozen=True)
+class AuditionResult:
+    """Outcome of synthesizing the text with one voice."""
+
+    voice: str
+    output: str
+    status: str
+    error: str | None = None
+    audio_seconds: float = 0.0
+    # Time to synthesize (or load from the cache) and save this voice
+    latency_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the voice was synthesized successfully."""
+        return self.status == "ok"
+
+
+def select_voices(spec: str = "all") -> list[str]:
+    """Resolve a voice selection to voice names in catalog order.
+
+    The selection is a comma-separated list whose entries are ``all``, a
+    voice name (case-insensitive) or a glob pattern such as ``A*``.
+
+    Args:
+        spec: Voice selection
+
+    Returns:
+        Selected voices without duplicates
+
+    Raises:
+        ValueError: If a name is unknown or a pattern matches no voice
+    """
+    by_name = {voice.lower(): voice for voice in VOICES}
+    selected: set[str] = set()
+    for entry in (part.strip() for part in spec.split(",")):
+        if not entry:
+            continue
+        if entry.lower() == "all":
+            selected.update(VOICES)
+        elif any(char in entry for char in "*?["):
+            matches = [voice for voice in VOICES if fnmatch.fnmatch(voice.lower(), entry.lower())]
+            if not matches:
+                raise ValueError(
+                    f"Voice pattern '{entry}' matches no voice.\n\n"
+                    "What to do:\n"
+                    "  1. View all voices: gemini-tts-tool list-voices\n"
+                    "  2. Use a pattern such as 'A*' or a list such as 'Kore,Puck'"
+                )
+            selected.update(matches)
+        else:
+            selected.add(by_name.get(entry.lower()) or validate_voice(entry))
+
+    if not selected:
+        raise ValueError("No voices selected. Use 'all', a list such as 'Kore,Puck' or 'A*'")
+    return [voice for voice in VOICES if voice in selected]
+
+
+def run_audition(
+    client: genai.Client,
+    text: str,
+    voices: list[str],
+    output_dir: str | Path,
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+    audio_format: str = "wav",
+    concurrency: int = DEFAULT_AUDITION_CONCURRENCY,
+    on_result: Callable[[AuditionResult], None] | None = None,
+    cache: AudioCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    metrics: MetricsRecorder | None = None,
+) -> list[AuditionResult]:
+    """Synthesize one text with every voice concurrently and write an index.
+
+    Each voice is saved as ``<output_dir>/<Voice>.<format>``. The index
+    (index.json) lists every voice with its file, audio duration and
+    latency. With a cache, voices auditioned before are served from disk,
+    so adding a voice to an earlier audition only calls the API for it.
+
+    Args:
+        client: Gemini API client shared by all voices
+        text: Text to synthesize
+        voices: Voice names (see select_voices)
+        output_dir: Directory for the audio files and the index
+        model: TTS model name or alias
+        system_instruction: Optional style instructions
+        audio_format: Output format extension (wav, flac, ogg, mp3 or m4a)
+        concurrency: Maximum number of voices synthesized at the same time
+        on_result: Optional callback invoked as each voice completes
+        cache: Optional audio cache
+        retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+        rate_limiter: Optional requests/tokens per minute limiter shared by all voices
+        metrics: Optional recorder of request latency, throughput and file writes
+
+    Returns:
+        Results in the order of voices
+
+    Raises:
+        ValueError: If the text is empty, a voice or the model is invalid
+    """
+    if not text.strip():
+        raise ValueError("Input text cannot be empty")
+    validate_model(model)
+    for voice in voices:
+        validate_voice(voice)
+
+    output_dir = Path(output_dir)
+    items = [
+        BatchItem(
+            line=i,
+            text=text,
+            output=output_dir / f"{voice}.{audio_format}",
+            voice=voice,
+            model=model,
+            style=system_instruction,
+        )
+        for i, voice in enumerate(voices, 1)
+    ]
+
+    def report(result: BatchResult) -> None:
+        if on_result:
+            on_result(_audition_result(voices[result.line - 1], result))
+
+    batch_results = run_batch(
+        client,
+        items,
+        concurrency=concurrency,
+        on_result=report,
+        cache=cache,
+        retry_policy=retry_policy,
+        rate_limiter=rate_limiter,
+        metrics=metrics,
+    )
+    results = [
+        _audition_result(voice, result) for voice, result in zip(voices, batch_results, strict=True)
+    ]
+    write_index(results, output_dir / INDEX_NAME, text, model, system_instruction)
+    return results
+
+
+def write_index(
+    results: list[AuditionResult],
+    index_path: str | Path,
+    text: str,
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+) -> None:
+    """Write the audition index as JSON.
+
+    Args:
+        results: Audition results to list
+        index_path: Path of the index file
+        text: Auditioned text
+        model: TTS model name or alias
+        system_instruction: Style instructions, if any
+    """
+    document = {
+        "text": text,
+        "model": validate_model(model),
+        "style": system_instruction,
+        "voices": [asdict(result) for result in results],
+    }
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def _audition_result(voice: str, result: BatchResult) -> AuditionResult:
+    return AuditionResult(
+        voice=voice,
+        output=result.output,
+        status=result.status,
+        error=result.error,
+        audio_seconds=result.audio_seconds,
+        latency_seconds=result.elapsed_seconds,
+    )
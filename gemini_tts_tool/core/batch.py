@@ -0,0 +1,409 @@
+"""Batch synthesis driven by a JSONL or CSV manifest.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from gemini_tts_tool.core.cache import AudioCache, cache_key
+from gemini_tts_tool.core.encode_pool import EncodePool, EncodeResult, encode_audio
+from gemini_tts_tool.core.estimate import Estimate, combine_estimates, estimate_speech
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.postprocess import PostProcess, require_numpy
+from gemini_tts_tool.core.retry import RateLimiter, RetryPolicy
+from gemini_tts_tool.core.synthesizer import SynthesisError, synthesize_speech
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE
+from gemini_tts_tool.utils import AudioError
+
+if TYPE_CHECKING:
+    from google import genai
+
+# Default number of manifest rows synthesized concurrently
+DEFAULT_CONCURRENCY = 4
+
+MANIFEST_FIELDS = ("text", "voice", "model", "style", "output")
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """A single manifest row."""
+
+    line: int
+    text: str
+    output: Path
+    voice: str = DEFAULT_VOICE
+    model: str = DEFAULT_MODEL
+    style: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of synthesizing a single manifest row."""
+
+    line: int
+    output: str
+    status: str
+    error: str | None = None
+    audio_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    # Audio reused from an identical row instead of a request of its own
+    shared: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether the row was synthesized successfully."""
+        return self.status == "ok"
+
+
+def read_manifest(
+    manifest_path: str | Path, output_dir: str | Path | None = None
+) -> list[BatchItem]:
+    """Read a batch manifest.
+
+    The format is chosen by extension: ``.jsonl`` (one JSON object per line) or
+    ``.csv`` (with a header row). Each row needs ``text`` and ``output`` and may
+    set ``voice``, ``model`` and ``style``. Relative output paths are resolved
+    against output_dir, which defaults to the manifest's directory.
+
+    Args:
+        manifest_path: Path to the manifest file
+        output_dir: Base directory for relative output paths
+
+    Returns:
+        Manifest rows in file order
+
+    Raises:
+        FileNotFoundError: If the manifest doesn't exist
+        ValueError: If the manifest format or a row is invalid
+    """
+    manifest_path = Path(manifest_path)
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"File not found: {manifest_path}")
+
+    base_dir = Path(output_dir) if output_dir else manifest_path.parent
+    suffix = manifest_path.suffix.lower()
+
+    with manifest_path.open(encoding="utf-8", newline="") as f:
+        if suffix == ".jsonl":
+            rows = list(_read_jsonl(f))
+        elif suffix == ".csv":
+            # Line 1 is the header
+            rows = [(i, row) for i, row in enumerate(csv.DictReader(f), 2)]
+        else:
+            raise ValueError(
+                f"Unsupported manifest format '{suffix}'. Use a .jsonl or .csv file.\n\n"
+                "What to do:\n"
+                "  Create a manifest with one row per output file, for example (prompts.jsonl):\n"
+                '    {"text": "Welcome!", "voice": "Kore", "output": "welcome.wav"}\n'
+                '    {"text": "Goodbye!", "style": "Speak warmly", "output": "bye.wav"}'
+            )
+
+    return [_parse_row(line, row, base_dir) for line, row in rows]
+
+
+def _read_jsonl(lines: Iterable[str]) -> Iterable[tuple[int, dict[str, object]]]:
+    """Yield (line number, object) pairs from JSONL content, skipping blank lines."""
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Manifest line {line_number}: invalid JSON: {e}") from e
+        if not isinstance(row, dict):
+            raise ValueError(f"Manifest line {line_number}: expected a JSON object")
+        yield line_number, row
+
+
+def _parse_row(line: int, row: dict[str, object], base_dir: Path) -> BatchItem:
+    """Convert a raw manifest row into a BatchItem."""
+    values = {key: str(value).strip() for key, value in row.items() if value not in (None, "")}
+
+    missing = [field for field in ("text", "output") if not values.get(field)]
+    if missing:
+        raise ValueError(
+            f"Manifest line {line}: missing required field(s): {', '.join(missing)}\n\n"
+            f"Supported fields: {', '.join(MANIFEST_FIELDS)} (text and output are required)"
+        )
+
+    output = Path(values["output"]).expanduser()
+    if not output.is_absolute():
+        output = base_dir / output
+
+    return BatchItem(
+        line=line,
+        text=values["text"],
+        output=output,
+        voice=values.get("voice", DEFAULT_VOICE),
+        model=values.get("model", DEFAULT_MODEL),
+        style=values.get("style"),
+    )
+
+
+def run_batch(
+    client: genai.Client,
+    items: list[BatchItem],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_result: Callable[[BatchResult], None] | None = None,
+    cache: AudioCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    metrics: MetricsRecorder | None = None,
+    postprocess: PostProcess | None = None,
+    encode_workers: int = 0,
+) -> list[BatchResult]:
+    """Synthesize manifest rows concurrently with a shared client.
+
+    A failing row is recorded in its result and does not stop the batch.
+    Rows with identical text, voice, model and style are synthesized once
+    and the audio is saved to each of their outputs.
+    Transient API failures are retried per request, and a shared rate limiter
+    keeps the whole batch within the account's quota.
+
+    With encode_workers, post-processing and encoding run in an EncodePool
+    of worker processes while the threads go on synthesizing; a thread
+    waits before handing over more audio when all encoders are busy.
+
+    Args:
+        client: Gemini API client shared by all rows
+        items: Manifest rows to synthesize
+        concurrency: Maximum number of rows synthesized at the same time
+        on_result: Optional callback invoked as each row completes
+        cache: Optional audio cache shared by all rows
+        retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+        rate_limiter: Optional requests/tokens per minute limiter shared by all rows
+        metrics: Optional recorder of request latency, throughput and file writes
+        postprocess: Optional processing applied to each row's audio before saving
+        encode_workers: Worker processes for post-processing and encoding
+            (0: on the synthesis threads)
+
+    Returns:
+        Results in manifest order
+
+    Raises:
+        ValueError: If concurrency is less than 1 or encode_workers is negative
+        AudioError: If post-processing is requested without NumPy installed
+    """
+    if concurrency < 1:
+        raise ValueError(f"Concurrency must be at least 1. Got: {concurrency}")
+    if encode_workers < 0:
+        raise ValueError(f"encode_workers must be at least 0. Got: {encode_workers}")
+    if postprocess and postprocess.enabled:
+        require_numpy()
+
+    positions = {id(item): i for i, item in enumerate(items)}
+    groups = group_items(items)
+    if metrics and len(groups) < len(items):
+        metrics.record_saved(len(items) - len(groups))
+
+    results: list[BatchResult | None] = [None] * len(items)
+    pool = EncodePool(encode_workers) if encode_workers else None
+    with ThreadPoolExecutor(max_workers=concurrency) as executor, pool or nullcontext():
+        # Synthesis futures, and encoding futures once their audio is handed over
+        pending: set[Future[Any]] = {
+            executor.submit(
+                _run_group,
+                client,
+                group,
+                cache,
+                retry_policy,
+                rate_limiter,
+                metrics,
+                postprocess,
+                pool,
+            )
+            for group in groups
+        }
+        saves: dict[Future[Any], _PendingSave] = {}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in saves:
+                    group_results = _collect_save(saves.pop(future), metrics)
+                else:
+                    outcome = future.result()
+                    if isinstance(outcome, _PendingSave):
+                        saves[outcome.future] = outcome
+                        pending.add(outcome.future)
+                        continue
+                    group_results = outcome
+                for item, result in group_results:
+                    results[positions[id(item)]] = result
+                    if on_result:
+                        on_result(result)
+
+    return [result for result in results if result is not None]
+
+
+def group_items(items: list[BatchItem]) -> list[list[BatchItem]]:
+    """Group rows that would produce identical audio.
+
+    Rows match when their text (ignoring whitespace), voice, model and style
+    are the same. Each group needs a single synthesis request.
+
+    Args:
+        items: Manifest rows
+
+    Returns:
+        Groups in order of their first row
+    """
+    groups: dict[str, list[BatchItem]] = {}
+    for item in items:
+        key = cache_key(item.text, item.voice, item.model, item.style)
+        groups.setdefault(key, []).append(item)
+    return list(groups.values())
+
+
+def estimate_batch(items: list[BatchItem], client: genai.Client | None = None) -> Estimate:
+    """Estimate a batch without synthesizing anything.
+
+    Identical rows are estimated as one request whose audio the others reuse.
+
+    Args:
+        items: Manifest rows
+        client: Optional client used to count input tokens with the API
+
+    Returns:
+        Per-request and total estimates
+    """
+    estimates = []
+    for group in group_items(items):
+        first = group[0]
+        estimate = estimate_speech(
+            first.text,
+            voice=first.voice,
+            model=first.model,
+            system_instruction=first.style,
+            client=client,
+        )
+        copies = (*estimate.requests, *estimate.reused) * (len(group) - 1)
+        estimates.append(replace(estimate, reused=estimate.reused + copies))
+    return combine_estimates(estimates)
+
+
+@dataclass(frozen=True)
+class _PendingSave:
+    """A group whose audio was handed to the encode pool."""
+
+    group: list[BatchItem]
+    start: float
+    future: Future[EncodeResult]
+
+
+def _run_group(
+    client: genai.Client,
+    group: list[BatchItem],
+    cache: AudioCache | None,
+    retry_policy: RetryPolicy | None,
+    rate_limiter: RateLimiter | None,
+    metrics: MetricsRecorder | None = None,
+    postprocess: PostProcess | None = None,
+    pool: EncodePool | None = None,
+) -> list[tuple[BatchItem, BatchResult]] | _PendingSave:
+    """Synthesize a group of identical rows once and save the audio for each row.
+
+    With a pool, the audio is handed to it and the save is returned pending.
+    """
+    start = time.perf_counter()
+    first = group[0]
+    try:
+        # Rows are the unit of concurrency, so chunks of a long row run serially
+        audio_data = synthesize_speech(
+            client=client,
+            text=first.text,
+            voice=first.voice,
+            model=first.model,
+            system_instruction=first.style,
+            max_workers=1,
+            cache=cache,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+        )
+    except (SynthesisError, ValueError) as e:
+        return [(item, _failed(item, e, start)) for item in group]
+
+    outputs = [item.output for item in group]
+    if pool:
+        try:
+            # Blocks while the encoders are behind, which holds back synthesis
+            return _PendingSave(group, start, pool.submit(audio_data, outputs, postprocess))
+        except (OSError, RuntimeError) as e:
+            return [(item, _failed(item, e, start)) for item in group]
+
+    try:
+        encoded = encode_audio(audio_data, outputs, postprocess)
+    except (AudioError, ValueError, OSError, RuntimeError) as e:
+        # An encoder failing in an unexpected way only fails this group's rows
+        return [(item, _failed(item, e, start)) for item in group]
+    if metrics:
+        metrics.record_write(encoded.bytes_written, encoded.write_seconds)
+    return _saved(group, start, encoded)
+
+
+def _collect_save(
+    save: _PendingSave, metrics: MetricsRecorder | None
+) -> list[tuple[BatchItem, BatchResult]]:
+    """Turn a finished encode pool job into the group's results."""
+    try:
+        encoded = save.future.result()
+    except (AudioError, ValueError, OSError, RuntimeError) as e:
+        # RuntimeError covers a worker process that died (BrokenProcessPool)
+        return [(item, _failed(item, e, save.start)) for item in save.group]
+    if metrics:
+        metrics.record_write(encoded.bytes_written, encoded.write_seconds)
+    return _saved(save.group, save.start, encoded)
+
+
+def _saved(
+    group: list[BatchItem], start: float, encoded: EncodeResult
+) -> list[tuple[BatchItem, BatchResult]]:
+    elapsed = round(time.perf_counter() - start, 3)
+    results = []
+    for i, (item, error) in enumerate(zip(group, encoded.errors, strict=True)):
+        result = BatchResult(
+            line=item.line,
+            output=str(item.output),
+            status="error" if error else "ok",
+            error=error,
+            audio_seconds=0.0 if error else encoded.audio_seconds,
+            elapsed_seconds=elapsed,
+            shared=i > 0 and not error,
+        )
+        results.append((item, result))
+    return results
+
+
+def _failed(item: BatchItem, error: Exception, start: float) -> BatchResult:
+    return BatchResult(
+        line=item.line,
+        output=str(item.output),
+        status="error",
+        error=str(error).split("\n", 1)[0],
+        elapsed_seconds=round(time.perf_counter() - start, 3),
+    )
+
+
+def write_report(results: list[BatchResult], report_path: str | Path) -> None:
+    """Write batch results as JSONL, one object per manifest row.
+
+    Args:
+        results: Batch results to write
+        report_path: Path of the report file
+    """
+    report_path = Path(report_path)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with report_path.open("w", encoding="utf-8") as f:
+        for result in results:
+            f.write(json.dumps(asdict(result)) + "\n")
@@ -0,0 +1,243 @@
+"""Content-addressed on-disk cache for synthesized audio.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+# Bump when the key derivation changes so stale entries are never served
+CACHE_KEY_VERSION = 1
+
+# Default cache size limit (1 GiB ≈ 6 hours of 24kHz 16-bit PCM)
+DEFAULT_MAX_CACHE_BYTES = 1024**3
+
+_SIZE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?i?B?)?\s*$", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A single cached audio file."""
+
+    key: str
+    path: Path
+    size: int
+    last_used: float
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Cache contents and hit/miss counters."""
+
+    directory: Path
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory.
+
+    Uses GEMINI_TTS_CACHE_DIR if set, otherwise $XDG_CACHE_HOME/gemini-tts-tool
+    (default: ~/.cache/gemini-tts-tool).
+    """
+    override = os.getenv("GEMINI_TTS_CACHE_DIR")
+    if override:
+        return Path(os.path.expanduser(override))
+    base = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "gemini-tts-tool"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache lookups.
+
+    Collapses runs of spaces and tabs, strips each line and collapses blank
+    lines, so whitespace-only edits map to the same cache entry while line
+    structure (which matters for dialogue) is preserved.
+    """
+    lines = [" ".join(line.split()) for line in text.strip().splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines))
+
+
+def cache_key(text: str, voice: str, model: str, system_instruction: str | None = None) -> str:
+    """Compute the cache key for a synthesis request.
+
+    Args:
+        text: Text or dialogue to synthesize
+        voice: Voice name, or speaker-to-voice mapping for multi-voice requests
+        model: Resolved model name (from validate_model)
+        system_instruction: Optional style instructions
+
+    Returns:
+        Hex SHA-256 digest identifying the audio
+    """
+    payload = json.dumps(
+        [CACHE_KEY_VERSION, normalize_text(text), voice, model, system_instruction or ""],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def parse_size(size: str) -> int:
+    """Parse a human-readable size such as '500MB', '2G' or '1048576'.
+
+    Units are binary (1 KB = 1024 bytes).
+
+    Raises:
+        ValueError: If the size cannot be parsed
+    """
+    match = _SIZE_RE.match(size)
+    if not match:
+        raise ValueError(f"Invalid size '{size}'. Use a number with an optional unit: 500MB, 2GB")
+    unit = (match.group(2) or "").upper()[:1]
+    return int(float(match.group(1)) * _SIZE_UNITS[unit])
+
+
+def format_size(num_bytes: int) -> str:
+    """Format a byte count for display (e.g. '1.5 MB')."""
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    size = num_bytes / 1024
+    for unit in ("KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class AudioCache:
+    """Size-bounded, least-recently-used cache of raw PCM audio on disk.
+
+    Entries are stored as ``<directory>/<key[:2]>/<key>.pcm``. Reads refresh the
+    file's modification time, which is used as the LRU timestamp, so the
+    cache stays consistent across processes sharing the directory.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (default: default_cache_dir())
+            max_bytes: Size limit; least recently used entries are evicted beyond it
+        """
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pcm"
+
+    def get(self, key: str) -> bytes | None:
+        """Return cached audio for a key, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, audio_data: bytes) -> None:
+        """Store audio for a key, evicting old entries if the cache is full.
+
+        Writes are atomic, so concurrent readers never see partial files.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(audio_data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(entry.size for entry in self.entries())
+            else:
+                self._total_bytes += len(audio_data)
+            over_limit = self._total_bytes > self.max_bytes
+
+        if over_limit:
+            self.prune()
+
+    def entries(self) -> list[CacheEntry]:
+        """List cache entries, least recently used first."""
+        entries = []
+        for path in self.directory.glob("*/*.pcm"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append(CacheEntry(path.stem, path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry.last_used)
+
+    def stats(self) -> CacheStats:
+        """Return current cache contents and this instance's hit/miss counters."""
+        entries = self.entries()
+        return CacheStats(
+            directory=self.directory,
+            entries=len(entries),
+            total_bytes=sum(entry.size for entry in entries),
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+    def prune(self, max_bytes: int | None = None, older_than: float | None = None) -> int:
+        """Evict least recently used entries.
+
+        Args:
+            max_bytes: Target size (default: the cache's max_bytes)
+            older_than: Also evict entries not used for this many seconds
+
+        Returns:
+            Number of entries removed
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        cutoff = time.time() - older_than if older_than is not None else None
+        entries = self.entries()
+        total = sum(entry.size for entry in entries)
+        removed = 0
+
+        for entry in entries:
+            expired = cutoff is not None and entry.last_used < cutoff
+            if total <= limit and not expired:
+                continue
+            try:
+                entry.path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= entry.size
+            removed += 1
+
+        with self._lock:
+            self._total_bytes = total
+        return removed
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of entries removed
+        """
+        return self.prune(max_bytes=0)
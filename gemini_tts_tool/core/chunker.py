@@ -0,0 +1,121 @@
+"""Text chunking for long-form TTS synthesis.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import math
+import re
+
+# Gemini TTS input limit (see references/token-and-text-limits.md)
+MAX_INPUT_TOKENS = 8192
+
+# Standard Gemini conversion rate: 1 token ≈ 4 characters
+CHARS_PER_TOKEN = 4
+
+# Default chunk budget. The 16,384 token audio output limit (~8.5 minutes) is
+# reached long before the input limit, so chunks are kept well below it.
+DEFAULT_MAX_CHUNK_TOKENS = 1000
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?…])\s+|(?<=[.!?…][\"'”’)\]])\s+")
+_CLAUSE_RE = re.compile(r"(?<=[,;:—])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of input tokens for a text.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count (4 characters per token, rounded up)
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def split_text(text: str, max_tokens: int = DEFAULT_MAX_CHUNK_TOKENS) -> list[str]:
+    """Split text into chunks that fit within a token budget.
+
+    Chunks are packed greedily from paragraphs and sentences so that each
+    chunk ends on a natural boundary. Sentences that exceed the budget on their
+    own are split at clause boundaries, then at word boundaries.
+
+    Args:
+        text: Text to split
+        max_tokens: Maximum estimated tokens per chunk
+
+    Returns:
+        List of chunks in document order (empty if text is blank)
+
+    Raises:
+        ValueError: If max_tokens is out of range
+    """
+    if max_tokens < 1 or max_tokens > MAX_INPUT_TOKENS:
+        raise ValueError(
+            f"Chunk token budget must be between 1 and {MAX_INPUT_TOKENS}. Got: {max_tokens}"
+        )
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    chunks: list[str] = []
+    current = ""
+
+    for paragraph in _PARAGRAPH_RE.split(text.strip()):
+        paragraph = " ".join(paragraph.split())
+        if not paragraph:
+            continue
+
+        separator = "\n\n"
+        for piece in _split_to_fit(paragraph, max_chars):
+            candidate = f"{current}{separator}{piece}" if current else piece
+            if len(candidate) <= max_chars:
+                current = candidate
+            else:
+                chunks.append(current)
+                current = piece
+            separator = " "
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def _split_to_fit(text: str, max_chars: int) -> list[str]:
+    """Break a paragraph into sentence-level pieces of at most max_chars."""
+    if len(text) <= max_chars:
+        return [text]
+
+    pieces: list[str] = []
+    for sentence in _SENTENCE_RE.split(text):
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        for clause in _CLAUSE_RE.split(sentence):
+            if len(clause) <= max_chars:
+                pieces.append(clause)
+            else:
+                pieces.extend(_split_words(clause, max_chars))
+    return pieces
+
+
+def _split_words(text: str, max_chars: int) -> list[str]:
+    """Split text at word boundaries, hard-splitting words longer than max_chars."""
+    pieces: list[str] = []
+    current = ""
+    for word in text.split(" "):
+        while len(word) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        candidate = f"{current} {word}" if current else word
+        if len(candidate) <= max_chars:
+            current = candidate
+        else:
+            pieces.append(current)
+            current = word
+    if current:
+        pieces.append(current)
+    return pieces
@@ -4,9 +4,26 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+from __future__ import annotations
+
 import os
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from gemini_tts_tool.lazy import LazyModule
 
-from google import genai
+if TYPE_CHECKING:
+    import httpx
+    from google import genai
+    from google.genai import types
+
+    from gemini_tts_tool.core.pool import ClientPool
+else:
+    # The SDK is slow to import; load it when the first client is created
+    genai = LazyModule("google.genai")
+    types = LazyModule("google.genai.types")
+    httpx = LazyModule("httpx")
 
 
 class GeminiClientError(Exception):
@@ -21,15 +38,38 @@ class AuthenticationError(GeminiClientError):
     pass
 
 
-def create_client(
+# Connection pool shared by all requests of a pooled client
+POOL_MAX_CONNECTIONS = 64
+POOL_MAX_KEEPALIVE = 32
+POOL_KEEPALIVE_EXPIRY = 60.0
+
+
+@dataclass(frozen=True)
+class ClientConfig:
+    """Resolved authentication settings; identifies a pooled client."""
+
+    api_key: str | None = None
+    project: str | None = None
+    location: str | None = None
+
+    @property
+    def vertexai(self) -> bool:
+        """Whether the configuration targets Vertex AI."""
+        return self.project is not None
+
+
+_clients: dict[ClientConfig, genai.Client] = {}
+_pools: dict[tuple[ClientConfig, ...], ClientPool] = {}
+_clients_lock = threading.Lock()
+
+
+def resolve_client_config(
     api_key: str | None = None,
     use_vertex: bool = False,
     project: str | None = None,
     location: str | None = None,
-) -> genai.Client:
-    """Create and configure a Gemini client for TTS operations.
-
-    Supports both Gemini Developer API and Vertex AI authentication.
+) -> ClientConfig:
+    """Resolve authentication settings from parameters and environment.
 
     Args:
         api_key: API key for Gemini Developer API (optional, reads from env)
@@ -38,7 +78,7 @@ def create_client(
         location: Google Cloud location (required for Vertex AI)
 
     Returns:
-        Configured Gemini client
+        Resolved client configuration
 
     Raises:
         AuthenticationError: If authentication configuration is invalid
@@ -61,10 +101,7 @@ def create_client(
             raise AuthenticationError(
                 "GOOGLE_CLOUD_LOCATION environment variable or --location is required for Vertex AI"
             )
-        try:
-            return genai.Client(vertexai=True, project=project, location=location)
-        except Exception as e:
-            raise AuthenticationError(f"Failed to create Vertex AI client: {e}") from e
+        return ClientConfig(project=project, location=location)
 
     # Gemini Developer API configuration
     # Priority: 1. Explicit api_key param, 2. GOOGLE_API_KEY, 3. GEMINI_API_KEY
@@ -78,8 +115,179 @@ def create_client(
             "Get your API key from https://aistudio.google.com/app/apikey"
         )
 
+    return ClientConfig(api_key=api_key)
+
+
+def resolve_client_configs(
+    api_key: str | None = None,
+    use_vertex: bool = False,
+    project: str | None = None,
+    location: str | None = None,
+) -> list[ClientConfig]:
+    """Resolve every backend to spread requests across.
+
+    Explicit parameters select a single backend. Otherwise GEMINI_API_KEYS
+    (comma-separated API keys) and GEMINI_VERTEX_BACKENDS (comma-separated
+    project/location pairs) configure a pool; without them the single
+    backend of resolve_client_config is used.
+
+    Args:
+        api_key: API key for Gemini Developer API (optional, reads from env)
+        use_vertex: Whether to use Vertex AI instead of Developer API
+        project: Google Cloud project ID (required for Vertex AI)
+        location: Google Cloud location (required for Vertex AI)
+
+    Returns:
+        One configuration per backend, without duplicates
+
+    Raises:
+        AuthenticationError: If authentication configuration is invalid
+    """
+    if api_key or use_vertex or project or location:
+        return [resolve_client_config(api_key, use_vertex, project, location)]
+
+    configs = [ClientConfig(api_key=key) for key in _env_list("GEMINI_API_KEYS")]
+    for backend in _env_list("GEMINI_VERTEX_BACKENDS"):
+        backend_project, _, backend_location = backend.partition("/")
+        if not backend_project or not backend_location:
+            raise AuthenticationError(
+                f"Invalid GEMINI_VERTEX_BACKENDS entry: {backend!r}. "
+                "Use comma-separated project/location pairs, "
+                "e.g. 'project-a/us-central1,project-b/europe-west4'"
+            )
+        configs.append(ClientConfig(project=backend_project, location=backend_location))
+
+    return list(dict.fromkeys(configs)) or [resolve_client_config()]
+
+
+def create_client(
+    api_key: str | None = None,
+    use_vertex: bool = False,
+    project: str | None = None,
+    location: str | None = None,
+) -> genai.Client:
+    """Create and configure a Gemini client for TTS operations.
+
+    Supports both Gemini Developer API and Vertex AI authentication. Every call
+    builds a new client with its own connections; use get_client to share one.
+    When several backends are configured (see resolve_client_configs) the
+    result is a ClientPool that balances requests across them.
+
+    Args:
+        api_key: API key for Gemini Developer API (optional, reads from env)
+        use_vertex: Whether to use Vertex AI instead of Developer API
+        project: Google Cloud project ID (required for Vertex AI)
+        location: Google Cloud location (required for Vertex AI)
+
+    Returns:
+        Configured Gemini client
+
+    Raises:
+        AuthenticationError: If authentication configuration is invalid
+    """
+    configs = resolve_client_configs(api_key, use_vertex, project, location)
+    if len(configs) == 1:
+        return _build_client(configs[0])
+
+    from gemini_tts_tool.core.pool import ClientPool
+
+    # The pool offers the models and aio.models methods the synthesizer uses
+    return cast("genai.Client", ClientPool({config: _build_client(config) for config in configs}))
+
+
+def get_client(
+    api_key: str | None = None,
+    use_vertex: bool = False,
+    project: str | None = None,
+    location: str | None = None,
+) -> genai.Client:
+    """Return the process-wide Gemini client for the resolved authentication.
+
+    Clients are cached per configuration (API key, or Vertex project and
+    location) and keep a pool of keep-alive connections, so repeated and
+    concurrent calls reuse TLS connections instead of opening new ones.
+    Several configured backends share one ClientPool. Thread-safe.
+
+    Args:
+        api_key: API key for Gemini Developer API (optional, reads from env)
+        use_vertex: Whether to use Vertex AI instead of Developer API
+        project: Google Cloud project ID (required for Vertex AI)
+        location: Google Cloud location (required for Vertex AI)
+
+    Returns:
+        Shared Gemini client
+
+    Raises:
+        AuthenticationError: If authentication configuration is invalid
+    """
+    configs = resolve_client_configs(api_key, use_vertex, project, location)
+    with _clients_lock:
+        if len(configs) == 1:
+            return _shared_client(configs[0])
+
+        key = tuple(configs)
+        pool = _pools.get(key)
+        if pool is None:
+            from gemini_tts_tool.core.pool import ClientPool
+
+            pool = ClientPool({config: _shared_client(config) for config in configs})
+            _pools[key] = pool
+        return cast("genai.Client", pool)
+
+
+def close_clients() -> None:
+    """Close and forget all pooled clients (e.g. on shutdown or in tests)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        _pools.clear()
+
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+def _shared_client(config: ClientConfig) -> genai.Client:
+    """Return the pooled client for a configuration; the caller holds _clients_lock."""
+    client = _clients.get(config)
+    if client is None:
+        client = _build_client(config, _pooled_http_options())
+        _clients[config] = client
+    return client
+
+
+def _env_list(name: str) -> list[str]:
+    """Comma-separated values of an environment variable."""
+    return [value.strip() for value in os.getenv(name, "").split(",") if value.strip()]
+
+
+def _pooled_http_options() -> types.HttpOptions:
+    """HTTP options for a larger, longer-lived connection pool than httpx defaults."""
+    limits = httpx.Limits(
+        max_connections=POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=POOL_MAX_KEEPALIVE,
+        keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+    )
+    return types.HttpOptions(client_args={"limits": limits}, async_client_args={"limits": limits})
+
+
+def _build_client(
+    config: ClientConfig, http_options: types.HttpOptions | None = None
+) -> genai.Client:
+    """Instantiate a Gemini client for a resolved configuration."""
+    kwargs: dict[str, Any] = {"http_options": http_options} if http_options else {}
+    if config.vertexai:
+        try:
+            return genai.Client(
+                vertexai=True, project=config.project, location=config.location, **kwargs
+            )
+        except Exception as e:
+            raise AuthenticationError(f"Failed to create Vertex AI client: {e}") from e
+
     try:
-        return genai.Client(api_key=api_key)
+        return genai.Client(api_key=config.api_key, **kwargs)
     except Exception as e:
         raise AuthenticationError(f"Failed to create Gemini client: {e}") from e
 
@@ -88,10 +296,16 @@ def validate_client(client: genai.Client) -> None:
     """Validate that the client is properly configured.
 
     Args:
-        client: Gemini client to validate
+        client: Gemini client, or a ClientPool of them, to validate
 
     Raises:
         GeminiClientError: If client validation fails
     """
+    from gemini_tts_tool.core.pool import ClientPool
+
+    if isinstance(client, ClientPool):
+        for backend in client.backends:
+            validate_client(backend.client)
+        return
     if not isinstance(client, genai.Client):
         raise GeminiClientError(f"Invalid client type: {type(client)}")
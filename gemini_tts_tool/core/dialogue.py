@@ -0,0 +1,325 @@
+"""Dialogue synthesis for any number of speakers.
+
+The API's multi-speaker mode accepts at most two voices per request. Longer
+casts are handled by splitting the script into consecutive segments with at
+most two speakers each, synthesizing the segments in parallel and joining
+the audio in script order.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.chunker import DEFAULT_MAX_CHUNK_TOKENS, estimate_tokens
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.postprocess import PostProcess, process_audio, require_numpy
+from gemini_tts_tool.core.retry import RateLimiter, RetryPolicy
+from gemini_tts_tool.core.synthesizer import (
+    DEFAULT_MAX_WORKERS,
+    SynthesisError,
+    plan_multi_voice,
+    synthesize_multi_voice,
+    synthesize_speech,
+)
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, VOICES, validate_voice
+from gemini_tts_tool.utils import silence
+
+if TYPE_CHECKING:
+    from google import genai
+
+# Speakers allowed in a single API request
+MAX_SPEAKERS_PER_REQUEST = 2
+
+# Silence inserted between segments, in seconds
+DEFAULT_TURN_GAP = 0.3
+
+# Voices assigned, in order, to speakers without an explicit voice
+DEFAULT_SPEAKER_VOICES = ("Kore", "Puck", "Charon", "Aoede", "Fenrir", "Leda")
+
+
+@dataclass(frozen=True)
+class Turn:
+    """A single speaker turn of a dialogue script."""
+
+    speaker: str
+    text: str
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Consecutive turns synthesized in one API request."""
+
+    turns: tuple[Turn, ...]
+
+    @property
+    def speakers(self) -> tuple[str, ...]:
+        """Distinct speakers in order of first appearance."""
+        return tuple(dict.fromkeys(turn.speaker for turn in self.turns))
+
+    @property
+    def text(self) -> str:
+        """Request text: plain text for one speaker, labeled lines for two."""
+        if len(self.speakers) == 1:
+            return "\n".join(turn.text for turn in self.turns)
+        return "\n".join(f"{turn.speaker}: {turn.text}" for turn in self.turns)
+
+
+def detect_speakers(dialogue: str) -> list[str]:
+    """Return the speaker labels of a dialogue in order of first appearance."""
+    labels = (line.partition(":") for line in dialogue.splitlines())
+    return list(
+        dict.fromkeys(
+            label.strip() for label, separator, _ in labels if separator and label.strip()
+        )
+    )
+
+
+def parse_dialogue(dialogue: str) -> list[Turn]:
+    """Parse a dialogue script into speaker turns.
+
+    Each turn starts with a "SpeakerName: text" line. Lines without a label
+    continue the previous turn.
+
+    Args:
+        dialogue: Dialogue text with speaker labels
+
+    Returns:
+        Turns in script order
+
+    Raises:
+        ValueError: If the script is empty or starts without a speaker label
+    """
+    turns: list[Turn] = []
+    for line in (line.strip() for line in dialogue.splitlines()):
+        if not line:
+            continue
+        speaker, separator, text = line.partition(":")
+        if separator and speaker.strip():
+            turns.append(Turn(speaker.strip(), text.strip()))
+        elif turns:
+            turns[-1] = Turn(turns[-1].speaker, f"{turns[-1].text} {line}".strip())
+        else:
+            raise ValueError(
+                f"Dialogue must start with a speaker label. Got: {line[:60]}\n\n"
+                "What to do:\n"
+                "  Start each turn with 'SpeakerName:' followed by the text, for example:\n"
+                "    Host: Welcome to today's show!\n"
+                "    Guest: Thanks for having me!"
+            )
+
+    turns = [turn for turn in turns if turn.text]
+    if not turns:
+        raise ValueError("Dialogue cannot be empty.")
+    return turns
+
+
+def group_turns(turns: list[Turn], max_tokens: int = DEFAULT_MAX_CHUNK_TOKENS) -> list[Segment]:
+    """Group consecutive turns into API-legal segments.
+
+    Each segment has at most MAX_SPEAKERS_PER_REQUEST speakers and, unless a
+    single turn is longer, at most max_tokens estimated input tokens.
+    Segments are extended greedily, which yields the fewest requests.
+
+    Args:
+        turns: Turns in script order
+        max_tokens: Maximum estimated input tokens per segment
+
+    Returns:
+        Segments in script order
+    """
+    segments: list[Segment] = []
+    current: list[Turn] = []
+    speakers: set[str] = set()
+    tokens = 0
+
+    for turn in turns:
+        turn_tokens = estimate_tokens(f"{turn.speaker}: {turn.text}")
+        fits_speakers = len(speakers | {turn.speaker}) <= MAX_SPEAKERS_PER_REQUEST
+        if current and (not fits_speakers or tokens + turn_tokens > max_tokens):
+            segments.append(Segment(tuple(current)))
+            current, speakers, tokens = [], set(), 0
+        current.append(turn)
+        speakers.add(turn.speaker)
+        tokens += turn_tokens
+
+    if current:
+        segments.append(Segment(tuple(current)))
+    return segments
+
+
+def assign_voices(
+    speakers: list[str], speaker_voices: dict[str, str] | None = None
+) -> dict[str, str]:
+    """Map every speaker to a voice.
+
+    Speakers without an explicit voice get the first unused voice from
+    DEFAULT_SPEAKER_VOICES, then from the full catalog.
+
+    Args:
+        speakers: Speaker names in order of first appearance
+        speaker_voices: Explicit speaker to voice mapping
+
+    Returns:
+        Speaker to voice mapping covering all speakers
+
+    Raises:
+        ValueError: If a voice name is invalid
+    """
+    assigned = {speaker: validate_voice(voice) for speaker, voice in (speaker_voices or {}).items()}
+    candidates = list(dict.fromkeys((*DEFAULT_SPEAKER_VOICES, *VOICES)))
+    used = set(assigned.values())
+    unassigned = [speaker for speaker in speakers if speaker not in assigned]
+    for i, speaker in enumerate(unassigned):
+        # Reuse voices only once every voice is taken
+        voice = next((v for v in candidates if v not in used), candidates[i % len(candidates)])
+        assigned[speaker] = voice
+        used.add(voice)
+    return assigned
+
+
+def apply_numbered_voices(
+    speakers: list[str], speaker_voices: dict[str, str] | None, *voices: str | None
+) -> dict[str, str]:
+    """Give the n-th voice to the n-th speaker, as --speaker1-voice and --speaker2-voice do.
+
+    Speakers are taken in order of first appearance; speakers that already
+    have a voice in speaker_voices keep it, and None voices are skipped.
+
+    Args:
+        speakers: Speaker names in order of first appearance
+        speaker_voices: Explicit speaker to voice mapping
+        *voices: Voices of the first, second, ... speaker
+
+    Returns:
+        Speaker to voice mapping including the numbered voices
+    """
+    merged = dict(speaker_voices or {})
+    for speaker, voice in zip(speakers, voices, strict=False):
+        if voice:
+            merged.setdefault(speaker, voice)
+    return merged
+
+
+def parse_speaker_voices(pairs: tuple[str, ...]) -> dict[str, str]:
+    """Parse repeated NAME=VOICE options into a speaker to voice mapping."""
+    speaker_voices = {}
+    for pair in pairs:
+        speaker, separator, voice = pair.partition("=")
+        if not separator or not speaker.strip() or not voice.strip():
+            raise ValueError(
+                f"Invalid --speaker-voice '{pair}'. Use NAME=VOICE, e.g. --speaker-voice Host=Kore"
+            )
+        speaker_voices[speaker.strip()] = voice.strip()
+    return speaker_voices
+
+
+def synthesize_dialogue(
+    client: genai.Client,
+    dialogue: str,
+    speaker_voices: dict[str, str] | None = None,
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+    gap: float = DEFAULT_TURN_GAP,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    cache: AudioCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    metrics: MetricsRecorder | None = None,
+    postprocess: PostProcess | None = None,
+) -> bytes:
+    """Synthesize a dialogue with any number of speakers.
+
+    The script is split into segments of consecutive turns with at most two
+    speakers. Single-speaker segments use a single-voice request, two-speaker
+    segments a multi-speaker request. Segments are synthesized concurrently
+    and joined in script order with gap seconds of silence between them.
+
+    Args:
+        client: Gemini API client
+        dialogue: Dialogue text with speaker labels (e.g., "Host: Hello\nGuest: Hi there")
+        speaker_voices: Speaker to voice mapping; other speakers get default voices
+        model: Model name or alias
+        system_instruction: Optional style instructions, applied to every segment
+        gap: Silence between segments, in seconds
+        max_chunk_tokens: Maximum estimated input tokens per request
+        max_workers: Maximum number of concurrent requests
+        cache: Optional audio cache; each segment is served from it when possible
+        retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+        rate_limiter: Optional limiter shared with other concurrent callers
+        metrics: Optional recorder of request latency and throughput
+        postprocess: Optional processing of the joined audio; a crossfade
+            fades each segment out and in around the gap
+
+    Returns:
+        Audio data as bytes (PCM, 24kHz, mono, 16-bit)
+
+    Raises:
+        SynthesisError: If synthesis fails
+        ValueError: If parameters are invalid
+    """
+    if not dialogue or not dialogue.strip():
+        raise ValueError("Dialogue cannot be empty.")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1. Got: {max_workers}")
+    if gap < 0:
+        raise ValueError(f"gap must not be negative. Got: {gap}")
+    if postprocess and postprocess.enabled:
+        require_numpy()
+
+    turns = parse_dialogue(dialogue)
+    voices = assign_voices(list(dict.fromkeys(turn.speaker for turn in turns)), speaker_voices)
+    segments = group_turns(turns, max_chunk_tokens)
+
+    def run(segment: Segment) -> bytes:
+        speakers = segment.speakers
+        if len(speakers) == 1:
+            return synthesize_speech(
+                client=client,
+                text=segment.text,
+                voice=voices[speakers[0]],
+                model=model,
+                system_instruction=system_instruction,
+                max_chunk_tokens=max_chunk_tokens,
+                max_workers=1,
+                cache=cache,
+                retry_policy=retry_policy,
+                rate_limiter=rate_limiter,
+                metrics=metrics,
+            )
+        # Order the voices the way synthesize_multi_voice hands them to speakers
+        first, second = plan_multi_voice(segment.text, model=model)[0]
+        return synthesize_multi_voice(
+            client=client,
+            dialogue=segment.text,
+            speaker1_voice=voices[first],
+            speaker2_voice=voices[second],
+            model=model,
+            system_instruction=system_instruction,
+            cache=cache,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+        )
+
+    results: list[bytes] = [b""] * len(segments)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(segments))) as executor:
+        futures = {executor.submit(run, segment): i for i, segment in enumerate(segments)}
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except SynthesisError as e:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise SynthesisError(
+                f"Failed to synthesize dialogue segment {futures[future] + 1}/{len(segments)}: {e}"
+            ) from e
+
+    if postprocess and postprocess.enabled:
+        return process_audio(results, postprocess, gap=gap)
+    return silence(gap).join(results)
@@ -0,0 +1,208 @@
+"""Process pool for CPU-bound encoding and post-processing of PCM audio.
+
+Synthesis waits on the network and runs on threads, but encoding (FLAC,
+Opus) and NumPy post-processing are CPU-bound and hold the GIL, so in a
+large batch they serialize on one core. EncodePool runs them in worker
+processes instead.
+
+PCM is handed over through shared memory rather than pickled: the parent
+copies it into a SharedMemory block once and the worker encodes straight
+from the same block. At most max_pending jobs are in flight; a synthesis
+thread submitting beyond that waits until an encoder is free, which keeps
+the audio held in memory bounded however far synthesis runs ahead.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from types import TracebackType
+from typing import cast
+
+from gemini_tts_tool.core.encoders import write_audio_stream
+from gemini_tts_tool.core.postprocess import PostProcess, process_audio
+from gemini_tts_tool.utils import AudioError, pcm_duration
+
+# Jobs in flight per worker process: one encoding, one waiting
+PENDING_PER_WORKER = 2
+
+
+@dataclass(frozen=True)
+class EncodeResult:
+    """Outcome of encoding one PCM buffer to its outputs."""
+
+    audio_seconds: float
+    # Per output: None if it was written, else the first line of the error
+    errors: tuple[str | None, ...]
+    bytes_written: int = 0
+    write_seconds: float = 0.0
+
+
+class EncodePool:
+    """Encodes and post-processes PCM in worker processes.
+
+    Use as a context manager; leaving it waits for the submitted jobs.
+    """
+
+    def __init__(self, workers: int | None = None, max_pending: int | None = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            workers: Number of worker processes (default: one per CPU)
+            max_pending: Jobs in flight before submit blocks
+                (default: PENDING_PER_WORKER per worker)
+
+        Raises:
+            ValueError: If workers or max_pending is less than 1
+        """
+        workers = workers or os.cpu_count() or 1
+        max_pending = max_pending or workers * PENDING_PER_WORKER
+        if workers < 1 or max_pending < 1:
+            raise ValueError(
+                f"workers and max_pending must be at least 1. Got: {workers}, {max_pending}"
+            )
+        self.workers = workers
+        self.max_pending = max_pending
+        # Batches submit from many threads, which fork() doesn't survive safely
+        method = (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        )
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(method)
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def submit(
+        self,
+        audio_data: bytes,
+        outputs: list[Path],
+        postprocess: PostProcess | None = None,
+    ) -> Future[EncodeResult]:
+        """Queue PCM for post-processing and encoding to every output.
+
+        Blocks while max_pending jobs are in flight.
+
+        Args:
+            audio_data: PCM audio (24kHz, mono, 16-bit)
+            outputs: Files to write, in the format of their extension
+            postprocess: Optional processing applied before encoding
+
+        Returns:
+            Future of the encoding outcome; write errors are reported in it
+        """
+        self._slots.acquire()
+        try:
+            # A block can't be empty; an empty buffer maps one unused byte
+            block = shared_memory.SharedMemory(create=True, size=max(1, len(audio_data)))
+        except BaseException:
+            self._slots.release()
+            raise
+        try:
+            _buffer(block)[: len(audio_data)] = audio_data
+            future = self._executor.submit(
+                _encode_shared,
+                block.name,
+                len(audio_data),
+                [str(output) for output in outputs],
+                postprocess,
+            )
+        except BaseException:
+            self._release(block)
+            raise
+        future.add_done_callback(lambda _: self._release(block))
+        return future
+
+    def close(self) -> None:
+        """Wait for submitted jobs and stop the worker processes."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> EncodePool:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _release(self, block: shared_memory.SharedMemory) -> None:
+        block.close()
+        block.unlink()
+        self._slots.release()
+
+
+def encode_audio(
+    audio_data: bytes, outputs: list[Path], postprocess: PostProcess | None = None
+) -> EncodeResult:
+    """Post-process PCM and encode it to every output in this process.
+
+    Args:
+        audio_data: PCM audio (24kHz, mono, 16-bit), or a view of it
+        outputs: Files to write, in the format of their extension
+        postprocess: Optional processing applied before encoding
+
+    Returns:
+        Encoding outcome; post-processing and write errors are reported in it
+    """
+    start = time.perf_counter()
+    if postprocess and postprocess.enabled:
+        try:
+            audio_data = process_audio([audio_data], postprocess)
+        except (AudioError, ValueError) as e:
+            # Nothing can be written, so every output fails the same way
+            error = str(e).split("\n", 1)[0]
+            return EncodeResult(
+                audio_seconds=round(pcm_duration(audio_data), 3),
+                errors=(error,) * len(outputs),
+                write_seconds=time.perf_counter() - start,
+            )
+
+    errors: list[str | None] = []
+    written = 0
+    for output in outputs:
+        try:
+            write_audio_stream([audio_data], output)
+            written += output.stat().st_size
+            errors.append(None)
+        except (AudioError, ValueError, OSError) as e:
+            errors.append(str(e).split("\n", 1)[0])
+    return EncodeResult(
+        audio_seconds=round(pcm_duration(audio_data), 3),
+        errors=tuple(errors),
+        bytes_written=written,
+        write_seconds=time.perf_counter() - start,
+    )
+
+
+def _encode_shared(
+    name: str, size: int, outputs: list[str], postprocess: PostProcess | None
+) -> EncodeResult:
+    """Worker side of EncodePool.submit: encode from the parent's shared block."""
+    # The parent owns and unlinks the block
+    block = shared_memory.SharedMemory(name=name, track=False)
+    try:
+        view = _buffer(block)[:size]
+        try:
+            # Encoders and NumPy read the view like bytes, without a copy
+            audio_data = cast(bytes, view)
+            return encode_audio(audio_data, [Path(output) for output in outputs], postprocess)
+        finally:
+            view.release()
+    finally:
+        block.close()
+
+
+def _buffer(block: shared_memory.SharedMemory) -> memoryview:
+    # buf is only None after close()
+    return cast(memoryview, block.buf)
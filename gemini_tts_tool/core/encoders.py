@@ -0,0 +1,283 @@
+"""Pluggable audio encoders for compressed output formats.
+
+Gemini TTS returns raw PCM (24kHz, mono, 16-bit), about 2.9 MB per minute.
+Encoders turn that PCM into the format selected by the output extension,
+consuming it chunk by chunk so no temporary WAV file is written.
+
+Built-in encoders:
+
+- wav: always available (standard library)
+- flac, ogg (Opus): soundfile (``pip install soundfile``) or ffmpeg
+- mp3, m4a (AAC): ffmpeg
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import importlib.util
+import shutil
+import subprocess
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Protocol
+
+from gemini_tts_tool.utils import (
+    CHANNELS,
+    SAMPLE_RATE,
+    SAMPLE_WIDTH,
+    AudioError,
+    WavStreamWriter,
+    validate_output_format,
+)
+
+
+class Encoder(Protocol):
+    """Writes a stream of PCM chunks to a file in one audio format."""
+
+    @property
+    def name(self) -> str:
+        """Short name shown in messages (e.g. 'ffmpeg')."""
+        ...
+
+    def available(self) -> bool:
+        """Whether the encoder's dependencies are installed."""
+        ...
+
+    def encode(self, chunks: Iterable[bytes], output_path: Path) -> int:
+        """Encode PCM chunks (24kHz, mono, 16-bit) to output_path.
+
+        Returns:
+            Number of PCM bytes consumed
+
+        Raises:
+            AudioError: If encoding fails
+        """
+        ...
+
+
+class WavEncoder:
+    """Uncompressed WAV via the standard library."""
+
+    name = "wav"
+
+    def available(self) -> bool:
+        return True
+
+    def encode(self, chunks: Iterable[bytes], output_path: Path) -> int:
+        # Atomic: an interrupted write leaves any previous file untouched
+        with WavStreamWriter(output_path) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        return writer.bytes_written
+
+
+class SoundFileEncoder:
+    """FLAC or Ogg encoding through libsndfile (the soundfile package)."""
+
+    name = "soundfile"
+
+    def __init__(self, container: str, subtype: str) -> None:
+        """Initialize the encoder.
+
+        Args:
+            container: libsndfile major format (e.g. 'FLAC', 'OGG')
+            subtype: libsndfile subtype (e.g. 'PCM_16', 'OPUS')
+        """
+        self.container = container
+        self.subtype = subtype
+
+    def available(self) -> bool:
+        if importlib.util.find_spec("soundfile") is None:
+            return False
+        import soundfile
+
+        # Opus needs libsndfile 1.0.29 or later
+        return self.subtype in soundfile.available_subtypes(self.container)
+
+    def encode(self, chunks: Iterable[bytes], output_path: Path) -> int:
+        import soundfile
+
+        written = 0
+        try:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with soundfile.SoundFile(
+                str(output_path),
+                "w",
+                samplerate=SAMPLE_RATE,
+                channels=CHANNELS,
+                format=self.container,
+                subtype=self.subtype,
+            ) as f:
+                for frames in _whole_frames(chunks):
+                    f.buffer_write(frames, dtype="int16")
+                    written += len(frames)
+        except (OSError, RuntimeError) as e:
+            # soundfile raises LibsndfileError (a RuntimeError) for codec errors
+            raise AudioError(f"Failed to encode {output_path.name}: {e}") from e
+        return written
+
+
+class FfmpegEncoder:
+    """Encoding by piping PCM into an ffmpeg process."""
+
+    name = "ffmpeg"
+
+    def __init__(self, codec_args: tuple[str, ...]) -> None:
+        """Initialize the encoder.
+
+        Args:
+            codec_args: ffmpeg output options selecting codec and bitrate
+        """
+        self.codec_args = codec_args
+
+    def available(self) -> bool:
+        return shutil.which("ffmpeg") is not None
+
+    def encode(self, chunks: Iterable[bytes], output_path: Path) -> int:
+        ffmpeg = shutil.which("ffmpeg")
+        if not ffmpeg:
+            raise AudioError("ffmpeg not found on PATH")
+
+        command = [
+            ffmpeg,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-f",
+            "s16le",
+            "-ar",
+            str(SAMPLE_RATE),
+            "-ac",
+            str(CHANNELS),
+            "-i",
+            "pipe:0",
+            *self.codec_args,
+            "-y",
+            str(output_path),
+        ]
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        ) as process:
+            stdin = process.stdin
+            if stdin is None:
+                raise AudioError("Failed to start ffmpeg")
+            try:
+                for chunk in chunks:
+                    stdin.write(chunk)
+                    written += len(chunk)
+            except BrokenPipeError:
+                # ffmpeg exited early; its stderr explains why
+                pass
+            finally:
+                try:
+                    stdin.close()
+                except BrokenPipeError:
+                    pass
+                errors = process.stderr.read() if process.stderr else b""
+                returncode = process.wait()
+
+        if returncode != 0:
+            message = errors.decode("utf-8", "replace").strip() or f"exit code {returncode}"
+            raise AudioError(f"ffmpeg failed to encode {output_path.name}: {message}")
+        return written
+
+
+# Encoders per format, in order of preference; the first available one is used
+ENCODERS: dict[str, list[Encoder]] = {
+    "wav": [WavEncoder()],
+    "flac": [SoundFileEncoder("FLAC", "PCM_16"), FfmpegEncoder(("-c:a", "flac"))],
+    "ogg": [
+        SoundFileEncoder("OGG", "OPUS"),
+        FfmpegEncoder(("-c:a", "libopus", "-b:a", "32k")),
+    ],
+    "mp3": [FfmpegEncoder(("-c:a", "libmp3lame", "-q:a", "4"))],
+    "m4a": [FfmpegEncoder(("-c:a", "aac", "-b:a", "64k"))],
+}
+
+_INSTALL_HINTS = {
+    "soundfile": "pip install soundfile",
+    "ffmpeg": "install ffmpeg (e.g. brew install ffmpeg / apt install ffmpeg)",
+}
+
+
+def register_encoder(audio_format: str, encoder: Encoder, preferred: bool = True) -> None:
+    """Register an encoder for an audio format.
+
+    Args:
+        audio_format: Format name as returned by validate_output_format (e.g. 'mp3')
+        encoder: Encoder instance
+        preferred: Try this encoder before the existing ones for the format
+    """
+    encoders = ENCODERS.setdefault(audio_format, [])
+    if preferred:
+        encoders.insert(0, encoder)
+    else:
+        encoders.append(encoder)
+
+
+def get_encoder(audio_format: str) -> Encoder:
+    """Return the first available encoder for an audio format.
+
+    Raises:
+        AudioError: If no encoder for the format is installed
+    """
+    encoders = ENCODERS.get(audio_format, [])
+    for encoder in encoders:
+        if encoder.available():
+            return encoder
+
+    names = dict.fromkeys(encoder.name for encoder in encoders)
+    hints = "\n".join(f"  • {_INSTALL_HINTS.get(name, name)}" for name in names)
+    raise AudioError(
+        f"No encoder available for '{audio_format}' output.\n\n"
+        "What to do:\n"
+        f"  Install one of the following:\n{hints or '  (no encoders registered)'}\n"
+        "  Or write a .wav file, which needs no extra dependencies."
+    )
+
+
+def save_audio(audio_data: bytes, output_path: str | Path) -> None:
+    """Save PCM audio in the format selected by the output extension.
+
+    Args:
+        audio_data: Raw PCM audio bytes from Gemini TTS
+        output_path: Output path ending in .wav, .flac, .ogg, .mp3 or .m4a
+
+    Raises:
+        AudioError: If no encoder is available or encoding fails
+        ValueError: If the extension is not a supported format
+    """
+    write_audio_stream([audio_data], output_path)
+
+
+def write_audio_stream(chunks: Iterable[bytes], output_path: str | Path) -> int:
+    """Encode PCM chunks as they arrive, in the format selected by the extension.
+
+    Args:
+        chunks: Iterable of raw PCM audio chunks (24kHz, mono, 16-bit)
+        output_path: Output path ending in .wav, .flac, .ogg, .mp3 or .m4a
+
+    Returns:
+        Number of PCM bytes written
+
+    Raises:
+        AudioError: If no encoder is available or encoding fails
+        ValueError: If the extension is not a supported format
+    """
+    output_path = Path(output_path)
+    encoder = get_encoder(validate_output_format(output_path))
+    return encoder.encode(chunks, output_path)
+
+
+def _whole_frames(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Re-chunk PCM so every piece holds whole frames."""
+    frame_size = SAMPLE_WIDTH * CHANNELS
+    remainder = b""
+    for chunk in chunks:
+        data = remainder + chunk
+        cut = len(data) - len(data) % frame_size
+        remainder = data[cut:]
+        if cut:
+            yield data[:cut]
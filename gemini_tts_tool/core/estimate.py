@@ -0,0 +1,365 @@
+"""Preflight estimates of requests, tokens, audio duration and cost.
+
+Estimates run the same validation and chunk planning as synthesis but make
+no synthesis calls. Input tokens use the 4 characters per token rule (see
+references/token-and-text-limits.md) unless a client is passed, in which
+case the API's count_tokens endpoint is used where it works.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from gemini_tts_tool.core.chunker import DEFAULT_MAX_CHUNK_TOKENS, estimate_tokens, split_text
+from gemini_tts_tool.core.dialogue import (
+    MAX_SPEAKERS_PER_REQUEST,
+    assign_voices,
+    detect_speakers,
+    group_turns,
+    parse_dialogue,
+)
+from gemini_tts_tool.core.markup import Speech, compile_markup
+from gemini_tts_tool.core.synthesizer import plan_multi_voice, plan_speech
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE, MODELS, validate_model
+
+if TYPE_CHECKING:
+    from google import genai
+
+# Audio output tokens per second of speech (see references/token-and-text-limits.md)
+AUDIO_TOKENS_PER_SECOND = 32
+
+# Speaking rate used to predict duration: ~150 words per minute
+CHARS_PER_SECOND = 15.0
+
+
+@dataclass(frozen=True)
+class ModelPricing:
+    """Gemini API prices in USD per million tokens (standard tier)."""
+
+    input_per_million: float
+    output_per_million: float
+
+
+# Published list prices; check https://ai.google.dev/gemini-api/docs/pricing for changes
+PRICING = {
+    MODELS["flash"]: ModelPricing(input_per_million=0.50, output_per_million=10.00),
+    MODELS["pro"]: ModelPricing(input_per_million=1.00, output_per_million=20.00),
+}
+
+
+@dataclass(frozen=True)
+class RequestEstimate:
+    """Estimate for a single API request."""
+
+    index: int
+    model: str
+    characters: int
+    input_tokens: int
+    audio_seconds: float
+    counted: bool = False
+
+    @property
+    def output_tokens(self) -> int:
+        """Expected audio output tokens."""
+        return round(self.audio_seconds * AUDIO_TOKENS_PER_SECOND)
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """Estimate for a whole synthesis job.
+
+    Repetitions of an identical request reuse its audio; they add to the
+    audio duration but cost no request or tokens. So does silence generated
+    locally for markup pauses.
+    """
+
+    requests: tuple[RequestEstimate, ...]
+    reused: tuple[RequestEstimate, ...] = ()
+    silence_seconds: float = 0.0
+
+    @property
+    def input_tokens(self) -> int:
+        """Total input tokens."""
+        return sum(request.input_tokens for request in self.requests)
+
+    @property
+    def output_tokens(self) -> int:
+        """Total expected audio output tokens."""
+        return sum(request.output_tokens for request in self.requests)
+
+    @property
+    def audio_seconds(self) -> float:
+        """Total expected audio duration in seconds, including reused audio and silence."""
+        spoken = sum(request.audio_seconds for request in (*self.requests, *self.reused))
+        return spoken + self.silence_seconds
+
+    @property
+    def counted(self) -> bool:
+        """Whether every input token count came from the API."""
+        return bool(self.requests) and all(request.counted for request in self.requests)
+
+    def cost(self, model: str | None = None) -> float | None:
+        """Return the expected cost in USD.
+
+        Args:
+            model: Price every request as this model instead of its own
+
+        Returns:
+            Cost in USD, or None if a model has no known pricing
+        """
+        total = 0.0
+        for request in self.requests:
+            pricing = PRICING.get(validate_model(model) if model else request.model)
+            if pricing is None:
+                return None
+            total += (
+                request.input_tokens * pricing.input_per_million
+                + request.output_tokens * pricing.output_per_million
+            ) / 1_000_000
+        return total
+
+
+def estimate_speech(
+    text: str,
+    voice: str = DEFAULT_VOICE,
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    client: genai.Client | None = None,
+) -> Estimate:
+    """Estimate a synthesize_speech call without synthesizing anything.
+
+    Args:
+        text: Text to synthesize
+        voice: Voice name (default: Puck)
+        model: Model name or alias (default: flash)
+        system_instruction: Optional style instructions, sent with every chunk
+        max_chunk_tokens: Maximum estimated input tokens per request
+        client: Optional client used to count input tokens with the API
+
+    Returns:
+        Per-request and total estimates
+
+    Raises:
+        ValueError: If parameters are invalid
+    """
+    _, model, chunks = plan_speech(text, voice, model, max_chunk_tokens)
+    # Repeated chunks are synthesized once (see synthesize_speech)
+    counts = Counter(chunks)
+    requests = {
+        chunk: _estimate_request(i, model, chunk, chunk, system_instruction, client)
+        for i, chunk in enumerate(counts)
+    }
+    reused = [requests[chunk] for chunk, count in counts.items() for _ in range(count - 1)]
+    return Estimate(tuple(requests.values()), tuple(reused))
+
+
+def estimate_markup(
+    document: str,
+    voice: str = DEFAULT_VOICE,
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    client: genai.Client | None = None,
+) -> Estimate:
+    """Estimate a synthesize_markup call without synthesizing anything.
+
+    Args:
+        document: Text with markup directives
+        voice: Voice used until the first [voice] directive
+        model: Model name or alias (default: flash)
+        system_instruction: Style used until the first [style] directive
+        max_chunk_tokens: Maximum estimated input tokens per request
+        client: Optional client used to count input tokens with the API
+
+    Returns:
+        Per-request and total estimates, with pauses as silence
+
+    Raises:
+        ValueError: If the markup or parameters are invalid
+    """
+    plan = compile_markup(document, voice, system_instruction)
+    model = validate_model(model)
+    requests: dict[tuple[str, str, str | None], RequestEstimate] = {}
+    reused = []
+    silence_seconds = 0.0
+    for step in plan:
+        if not isinstance(step, Speech):
+            silence_seconds += step.seconds
+            continue
+        for chunk in split_text(step.text, max_chunk_tokens):
+            # Identical chunks are synthesized once (see synthesize_markup)
+            key = (chunk, step.voice, step.style)
+            if key in requests:
+                reused.append(requests[key])
+            else:
+                requests[key] = _estimate_request(
+                    len(requests), model, chunk, chunk, step.style, client
+                )
+    return Estimate(tuple(requests.values()), tuple(reused), silence_seconds)
+
+
+def estimate_dialogue(
+    dialogue: str,
+    speaker_voices: dict[str, str] | None = None,
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    client: genai.Client | None = None,
+) -> Estimate:
+    """Estimate a multi-voice dialogue without synthesizing anything.
+
+    Plans requests the same way as the multi-voice command: one request for
+    two-speaker dialogues, and segments of at most two speakers for longer
+    casts or explicit speaker voices.
+
+    Args:
+        dialogue: Dialogue text with speaker labels
+        speaker_voices: Speaker to voice mapping
+        model: Model name or alias (default: flash)
+        system_instruction: Optional style instructions
+        max_chunk_tokens: Maximum estimated input tokens per segment
+        client: Optional client used to count input tokens with the API
+
+    Returns:
+        Per-request and total estimates
+
+    Raises:
+        ValueError: If parameters are invalid
+    """
+    speakers = detect_speakers(dialogue)
+    if not speaker_voices and len(speakers) <= MAX_SPEAKERS_PER_REQUEST:
+        _, model = plan_multi_voice(dialogue, model=model)
+        # Style instructions are sent as part of the prompt
+        prompt = f"{system_instruction}\n\n{dialogue}" if system_instruction else dialogue
+        spoken = " ".join(
+            text or label
+            for label, _, text in (line.partition(":") for line in dialogue.splitlines())
+        )
+        return Estimate((_estimate_request(0, model, prompt, spoken, None, client),))
+
+    turns = parse_dialogue(dialogue)
+    assign_voices(list(dict.fromkeys(turn.speaker for turn in turns)), speaker_voices)
+    model = validate_model(model)
+    return Estimate(
+        tuple(
+            _estimate_request(
+                i,
+                model,
+                segment.text,
+                " ".join(turn.text for turn in segment.turns),
+                system_instruction,
+                client,
+            )
+            for i, segment in enumerate(group_turns(turns, max_chunk_tokens))
+        )
+    )
+
+
+def combine_estimates(estimates: Iterable[Estimate]) -> Estimate:
+    """Merge estimates of several jobs (e.g. batch rows) into one."""
+    estimates = list(estimates)
+    requests = [request for estimate in estimates for request in estimate.requests]
+    reused = [request for estimate in estimates for request in estimate.reused]
+    return Estimate(
+        tuple(replace(request, index=i) for i, request in enumerate(requests)),
+        tuple(reused),
+        sum(estimate.silence_seconds for estimate in estimates),
+    )
+
+
+def format_estimate(estimate: Estimate, per_request: bool = True) -> list[str]:
+    """Format an estimate as report lines.
+
+    Args:
+        estimate: Estimate to format
+        per_request: Include one line per request
+
+    Returns:
+        Report lines
+    """
+    source = "counted by the API" if estimate.counted else "estimated at 4 chars/token"
+    lines = []
+    if per_request:
+        for request in estimate.requests:
+            lines.append(
+                f"  #{request.index + 1:<4} {request.characters:>7,} chars  "
+                f"{request.input_tokens:>6,} tokens  {request.audio_seconds:>7.1f}s audio"
+            )
+        lines.append("")
+
+    lines += [
+        f"Requests:       {len(estimate.requests):,}",
+        *(
+            [f"Reused:         {len(estimate.reused):,} repeated (no request needed)"]
+            if estimate.reused
+            else []
+        ),
+        *(
+            [f"Pauses:         {estimate.silence_seconds:.1f}s of silence (no request needed)"]
+            if estimate.silence_seconds
+            else []
+        ),
+        f"Input tokens:   {estimate.input_tokens:,} ({source})",
+        f"Output tokens:  {estimate.output_tokens:,} (~{AUDIO_TOKENS_PER_SECOND}/s of audio)",
+        f"Audio duration: {_format_duration(estimate.audio_seconds)}",
+        "Estimated cost:",
+    ]
+    for alias, name in MODELS.items():
+        cost = estimate.cost(name)
+        lines.append(f"  {alias:<6} ${cost:,.4f}" if cost is not None else f"  {alias:<6} unknown")
+    return lines
+
+
+def _estimate_request(
+    index: int,
+    model: str,
+    prompt: str,
+    spoken: str,
+    system_instruction: str | None,
+    client: genai.Client | None,
+) -> RequestEstimate:
+    """Estimate one request from its prompt text and the text that will be spoken."""
+    counted = None
+    if client is not None:
+        counted = _count_tokens(client, model, prompt, system_instruction)
+    input_tokens = counted
+    if input_tokens is None:
+        input_tokens = estimate_tokens(prompt)
+        if system_instruction:
+            input_tokens += estimate_tokens(system_instruction)
+
+    return RequestEstimate(
+        index=index,
+        model=model,
+        characters=len(prompt),
+        input_tokens=input_tokens,
+        audio_seconds=round(len(spoken) / CHARS_PER_SECOND, 1),
+        counted=counted is not None,
+    )
+
+
+def _count_tokens(
+    client: genai.Client, model: str, prompt: str, system_instruction: str | None
+) -> int | None:
+    """Count input tokens with the API; None if counting is not available."""
+    contents = [system_instruction, prompt] if system_instruction else [prompt]
+    try:
+        total = client.models.count_tokens(model=model, contents=contents).total_tokens
+    except Exception:
+        return None
+    return total if isinstance(total, int) else None
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m {secs:02d}s"
+    return f"{minutes}m {secs:02d}s"
@@ -0,0 +1,277 @@
+"""Checkpointed, resumable synthesis of long documents.
+
+A job keeps its state in a work directory: a manifest describing the planned
+segments and one PCM file per completed segment. Segment files are named by
+the hash of their text, voice, model and style, so a restarted run skips
+every segment that is already on disk and only requests missing or edited
+ones. The output is assembled by streaming segment files from disk.
+
+Work directory layout::
+
+    work-dir/
+    ├── manifest.json       # Voice, model, style and ordered segment hashes
+    └── segments/
+        └── <hash>.pcm      # Raw PCM (24kHz, mono, 16-bit) per segment
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from gemini_tts_tool.core.cache import AudioCache, cache_key
+from gemini_tts_tool.core.chunker import DEFAULT_MAX_CHUNK_TOKENS, split_text
+from gemini_tts_tool.core.encoders import write_audio_stream
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.retry import RateLimiter, RetryPolicy
+from gemini_tts_tool.core.synthesizer import (
+    DEFAULT_MAX_WORKERS,
+    SynthesisError,
+    synthesize_speech,
+)
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE, validate_model, validate_voice
+from gemini_tts_tool.utils import AudioError, WavStreamWriter, validate_output_format
+
+if TYPE_CHECKING:
+    from google import genai
+
+# Bump when the manifest layout changes
+MANIFEST_VERSION = 1
+
+MANIFEST_NAME = "manifest.json"
+SEGMENTS_DIR = "segments"
+
+# Size of the reads used to stream segment files into the output
+READ_CHUNK_BYTES = 1024**2
+
+
+@dataclass(frozen=True)
+class JobSegment:
+    """A request-sized piece of the document."""
+
+    index: int
+    key: str
+    text: str
+
+
+class SynthesisJob:
+    """A resumable single-voice synthesis job backed by a work directory.
+
+    Example:
+        >>> job = SynthesisJob("book.work", text, voice="Kore")
+        >>> job.run(client)
+        >>> job.save("book.mp3")
+    """
+
+    def __init__(
+        self,
+        work_dir: str | Path,
+        text: str,
+        voice: str = DEFAULT_VOICE,
+        model: str = DEFAULT_MODEL,
+        system_instruction: str | None = None,
+        max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    ) -> None:
+        """Validate parameters and plan the segments.
+
+        Args:
+            work_dir: Directory holding the manifest and segment files
+            text: Text to synthesize
+            voice: Voice name (default: Puck)
+            model: Model name or alias (default: flash)
+            system_instruction: Optional style instructions
+            max_chunk_tokens: Maximum estimated input tokens per segment
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty.")
+
+        self.work_dir = Path(work_dir)
+        self.segments_dir = self.work_dir / SEGMENTS_DIR
+        self.voice = validate_voice(voice)
+        self.model = validate_model(model)
+        self.system_instruction = system_instruction
+        self.max_chunk_tokens = max_chunk_tokens
+        self.segments = [
+            JobSegment(i, cache_key(chunk, self.voice, self.model, system_instruction), chunk)
+            for i, chunk in enumerate(split_text(text, max_chunk_tokens))
+        ]
+
+    def segment_path(self, segment: JobSegment) -> Path:
+        """Return the PCM file of a segment."""
+        return self.segments_dir / f"{segment.key}.pcm"
+
+    def pending(self) -> list[JobSegment]:
+        """Segments without audio on disk, in document order."""
+        return [segment for segment in self.segments if not self.segment_path(segment).is_file()]
+
+    def run(
+        self,
+        client: genai.Client,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: AudioCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        on_segment: Callable[[JobSegment], None] | None = None,
+        metrics: MetricsRecorder | None = None,
+    ) -> int:
+        """Synthesize the segments that are not on disk yet.
+
+        Writes the manifest, removes segment files that are no longer part of
+        the plan (because their text or settings changed), then synthesizes
+        the pending segments concurrently. Each segment is saved as soon as
+        it completes, so an interrupted run loses only the requests in flight.
+
+        Args:
+            client: Gemini API client
+            max_workers: Maximum number of concurrent requests
+            cache: Optional audio cache consulted before the API
+            retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+            rate_limiter: Optional limiter shared with other concurrent callers
+            on_segment: Called after each segment is saved (serialized across threads)
+            metrics: Optional recorder of request latency and throughput
+
+        Returns:
+            Number of segments synthesized by this run
+
+        Raises:
+            SynthesisError: If a segment fails; completed segments are kept
+            AudioError: If a segment cannot be saved
+            ValueError: If parameters are invalid
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1. Got: {max_workers}")
+
+        self._write_manifest()
+        planned = {self.segment_path(segment) for segment in self.segments}
+        for path in self.segments_dir.glob("*.pcm"):
+            if path not in planned:
+                path.unlink(missing_ok=True)
+
+        # Identical segments share one file, so each key is synthesized once
+        missing = self.pending()
+        pending = list({segment.key: segment for segment in missing}.values())
+        if metrics and len(pending) < len(missing):
+            metrics.record_saved(len(missing) - len(pending))
+        if not pending:
+            return 0
+
+        lock = threading.Lock()
+
+        def run_segment(segment: JobSegment) -> None:
+            audio_data = synthesize_speech(
+                client=client,
+                text=segment.text,
+                voice=self.voice,
+                model=self.model,
+                system_instruction=self.system_instruction,
+                max_chunk_tokens=self.max_chunk_tokens,
+                max_workers=1,
+                cache=cache,
+                retry_policy=retry_policy,
+                rate_limiter=rate_limiter,
+                metrics=metrics,
+            )
+            try:
+                _write_atomic(self.segment_path(segment), audio_data)
+            except OSError as e:
+                raise AudioError(f"Failed to save segment {segment.index + 1}: {e}") from e
+            if on_segment:
+                with lock:
+                    on_segment(segment)
+
+        total = len(self.segments)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            futures = {executor.submit(run_segment, segment): segment for segment in pending}
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except SynthesisError as e:
+                executor.shutdown(wait=False, cancel_futures=True)
+                done = total - len(self.pending())
+                raise SynthesisError(
+                    f"Failed to synthesize segment {futures[future].index + 1}/{total}: {e}\n\n"
+                    "What to do:\n"
+                    f"  {done}/{total} segments are saved in {self.work_dir}.\n"
+                    "  Run the same command again to resume from there."
+                ) from e
+
+        return len(pending)
+
+    def iter_audio(self) -> Iterator[bytes]:
+        """Stream the PCM of all segments in document order from disk.
+
+        Raises:
+            SynthesisError: If a segment has not been synthesized
+        """
+        for segment in self.segments:
+            path = self.segment_path(segment)
+            if not path.is_file():
+                raise SynthesisError(
+                    f"Segment {segment.index + 1}/{len(self.segments)} has not been synthesized"
+                )
+            with path.open("rb") as f:
+                while chunk := f.read(READ_CHUNK_BYTES):
+                    yield chunk
+
+    def save(self, output_path: str | Path) -> None:
+        """Assemble the synthesized segments into an audio file.
+
+        WAV output splices the segment files in through memory-mapped reads;
+        other formats stream them into the encoder.
+
+        Args:
+            output_path: Output path ending in .wav, .flac, .ogg, .mp3 or .m4a
+
+        Raises:
+            AudioError: If no encoder is available or writing fails
+            SynthesisError: If a segment has not been synthesized
+            ValueError: If the extension is not a supported format
+        """
+        if validate_output_format(output_path) != "wav":
+            write_audio_stream(self.iter_audio(), output_path)
+            return
+
+        missing = self.pending()
+        if missing:
+            raise SynthesisError(
+                f"Segment {missing[0].index + 1}/{len(self.segments)} has not been synthesized"
+            )
+        with WavStreamWriter(output_path) as writer:
+            for segment in self.segments:
+                writer.splice(self.segment_path(segment))
+
+    def _write_manifest(self) -> None:
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "voice": self.voice,
+            "model": self.model,
+            "style": self.system_instruction,
+            "max_chunk_tokens": self.max_chunk_tokens,
+            "segments": [
+                {"key": segment.key, "characters": len(segment.text)} for segment in self.segments
+            ],
+        }
+        _write_atomic(
+            self.work_dir / MANIFEST_NAME,
+            (json.dumps(manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8"),
+        )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary file, so readers never see partial data."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
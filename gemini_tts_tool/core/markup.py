@@ -0,0 +1,251 @@
+"""Markup directives for exact pauses and voice or style changes.
+
+Square-bracket directives in a document are compiled into a plan of API
+requests and locally generated silence:
+
+- ``[pause 500ms]``, ``[pause 1.5s]``: exact silence, without a request
+- ``[voice Kore]``: speak the following text with another voice;
+  ``[voice]`` restores the document's voice
+- ``[style Speak slowly]``: style instructions for the following text;
+  ``[style]`` restores the document's style
+- ``[segment]``: start a new request here, e.g. at a chapter boundary
+
+Every directive ends the current segment. Segments are synthesized
+concurrently and joined in document order with the pauses in between.
+Other bracketed text (such as ``[laughs]``) is passed to the model as is.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.chunker import DEFAULT_MAX_CHUNK_TOKENS, split_text
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.postprocess import PostProcess, process_audio, require_numpy
+from gemini_tts_tool.core.retry import RateLimiter, RetryPolicy
+from gemini_tts_tool.core.synthesizer import DEFAULT_MAX_WORKERS, SynthesisError, synthesize_speech
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE, validate_model, validate_voice
+from gemini_tts_tool.utils import silence
+
+if TYPE_CHECKING:
+    from google import genai
+
+# Longest pause a single directive may insert, in seconds
+MAX_PAUSE_SECONDS = 60.0
+
+_DIRECTIVE = re.compile(r"\[\s*(pause|voice|style|segment)\b([^\]]*)\]", re.IGNORECASE)
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)\s*(ms|s)", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class Speech:
+    """Text spoken with one voice and style."""
+
+    text: str
+    voice: str
+    style: str | None = None
+
+
+@dataclass(frozen=True)
+class Pause:
+    """Silence generated locally."""
+
+    seconds: float
+
+
+PlanStep = Speech | Pause
+
+
+def has_markup(text: str) -> bool:
+    """Whether text contains any markup directive."""
+    return _DIRECTIVE.search(text) is not None
+
+
+def compile_markup(
+    document: str, voice: str = DEFAULT_VOICE, system_instruction: str | None = None
+) -> list[PlanStep]:
+    """Compile a marked-up document into speech segments and pauses.
+
+    Args:
+        document: Text with markup directives
+        voice: Voice used until the first [voice] directive
+        system_instruction: Style used until the first [style] directive
+
+    Returns:
+        Plan steps in document order; adjacent pauses are merged
+
+    Raises:
+        ValueError: If a directive is invalid or there is no text to speak
+    """
+    voice = validate_voice(voice)
+    plan: list[PlanStep] = []
+    current_voice, current_style = voice, system_instruction
+
+    def add_text(text: str) -> None:
+        text = text.strip()
+        if text:
+            plan.append(Speech(text, current_voice, current_style))
+
+    position = 0
+    for match in _DIRECTIVE.finditer(document):
+        add_text(document[position : match.start()])
+        position = match.end()
+        name, argument = match.group(1).lower(), match.group(2).strip()
+
+        if name == "pause":
+            seconds = parse_pause(argument)
+            if plan and isinstance(plan[-1], Pause):
+                plan[-1] = Pause(plan[-1].seconds + seconds)
+            else:
+                plan.append(Pause(seconds))
+        elif name == "voice":
+            current_voice = validate_voice(argument) if argument else voice
+        elif name == "style":
+            current_style = argument or system_instruction
+        elif argument:
+            raise ValueError(f"[segment] takes no argument. Got: {match.group(0)}")
+    add_text(document[position:])
+
+    if not any(isinstance(step, Speech) for step in plan):
+        raise ValueError(
+            "Document has no text to speak.\n\n"
+            "What to do:\n"
+            "  Add text between the directives, for example:\n"
+            "    Welcome. [pause 500ms] [voice Kore] Thanks for listening."
+        )
+    return plan
+
+
+def parse_pause(argument: str) -> float:
+    """Parse a pause duration such as '500ms' or '1.5s' into seconds.
+
+    Raises:
+        ValueError: If the duration is malformed or too long
+    """
+    match = _DURATION.fullmatch(argument.strip())
+    if not match:
+        raise ValueError(
+            f"Invalid pause '[pause {argument}]'.\n\n"
+            "What to do:\n"
+            "  Give the duration with a unit: [pause 500ms] or [pause 1.5s]"
+        )
+    value, unit = float(match.group(1)), match.group(2).lower()
+    seconds = value / 1000 if unit == "ms" else value
+    if seconds > MAX_PAUSE_SECONDS:
+        raise ValueError(f"Pause must be at most {MAX_PAUSE_SECONDS:g}s. Got: {argument}")
+    return seconds
+
+
+def synthesize_markup(
+    client: genai.Client,
+    document: str,
+    voice: str = DEFAULT_VOICE,
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    cache: AudioCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    metrics: MetricsRecorder | None = None,
+    postprocess: PostProcess | None = None,
+) -> bytes:
+    """Synthesize a marked-up document.
+
+    Segments longer than max_chunk_tokens are chunked as in
+    synthesize_speech. All chunks of all segments are synthesized
+    concurrently, identical ones (same text, voice and style) once, and
+    pauses are inserted as silence without a request.
+
+    Args:
+        client: Gemini API client
+        document: Text with markup directives (see compile_markup)
+        voice: Voice used until the first [voice] directive
+        model: Model name or alias (default: flash)
+        system_instruction: Style used until the first [style] directive
+        max_chunk_tokens: Maximum estimated input tokens per request
+        max_workers: Maximum number of concurrent requests
+        cache: Optional audio cache; each request is served from it when possible
+        retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+        rate_limiter: Optional limiter shared with other concurrent callers
+        metrics: Optional recorder of request latency and throughput
+        postprocess: Optional processing; a crossfade applies to the chunks
+            of a segment, trimming and normalization to the whole document
+
+    Returns:
+        Audio data as bytes (PCM, 24kHz, mono, 16-bit)
+
+    Raises:
+        SynthesisError: If synthesis fails
+        ValueError: If the markup or parameters are invalid
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1. Got: {max_workers}")
+    plan = compile_markup(document, voice, system_instruction)
+    model = validate_model(model)
+    if postprocess and postprocess.enabled:
+        require_numpy()
+
+    step_requests = [
+        [(chunk, step.voice, step.style) for chunk in split_text(step.text, max_chunk_tokens)]
+        if isinstance(step, Speech)
+        else []
+        for step in plan
+    ]
+    requests = [request for keys in step_requests for request in keys]
+    unique = list(dict.fromkeys(requests))
+    if metrics and len(unique) < len(requests):
+        metrics.record_saved(len(requests) - len(unique))
+
+    def run(request: tuple[str, str, str | None]) -> bytes:
+        text, request_voice, style = request
+        return synthesize_speech(
+            client=client,
+            text=text,
+            voice=request_voice,
+            model=model,
+            system_instruction=style,
+            max_chunk_tokens=max_chunk_tokens,
+            max_workers=1,
+            cache=cache,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            metrics=metrics,
+        )
+
+    results: dict[tuple[str, str, str | None], bytes] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+        futures = {executor.submit(run, request): request for request in unique}
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except SynthesisError as e:
+            executor.shutdown(wait=False, cancel_futures=True)
+            index = requests.index(futures[future])
+            raise SynthesisError(
+                f"Failed to synthesize request {index + 1}/{len(requests)}: {e}"
+            ) from e
+
+    crossfade = None
+    if postprocess and postprocess.crossfade_ms:
+        crossfade = PostProcess(crossfade_ms=postprocess.crossfade_ms)
+    pieces = []
+    for step, step_keys in zip(plan, step_requests, strict=True):
+        if isinstance(step, Pause):
+            pieces.append(silence(step.seconds))
+        elif crossfade and len(step_keys) > 1:
+            pieces.append(process_audio([results[key] for key in step_keys], crossfade))
+        else:
+            pieces.append(b"".join(results[key] for key in step_keys))
+    audio_data = b"".join(pieces)
+
+    if postprocess and (postprocess.normalize or postprocess.trim_silence):
+        audio_data = process_audio([audio_data], replace(postprocess, crossfade_ms=0))
+    return audio_data
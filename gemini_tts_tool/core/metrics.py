@@ -0,0 +1,292 @@
+"""Latency and throughput instrumentation for synthesis requests.
+
+A MetricsRecorder collects one record per API request (latency, time to
+first audio, response parsing time, audio produced, retries, cache hits)
+plus output writes. It renders a JSON summary for one-shot commands and
+Prometheus text exposition for long-running servers.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from gemini_tts_tool.utils import CHANNELS, SAMPLE_RATE, SAMPLE_WIDTH
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+# Requests kept for percentiles; older ones only count towards the totals
+RECENT_REQUESTS = 1000
+
+BYTES_PER_SECOND = SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH
+
+
+@dataclass(frozen=True)
+class RequestMetrics:
+    """Measurements of a single API request (including its retries)."""
+
+    model: str
+    latency: float
+    first_byte: float
+    parse_seconds: float = 0.0
+    audio_bytes: int = 0
+    retries: int = 0
+    cached: bool = False
+    error: str | None = None
+
+    @property
+    def audio_seconds(self) -> float:
+        """Duration of the audio produced."""
+        return self.audio_bytes / BYTES_PER_SECOND
+
+    @property
+    def real_time_factor(self) -> float | None:
+        """API latency per second of audio (below 1 is faster than real time)."""
+        return self.latency / self.audio_seconds if self.audio_bytes else None
+
+
+class RequestTimer:
+    """Measures one request; created by MetricsRecorder.start()."""
+
+    def __init__(self, recorder: MetricsRecorder, model: str) -> None:
+        """Start timing a request.
+
+        Args:
+            recorder: Recorder receiving the result
+            model: Resolved model name
+        """
+        self.recorder = recorder
+        self.model = model
+        self.retries = 0
+        self._start = time.perf_counter()
+        self._first_byte: float | None = None
+        self._received: float | None = None
+
+    def on_retry(self, attempt: int, error: BaseException, delay: float) -> None:
+        """Count a retry (signature of call_with_retry's on_retry callback)."""
+        self.retries += 1
+
+    def first_byte(self) -> None:
+        """Mark the arrival of the first audio."""
+        if self._first_byte is None:
+            self._first_byte = time.perf_counter() - self._start
+
+    def received(self) -> None:
+        """Mark the end of the API response; what follows is response parsing."""
+        self._received = time.perf_counter()
+
+    def done(self, audio_bytes: int) -> None:
+        """Record a successful request."""
+        now = time.perf_counter()
+        received = self._received or now
+        latency = received - self._start
+        self.recorder.record(
+            RequestMetrics(
+                model=self.model,
+                latency=latency,
+                first_byte=latency if self._first_byte is None else self._first_byte,
+                parse_seconds=now - received,
+                audio_bytes=audio_bytes,
+                retries=self.retries,
+            )
+        )
+
+    def failed(self, error: BaseException) -> None:
+        """Record a failed request."""
+        latency = time.perf_counter() - self._start
+        self.recorder.record(
+            RequestMetrics(
+                model=self.model,
+                latency=latency,
+                first_byte=latency,
+                retries=self.retries,
+                error=type(error).__name__,
+            )
+        )
+
+
+class MetricsRecorder:
+    """Thread-safe collector of request and write metrics.
+
+    Example:
+        >>> metrics = MetricsRecorder()
+        >>> audio = synthesize_speech(client, text, metrics=metrics)
+        >>> print(metrics.to_json())
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder; the wall clock starts now."""
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._recent: deque[RequestMetrics] = deque(maxlen=RECENT_REQUESTS)
+        self._buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.requests = 0
+        self.errors = 0
+        self.cache_hits = 0
+        self.requests_saved = 0
+        self.retries = 0
+        self.api_seconds = 0.0
+        self.parse_seconds = 0.0
+        self.audio_bytes = 0
+        self.bytes_written = 0
+        self.write_seconds = 0.0
+
+    def start(self, model: str) -> RequestTimer:
+        """Start timing an API request."""
+        return RequestTimer(self, model)
+
+    def cache_hit(self, model: str, audio_bytes: int) -> None:
+        """Record a request served from the audio cache."""
+        self.record(
+            RequestMetrics(
+                model=model, latency=0.0, first_byte=0.0, audio_bytes=audio_bytes, cached=True
+            )
+        )
+
+    def record(self, metrics: RequestMetrics) -> None:
+        """Add the measurements of one request."""
+        with self._lock:
+            self.requests += 1
+            self.retries += metrics.retries
+            self.audio_bytes += metrics.audio_bytes
+            if metrics.error:
+                self.errors += 1
+            if metrics.cached:
+                self.cache_hits += 1
+                return
+            self.api_seconds += metrics.latency
+            self.parse_seconds += metrics.parse_seconds
+            self._buckets[_bucket(metrics.latency)] += 1
+            self._recent.append(metrics)
+
+    def record_saved(self, count: int) -> None:
+        """Add requests avoided by reusing the audio of identical text."""
+        with self._lock:
+            self.requests_saved += count
+
+    @contextmanager
+    def writing(self, output_path: str | Path | None = None) -> Iterator[None]:
+        """Time writing an output file and record its size afterwards."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            size = 0
+            if output_path is not None:
+                try:
+                    size = Path(output_path).stat().st_size
+                except OSError:
+                    pass
+            self.record_write(size, elapsed)
+
+    def record_write(self, nbytes: int, seconds: float = 0.0) -> None:
+        """Add bytes written to a file or sent to a client."""
+        with self._lock:
+            self.bytes_written += nbytes
+            self.write_seconds += seconds
+
+    def summary(self) -> dict[str, Any]:
+        """Return all metrics as a JSON-serializable dict."""
+        with self._lock:
+            recent = [m for m in self._recent if not m.error]
+            elapsed = time.perf_counter() - self._started
+            audio_seconds = self.audio_bytes / BYTES_PER_SECOND
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "cache_hits": self.cache_hits,
+                "requests_saved": self.requests_saved,
+                "retries": self.retries,
+                "api_latency_seconds": distribution([m.latency for m in recent]),
+                "time_to_first_byte_seconds": distribution([m.first_byte for m in recent]),
+                "api_seconds_total": round(self.api_seconds, 4),
+                "parse_seconds_total": round(self.parse_seconds, 4),
+                "audio_seconds": round(audio_seconds, 3),
+                "real_time_factor": (round(elapsed / audio_seconds, 4) if audio_seconds else None),
+                "bytes_written": self.bytes_written,
+                "write_seconds": round(self.write_seconds, 4),
+                "elapsed_seconds": round(elapsed, 4),
+            }
+
+    def to_json(self) -> str:
+        """Return the summary as a JSON document."""
+        return json.dumps(self.summary(), indent=2)
+
+    def prometheus(self) -> str:
+        """Return the metrics in Prometheus text exposition format."""
+        prefix = "gemini_tts"
+        with self._lock:
+            api_requests = self.requests - self.cache_hits
+            lines = [
+                f"# HELP {prefix}_requests_total Synthesis requests, including cache hits.",
+                f"# TYPE {prefix}_requests_total counter",
+                f"{prefix}_requests_total {self.requests}",
+                f"# HELP {prefix}_errors_total Requests that failed after all retries.",
+                f"# TYPE {prefix}_errors_total counter",
+                f"{prefix}_errors_total {self.errors}",
+                f"# HELP {prefix}_cache_hits_total Requests served from the audio cache.",
+                f"# TYPE {prefix}_cache_hits_total counter",
+                f"{prefix}_cache_hits_total {self.cache_hits}",
+                f"# HELP {prefix}_requests_saved_total Requests avoided by reusing audio.",
+                f"# TYPE {prefix}_requests_saved_total counter",
+                f"{prefix}_requests_saved_total {self.requests_saved}",
+                f"# HELP {prefix}_retries_total Retried API attempts.",
+                f"# TYPE {prefix}_retries_total counter",
+                f"{prefix}_retries_total {self.retries}",
+                f"# HELP {prefix}_audio_seconds_total Seconds of audio produced.",
+                f"# TYPE {prefix}_audio_seconds_total counter",
+                f"{prefix}_audio_seconds_total {self.audio_bytes / BYTES_PER_SECOND:.3f}",
+                f"# HELP {prefix}_bytes_written_total Bytes of audio written to files or clients.",
+                f"# TYPE {prefix}_bytes_written_total counter",
+                f"{prefix}_bytes_written_total {self.bytes_written}",
+                f"# HELP {prefix}_api_latency_seconds API request latency, including retries.",
+                f"# TYPE {prefix}_api_latency_seconds histogram",
+            ]
+            cumulative = 0
+            for bound, count in zip((*LATENCY_BUCKETS, math.inf), self._buckets, strict=True):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else f"{bound:g}"
+                lines.append(f'{prefix}_api_latency_seconds_bucket{{le="{le}"}} {cumulative}')
+            lines += [
+                f"{prefix}_api_latency_seconds_sum {self.api_seconds:.4f}",
+                f"{prefix}_api_latency_seconds_count {api_requests}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+def _bucket(latency: float) -> int:
+    """Index of the histogram bucket for a latency."""
+    for i, bound in enumerate(LATENCY_BUCKETS):
+        if latency <= bound:
+            return i
+    return len(LATENCY_BUCKETS)
+
+
+def distribution(values: list[float]) -> dict[str, float] | None:
+    """Mean, median, 95th percentile and maximum of a list of durations."""
+    if not values:
+        return None
+    ordered = sorted(values)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, math.ceil(p * len(ordered)) - 1)]
+
+    return {
+        "mean": round(sum(ordered) / len(ordered), 4),
+        "p50": round(percentile(0.5), 4),
+        "p95": round(percentile(0.95), 4),
+        "max": round(ordered[-1], 4),
+    }
@@ -0,0 +1,359 @@
+"""Load balancing across several API keys and Vertex AI projects.
+
+A ClientPool holds one Gemini client per backend (an API key or a Vertex AI
+project/location pair) and offers the same models and aio.models methods as
+genai.Client, so it can be passed anywhere a client is expected. Each
+request goes to the healthy backend with the most remaining quota. A backend
+that answers 429, fails with a server or network error, or rejects its
+credentials is taken out of rotation for a cooldown and the request moves on
+to the next backend, so a batch keeps running at the combined capacity. When
+every backend is cooling down, requests wait for the first one to recover.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from gemini_tts_tool.core.chunker import estimate_tokens
+from gemini_tts_tool.core.client import ClientConfig
+from gemini_tts_tool.core.retry import RateLimiter, is_rate_limited, is_retryable, retry_after
+
+if TYPE_CHECKING:
+    from google import genai
+
+# Cooldown after a 429 that carries no retry-after hint, in seconds
+RATE_LIMIT_COOLDOWN = 30.0
+
+# Cooldown after a transient error; doubles with each consecutive failure
+ERROR_COOLDOWN = 2.0
+
+# Upper bound for any cooldown, also applied to rejected credentials
+MAX_COOLDOWN = 300.0
+
+# Status codes meaning the backend's key or project is not usable
+AUTH_ERROR_CODES = frozenset({401, 403})
+
+
+@dataclass(eq=False)
+class Backend:
+    """One API key or Vertex AI project/location and its health."""
+
+    config: ClientConfig
+    client: genai.Client
+    limiter: RateLimiter | None = None
+    in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    failures: int = 0
+    cooldown_until: float = 0.0
+
+    @property
+    def name(self) -> str:
+        """Label safe to print: the Vertex AI project/location or the key's last characters."""
+        if self.config.vertexai:
+            return f"{self.config.project}/{self.config.location}"
+        return f"api-key ...{(self.config.api_key or '')[-4:]}"
+
+
+class ClientPool:
+    """Gemini client that spreads requests over several backends.
+
+    Example:
+        >>> pool = ClientPool({config: genai.Client(api_key=config.api_key)
+        ...                    for config in configs}, requests_per_minute=10)
+        >>> audio = synthesize_speech(pool, text)
+    """
+
+    def __init__(
+        self,
+        clients: Mapping[ClientConfig, genai.Client],
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            clients: One client per backend configuration
+            requests_per_minute: Request quota of each backend (None for unlimited)
+            tokens_per_minute: Input token quota of each backend (None for unlimited)
+            clock: Monotonic clock, injectable for tests
+
+        Raises:
+            ValueError: If no backend is given
+        """
+        if not clients:
+            raise ValueError(
+                "A client pool needs at least one backend.\n\n"
+                "What to do:\n"
+                "  - Set GEMINI_API_KEYS to a comma-separated list of API keys, or\n"
+                "  - Set GEMINI_VERTEX_BACKENDS to project/location pairs"
+            )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.backends = [
+            Backend(
+                config,
+                client,
+                RateLimiter(requests_per_minute, tokens_per_minute, clock)
+                if requests_per_minute or tokens_per_minute
+                else None,
+            )
+            for config, client in clients.items()
+        ]
+        self.models = _PoolModels(self)
+        self.aio = _PoolAio(self)
+
+    def with_quota(
+        self, requests_per_minute: float | None, tokens_per_minute: float | None = None
+    ) -> ClientPool:
+        """Return a pool over the same clients with a per-backend quota."""
+        return ClientPool(
+            {backend.config: backend.client for backend in self.backends},
+            requests_per_minute,
+            tokens_per_minute,
+            self._clock,
+        )
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Return per-backend request, error and cooldown counts."""
+        with self._lock:
+            now = self._clock()
+            return [
+                {
+                    "backend": backend.name,
+                    "requests": backend.requests,
+                    "errors": backend.errors,
+                    "rate_limited": backend.rate_limited,
+                    "in_flight": backend.in_flight,
+                    "cooldown_seconds": round(max(0.0, backend.cooldown_until - now), 1),
+                }
+                for backend in self.backends
+            ]
+
+    def remaining(self) -> float:
+        """Return the fraction of the pool's total quota available right now.
+
+        Backends cooling down count as empty.
+        """
+        with self._lock:
+            now = self._clock()
+            levels = [
+                0.0
+                if backend.cooldown_until > now
+                else (backend.limiter.remaining() if backend.limiter else 1.0)
+                for backend in self.backends
+            ]
+        return sum(levels) / len(levels)
+
+    def close(self) -> None:
+        """Close every backend's client."""
+        for backend in self.backends:
+            try:
+                backend.client.close()
+            except Exception:
+                pass
+
+    def _call[T](self, call: Callable[[genai.Client], T], tokens: int = 0) -> T:
+        """Send a request, failing over to other backends on backend errors."""
+        tried: list[Backend] = []
+        while True:
+            backend, cooldown = self._checkout(tried)
+            if cooldown > 0:
+                time.sleep(cooldown)
+            if backend.limiter:
+                backend.limiter.acquire(tokens)
+            try:
+                result = call(backend.client)
+            except Exception as e:
+                if not self._checkin(backend, e) or not self._has_healthy(tried):
+                    raise
+                continue
+            self._checkin(backend)
+            return result
+
+    async def _call_async[T](
+        self, call: Callable[[genai.Client], Awaitable[T]], tokens: int = 0
+    ) -> T:
+        """Async counterpart of _call."""
+        tried: list[Backend] = []
+        while True:
+            backend, cooldown = self._checkout(tried)
+            if cooldown > 0:
+                await asyncio.sleep(cooldown)
+            if backend.limiter:
+                await backend.limiter.acquire_async(tokens)
+            try:
+                result = await call(backend.client)
+            except Exception as e:
+                if not self._checkin(backend, e) or not self._has_healthy(tried):
+                    raise
+                continue
+            self._checkin(backend)
+            return result
+
+    def _checkout(self, tried: list[Backend]) -> tuple[Backend, float]:
+        """Pick the best backend not tried yet and mark it busy.
+
+        Backends out of cooldown come first, then the one with the most
+        remaining quota, then the least loaded. When every backend is
+        cooling down the one that recovers first is used.
+
+        Returns:
+            The backend and the seconds left in its cooldown, to wait before sending
+        """
+        with self._lock:
+            now = self._clock()
+            candidates = [backend for backend in self.backends if backend not in tried]
+            backend = min(
+                candidates,
+                key=lambda b: (
+                    max(0.0, b.cooldown_until - now),
+                    -(b.limiter.remaining() if b.limiter else 1.0),
+                    b.in_flight,
+                    b.requests,
+                ),
+            )
+            backend.in_flight += 1
+            backend.requests += 1
+            tried.append(backend)
+            return backend, max(0.0, backend.cooldown_until - now)
+
+    def _checkin(self, backend: Backend, error: Exception | None = None) -> bool:
+        """Release a backend and record the outcome of its request.
+
+        Returns:
+            Whether the error is the backend's fault (worth trying another one)
+        """
+        with self._lock:
+            backend.in_flight -= 1
+            if error is None:
+                backend.failures = 0
+                return False
+
+            if is_rate_limited(error):
+                backend.rate_limited += 1
+                cooldown = retry_after(error) or RATE_LIMIT_COOLDOWN
+            elif getattr(error, "code", None) in AUTH_ERROR_CODES:
+                cooldown = MAX_COOLDOWN
+            elif is_retryable(error):
+                backend.failures += 1
+                cooldown = ERROR_COOLDOWN * 2 ** (backend.failures - 1)
+            else:
+                # Invalid requests fail the same way on every backend
+                return False
+
+            backend.errors += 1
+            until = self._clock() + min(cooldown, MAX_COOLDOWN)
+            backend.cooldown_until = max(backend.cooldown_until, until)
+            return True
+
+    def _has_healthy(self, tried: list[Backend]) -> bool:
+        """Whether a backend not tried yet is out of cooldown."""
+        with self._lock:
+            now = self._clock()
+            return any(
+                backend not in tried and backend.cooldown_until <= now for backend in self.backends
+            )
+
+
+def apply_quota(
+    client: genai.Client,
+    requests_per_minute: float | None = None,
+    tokens_per_minute: float | None = None,
+) -> tuple[genai.Client, RateLimiter | None]:
+    """Attach a requests/tokens per minute quota to a client.
+
+    Quotas belong to an API key or project, so a ClientPool gets a limiter
+    per backend; any other client gets one limiter shared by all callers.
+
+    Args:
+        client: Gemini client or ClientPool
+        requests_per_minute: Request quota (None for unlimited)
+        tokens_per_minute: Input token quota (None for unlimited)
+
+    Returns:
+        The client to use and the shared limiter to pass to synthesis, if any
+    """
+    if not requests_per_minute and not tokens_per_minute:
+        return client, None
+    if isinstance(client, ClientPool):
+        pool = client.with_quota(requests_per_minute, tokens_per_minute)
+        return cast("genai.Client", pool), None
+    return client, RateLimiter(requests_per_minute, tokens_per_minute)
+
+
+def format_backend_stats(client: genai.Client) -> list[str]:
+    """Describe per-backend usage of a ClientPool (nothing for a single client)."""
+    if not isinstance(client, ClientPool):
+        return []
+    return [
+        f"Backend {stats['backend']}: {stats['requests']} request(s), "
+        f"{stats['errors']} error(s), {stats['rate_limited']} rate-limited"
+        for stats in client.stats()
+    ]
+
+
+class _PoolModels:
+    """Synchronous models API of a ClientPool."""
+
+    def __init__(self, pool: ClientPool) -> None:
+        self._pool = pool
+
+    def generate_content(self, **kwargs: Any) -> Any:
+        return self._pool._call(
+            lambda client: client.models.generate_content(**kwargs), _request_tokens(kwargs)
+        )
+
+    def generate_content_stream(self, **kwargs: Any) -> Iterator[Any]:
+        # Errors surface on the first response, so fetch it while failover is possible
+        def open_stream(client: genai.Client) -> Iterator[Any]:
+            responses = iter(client.models.generate_content_stream(**kwargs))
+            first = next(responses, None)
+            return responses if first is None else itertools.chain([first], responses)
+
+        return self._pool._call(open_stream, _request_tokens(kwargs))
+
+    def count_tokens(self, **kwargs: Any) -> Any:
+        return self._pool._call(lambda client: client.models.count_tokens(**kwargs))
+
+
+class _PoolAsyncModels:
+    """Asynchronous models API of a ClientPool."""
+
+    def __init__(self, pool: ClientPool) -> None:
+        self._pool = pool
+
+    async def generate_content(self, **kwargs: Any) -> Any:
+        return await self._pool._call_async(
+            lambda client: client.aio.models.generate_content(**kwargs), _request_tokens(kwargs)
+        )
+
+
+class _PoolAio:
+    """Counterpart of genai.Client.aio."""
+
+    def __init__(self, pool: ClientPool) -> None:
+        self.models = _PoolAsyncModels(pool)
+
+
+def _request_tokens(kwargs: dict[str, Any]) -> int:
+    """Estimated input tokens of a request, for per-backend token quotas."""
+    contents = kwargs.get("contents")
+    if isinstance(contents, str):
+        contents = [contents]
+    if not isinstance(contents, list):
+        return 0
+    return sum(estimate_tokens(part) for part in contents if isinstance(part, str))
@@ -0,0 +1,198 @@
+"""Vectorized post-processing of synthesized PCM audio.
+
+Joins the audio of several requests and evens it out before it is written:
+crossfades at the joins (no clicks), trims leading and trailing silence and
+normalizes peak level or loudness. The PCM bytes are read through int16
+NumPy views without copying, the output is assembled in a single float32
+buffer and converted back to int16 once, so an hour of audio takes a
+fraction of a second instead of a Python-level loop over samples.
+
+Requires NumPy (``pip install 'gemini-tts-tool[dsp]'``).
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from gemini_tts_tool.lazy import LazyModule
+from gemini_tts_tool.utils import SAMPLE_RATE, SAMPLE_WIDTH, AudioError
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = LazyModule("numpy")
+
+NORMALIZE_MODES = ("peak", "loudness")
+
+# Default targets in dBFS: peak level, and RMS level for loudness
+DEFAULT_TARGET_DBFS = {"peak": -1.0, "loudness": -20.0}
+
+# Frames quieter than this (RMS, dBFS) count as silence when trimming
+DEFAULT_SILENCE_THRESHOLD_DBFS = -50.0
+
+# RMS window used to find silence, in milliseconds
+TRIM_FRAME_MS = 10
+
+# Silence kept before the first and after the last sound, in milliseconds
+TRIM_PADDING_MS = 50
+
+_FULL_SCALE = 32767.0
+
+
+@dataclass(frozen=True)
+class PostProcess:
+    """Post-processing applied to synthesized audio before it is written.
+
+    Attributes:
+        normalize: "peak" or "loudness" (RMS) normalization, or None
+        target_dbfs: Normalization target (default: -1 dBFS peak, -20 dBFS RMS)
+        trim_silence: Remove leading and trailing silence
+        silence_threshold_dbfs: RMS level below which audio counts as silence
+        crossfade_ms: Equal-power crossfade at each join between segments
+    """
+
+    normalize: str | None = None
+    target_dbfs: float | None = None
+    trim_silence: bool = False
+    silence_threshold_dbfs: float = DEFAULT_SILENCE_THRESHOLD_DBFS
+    crossfade_ms: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.normalize is not None and self.normalize not in NORMALIZE_MODES:
+            raise ValueError(
+                f"Invalid normalization '{self.normalize}'. Options: {', '.join(NORMALIZE_MODES)}"
+            )
+        if self.target_dbfs is not None and self.target_dbfs > 0:
+            raise ValueError(f"target_dbfs must be at most 0. Got: {self.target_dbfs}")
+        if self.crossfade_ms < 0:
+            raise ValueError(f"crossfade_ms must not be negative. Got: {self.crossfade_ms}")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any processing is requested."""
+        return bool(self.normalize or self.trim_silence or self.crossfade_ms)
+
+
+def require_numpy() -> None:
+    """Raise AudioError with installation instructions if NumPy is missing."""
+    if importlib.util.find_spec("numpy") is None:
+        raise AudioError(
+            "Audio post-processing needs NumPy.\n\n"
+            "What to do:\n"
+            "  • pip install 'gemini-tts-tool[dsp]' (or: pip install numpy)\n"
+            "  • Or drop --normalize, --trim-silence and --crossfade"
+        )
+
+
+def pcm_samples(audio_data: bytes) -> np.ndarray:
+    """Return a read-only int16 view of PCM bytes (no copy).
+
+    A trailing odd byte, which cannot form a sample, is ignored.
+    """
+    return np.frombuffer(audio_data, dtype="<i2", count=len(audio_data) // SAMPLE_WIDTH)
+
+
+def process_audio(segments: Sequence[bytes], options: PostProcess, gap: float = 0.0) -> bytes:
+    """Join audio segments and apply post-processing.
+
+    Without a gap, consecutive segments overlap by the crossfade duration.
+    With a gap, each join gets a fade-out and fade-in of that duration
+    around gap seconds of silence.
+
+    Args:
+        segments: PCM audio (24kHz, mono, 16-bit) in playback order
+        options: Processing to apply
+        gap: Silence between segments, in seconds
+
+    Returns:
+        Processed PCM audio
+
+    Raises:
+        AudioError: If NumPy is not installed
+    """
+    require_numpy()
+    views = [pcm_samples(segment) for segment in segments]
+    views = [view for view in views if view.size]
+    if not views:
+        return b""
+
+    audio = _join(views, _samples(options.crossfade_ms / 1000), _samples(gap))
+    if options.trim_silence:
+        audio = _trim(audio, options.silence_threshold_dbfs)
+    if options.normalize and audio.size:
+        target = options.target_dbfs
+        if target is None:
+            target = DEFAULT_TARGET_DBFS[options.normalize]
+        audio *= _gain(audio, options.normalize, target)
+
+    np.clip(audio, -_FULL_SCALE - 1, _FULL_SCALE, out=audio)
+    processed: bytes = np.rint(audio).astype("<i2").tobytes()
+    return processed
+
+
+def _samples(seconds: float) -> int:
+    return max(0, round(seconds * SAMPLE_RATE))
+
+
+def _join(views: list[np.ndarray], fade: int, gap: int) -> np.ndarray:
+    """Place segments in one float32 buffer, fading them at the joins."""
+    # A fade can't be longer than half of the shortest segment it touches
+    fade = min(fade, *(view.size // 2 for view in views)) if len(views) > 1 else 0
+    overlap = 0 if gap else fade
+    total = sum(view.size for view in views) + (len(views) - 1) * (gap - overlap)
+    audio = np.zeros(total, dtype=np.float32)
+
+    # Equal-power curves keep the level steady across uncorrelated speech
+    ramp = np.linspace(0.0, np.pi / 2, fade, dtype=np.float32)
+    fade_in, fade_out = np.sin(ramp), np.cos(ramp)
+
+    position = 0
+    last = len(views) - 1
+    for i, view in enumerate(views):
+        head = fade if i > 0 else 0
+        tail = fade if i < last else 0
+        end = position + view.size
+        if head:
+            audio[position : position + head] += view[:head] * fade_in
+        audio[position + head : end - tail] += view[head : view.size - tail]
+        if tail:
+            audio[end - tail : end] += view[view.size - tail :] * fade_out
+        position = end + gap - overlap
+    return audio
+
+
+def _trim(audio: np.ndarray, threshold_dbfs: float) -> np.ndarray:
+    """Cut leading and trailing frames whose RMS is below the threshold."""
+    frame = _samples(TRIM_FRAME_MS / 1000)
+    count = audio.size // frame
+    if not count:
+        return audio
+
+    frames = audio[: count * frame].reshape(count, frame)
+    mean_square = np.einsum("ij,ij->i", frames, frames) / frame
+    threshold = (_FULL_SCALE * 10 ** (threshold_dbfs / 20)) ** 2
+    loud = np.flatnonzero(mean_square > threshold)
+    if not loud.size:
+        # All silence: keep it rather than return nothing
+        return audio
+
+    padding = _samples(TRIM_PADDING_MS / 1000)
+    start = max(0, int(loud[0]) * frame - padding)
+    end = audio.size if loud[-1] == count - 1 else (int(loud[-1]) + 1) * frame + padding
+    return audio[start : min(end, audio.size)]
+
+
+def _gain(audio: np.ndarray, mode: str, target_dbfs: float) -> float:
+    """Linear gain that brings the peak or RMS level to the target."""
+    target = _FULL_SCALE * 10 ** (target_dbfs / 20)
+    if mode == "peak":
+        level = float(np.max(np.abs(audio)))
+    else:
+        level = float(np.sqrt(np.dot(audio, audio) / audio.size))
+    return target / level if level else 1.0
@@ -0,0 +1,315 @@
+"""Retry policy and rate limiting for Gemini API calls.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+from gemini_tts_tool.lazy import LazyModule
+
+if TYPE_CHECKING:
+    import httpx
+else:
+    httpx = LazyModule("httpx")
+
+# HTTP status codes worth retrying: timeouts, rate limits and transient server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)s\s*$")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Jittered exponential backoff for transient API failures.
+
+    Attributes:
+        max_attempts: Total attempts including the first call (1 disables retries)
+        initial_delay: Backoff before the first retry, in seconds
+        max_delay: Upper bound for a single backoff, in seconds
+        multiplier: Backoff growth factor per attempt
+        jitter: Fraction of each backoff that is randomized (0 to 1)
+    """
+
+    max_attempts: int = 4
+    initial_delay: float = 1.0
+    max_delay: float = 60.0
+    multiplier: float = 2.0
+    jitter: float = 0.5
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1. Got: {self.max_attempts}")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError(f"jitter must be between 0 and 1. Got: {self.jitter}")
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the delay before retrying after the given failed attempt.
+
+        A server-provided retry-after hint is honored as a lower bound.
+
+        Args:
+            attempt: Number of the attempt that failed (1-based)
+            retry_after: Server-suggested delay in seconds, if any
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_delay, self.initial_delay * self.multiplier ** (attempt - 1))
+        delay -= delay * self.jitter * random.random()
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+# Default policy used by the synthesizer
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Policy that never retries
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Return whether an exception from an API call is worth retrying.
+
+    Args:
+        error: Exception raised by the Gemini SDK
+
+    Returns:
+        True for rate limits, transient server errors and network failures
+    """
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (httpx.TransportError, ConnectionError, TimeoutError))
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Return whether an exception is a 429 rate-limit response."""
+    return getattr(error, "code", None) == 429
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Extract a server-suggested retry delay from an API error.
+
+    Checks the Retry-After response header and the google.rpc.RetryInfo
+    detail (e.g. ``"retryDelay": "12s"``) in the error body.
+
+    Args:
+        error: Exception raised by the Gemini SDK
+
+    Returns:
+        Delay in seconds, or None if the error carries no hint
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        try:
+            value = headers.get("retry-after")
+        except Exception:
+            value = None
+        if isinstance(value, str) and value.strip():
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+                except ValueError:
+                    pass
+
+    details = getattr(error, "details", None)
+    if isinstance(details, dict):
+        error_body = details.get("error", details)
+        for detail in error_body.get("details", []) if isinstance(error_body, dict) else []:
+            if isinstance(detail, dict) and "retryDelay" in detail:
+                match = _DURATION_RE.match(str(detail["retryDelay"]))
+                if match:
+                    return float(match.group(1))
+
+    return None
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float, now: float) -> None:
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.level = per_minute
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take amount from the bucket and return how long the caller must wait."""
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        self.level -= min(amount, self.capacity)
+        return 0.0 if self.level >= 0 else -self.level / self.rate
+
+    def available(self, now: float) -> float:
+        """Return the current level without taking anything from the bucket."""
+        return min(self.capacity, self.level + (now - self.updated) * self.rate)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter shared by all callers.
+
+    Capacity is reserved up front: each call deducts from the buckets
+    immediately and is told how long to wait, so concurrent threads and
+    coroutines are served in arrival order without busy-waiting. A 429
+    response pauses every caller for the server's retry-after delay.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request quota (None for unlimited)
+            tokens_per_minute: Input token quota (None for unlimited)
+            clock: Monotonic clock, injectable for tests
+        """
+        for name, value in (
+            ("requests_per_minute", requests_per_minute),
+            ("tokens_per_minute", tokens_per_minute),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive. Got: {value}")
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self._requests = _TokenBucket(requests_per_minute, now) if requests_per_minute else None
+        self._tokens = _TokenBucket(tokens_per_minute, now) if tokens_per_minute else None
+        self._paused_until = now
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve capacity for one request and return the required wait in seconds."""
+        with self._lock:
+            now = self._clock()
+            wait = max(0.0, self._paused_until - now)
+            if self._requests:
+                wait = max(wait, self._requests.reserve(1, now))
+            if self._tokens and tokens:
+                wait = max(wait, self._tokens.reserve(tokens, now))
+            return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until one request using the given tokens may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: int = 0) -> float:
+        """Async counterpart of acquire that yields to the event loop while waiting."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def remaining(self) -> float:
+        """Return the fraction of the quota available right now (1.0 if unlimited).
+
+        The most depleted of the request and token buckets decides; a paused
+        limiter has nothing left.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._paused_until > now:
+                return 0.0
+            buckets = [bucket for bucket in (self._requests, self._tokens) if bucket]
+            fractions = [bucket.available(now) / bucket.capacity for bucket in buckets]
+            return max(0.0, min(fractions, default=1.0))
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all callers for the given number of seconds (e.g. after a 429)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+def call_with_retry[T](
+    fn: Callable[[], T],
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    rate_limiter: RateLimiter | None = None,
+    tokens: int = 0,
+    on_retry: Callable[[int, BaseException, float], None] | None = None,
+) -> T:
+    """Call fn, retrying transient failures according to the policy.
+
+    Args:
+        fn: Zero-argument callable performing one API request
+        policy: Retry policy
+        rate_limiter: Optional limiter acquired before every attempt
+        tokens: Estimated input tokens of the request (for the TPM quota)
+        on_retry: Optional callback(attempt, error, delay) invoked before sleeping
+
+    Returns:
+        The result of fn
+
+    Raises:
+        Exception: The last error if it is not retryable or attempts are exhausted
+    """
+    attempt = 1
+    while True:
+        if rate_limiter:
+            rate_limiter.acquire(tokens)
+        try:
+            return fn()
+        except Exception as e:
+            delay = _handle_failure(e, attempt, policy, rate_limiter)
+            if on_retry:
+                on_retry(attempt, e, delay)
+            time.sleep(delay)
+            attempt += 1
+
+
+async def async_call_with_retry[T](
+    fn: Callable[[], Awaitable[T]],
+    policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    rate_limiter: RateLimiter | None = None,
+    tokens: int = 0,
+    on_retry: Callable[[int, BaseException, float], None] | None = None,
+) -> T:
+    """Async counterpart of call_with_retry."""
+    attempt = 1
+    while True:
+        if rate_limiter:
+            await rate_limiter.acquire_async(tokens)
+        try:
+            return await fn()
+        except Exception as e:
+            delay = _handle_failure(e, attempt, policy, rate_limiter)
+            if on_retry:
+                on_retry(attempt, e, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+def _handle_failure(
+    error: Exception, attempt: int, policy: RetryPolicy, rate_limiter: RateLimiter | None
+) -> float:
+    """Re-raise non-retryable errors, otherwise return the backoff delay."""
+    if attempt >= policy.max_attempts or not is_retryable(error):
+        raise error
+
+    hint = retry_after(error)
+    delay = policy.backoff(attempt, hint)
+    if rate_limiter and is_rate_limited(error):
+        rate_limiter.pause(delay)
+    return delay
@@ -0,0 +1,518 @@
+"""Priority and deadline scheduling of synthesis requests.
+
+Callers of synthesize_speech reserve quota from the RateLimiter in arrival
+order, so a short interactive prompt arriving after a 500-chunk chapter
+waits for all of it. A Scheduler queues requests instead and dispatches
+them by priority:
+
+- Higher priorities go first; within a priority the earliest deadline,
+  then the earliest arrival.
+- Bulk work is packed into spare capacity: it only starts while more than
+  bulk_headroom of the quota is left, and never takes the last worker, so
+  interactive work can start at once.
+- Work whose deadline passes while it is queued is dropped without using
+  quota, and the caller gets DeadlineExceededError.
+
+Long texts are queued chunk by chunk, so an interactive request overtakes
+the rest of a chapter that is already being synthesized. Calls made for
+several callers at once (coalesced requests) share an Urgency, which each
+caller raises to its own priority and deadline.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import itertools
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.chunker import DEFAULT_MAX_CHUNK_TOKENS, split_text
+from gemini_tts_tool.core.metrics import MetricsRecorder, distribution
+from gemini_tts_tool.core.pool import ClientPool
+from gemini_tts_tool.core.retry import RateLimiter, RetryPolicy
+from gemini_tts_tool.core.synthesizer import DEFAULT_MAX_WORKERS, SynthesisError, synthesize_speech
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE
+
+if TYPE_CHECKING:
+    from google import genai
+
+# Priorities, highest first
+PRIORITIES = ("interactive", "normal", "bulk")
+INTERACTIVE, NORMAL, BULK = range(len(PRIORITIES))
+
+# Share of the quota bulk work leaves for higher priorities
+DEFAULT_BULK_HEADROOM = 0.2
+
+# How often bulk work held back for capacity checks the quota again
+CAPACITY_POLL_SECONDS = 0.05
+
+# Wait times kept per priority for percentiles
+RECENT_WAITS = 1000
+
+
+class DeadlineExceededError(SynthesisError):
+    """Raised when a request's deadline passes before its audio is ready."""
+
+
+@dataclass
+class Urgency:
+    """How soon the callers waiting for some calls need them.
+
+    Calls are ordered by the highest priority and earliest deadline of their
+    callers, and only dropped once the last caller's deadline has passed.
+    """
+
+    priority: int
+    # Earliest deadline as a clock time (math.inf: none)
+    due: float
+    # Latest deadline as a clock time (None: some caller has none)
+    expires: float | None
+
+
+@dataclass(order=True)
+class _Job:
+    """A queued call, ordered by (priority, deadline, arrival)."""
+
+    sort_key: tuple[int, float, int]
+    fn: Callable[[], Any] = field(compare=False)
+    future: Future[Any] = field(compare=False)
+    urgency: Urgency = field(compare=False)
+    priority: int = field(compare=False)
+    expires: float | None = field(compare=False)
+    submitted: float = field(compare=False)
+
+
+class Scheduler:
+    """Runs synthesis requests on a fixed set of workers in priority order.
+
+    Example:
+        >>> scheduler = Scheduler(max_workers=8, capacity=rate_limiter.remaining)
+        >>> audio = scheduler.synthesize_speech(client, "Hi!", priority=INTERACTIVE,
+        ...                                     rate_limiter=rate_limiter)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        capacity: Callable[[], float] | None = None,
+        bulk_headroom: float = DEFAULT_BULK_HEADROOM,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler and start its workers.
+
+        Args:
+            max_workers: Number of requests running at the same time
+            capacity: Returns the fraction of the quota available right now,
+                e.g. RateLimiter.remaining (None: bulk is not held back for quota)
+            bulk_headroom: Bulk work only starts while more than this fraction is left
+            clock: Monotonic clock, injectable for tests
+
+        Raises:
+            ValueError: If max_workers is less than 1 or bulk_headroom is not in [0, 1)
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1. Got: {max_workers}")
+        if not 0 <= bulk_headroom < 1:
+            raise ValueError(f"bulk_headroom must be in [0, 1). Got: {bulk_headroom}")
+        self.max_workers = max_workers
+        self.bulk_headroom = bulk_headroom
+        # One worker stays free for higher priorities whenever there is more than one
+        self.bulk_workers = max(1, max_workers - 1)
+        self._capacity = capacity
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._queue: list[_Job] = []
+        self._arrivals = itertools.count()
+        self._closed = False
+        self._running = [0] * len(PRIORITIES)
+        self._dispatched = [0] * len(PRIORITIES)
+        self._expired = [0] * len(PRIORITIES)
+        self._waits: list[deque[float]] = [deque(maxlen=RECENT_WAITS) for _ in PRIORITIES]
+        self._wait_totals = [0.0] * len(PRIORITIES)
+        self._workers = [
+            threading.Thread(target=self._work, name=f"scheduler-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def urgency(self, priority: int = NORMAL, deadline: float | None = None) -> Urgency:
+        """Return the urgency of a caller that needs a result within deadline seconds.
+
+        Raises:
+            ValueError: If the priority or deadline is invalid
+        """
+        if priority not in range(len(PRIORITIES)):
+            raise ValueError(f"Invalid priority: {priority}")
+        if deadline is not None and deadline <= 0:
+            raise ValueError(f"deadline must be positive. Got: {deadline}")
+        expires = self._clock() + deadline if deadline is not None else None
+        return Urgency(priority, math.inf if expires is None else expires, expires)
+
+    def add_waiter(
+        self, urgency: Urgency, priority: int = NORMAL, deadline: float | None = None
+    ) -> None:
+        """Raise an urgency for one more caller and reorder its queued calls.
+
+        Args:
+            urgency: Urgency the calls were submitted with
+            priority: The new caller's priority
+            deadline: The new caller's deadline in seconds (None: no deadline)
+
+        Raises:
+            ValueError: If the priority or deadline is invalid
+        """
+        waiter = self.urgency(priority, deadline)
+        with self._condition:
+            urgency.priority = min(urgency.priority, waiter.priority)
+            urgency.due = min(urgency.due, waiter.due)
+            if urgency.expires is not None:
+                urgency.expires = (
+                    None if waiter.expires is None else max(urgency.expires, waiter.expires)
+                )
+            for job in self._queue:
+                if job.urgency is urgency:
+                    job.sort_key = (urgency.priority, urgency.due, job.sort_key[2])
+                    job.priority = urgency.priority
+                    job.expires = urgency.expires
+            heapq.heapify(self._queue)
+            self._condition.notify_all()
+
+    def submit[T](
+        self,
+        fn: Callable[[], T],
+        priority: int = NORMAL,
+        deadline: float | None = None,
+        urgency: Urgency | None = None,
+    ) -> Future[T]:
+        """Queue a call.
+
+        Args:
+            fn: Zero-argument callable, normally performing one API request
+            priority: INTERACTIVE, NORMAL or BULK
+            deadline: Seconds from now after which the call is dropped if it
+                hasn't started (None: no deadline)
+            urgency: Urgency shared with other calls, used instead of
+                priority and deadline (see add_waiter)
+
+        Returns:
+            Future of the call's result; DeadlineExceededError if it was dropped
+
+        Raises:
+            ValueError: If the priority or deadline is invalid
+            RuntimeError: If the scheduler is closed
+        """
+        urgency = urgency or self.urgency(priority, deadline)
+        future: Future[T] = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a closed scheduler")
+            job = _Job(
+                (urgency.priority, urgency.due, next(self._arrivals)),
+                fn,
+                future,
+                urgency,
+                urgency.priority,
+                urgency.expires,
+                self._clock(),
+            )
+            heapq.heappush(self._queue, job)
+            self._condition.notify()
+        return future
+
+    def run[T](
+        self,
+        fn: Callable[[], T],
+        priority: int = NORMAL,
+        deadline: float | None = None,
+        urgency: Urgency | None = None,
+    ) -> T:
+        """Queue a call and wait for its result.
+
+        With a shared urgency the call is waited for until it completes or is
+        dropped; each caller enforces its own deadline.
+
+        Raises:
+            DeadlineExceededError: If the result isn't ready within the deadline
+        """
+        future = self.submit(fn, priority, deadline, urgency)
+        return self._wait([future], None if urgency else deadline)[0]
+
+    def synthesize_speech(
+        self,
+        client: genai.Client,
+        text: str,
+        voice: str = DEFAULT_VOICE,
+        model: str = DEFAULT_MODEL,
+        system_instruction: str | None = None,
+        priority: int = NORMAL,
+        deadline: float | None = None,
+        urgency: Urgency | None = None,
+        max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+        cache: AudioCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        metrics: MetricsRecorder | None = None,
+    ) -> bytes:
+        """Synthesize text with each chunk queued as a request of its own.
+
+        Takes the arguments of synthesize_speech plus:
+
+        Args:
+            priority: INTERACTIVE, NORMAL or BULK
+            deadline: Seconds from now within which the audio is needed
+                (None: no deadline)
+            urgency: Urgency shared with other callers, used instead of
+                priority and deadline; each caller then enforces its own deadline
+
+        Returns:
+            Audio data as bytes (PCM, 24kHz, mono, 16-bit)
+
+        Raises:
+            DeadlineExceededError: If the audio isn't ready within the deadline
+            SynthesisError: If synthesis fails
+            ValueError: If parameters are invalid
+        """
+        # Empty text goes through as is so synthesize_speech reports it
+        chunks = split_text(text, max_chunk_tokens) or [text]
+
+        def run(chunk: str) -> bytes:
+            return synthesize_speech(
+                client=client,
+                text=chunk,
+                voice=voice,
+                model=model,
+                system_instruction=system_instruction,
+                max_chunk_tokens=max_chunk_tokens,
+                max_workers=1,
+                cache=cache,
+                retry_policy=retry_policy,
+                rate_limiter=rate_limiter,
+                metrics=metrics,
+            )
+
+        unique = list(dict.fromkeys(chunks))
+        # All chunks share one urgency, so a caller joining later moves them all
+        shared = urgency or self.urgency(priority, deadline)
+        futures = [self.submit(functools.partial(run, chunk), urgency=shared) for chunk in unique]
+        audio = dict(zip(unique, self._wait(futures, None if urgency else deadline), strict=True))
+        return b"".join(audio[chunk] for chunk in chunks)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, running requests and wait times per priority."""
+        with self._condition:
+            queued = [0] * len(PRIORITIES)
+            for job in self._queue:
+                queued[job.priority] += 1
+            return {
+                "queued": sum(queued),
+                "running": sum(self._running),
+                "priorities": [
+                    {
+                        "priority": name,
+                        "queued": queued[i],
+                        "running": self._running[i],
+                        "dispatched": self._dispatched[i],
+                        "expired": self._expired[i],
+                        "wait_seconds": distribution(list(self._waits[i])),
+                    }
+                    for i, name in enumerate(PRIORITIES)
+                ],
+            }
+
+    def prometheus(self) -> str:
+        """Return queue metrics in Prometheus text exposition format."""
+        prefix = "gemini_tts_queue"
+        stats = self.stats()["priorities"]
+        with self._condition:
+            wait_totals = list(self._wait_totals)
+        lines = []
+        for metric, kind, help_text, values in (
+            ("depth", "gauge", "Requests waiting to be dispatched.", [s["queued"] for s in stats]),
+            ("running", "gauge", "Requests being synthesized.", [s["running"] for s in stats]),
+            (
+                "expired_total",
+                "counter",
+                "Requests dropped because their deadline passed.",
+                [s["expired"] for s in stats],
+            ),
+            (
+                "wait_seconds_sum",
+                "counter",
+                "Time dispatched requests spent queued.",
+                [f"{total:.4f}" for total in wait_totals],
+            ),
+            (
+                "wait_seconds_count",
+                "counter",
+                "Requests dispatched.",
+                [s["dispatched"] for s in stats],
+            ),
+        ):
+            lines += [
+                f"# HELP {prefix}_{metric} {help_text}",
+                f"# TYPE {prefix}_{metric} {kind}",
+            ]
+            lines += [
+                f'{prefix}_{metric}{{priority="{name}"}} {value}'
+                for name, value in zip(PRIORITIES, values, strict=True)
+            ]
+        return "\n".join(lines) + "\n"
+
+    def close(self, wait: bool = True) -> None:
+        """Stop accepting work and cancel queued calls.
+
+        Args:
+            wait: Wait for running calls to finish
+        """
+        with self._condition:
+            self._closed = True
+            for job in self._queue:
+                job.future.cancel()
+            self._queue.clear()
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def __enter__(self) -> Scheduler:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _wait[T](self, futures: list[Future[T]], deadline: float | None) -> list[T]:
+        """Collect results in order, cancelling the rest on failure or timeout."""
+        expires = self._clock() + deadline if deadline is not None else None
+        try:
+            return [
+                future.result(None if expires is None else max(0.0, expires - self._clock()))
+                for future in futures
+            ]
+        except FutureTimeoutError as e:
+            raise DeadlineExceededError(f"Deadline of {deadline:g}s exceeded") from e
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _bulk_ready(self) -> bool:
+        """Whether spare workers and quota allow starting bulk work."""
+        if self._running[BULK] >= self.bulk_workers:
+            return False
+        return self._capacity is None or self._capacity() > self.bulk_headroom
+
+    def _next(self) -> _Job | None:
+        """Take the next job to run, or None once the scheduler is closed."""
+        with self._condition:
+            while True:
+                if not self._queue:
+                    if self._closed:
+                        return None
+                    self._condition.wait()
+                    continue
+
+                job = self._queue[0]
+                now = self._clock()
+                if job.expires is not None and now > job.expires:
+                    heapq.heappop(self._queue)
+                    self._expired[job.priority] += 1
+                    if not job.future.cancelled():
+                        job.future.set_exception(
+                            DeadlineExceededError(
+                                "Deadline passed before the request was dispatched"
+                            )
+                        )
+                    continue
+                if job.priority == BULK and not self._bulk_ready():
+                    self._condition.wait(CAPACITY_POLL_SECONDS)
+                    continue
+
+                heapq.heappop(self._queue)
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                waited = now - job.submitted
+                self._running[job.priority] += 1
+                self._dispatched[job.priority] += 1
+                self._waits[job.priority].append(waited)
+                self._wait_totals[job.priority] += waited
+                return job
+
+    def _work(self) -> None:
+        while (job := self._next()) is not None:
+            try:
+                result = job.fn()
+            except BaseException as e:
+                job.future.set_exception(e)
+            else:
+                job.future.set_result(result)
+            finally:
+                with self._condition:
+                    self._running[job.priority] -= 1
+                    self._condition.notify_all()
+
+
+def parse_priority(name: str) -> int:
+    """Convert a priority name ('interactive', 'normal', 'bulk') to its value.
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        return PRIORITIES.index(name.strip().lower())
+    except ValueError:
+        raise ValueError(
+            f"Invalid priority '{name}'.\n\nWhat to do:\n  Use one of: {', '.join(PRIORITIES)}"
+        ) from None
+
+
+def quota_remaining(
+    client: genai.Client, rate_limiter: RateLimiter | None = None
+) -> Callable[[], float] | None:
+    """Return a function reporting the spare quota of a client, if it has a quota.
+
+    Args:
+        client: Gemini client or ClientPool
+        rate_limiter: Limiter shared by the client's callers, if any
+
+    Returns:
+        The limiter's or pool's remaining(), or None for an unlimited client
+    """
+    if rate_limiter:
+        return rate_limiter.remaining
+    if isinstance(client, ClientPool) and (client.requests_per_minute or client.tokens_per_minute):
+        return client.remaining
+    return None
+
+
+def format_scheduler_stats(stats: dict[str, Any]) -> list[str]:
+    """Describe dispatched requests and queue waits per priority."""
+    lines = []
+    for entry in stats["priorities"]:
+        if not entry["dispatched"] and not entry["expired"]:
+            continue
+        wait = entry["wait_seconds"]
+        line = f"Queue {entry['priority']}: {entry['dispatched']} dispatched"
+        if wait:
+            line += f", wait p50 {wait['p50']:.3f}s p95 {wait['p95']:.3f}s"
+        if entry["expired"]:
+            line += f", {entry['expired']} past deadline"
+        lines.append(line)
+    return lines
@@ -0,0 +1,386 @@
+"""Local HTTP synthesis server with a warm client and request coalescing.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.dialogue import (
+    DEFAULT_TURN_GAP,
+    MAX_SPEAKERS_PER_REQUEST,
+    apply_numbered_voices,
+    detect_speakers,
+    synthesize_dialogue,
+)
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.retry import RateLimiter, RetryPolicy
+from gemini_tts_tool.core.scheduler import (
+    NORMAL,
+    DeadlineExceededError,
+    Scheduler,
+    Urgency,
+    parse_priority,
+    quota_remaining,
+)
+from gemini_tts_tool.core.synthesizer import SynthesisError, synthesize_multi_voice
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE
+from gemini_tts_tool.utils import wav_header
+
+if TYPE_CHECKING:
+    from google import genai
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# Default number of API requests in flight across all connections
+DEFAULT_CONCURRENCY = 8
+
+# Largest accepted request body (1 MiB is far beyond the API's input limit)
+MAX_REQUEST_BYTES = 1024**2
+
+
+class Coalescer:
+    """Single-flight execution: concurrent calls with the same key share one result.
+
+    The first caller for a key starts the function; callers arriving while
+    it is in flight wait for and receive the same result (or exception).
+    The function's scheduler calls run at the highest priority and earliest
+    deadline of everyone waiting, and each caller waits only until its own
+    deadline. Completed results are not kept, so later calls run again.
+    """
+
+    def __init__(self, scheduler: Scheduler) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            scheduler: Scheduler the coalesced functions submit their calls to
+        """
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, tuple[Future[bytes], Urgency]] = {}
+        self.coalesced = 0
+
+    def run(
+        self,
+        key: str,
+        fn: Callable[[Urgency], bytes],
+        priority: int = NORMAL,
+        deadline: float | None = None,
+    ) -> bytes:
+        """Run fn for key, or wait for an identical call already in flight.
+
+        Args:
+            key: Identity of the request, without its priority and deadline
+            fn: Function producing the result, scheduling its calls with the given urgency
+            priority: This caller's priority
+            deadline: Seconds within which this caller needs the result (None: no deadline)
+
+        Returns:
+            The result of fn
+
+        Raises:
+            DeadlineExceededError: If the result isn't ready within the deadline
+        """
+        with self._lock:
+            entry = self._in_flight.get(key)
+            if entry is None:
+                future: Future[bytes] = Future()
+                urgency = self._scheduler.urgency(priority, deadline)
+                self._in_flight[key] = (future, urgency)
+                # Runs apart from the caller, which may give up at its deadline
+                threading.Thread(
+                    target=self._lead, args=(key, fn, future, urgency), daemon=True
+                ).start()
+            else:
+                future, urgency = entry
+                self._scheduler.add_waiter(urgency, priority, deadline)
+                self.coalesced += 1
+
+        try:
+            return future.result(deadline)
+        except FutureTimeoutError as e:
+            raise DeadlineExceededError(f"Deadline of {deadline:g}s exceeded") from e
+
+    def _lead(
+        self, key: str, fn: Callable[[Urgency], bytes], future: Future[bytes], urgency: Urgency
+    ) -> None:
+        try:
+            future.set_result(fn(urgency))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+class SynthesisServer(ThreadingHTTPServer):
+    """HTTP server exposing synthesize and multi-voice with one shared client.
+
+    Endpoints (JSON request bodies, WAV responses):
+
+    - ``POST /synthesize`` with ``text`` and optional ``voice``, ``model``, ``style``
+    - ``POST /multi-voice`` with ``dialogue`` and optional ``speaker1_voice``,
+      ``speaker2_voice``, ``speaker_voices``, ``gap``, ``model``, ``style``
+    - ``GET /health``
+    - ``GET /metrics`` (Prometheus text format)
+
+    Both POST endpoints accept ``priority`` (interactive, normal or bulk) and
+    ``deadline`` (seconds) and run through one Scheduler, so interactive
+    requests are dispatched ahead of queued bulk work.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        client: genai.Client,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        cache: AudioCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        verbose: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        """Initialize the server and bind the socket.
+
+        Args:
+            client: Gemini API client shared by all requests
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            cache: Optional audio cache shared by all requests
+            retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+            rate_limiter: Optional limiter shared by all requests
+            verbose: Log every request to stderr
+            concurrency: Maximum number of API requests in flight
+        """
+        super().__init__((host, port), _RequestHandler)
+        self.client = client
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.verbose = verbose
+        self.metrics = MetricsRecorder()
+        self.scheduler = Scheduler(concurrency, capacity=quota_remaining(client, rate_limiter))
+        self.coalescer = Coalescer(self.scheduler)
+
+    def server_close(self) -> None:
+        """Close the socket and cancel queued requests."""
+        super().server_close()
+        self.scheduler.close(wait=False)
+
+    def synthesize(self, params: dict[str, Any], urgency: Urgency) -> bytes:
+        """Synthesize a /synthesize request body to PCM audio."""
+        return self.scheduler.synthesize_speech(
+            client=self.client,
+            text=_require(params, "text"),
+            voice=_optional(params, "voice") or DEFAULT_VOICE,
+            model=_optional(params, "model") or DEFAULT_MODEL,
+            system_instruction=_optional(params, "style"),
+            urgency=urgency,
+            cache=self.cache,
+            retry_policy=self.retry_policy,
+            rate_limiter=self.rate_limiter,
+            metrics=self.metrics,
+        )
+
+    def multi_voice(self, params: dict[str, Any], urgency: Urgency) -> bytes:
+        """Synthesize a /multi-voice request body to PCM audio."""
+        dialogue = _require(params, "dialogue")
+        model = _optional(params, "model") or DEFAULT_MODEL
+        style = _optional(params, "style")
+        speaker1_voice = _optional(params, "speaker1_voice")
+        speaker2_voice = _optional(params, "speaker2_voice")
+        speaker_voices = params.get("speaker_voices")
+        if speaker_voices is not None and (
+            not isinstance(speaker_voices, dict)
+            or not all(isinstance(voice, str) for voice in speaker_voices.values())
+        ):
+            raise ValueError("speaker_voices must be an object mapping speaker names to voices")
+        gap = params.get("gap", DEFAULT_TURN_GAP)
+        if isinstance(gap, bool) or not isinstance(gap, int | float):
+            raise ValueError("gap must be a number of seconds")
+
+        speakers = detect_speakers(dialogue)
+        # A dialogue is scheduled as one unit and synthesizes its turns itself
+        if speaker_voices or len(speakers) > MAX_SPEAKERS_PER_REQUEST:
+            speaker_voices = apply_numbered_voices(
+                speakers, speaker_voices, speaker1_voice, speaker2_voice
+            )
+            return self.scheduler.run(
+                lambda: synthesize_dialogue(
+                    client=self.client,
+                    dialogue=dialogue,
+                    speaker_voices=speaker_voices,
+                    model=model,
+                    system_instruction=style,
+                    gap=gap,
+                    cache=self.cache,
+                    retry_policy=self.retry_policy,
+                    rate_limiter=self.rate_limiter,
+                    metrics=self.metrics,
+                ),
+                urgency=urgency,
+            )
+        # A 2-speaker dialogue is one request, so there is no gap to apply
+        if "gap" in params and self.verbose:
+            sys.stderr.write("Note: gap is ignored for a 2-speaker dialogue\n")
+        return self.scheduler.run(
+            lambda: synthesize_multi_voice(
+                client=self.client,
+                dialogue=dialogue,
+                speaker1_voice=speaker1_voice or "Kore",
+                speaker2_voice=speaker2_voice or "Puck",
+                model=model,
+                system_instruction=style,
+                cache=self.cache,
+                retry_policy=self.retry_policy,
+                rate_limiter=self.rate_limiter,
+                metrics=self.metrics,
+            ),
+            urgency=urgency,
+        )
+
+
+def _scheduling(params: dict[str, Any]) -> tuple[int, float | None]:
+    """Read the priority and deadline (seconds) of a request body."""
+    priority = params.pop("priority", None)
+    deadline = params.pop("deadline", None)
+    if deadline is not None and (
+        isinstance(deadline, bool) or not isinstance(deadline, int | float) or deadline <= 0
+    ):
+        raise ValueError("deadline must be a positive number of seconds")
+    return (parse_priority(str(priority)) if priority else NORMAL), deadline
+
+
+def _require(params: dict[str, Any], field: str) -> str:
+    value = params.get(field)
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"Missing required field: {field}")
+    return value
+
+
+def _optional(params: dict[str, Any], field: str) -> str | None:
+    value = params.get(field)
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{field} must be a string")
+    return value
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the SynthesisServer."""
+
+    server: SynthesisServer
+    protocol_version = "HTTP/1.1"
+
+    _ROUTES: dict[str, Callable[[SynthesisServer, dict[str, Any], Urgency], bytes]] = {
+        "/synthesize": SynthesisServer.synthesize,
+        "/multi-voice": SynthesisServer.multi_voice,
+    }
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        elif self.path == "/metrics":
+            text = (
+                self.server.metrics.prometheus()
+                + (
+                    "# HELP gemini_tts_coalesced_total Requests that shared a call in flight.\n"
+                    "# TYPE gemini_tts_coalesced_total counter\n"
+                    f"gemini_tts_coalesced_total {self.server.coalescer.coalesced}\n"
+                )
+                + self.server.scheduler.prometheus()
+            )
+            self._send(HTTPStatus.OK, "text/plain; version=0.0.4", text.encode("utf-8"))
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self) -> None:
+        route = self._ROUTES.get(self.path)
+        if route is None:
+            # The body is left unread, so the connection can't be reused
+            self.close_connection = True
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+            return
+
+        body_read = False
+        try:
+            length = self._content_length()
+            if length > MAX_REQUEST_BYTES:
+                self.close_connection = True
+                self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Request too large"})
+                return
+
+            data = self.rfile.read(length)
+            body_read = True
+            params = json.loads(data or b"{}")
+            if not isinstance(params, dict):
+                raise ValueError("Request body must be a JSON object")
+            priority, deadline = _scheduling(params)
+            # Identical concurrent requests share one upstream call, whatever their urgency
+            key = json.dumps([self.path, params], sort_keys=True)
+            audio_data = self.server.coalescer.run(
+                key, lambda urgency: route(self.server, params, urgency), priority, deadline
+            )
+        except ValueError as e:
+            # Includes json.JSONDecodeError
+            if not body_read:
+                self.close_connection = True
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e).split("\n", 1)[0]})
+            return
+        except DeadlineExceededError as e:
+            self._send_json(HTTPStatus.GATEWAY_TIMEOUT, {"error": str(e)})
+            return
+        except SynthesisError as e:
+            self._send_json(HTTPStatus.BAD_GATEWAY, {"error": str(e)})
+            return
+        except Exception as e:
+            # Anything else is a bug, but the client still gets a response
+            self.log_error("Unexpected error: %r", e)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"Internal error: {e}"})
+            return
+
+        body = wav_header(len(audio_data)) + audio_data
+        self.server.metrics.record_write(len(body))
+        self._send(HTTPStatus.OK, "audio/wav", body)
+
+    def _content_length(self) -> int:
+        """Return the request's Content-Length (0 if absent).
+
+        Raises:
+            ValueError: If the header is not a non-negative integer
+        """
+        value = self.headers.get("Content-Length") or "0"
+        try:
+            length = int(value)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise ValueError(f"Invalid Content-Length: {value}")
+        return length
+
+    def _send_json(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        self._send(status, "application/json", json.dumps(body).encode("utf-8"))
+
+    def _send(self, status: HTTPStatus, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
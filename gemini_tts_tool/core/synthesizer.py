@@ -4,13 +4,43 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+from __future__ import annotations
+
+import asyncio
+import functools
 import sys
-from typing import Any
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from gemini_tts_tool.core.cache import AudioCache, cache_key
+from gemini_tts_tool.core.chunker import DEFAULT_MAX_CHUNK_TOKENS, estimate_tokens, split_text
+from gemini_tts_tool.core.metrics import MetricsRecorder
+from gemini_tts_tool.core.postprocess import PostProcess, process_audio, require_numpy
+from gemini_tts_tool.core.retry import (
+    DEFAULT_RETRY_POLICY,
+    RateLimiter,
+    RetryPolicy,
+    async_call_with_retry,
+    call_with_retry,
+)
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE, validate_model, validate_voice
+from gemini_tts_tool.lazy import LazyModule
 
-from google import genai
-from google.genai import types
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+else:
+    # The SDK is slow to import; load it when the first request is built
+    types = LazyModule("google.genai.types")
 
-from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE, validate_model, validate_voice
+# Default number of concurrent requests when synthesizing chunked text
+DEFAULT_MAX_WORKERS = 4
+
+# Voice and speaker combinations whose request configs are kept for reuse
+CONFIG_CACHE_SIZE = 256
 
 
 class SynthesisError(Exception):
@@ -19,21 +49,51 @@ class SynthesisError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class _RequestOptions:
+    """Settings applied to every API request of a synthesis call."""
+
+    cache: AudioCache | None = None
+    retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY
+    rate_limiter: RateLimiter | None = None
+    metrics: MetricsRecorder | None = None
+
+
 def synthesize_speech(
     client: genai.Client,
     text: str,
     voice: str = DEFAULT_VOICE,
     model: str = DEFAULT_MODEL,
     system_instruction: str | None = None,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    cache: AudioCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    metrics: MetricsRecorder | None = None,
+    postprocess: PostProcess | None = None,
 ) -> bytes:
     """Synthesize speech from text using Gemini TTS.
 
+    Text longer than max_chunk_tokens is split at paragraph and sentence
+    boundaries, the chunks are synthesized concurrently, and the resulting
+    PCM is concatenated in document order. Identical chunks are synthesized
+    once and their audio is reused at every occurrence. With postprocess,
+    the chunks are crossfaded and the result trimmed and normalized.
+
     Args:
         client: Gemini API client
         text: Text to synthesize
         voice: Voice name (default: Puck)
         model: Model name or alias (default: flash)
         system_instruction: Optional style instructions
+        max_chunk_tokens: Maximum estimated input tokens per request
+        max_workers: Maximum number of concurrent requests for chunked text
+        cache: Optional audio cache; each request is served from it when possible
+        retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+        rate_limiter: Optional limiter shared with other concurrent callers
+        metrics: Optional recorder of request latency and throughput
+        postprocess: Optional crossfade, silence trimming and normalization
 
     Returns:
         Audio data as bytes (PCM, 24kHz, mono, 16-bit)
@@ -42,6 +102,236 @@ def synthesize_speech(
         SynthesisError: If synthesis fails
         ValueError: If parameters are invalid
     """
+    voice, model, chunks = plan_speech(text, voice, model, max_chunk_tokens)
+    _check_max_workers(max_workers)
+    _check_postprocess(postprocess)
+    options = _RequestOptions(cache, retry_policy or DEFAULT_RETRY_POLICY, rate_limiter, metrics)
+    if len(chunks) <= 1:
+        audio_data = _synthesize_chunk(client, text, voice, model, system_instruction, options)
+        return _join_audio([audio_data], postprocess)
+
+    return _join_audio(
+        _synthesize_chunks(client, chunks, voice, model, system_instruction, max_workers, options),
+        postprocess,
+    )
+
+
+async def async_synthesize_speech(
+    client: genai.Client,
+    text: str,
+    voice: str = DEFAULT_VOICE,
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    cache: AudioCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    metrics: MetricsRecorder | None = None,
+    postprocess: PostProcess | None = None,
+) -> bytes:
+    """Synthesize speech from text using the async Gemini API (client.aio).
+
+    Same behavior, validation and errors as synthesize_speech, but requests run
+    on the event loop instead of blocking a thread. Chunks of long text are
+    synthesized concurrently, at most max_workers at a time.
+
+    Args:
+        client: Gemini API client
+        text: Text to synthesize
+        voice: Voice name (default: Puck)
+        model: Model name or alias (default: flash)
+        system_instruction: Optional style instructions
+        max_chunk_tokens: Maximum estimated input tokens per request
+        max_workers: Maximum number of concurrent requests for chunked text
+        cache: Optional audio cache; each request is served from it when possible
+        retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+        rate_limiter: Optional limiter shared with other concurrent callers
+        metrics: Optional recorder of request latency and throughput
+        postprocess: Optional crossfade, silence trimming and normalization
+
+    Returns:
+        Audio data as bytes (PCM, 24kHz, mono, 16-bit)
+
+    Raises:
+        SynthesisError: If synthesis fails
+        ValueError: If parameters are invalid
+    """
+    voice, model, chunks = plan_speech(text, voice, model, max_chunk_tokens)
+    _check_max_workers(max_workers)
+    _check_postprocess(postprocess)
+    options = _RequestOptions(cache, retry_policy or DEFAULT_RETRY_POLICY, rate_limiter, metrics)
+    if len(chunks) <= 1:
+        audio_data = await _async_synthesize_chunk(
+            client, text, voice, model, system_instruction, options
+        )
+        return _join_audio([audio_data], postprocess)
+
+    semaphore = asyncio.Semaphore(max_workers)
+    unique = _unique_chunks(chunks, options)
+
+    async def run(chunk: str) -> bytes:
+        async with semaphore:
+            try:
+                return await _async_synthesize_chunk(
+                    client, chunk, voice, model, system_instruction, options
+                )
+            except SynthesisError as e:
+                raise SynthesisError(
+                    f"Failed to synthesize chunk {chunks.index(chunk) + 1}/{len(chunks)}: {e}"
+                ) from e
+
+    tasks = [asyncio.ensure_future(run(chunk)) for chunk in unique]
+    try:
+        results = dict(zip(unique, await asyncio.gather(*tasks), strict=True))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    return _join_audio([results[chunk] for chunk in chunks], postprocess)
+
+
+def stream_speech(
+    client: genai.Client,
+    text: str,
+    voice: str = DEFAULT_VOICE,
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+    cache: AudioCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    metrics: MetricsRecorder | None = None,
+) -> Iterator[bytes]:
+    """Synthesize speech and yield PCM audio as it arrives.
+
+    Uses the streaming endpoint (generate_content_stream), so the first audio
+    is available before generation finishes and memory use stays bounded by
+    the size of a single response chunk. Long text is split like in
+    synthesize_speech and its chunks are streamed one after another; the audio
+    of a repeated chunk is kept until its last occurrence and replayed.
+    Failures are retried only until a request has produced its first audio.
+
+    Args:
+        client: Gemini API client
+        text: Text to synthesize
+        voice: Voice name (default: Puck)
+        model: Model name or alias (default: flash)
+        system_instruction: Optional style instructions
+        max_chunk_tokens: Maximum estimated input tokens per request
+        cache: Optional audio cache; cached requests are yielded in one piece
+        retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+        rate_limiter: Optional limiter shared with other concurrent callers
+        metrics: Optional recorder of request latency and throughput
+
+    Yields:
+        Audio data chunks (PCM, 24kHz, mono, 16-bit)
+
+    Raises:
+        SynthesisError: If synthesis fails
+        ValueError: If parameters are invalid
+    """
+    voice, model, chunks = plan_speech(text, voice, model, max_chunk_tokens)
+    if len(chunks) <= 1:
+        chunks = [text]
+
+    # Audio of chunks that occur again later, dropped after their last occurrence
+    remaining = Counter(chunks)
+    if metrics and len(remaining) < len(chunks):
+        metrics.record_saved(len(chunks) - len(remaining))
+    replay: dict[str, bytes] = {}
+
+    for chunk in chunks:
+        remaining[chunk] -= 1
+        if chunk in replay:
+            yield replay.pop(chunk) if not remaining[chunk] else replay[chunk]
+            continue
+
+        key = cache_key(chunk, voice, model, system_instruction) if cache else None
+        if cache and key and (cached := cache.get(key)) is not None:
+            if metrics:
+                metrics.cache_hit(model, len(cached))
+            if remaining[chunk]:
+                replay[chunk] = cached
+            yield cached
+            continue
+
+        received: list[bytes] = []
+        size = 0
+        timer = metrics.start(model) if metrics else None
+        try:
+            request = _speech_request(chunk, voice, model, system_instruction)
+
+            def open_stream(
+                request: dict[str, Any] = request,
+            ) -> tuple[list[bytes], Iterator[Any]]:
+                # Requests fail before the first audio arrives, so only retry up to there
+                responses = iter(client.models.generate_content_stream(**request))
+                for response in responses:
+                    first = list(_iter_audio(response))
+                    if first:
+                        return first, responses
+                raise SynthesisError("No audio data found in response")
+
+            first, responses = call_with_retry(
+                open_stream,
+                retry_policy or DEFAULT_RETRY_POLICY,
+                rate_limiter,
+                estimate_tokens(chunk),
+                on_retry=timer.on_retry if timer else None,
+            )
+            if timer:
+                timer.first_byte()
+            for audio_data in _iter_stream(first, responses):
+                if cache or remaining[chunk]:
+                    received.append(audio_data)
+                size += len(audio_data)
+                yield audio_data
+
+        except ValueError:
+            raise
+        except SynthesisError as e:
+            if timer:
+                timer.failed(e)
+            raise
+        except Exception as e:
+            if timer:
+                timer.failed(e)
+            raise SynthesisError(f"Failed to stream speech: {e}") from e
+
+        if timer:
+            timer.received()
+            timer.done(size)
+
+        if cache and key:
+            _cache_store(cache, key, b"".join(received))
+        if remaining[chunk]:
+            replay[chunk] = b"".join(received)
+
+
+def plan_speech(
+    text: str,
+    voice: str = DEFAULT_VOICE,
+    model: str = DEFAULT_MODEL,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+) -> tuple[str, str, list[str]]:
+    """Validate single-voice parameters and plan the chunks synthesize_speech sends.
+
+    Makes no API calls, so it can be used to preview or estimate a job.
+
+    Args:
+        text: Text to synthesize
+        voice: Voice name (default: Puck)
+        model: Model name or alias (default: flash)
+        max_chunk_tokens: Maximum estimated input tokens per request
+
+    Returns:
+        Tuple of (voice, resolved model name, chunks)
+
+    Raises:
+        ValueError: If parameters are invalid
+    """
     # Validate inputs
     voice = validate_voice(voice)
     model = validate_model(model)
@@ -56,42 +346,60 @@ def synthesize_speech(
             "  3. From stdin: echo 'Hello world' | gemini-tts-tool synthesize --stdin -o output.wav"
         )
 
-    try:
-        # Configure TTS request
-        config = types.GenerateContentConfig(
-            response_modalities=["AUDIO"],
-            speech_config=types.SpeechConfig(
-                voice_config=types.VoiceConfig(
-                    prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice)
-                )
-            ),
-        )
+    return voice, model, split_text(text, max_chunk_tokens)
 
-        # Build request contents
-        contents = [text]
 
-        # Add system instruction if provided
-        kwargs: dict[str, Any] = {"model": model, "contents": contents, "config": config}
-        if system_instruction:
-            kwargs["system_instruction"] = system_instruction
+def _speech_request(
+    text: str, voice: str, model: str, system_instruction: str | None
+) -> dict[str, Any]:
+    """Build generate_content keyword arguments for a single-voice request."""
+    # Build request contents
+    contents = [text]
 
-        # Make API call
-        response = client.models.generate_content(**kwargs)
+    # Add system instruction if provided
+    kwargs: dict[str, Any] = {"model": model, "contents": contents, "config": speech_config(voice)}
+    if system_instruction:
+        kwargs["system_instruction"] = system_instruction
 
-        # Extract audio data
-        if not response.candidates:
-            raise SynthesisError("No audio generated - empty response from API")
+    return kwargs
 
-        candidate = response.candidates[0]
-        if not candidate.content or not candidate.content.parts:
-            raise SynthesisError("No content in response")
 
-        # Get the first part with inline data
-        for part in candidate.content.parts:
-            if part.inline_data and part.inline_data.data:
-                return part.inline_data.data
+@functools.lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def speech_config(voice: str) -> types.GenerateContentConfig:
+    """Return the request config for a voice, built once and shared by all requests.
+
+    The SDK copies a config before sending it, so sharing one is safe as
+    long as it is treated as read-only. The uncached builder is available
+    as speech_config.__wrapped__.
+    """
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(
+                prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice)
+            )
+        ),
+    )
 
-        raise SynthesisError("No audio data found in response")
+
+def _synthesize_chunk(
+    client: genai.Client,
+    text: str,
+    voice: str,
+    model: str,
+    system_instruction: str | None,
+    options: _RequestOptions,
+) -> bytes:
+    """Synthesize a single request-sized piece of text with validated parameters."""
+    key = cache_key(text, voice, model, system_instruction) if options.cache else None
+    try:
+        return _generate_audio(
+            client,
+            _speech_request(text, voice, model, system_instruction),
+            key,
+            estimate_tokens(text),
+            options,
+        )
 
     except ValueError:
         # Re-raise validation errors
@@ -100,6 +408,215 @@ def synthesize_speech(
         raise SynthesisError(f"Failed to synthesize speech: {e}") from e
 
 
+async def _async_synthesize_chunk(
+    client: genai.Client,
+    text: str,
+    voice: str,
+    model: str,
+    system_instruction: str | None,
+    options: _RequestOptions,
+) -> bytes:
+    """Async counterpart of _synthesize_chunk using client.aio."""
+    key = cache_key(text, voice, model, system_instruction) if options.cache else None
+    try:
+        return await _async_generate_audio(
+            client,
+            _speech_request(text, voice, model, system_instruction),
+            key,
+            estimate_tokens(text),
+            options,
+        )
+
+    except ValueError:
+        raise
+    except Exception as e:
+        raise SynthesisError(f"Failed to synthesize speech: {e}") from e
+
+
+def _synthesize_chunks(
+    client: genai.Client,
+    chunks: list[str],
+    voice: str,
+    model: str,
+    system_instruction: str | None,
+    max_workers: int,
+    options: _RequestOptions,
+) -> list[bytes]:
+    """Synthesize distinct chunks concurrently and return their PCM in document order."""
+    unique = _unique_chunks(chunks, options)
+    results: dict[str, bytes] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+        futures = {
+            executor.submit(
+                _synthesize_chunk, client, chunk, voice, model, system_instruction, options
+            ): chunk
+            for chunk in unique
+        }
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        except SynthesisError as e:
+            executor.shutdown(wait=False, cancel_futures=True)
+            index = chunks.index(futures[future])
+            raise SynthesisError(
+                f"Failed to synthesize chunk {index + 1}/{len(chunks)}: {e}"
+            ) from e
+
+    return [results[chunk] for chunk in chunks]
+
+
+def _join_audio(segments: list[bytes], postprocess: PostProcess | None) -> bytes:
+    """Concatenate PCM segments, or join and process them if post-processing is set."""
+    if postprocess and postprocess.enabled:
+        return process_audio(segments, postprocess)
+    return b"".join(segments)
+
+
+def _check_max_workers(max_workers: int) -> None:
+    """Reject a worker count that couldn't run any chunk."""
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1. Got: {max_workers}")
+
+
+def _check_postprocess(postprocess: PostProcess | None) -> None:
+    """Fail before any API call if post-processing is requested but unavailable."""
+    if postprocess and postprocess.enabled:
+        require_numpy()
+
+
+def _unique_chunks(chunks: list[str], options: _RequestOptions) -> list[str]:
+    """Return the distinct chunks in document order, recording the requests saved."""
+    unique = list(dict.fromkeys(chunks))
+    if options.metrics and len(unique) < len(chunks):
+        options.metrics.record_saved(len(chunks) - len(unique))
+    return unique
+
+
+def _generate_audio(
+    client: genai.Client,
+    request: dict[str, Any],
+    key: str | None,
+    tokens: int,
+    options: _RequestOptions,
+) -> bytes:
+    """Serve a request from the cache, or call the API with retries and rate limiting."""
+    if options.cache and key and (cached := options.cache.get(key)) is not None:
+        if options.metrics:
+            options.metrics.cache_hit(request["model"], len(cached))
+        return cached
+
+    timer = options.metrics.start(request["model"]) if options.metrics else None
+    try:
+        response = call_with_retry(
+            lambda: client.models.generate_content(**request),
+            options.retry_policy,
+            options.rate_limiter,
+            tokens,
+            on_retry=timer.on_retry if timer else None,
+        )
+        if timer:
+            timer.received()
+        audio_data = _extract_audio(response)
+    except Exception as e:
+        if timer:
+            timer.failed(e)
+        raise
+    if timer:
+        timer.done(len(audio_data))
+
+    if options.cache and key:
+        _cache_store(options.cache, key, audio_data)
+    return audio_data
+
+
+async def _async_generate_audio(
+    client: genai.Client,
+    request: dict[str, Any],
+    key: str | None,
+    tokens: int,
+    options: _RequestOptions,
+) -> bytes:
+    """Async counterpart of _generate_audio using client.aio."""
+    if options.cache and key and (cached := options.cache.get(key)) is not None:
+        if options.metrics:
+            options.metrics.cache_hit(request["model"], len(cached))
+        return cached
+
+    timer = options.metrics.start(request["model"]) if options.metrics else None
+    try:
+        response = await async_call_with_retry(
+            lambda: client.aio.models.generate_content(**request),
+            options.retry_policy,
+            options.rate_limiter,
+            tokens,
+            on_retry=timer.on_retry if timer else None,
+        )
+        if timer:
+            timer.received()
+        audio_data = _extract_audio(response)
+    except Exception as e:
+        if timer:
+            timer.failed(e)
+        raise
+    if timer:
+        timer.done(len(audio_data))
+
+    if options.cache and key:
+        _cache_store(options.cache, key, audio_data)
+    return audio_data
+
+
+def _cache_store(cache: AudioCache, key: str, audio_data: bytes) -> None:
+    """Store audio in the cache; a failing cache never fails synthesis."""
+    try:
+        cache.put(key, audio_data)
+    except OSError:
+        pass
+
+
+def _iter_audio(response: Any) -> Iterator[bytes]:
+    """Yield every inline audio payload of the first candidate in a streamed response."""
+    if not response.candidates:
+        return
+
+    candidate = response.candidates[0]
+    if not candidate.content or not candidate.content.parts:
+        return
+
+    for part in candidate.content.parts:
+        if part.inline_data and part.inline_data.data:
+            yield part.inline_data.data
+
+
+def _iter_stream(first: list[bytes], responses: Iterator[Any]) -> Iterator[bytes]:
+    """Yield already received audio, then the audio of the remaining streamed responses."""
+    yield from first
+    for response in responses:
+        yield from _iter_audio(response)
+
+
+def _extract_audio(response: Any) -> bytes:
+    """Return the first inline audio payload from a generate_content response.
+
+    Raises:
+        SynthesisError: If the response contains no audio
+    """
+    if not response.candidates:
+        raise SynthesisError("No audio generated - empty response from API")
+
+    candidate = response.candidates[0]
+    if not candidate.content or not candidate.content.parts:
+        raise SynthesisError("No content in response")
+
+    # Get the first part with inline data
+    for part in candidate.content.parts:
+        if part.inline_data and part.inline_data.data:
+            data: bytes = part.inline_data.data
+            return data
+
+    raise SynthesisError("No audio data found in response")
+
+
 def synthesize_multi_voice(
     client: genai.Client,
     dialogue: str,
@@ -107,16 +624,26 @@ def synthesize_multi_voice(
     speaker2_voice: str = "Puck",
     model: str = DEFAULT_MODEL,
     system_instruction: str | None = None,
+    cache: AudioCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    metrics: MetricsRecorder | None = None,
+    postprocess: PostProcess | None = None,
 ) -> bytes:
     """Synthesize multi-speaker dialogue using Gemini TTS.
 
     Args:
         client: Gemini API client
         dialogue: Dialogue text with speaker labels (e.g., "Host: Hello\nGuest: Hi there")
-        speaker1_voice: Voice for first speaker
-        speaker2_voice: Voice for second speaker
+        speaker1_voice: Voice for the first speaker in sorted order
+        speaker2_voice: Voice for the second speaker in sorted order
         model: Model name or alias
         system_instruction: Optional style instructions
+        cache: Optional audio cache; served from it when possible
+        retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+        rate_limiter: Optional limiter shared with other concurrent callers
+        metrics: Optional recorder of request latency and throughput
+        postprocess: Optional crossfade, silence trimming and normalization
 
     Returns:
         Audio data as bytes (PCM, 24kHz, mono, 16-bit)
@@ -125,6 +652,107 @@ def synthesize_multi_voice(
         SynthesisError: If synthesis fails
         ValueError: If parameters are invalid
     """
+    speaker_voices, model = plan_multi_voice(dialogue, speaker1_voice, speaker2_voice, model)
+    _check_postprocess(postprocess)
+    options = _RequestOptions(cache, retry_policy or DEFAULT_RETRY_POLICY, rate_limiter, metrics)
+
+    try:
+        audio_data = _generate_audio(
+            client,
+            _multi_voice_request(dialogue, speaker_voices, model, system_instruction),
+            _multi_voice_cache_key(dialogue, speaker_voices, model, system_instruction, cache),
+            estimate_tokens(dialogue),
+            options,
+        )
+        return _join_audio([audio_data], postprocess)
+
+    except ValueError:
+        raise
+    except Exception as e:
+        raise SynthesisError(f"Failed to synthesize multi-voice dialogue: {e}") from e
+
+
+async def async_synthesize_multi_voice(
+    client: genai.Client,
+    dialogue: str,
+    speaker1_voice: str = "Kore",
+    speaker2_voice: str = "Puck",
+    model: str = DEFAULT_MODEL,
+    system_instruction: str | None = None,
+    cache: AudioCache | None = None,
+    retry_policy: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    metrics: MetricsRecorder | None = None,
+    postprocess: PostProcess | None = None,
+) -> bytes:
+    """Synthesize multi-speaker dialogue using the async Gemini API (client.aio).
+
+    Same behavior, validation and errors as synthesize_multi_voice.
+
+    Args:
+        client: Gemini API client
+        dialogue: Dialogue text with speaker labels (e.g., "Host: Hello\nGuest: Hi there")
+        speaker1_voice: Voice for the first speaker in sorted order
+        speaker2_voice: Voice for the second speaker in sorted order
+        model: Model name or alias
+        system_instruction: Optional style instructions
+        cache: Optional audio cache; served from it when possible
+        retry_policy: Retry policy for transient failures (default: DEFAULT_RETRY_POLICY)
+        rate_limiter: Optional limiter shared with other concurrent callers
+        metrics: Optional recorder of request latency and throughput
+        postprocess: Optional crossfade, silence trimming and normalization
+
+    Returns:
+        Audio data as bytes (PCM, 24kHz, mono, 16-bit)
+
+    Raises:
+        SynthesisError: If synthesis fails
+        ValueError: If parameters are invalid
+    """
+    speaker_voices, model = plan_multi_voice(dialogue, speaker1_voice, speaker2_voice, model)
+    _check_postprocess(postprocess)
+    options = _RequestOptions(cache, retry_policy or DEFAULT_RETRY_POLICY, rate_limiter, metrics)
+
+    try:
+        audio_data = await _async_generate_audio(
+            client,
+            _multi_voice_request(dialogue, speaker_voices, model, system_instruction),
+            _multi_voice_cache_key(dialogue, speaker_voices, model, system_instruction, cache),
+            estimate_tokens(dialogue),
+            options,
+        )
+        return _join_audio([audio_data], postprocess)
+
+    except ValueError:
+        raise
+    except Exception as e:
+        raise SynthesisError(f"Failed to synthesize multi-voice dialogue: {e}") from e
+
+
+def plan_multi_voice(
+    dialogue: str,
+    speaker1_voice: str = "Kore",
+    speaker2_voice: str = "Puck",
+    model: str = DEFAULT_MODEL,
+) -> tuple[dict[str, str], str]:
+    """Validate multi-voice parameters and map detected speakers to voices.
+
+    Speakers get the numbered voices in sorted order of their names.
+    Makes no API calls; synthesize_multi_voice sends the dialogue as one
+    request with this mapping.
+
+    Args:
+        dialogue: Dialogue text with speaker labels
+        speaker1_voice: Voice for the first speaker in sorted order
+        speaker2_voice: Voice for the second speaker in sorted order
+        model: Model name or alias
+
+    Returns:
+        Tuple of (speaker name to voice mapping, resolved model name)
+
+    Raises:
+        ValueError: If parameters are invalid or there aren't exactly 2 speakers
+    """
     # Validate inputs
     speaker1_voice = validate_voice(speaker1_voice)
     speaker2_voice = validate_voice(speaker2_voice)
@@ -178,63 +806,60 @@ def synthesize_multi_voice(
     speaker1_name = speaker_list[0]
     speaker2_name = speaker_list[1]
 
-    try:
-        # Configure multi-speaker TTS
-        config = types.GenerateContentConfig(
-            response_modalities=["AUDIO"],
-            speech_config=types.SpeechConfig(
-                multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
-                    speaker_voice_configs=[
-                        types.SpeakerVoiceConfig(
-                            speaker=speaker1_name,
-                            voice_config=types.VoiceConfig(
-                                prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                    voice_name=speaker1_voice
-                                )
-                            ),
-                        ),
-                        types.SpeakerVoiceConfig(
-                            speaker=speaker2_name,
-                            voice_config=types.VoiceConfig(
-                                prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                                    voice_name=speaker2_voice
-                                )
-                            ),
-                        ),
-                    ]
-                )
-            ),
-        )
-
-        # Build request
-        # Note: For multi-voice, style instructions should be included in the prompt
-        contents = dialogue
-        if system_instruction:
-            contents = f"{system_instruction}\n\n{dialogue}"
-
-        kwargs: dict[str, Any] = {"model": model, "contents": [contents], "config": config}
-
-        # Make API call
-        response = client.models.generate_content(**kwargs)
-
-        # Extract audio
-        if not response.candidates:
-            raise SynthesisError("No audio generated - empty response from API")
+    return {speaker1_name: speaker1_voice, speaker2_name: speaker2_voice}, model
 
-        candidate = response.candidates[0]
-        if not candidate.content or not candidate.content.parts:
-            raise SynthesisError("No content in response")
 
-        for part in candidate.content.parts:
-            if part.inline_data and part.inline_data.data:
-                return part.inline_data.data
-
-        raise SynthesisError("No audio data found in response")
-
-    except ValueError:
-        raise
-    except Exception as e:
-        raise SynthesisError(f"Failed to synthesize multi-voice dialogue: {e}") from e
+def _multi_voice_cache_key(
+    dialogue: str,
+    speaker_voices: dict[str, str],
+    model: str,
+    system_instruction: str | None,
+    cache: AudioCache | None,
+) -> str | None:
+    """Return the cache key for a multi-voice request, or None without a cache."""
+    if not cache:
+        return None
+    voices = ",".join(f"{speaker}={voice}" for speaker, voice in speaker_voices.items())
+    return cache_key(dialogue, voices, model, system_instruction)
+
+
+def _multi_voice_request(
+    dialogue: str,
+    speaker_voices: dict[str, str],
+    model: str,
+    system_instruction: str | None,
+) -> dict[str, Any]:
+    """Build generate_content keyword arguments for a multi-speaker request."""
+    config = multi_voice_config(tuple(speaker_voices.items()))
+
+    # Build request
+    # Note: For multi-voice, style instructions should be included in the prompt
+    contents = dialogue
+    if system_instruction:
+        contents = f"{system_instruction}\n\n{dialogue}"
+
+    return {"model": model, "contents": [contents], "config": config}
+
+
+@functools.lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def multi_voice_config(speaker_voices: tuple[tuple[str, str], ...]) -> types.GenerateContentConfig:
+    """Return the shared request config for (speaker, voice) pairs; see speech_config."""
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
+                speaker_voice_configs=[
+                    types.SpeakerVoiceConfig(
+                        speaker=speaker,
+                        voice_config=types.VoiceConfig(
+                            prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice)
+                        ),
+                    )
+                    for speaker, voice in speaker_voices
+                ]
+            )
+        ),
+    )
 
 
 def read_stdin() -> str:
@@ -50,6 +50,10 @@ VOICES = [
 # Default voice
 DEFAULT_VOICE = "Puck"
 
+# Constant-time lookups for validation, which runs on every request
+_VOICE_NAMES = frozenset(VOICES)
+_MODEL_NAMES = {**{name: name for name in MODELS.values()}, **MODELS}
+
 
 def validate_voice(voice: str) -> str:
     """Validate voice name.
@@ -63,7 +67,7 @@ def validate_voice(voice: str) -> str:
     Raises:
         ValueError: If voice is not valid
     """
-    if voice not in VOICES:
+    if voice not in _VOICE_NAMES:
         raise ValueError(
             f"Invalid voice '{voice}'.\n\n"
             f"Available voices: {', '.join(VOICES[:5])}... (30 total)\n\n"
@@ -87,13 +91,10 @@ def validate_model(model: str) -> str:
     Raises:
         ValueError: If model is not valid
     """
-    # Check if it's an alias
-    if model in MODELS:
-        return MODELS[model]
-
-    # Check if it's a full model name
-    if model in MODELS.values():
-        return model
+    # Aliases and full model names both resolve to the full name
+    resolved = _MODEL_NAMES.get(model)
+    if resolved is not None:
+        return resolved
 
     raise ValueError(
         f"Invalid model '{model}'.\n\n"
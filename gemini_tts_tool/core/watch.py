@@ -0,0 +1,392 @@
+"""Watch a folder of dialogue scripts and re-synthesize only what changed.
+
+Each script is rendered turn by turn: every turn is a single-voice request
+keyed by its voice and text. After an edit the script is parsed again,
+turns whose audio is already known are reused from memory (or the on-disk
+cache after a restart) and only new or edited turns call the API. The
+output file is then rebuilt from the turn audio, so re-rendering a long
+episode costs about as much as the edited lines.
+
+Changes are detected with inotify on Linux (through ctypes, no extra
+dependency) and by polling modification times elsewhere.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import fnmatch
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.dialogue import DEFAULT_TURN_GAP, assign_voices, parse_dialogue
+from gemini_tts_tool.core.encoders import save_audio
+from gemini_tts_tool.core.retry import RetryPolicy
+from gemini_tts_tool.core.synthesizer import DEFAULT_MAX_WORKERS, SynthesisError, synthesize_speech
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, validate_model
+from gemini_tts_tool.utils import AudioError, pcm_duration, read_file, silence
+
+if TYPE_CHECKING:
+    from google import genai
+
+# Scripts watched by default
+DEFAULT_PATTERN = "*.txt"
+
+# Seconds between scans when polling
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Editors save in bursts (write, rename, chmod); wait this long for quiet
+DEBOUNCE_SECONDS = 0.2
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_Q_OVERFLOW = 0x00004000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class Watcher(Protocol):
+    """Reports script files that were written in a directory."""
+
+    @property
+    def name(self) -> str:
+        """Short name shown in messages (e.g. 'inotify')."""
+        ...
+
+    def changes(self, timeout: float) -> set[Path]:
+        """Wait up to timeout seconds and return the scripts changed since the last call."""
+        ...
+
+    def close(self) -> None:
+        """Release the watch."""
+        ...
+
+
+class InotifyWatcher:
+    """Linux inotify watch of one directory, via ctypes."""
+
+    name = "inotify"
+
+    def __init__(self, directory: Path, pattern: str = DEFAULT_PATTERN) -> None:
+        self.directory = directory
+        self.pattern = pattern
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # Saved in place (close after write) or atomically (rename over the file)
+        mask = _IN_CLOSE_WRITE | _IN_MOVED_TO
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            error = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(error, f"Cannot watch {directory}")
+
+    def changes(self, timeout: float) -> set[Path]:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    # Events were dropped: treat every script as changed
+                    changed.update(find_scripts(self.directory, self.pattern))
+                elif name and fnmatch.fnmatch(os.fsdecode(name), self.pattern):
+                    changed.add(self.directory / os.fsdecode(name))
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """Portable watch that compares modification times and sizes."""
+
+    name = "polling"
+
+    def __init__(self, directory: Path, pattern: str = DEFAULT_PATTERN) -> None:
+        self.directory = directory
+        self.pattern = pattern
+        self._seen = self._scan()
+
+    def changes(self, timeout: float) -> set[Path]:
+        time.sleep(timeout)
+        current = self._scan()
+        changed = {path for path, stamp in current.items() if self._seen.get(path) != stamp}
+        self._seen = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        stamps = {}
+        for path in find_scripts(self.directory, self.pattern):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+
+def open_watcher(
+    directory: str | Path, pattern: str = DEFAULT_PATTERN, polling: bool = False
+) -> Watcher:
+    """Watch a directory with inotify where available, else by polling.
+
+    Args:
+        directory: Directory containing the scripts
+        pattern: Glob pattern of script file names
+        polling: Always poll (e.g. for network file systems, where inotify
+            does not see changes made on other machines)
+
+    Returns:
+        A watcher for the directory
+    """
+    directory = Path(directory)
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directory, pattern)
+        except OSError:
+            # No inotify (e.g. out of watches, or a libc without it)
+            pass
+    return PollingWatcher(directory, pattern)
+
+
+def iter_changes(watcher: Watcher, interval: float = DEFAULT_POLL_INTERVAL) -> Iterator[set[Path]]:
+    """Yield sets of changed scripts, each after the directory has settled.
+
+    Args:
+        watcher: Watcher of the script directory
+        interval: Seconds to wait for a change per check
+
+    Yields:
+        Scripts changed together, waiting up to DEBOUNCE_SECONDS of quiet
+    """
+    while True:
+        changed = watcher.changes(interval)
+        if not changed:
+            continue
+        while more := watcher.changes(DEBOUNCE_SECONDS):
+            changed |= more
+        yield changed
+
+
+def find_scripts(directory: str | Path, pattern: str = DEFAULT_PATTERN) -> list[Path]:
+    """Return the scripts in a directory (not recursive), sorted by name."""
+    return sorted(path for path in Path(directory).glob(pattern) if path.is_file())
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """Outcome of rendering one script."""
+
+    script: str
+    output: str
+    turns: int
+    # Turns sent to the API; the rest were reused
+    synthesized: int
+    audio_seconds: float
+    elapsed_seconds: float
+
+    @property
+    def reused(self) -> int:
+        """Turns whose audio was reused."""
+        return self.turns - self.synthesized
+
+
+class ScriptRenderer:
+    """Renders a dialogue script, keeping the audio of each turn for the next render.
+
+    Turns are keyed by voice and text, so moving, deleting or repeating a
+    turn never calls the API; only new or edited text does.
+    """
+
+    def __init__(
+        self,
+        client: genai.Client,
+        speaker_voices: dict[str, str] | None = None,
+        model: str = DEFAULT_MODEL,
+        system_instruction: str | None = None,
+        gap: float = DEFAULT_TURN_GAP,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: AudioCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1. Got: {max_workers}")
+        if gap < 0:
+            raise ValueError(f"gap must not be negative. Got: {gap}")
+        self.client = client
+        self.speaker_voices = speaker_voices
+        self.model = validate_model(model)
+        self.system_instruction = system_instruction
+        self.gap = gap
+        self.max_workers = max_workers
+        self.cache = cache
+        self.retry_policy = retry_policy
+        # (voice, text) -> PCM, per script
+        self._audio: dict[Path, dict[tuple[str, str], bytes]] = {}
+
+    def render(self, script: str | Path, output: str | Path) -> RenderResult:
+        """Synthesize the new or edited turns of a script and rebuild its output.
+
+        Args:
+            script: Dialogue script with speaker labels
+            output: Audio file to write (format from the extension)
+
+        Returns:
+            Counts of synthesized and reused turns
+
+        Raises:
+            SynthesisError: If a turn fails; turns that succeeded are kept
+            ValueError: If the script or a voice is invalid
+            AudioError: If the output cannot be written
+        """
+        started = time.perf_counter()
+        script, output = Path(script), Path(output)
+        turns = parse_dialogue(read_file(script))
+        voices = assign_voices(
+            list(dict.fromkeys(turn.speaker for turn in turns)), self.speaker_voices
+        )
+        keys = [(voices[turn.speaker], turn.text) for turn in turns]
+
+        known = self._audio.setdefault(script, {})
+        missing = [key for key in dict.fromkeys(keys) if key not in known]
+        if missing:
+            self._synthesize(missing, known)
+
+        audio_data = silence(self.gap).join(known[key] for key in keys)
+        save_audio(audio_data, output)
+        # Forget turns that are no longer in the script
+        self._audio[script] = {key: known[key] for key in keys}
+
+        return RenderResult(
+            script=str(script),
+            output=str(output),
+            turns=len(keys),
+            synthesized=len(missing),
+            audio_seconds=round(pcm_duration(audio_data), 3),
+            elapsed_seconds=round(time.perf_counter() - started, 3),
+        )
+
+    def _synthesize(self, keys: list[tuple[str, str]], known: dict[tuple[str, str], bytes]) -> None:
+        """Synthesize turns concurrently, storing each as it completes."""
+
+        def run(key: tuple[str, str]) -> bytes:
+            voice, text = key
+            return synthesize_speech(
+                client=self.client,
+                text=text,
+                voice=voice,
+                model=self.model,
+                system_instruction=self.system_instruction,
+                max_workers=1,
+                cache=self.cache,
+                retry_policy=self.retry_policy,
+            )
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(keys))) as executor:
+            futures = {executor.submit(run, key): key for key in keys}
+            try:
+                for future in as_completed(futures):
+                    known[futures[future]] = future.result()
+            except SynthesisError as e:
+                executor.shutdown(wait=False, cancel_futures=True)
+                voice, text = futures[future]
+                raise SynthesisError(
+                    f"Failed to synthesize turn '{text[:40]}' ({voice}): {e}"
+                ) from e
+
+
+def output_path(
+    script: Path, output_dir: str | Path | None = None, audio_format: str = "wav"
+) -> Path:
+    """Return where the audio of a script is written: <output_dir>/<stem>.<format>."""
+    return Path(output_dir or script.parent) / f"{script.stem}.{audio_format}"
+
+
+def watch_scripts(
+    renderer: ScriptRenderer,
+    directory: str | Path,
+    pattern: str = DEFAULT_PATTERN,
+    output_dir: str | Path | None = None,
+    audio_format: str = "wav",
+    watcher: Watcher | None = None,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    once: bool = False,
+    on_render: Callable[[RenderResult], None] | None = None,
+    on_error: Callable[[Path, Exception], None] | None = None,
+) -> None:
+    """Render every script in a directory, then re-render scripts as they change.
+
+    Runs until interrupted (KeyboardInterrupt) unless once is set. A failing
+    script is reported through on_error and watching continues.
+
+    Args:
+        renderer: Renderer shared by all scripts
+        directory: Directory containing the scripts
+        pattern: Glob pattern of script file names
+        output_dir: Directory for the audio files (default: next to each script)
+        audio_format: Output format extension (wav, flac, ogg, mp3 or m4a)
+        watcher: Watcher of the directory (default: open_watcher)
+        interval: Seconds to wait for a change per check
+        once: Render every script once and return without watching
+        on_render: Optional callback invoked after each render
+        on_error: Optional callback invoked when a script fails
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        raise ValueError(f"Not a directory: {directory}")
+
+    def render(script: Path) -> None:
+        try:
+            result = renderer.render(script, output_path(script, output_dir, audio_format))
+        except (SynthesisError, AudioError, OSError, ValueError) as e:
+            if on_error:
+                on_error(script, e)
+            return
+        if on_render:
+            on_render(result)
+
+    if once:
+        for script in find_scripts(directory, pattern):
+            render(script)
+        return
+
+    # Start watching before the first render so edits made meanwhile are seen
+    watcher = watcher or open_watcher(directory, pattern)
+    try:
+        for script in find_scripts(directory, pattern):
+            render(script)
+        for changed in iter_changes(watcher, interval):
+            for script in sorted(changed):
+                if script.is_file():
+                    render(script)
+    finally:
+        watcher.close()
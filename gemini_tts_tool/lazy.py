@@ -0,0 +1,37 @@
+"""Deferred imports for keeping CLI startup fast.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """Proxy that imports a module on first attribute access.
+
+    Used for heavy dependencies (google.genai, httpx) that only synthesis
+    needs, so commands like list-voices and --help never import them.
+    Attributes set on the proxy (e.g. by unittest.mock.patch) take precedence
+    over the module's own.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize the proxy.
+
+        Args:
+            name: Fully qualified module name
+        """
+        self._name = name
+        self._module: ModuleType | None = None
+
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
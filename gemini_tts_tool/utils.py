@@ -4,9 +4,19 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import mmap
 import os
-import wave
+import struct
+import sys
+import threading
+from collections.abc import Iterable
 from pathlib import Path
+from typing import BinaryIO, Self
+
+# Gemini TTS output format: 24kHz, mono, 16-bit PCM
+SAMPLE_RATE = 24000
+CHANNELS = 1
+SAMPLE_WIDTH = 2
 
 
 class AudioError(Exception):
@@ -19,7 +29,8 @@ def save_audio_wav(audio_data: bytes, output_path: str | Path) -> None:
     """Save PCM audio data as WAV file.
 
     Gemini TTS returns raw PCM data (24kHz, mono, 16-bit).
-    This function adds the WAV header.
+    This function adds the WAV header. The file is written atomically, so
+    readers never see a partial file.
 
     Args:
         audio_data: Raw PCM audio bytes from Gemini TTS
@@ -28,19 +39,257 @@ def save_audio_wav(audio_data: bytes, output_path: str | Path) -> None:
     Raises:
         AudioError: If saving fails
     """
+    with WavStreamWriter(output_path) as writer:
+        writer.write(audio_data)
+
+
+def wav_header(data_size: int) -> bytes:
+    """Build a 44-byte WAV header for Gemini TTS PCM audio.
+
+    Args:
+        data_size: Size of the PCM data in bytes
+
+    Returns:
+        RIFF/WAVE header bytes
+    """
+    byte_rate = SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        min(36 + data_size, 0xFFFFFFFF),
+        b"WAVE",
+        b"fmt ",
+        16,  # fmt chunk size
+        1,  # PCM
+        CHANNELS,
+        SAMPLE_RATE,
+        byte_rate,
+        CHANNELS * SAMPLE_WIDTH,  # block align
+        SAMPLE_WIDTH * 8,  # bits per sample
+        b"data",
+        min(data_size, 0xFFFFFFFF),
+    )
+
+
+def write_wav_stream(chunks: Iterable[bytes], output_path: str | Path | None) -> int:
+    """Write PCM chunks to a WAV file or stdout as they arrive.
+
+    For files, a placeholder header is written first and patched with the
+    final sizes on close, so even an interrupted write leaves a valid file.
+    For stdout (output_path None), the header uses the maximum size that
+    streaming players accept for data of unknown length.
+
+    Args:
+        chunks: Iterable of raw PCM audio chunks (24kHz, mono, 16-bit)
+        output_path: Path to save WAV file, or None for stdout
+
+    Returns:
+        Number of PCM bytes written
+
+    Raises:
+        AudioError: If writing fails
+    """
+    if output_path is None:
+        try:
+            stream = sys.stdout.buffer
+            stream.write(wav_header(0xFFFFFFFF))
+            written = 0
+            for chunk in chunks:
+                stream.write(chunk)
+                stream.flush()
+                written += len(chunk)
+            return written
+        except OSError as e:
+            raise AudioError(f"Failed to write WAV stream: {e}") from e
+
+    # Not atomic: the file grows as audio arrives and survives interruptions
+    writer = WavStreamWriter(output_path, atomic=False)
     try:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        for chunk in chunks:
+            writer.write(chunk)
+    finally:
+        writer.close()
+    return writer.bytes_written
 
-        with wave.open(str(output_path), "wb") as wav_file:
-            # Gemini TTS specs: 24kHz, mono, 16-bit
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit = 2 bytes
-            wav_file.setframerate(24000)  # 24kHz
-            wav_file.writeframes(audio_data)
 
-    except Exception as e:
-        raise AudioError(f"Failed to save WAV file: {e}") from e
+class WavStreamWriter:
+    """Incremental WAV file writer.
+
+    Chunks are appended as they arrive (bytes, bytearray or memoryview,
+    written without copying) behind a placeholder header that is patched
+    with the final sizes on close. Existing PCM or WAV files can be spliced
+    in through memory-mapped reads, so assembling long outputs never holds
+    more than one chunk in memory.
+
+    With atomic=True (the default) audio is written to a temporary file
+    that replaces output_path on close; an exception inside the ``with``
+    block discards it. With atomic=False the file is written in place and
+    an exception still leaves a valid WAV file with the audio written so far.
+
+    Example:
+        >>> with WavStreamWriter("book.wav") as writer:
+        ...     for path in segment_paths:
+        ...         writer.splice(path)
+    """
+
+    def __init__(self, output_path: str | Path, atomic: bool = True) -> None:
+        """Create the output file and write a placeholder header.
+
+        Args:
+            output_path: Path to save WAV file
+            atomic: Write to a temporary file and rename it on close
+
+        Raises:
+            AudioError: If the file cannot be created
+        """
+        self.output_path = Path(output_path)
+        self.atomic = atomic
+        self.bytes_written = 0
+        self._path = (
+            self.output_path.with_name(
+                f".{self.output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            if atomic
+            else self.output_path
+        )
+        try:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file: BinaryIO | None = self._path.open("wb")
+            self._file.write(wav_header(0))
+        except OSError as e:
+            raise AudioError(f"Failed to save WAV file: {e}") from e
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is not None and self.atomic:
+            self.abort()
+        else:
+            self.close()
+
+    def write(self, chunk: bytes | bytearray | memoryview) -> int:
+        """Append raw PCM (24kHz, mono, 16-bit).
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            AudioError: If writing fails or the writer is closed
+        """
+        if self._file is None:
+            raise AudioError("WAV writer is closed")
+        try:
+            self._file.write(chunk)
+        except OSError as e:
+            raise AudioError(f"Failed to save WAV file: {e}") from e
+        size = chunk.nbytes if isinstance(chunk, memoryview) else len(chunk)
+        self.bytes_written += size
+        return size
+
+    def splice(self, path: str | Path) -> int:
+        """Append the audio of an existing raw PCM or WAV file.
+
+        The file is memory-mapped and its audio written straight from the
+        mapping. WAV files must be in the Gemini TTS format.
+
+        Args:
+            path: Raw PCM file, or WAV file (detected by its RIFF header)
+
+        Returns:
+            Number of PCM bytes written
+
+        Raises:
+            AudioError: If the file cannot be read or has a different format
+        """
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return 0
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    start, end = _pcm_span(mapped, path)
+                    with memoryview(mapped) as view, view[start:end] as pcm:
+                        return self.write(pcm)
+        except OSError as e:
+            raise AudioError(f"Failed to read audio from {path}: {e}") from e
+
+    def close(self) -> None:
+        """Patch the header and, for atomic writers, move the file into place.
+
+        Raises:
+            AudioError: If finishing the file fails
+        """
+        if self._file is None:
+            return
+        f, self._file = self._file, None
+        try:
+            with f:
+                f.seek(0)
+                f.write(wav_header(self.bytes_written))
+            if self.atomic:
+                os.replace(self._path, self.output_path)
+        except OSError as e:
+            if self.atomic:
+                self._path.unlink(missing_ok=True)
+            raise AudioError(f"Failed to save WAV file: {e}") from e
+
+    def abort(self) -> None:
+        """Close the writer, discarding the temporary file of an atomic writer."""
+        if self._file is None:
+            return
+        f, self._file = self._file, None
+        f.close()
+        if self.atomic:
+            self._path.unlink(missing_ok=True)
+
+
+def _pcm_span(data: mmap.mmap, path: str | Path) -> tuple[int, int]:
+    """Return the (start, end) offsets of the PCM audio in raw PCM or WAV data."""
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return 0, len(data)
+
+    expected_fmt = wav_header(0)[20:36]
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset : offset + 4]
+        (size,) = struct.unpack("<I", data[offset + 4 : offset + 8])
+        body = offset + 8
+        if chunk_id == b"fmt " and data[body : body + 16] != expected_fmt:
+            raise AudioError(
+                f"Cannot splice {path}: audio must be {SAMPLE_RATE} Hz, "
+                f"{CHANNELS} channel, {SAMPLE_WIDTH * 8}-bit PCM"
+            )
+        if chunk_id == b"data":
+            # Streamed WAV files declare the maximum size
+            return body, min(body + size, len(data))
+        offset = body + size + size % 2
+
+    raise AudioError(f"Cannot splice {path}: no audio data found")
+
+
+def pcm_duration(audio_data: bytes) -> float:
+    """Return the duration in seconds of raw Gemini TTS PCM audio.
+
+    Args:
+        audio_data: Raw PCM audio bytes (24kHz, mono, 16-bit)
+
+    Returns:
+        Duration in seconds
+    """
+    return len(audio_data) / (SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH)
+
+
+def silence(seconds: float) -> bytes:
+    """Return raw PCM silence in the Gemini TTS format.
+
+    Args:
+        seconds: Duration of the silence (negative values yield no audio)
+
+    Returns:
+        Zeroed PCM audio bytes (24kHz, mono, 16-bit)
+    """
+    frames = max(0, round(seconds * SAMPLE_RATE))
+    return bytes(frames * CHANNELS * SAMPLE_WIDTH)
 
 
 def validate_output_format(output_path: str | Path) -> str:
@@ -61,7 +310,12 @@ def validate_output_format(output_path: str | Path) -> str:
     supported_formats = ["wav", "mp3", "ogg", "m4a", "flac"]
     if ext not in supported_formats:
         raise ValueError(
-            f"Unsupported audio format '{ext}'. Supported formats: {', '.join(supported_formats)}"
+            f"Unsupported audio format '{ext}'. "
+            f"Supported formats: {', '.join(supported_formats)}\n\n"
+            "What to do:\n"
+            "  Use an output file with one of the supported extensions, for example:\n"
+            "  • output.wav (no extra dependencies)\n"
+            "  • output.mp3, output.ogg, output.m4a or output.flac"
         )
 
     return ext
@@ -0,0 +1,95 @@
+"""Tests for gemini_tts_tool.core.audition module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from gemini_tts_tool.core.audition import run_audition, select_voices
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.voices import VOICES
+from tests.test_synthesizer import create_mock_response
+
+
+def test_select_voices() -> None:
+    """Test 'all', names and patterns resolve to voices in catalog order."""
+    assert select_voices("all") == VOICES
+    assert select_voices("puck, Kore,Puck") == ["Puck", "Kore"]
+    assert select_voices("Sad*") == ["Sadachbia", "Sadaltager"]
+    assert select_voices("Zephyr,A*") == [
+        "Zephyr",
+        *(voice for voice in VOICES if voice.startswith("A")),
+    ]
+
+
+def test_select_voices_rejects_unknown() -> None:
+    """Test unknown names, empty patterns and empty selections are errors."""
+    with pytest.raises(ValueError, match="Invalid voice 'Nobody'"):
+        select_voices("Kore,Nobody")
+    with pytest.raises(ValueError, match="matches no voice"):
+        select_voices("Q*")
+    with pytest.raises(ValueError, match="No voices selected"):
+        select_voices(" , ")
+
+
+def test_run_audition_writes_files_and_index(tmp_path: Path) -> None:
+    """Test every voice gets a file and an index entry with duration and latency."""
+    client = MagicMock()
+    client.models.generate_content.return_value = create_mock_response(b"\x00\x00" * 24000)
+
+    results = run_audition(
+        client, "Welcome!", ["Kore", "Puck", "Zephyr"], tmp_path, system_instruction="Warm"
+    )
+
+    assert client.models.generate_content.call_count == 3
+    assert [result.voice for result in results] == ["Kore", "Puck", "Zephyr"]
+    assert all(result.ok and Path(result.output).exists() for result in results)
+
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert index["text"] == "Welcome!"
+    assert index["style"] == "Warm"
+    assert [entry["voice"] for entry in index["voices"]] == ["Kore", "Puck", "Zephyr"]
+    assert index["voices"][0]["audio_seconds"] == 1.0
+    assert index["voices"][0]["output"] == str(tmp_path / "Kore.wav")
+    assert "latency_seconds" in index["voices"][0]
+
+
+def test_run_audition_reuses_cached_voices(tmp_path: Path) -> None:
+    """Test re-auditioning with an added voice only synthesizes the new voice."""
+    client = MagicMock()
+    client.models.generate_content.return_value = create_mock_response(b"\x00\x00")
+    cache = AudioCache(tmp_path / "cache")
+
+    run_audition(client, "Welcome!", ["Kore", "Puck"], tmp_path / "a", cache=cache)
+    results = run_audition(
+        client, "Welcome!", ["Kore", "Puck", "Leda"], tmp_path / "b", cache=cache
+    )
+
+    assert client.models.generate_content.call_count == 3
+    assert cache.hits == 2
+    assert all(result.ok for result in results)
+
+
+def test_run_audition_reports_failed_voice(tmp_path: Path) -> None:
+    """Test a failing voice is listed with its error and the others still succeed."""
+    client = MagicMock()
+
+    def generate(**kwargs: object) -> MagicMock:
+        voice = kwargs["config"].speech_config.voice_config.prebuilt_voice_config.voice_name  # type: ignore[attr-defined]
+        if voice == "Puck":
+            raise ValueError("Voice unavailable")
+        return create_mock_response(b"\x00\x00")
+
+    client.models.generate_content.side_effect = generate
+
+    results = run_audition(client, "Hi", ["Kore", "Puck"], tmp_path)
+
+    assert [result.ok for result in results] == [True, False]
+    assert "Voice unavailable" in (results[1].error or "")
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert index["voices"][1]["status"] == "error"
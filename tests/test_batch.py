@@ -0,0 +1,189 @@
+"""Tests for gemini_tts_tool.core.batch module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gemini_tts_tool.core import batch
+from gemini_tts_tool.core.batch import (
+    BatchItem,
+    estimate_batch,
+    group_items,
+    read_manifest,
+    run_batch,
+    write_report,
+)
+from gemini_tts_tool.core.synthesizer import SynthesisError
+from gemini_tts_tool.core.voices import DEFAULT_MODEL, DEFAULT_VOICE
+
+
+def test_read_manifest_jsonl(tmp_path: Path) -> None:
+    """Test read_manifest parses JSONL rows and applies defaults."""
+    manifest = tmp_path / "prompts.jsonl"
+    manifest.write_text(
+        '{"text": "Welcome!", "voice": "Kore", "style": "Warm", "output": "a.wav"}\n'
+        "\n"
+        '{"text": "Bye!", "model": "pro", "output": "/abs/b.wav"}\n'
+    )
+
+    items = read_manifest(manifest)
+
+    assert items == [
+        BatchItem(
+            line=1,
+            text="Welcome!",
+            output=tmp_path / "a.wav",
+            voice="Kore",
+            style="Warm",
+        ),
+        BatchItem(line=3, text="Bye!", output=Path("/abs/b.wav"), model="pro"),
+    ]
+
+
+def test_read_manifest_csv(tmp_path: Path) -> None:
+    """Test read_manifest parses CSV rows with empty optional columns."""
+    manifest = tmp_path / "prompts.csv"
+    manifest.write_text("text,voice,model,style,output\nHello there,,,,out/hello.wav\n")
+
+    items = read_manifest(manifest, output_dir=tmp_path / "audio")
+
+    assert len(items) == 1
+    assert items[0].line == 2
+    assert items[0].voice == DEFAULT_VOICE
+    assert items[0].model == DEFAULT_MODEL
+    assert items[0].style is None
+    assert items[0].output == tmp_path / "audio" / "out" / "hello.wav"
+
+
+def test_read_manifest_missing_fields_raises_error(tmp_path: Path) -> None:
+    """Test read_manifest reports rows without required fields."""
+    manifest = tmp_path / "prompts.jsonl"
+    manifest.write_text('{"text": "Hello"}\n')
+
+    with pytest.raises(ValueError, match="line 1: missing required field"):
+        read_manifest(manifest)
+
+
+def test_read_manifest_unsupported_format_raises_error(tmp_path: Path) -> None:
+    """Test read_manifest rejects unknown manifest extensions."""
+    manifest = tmp_path / "prompts.txt"
+    manifest.write_text("Hello")
+
+    with pytest.raises(ValueError, match="Unsupported manifest format"):
+        read_manifest(manifest)
+
+
+def test_run_batch_reuses_client_and_writes_files(tmp_path: Path) -> None:
+    """Test run_batch synthesizes every row with the shared client."""
+    client = MagicMock()
+    items = [BatchItem(line=i, text=f"Prompt {i}", output=tmp_path / f"{i}.wav") for i in range(5)]
+
+    with patch("gemini_tts_tool.core.batch.synthesize_speech") as mock_synth:
+        mock_synth.return_value = b"\x00\x00" * 24000
+        results = run_batch(client, items, concurrency=3)
+
+    assert [result.line for result in results] == list(range(5))
+    assert all(result.ok and result.audio_seconds == 1.0 for result in results)
+    assert all(call.kwargs["client"] is client for call in mock_synth.call_args_list)
+    assert all(item.output.exists() for item in items)
+
+
+def test_run_batch_continues_after_row_failure(tmp_path: Path) -> None:
+    """Test a failing row is reported without stopping the batch."""
+    items = [
+        BatchItem(line=1, text="good", output=tmp_path / "good.wav"),
+        BatchItem(line=2, text="bad", output=tmp_path / "bad.wav"),
+    ]
+
+    def synthesize(**kwargs: object) -> bytes:
+        if kwargs["text"] == "bad":
+            raise SynthesisError("quota exceeded")
+        return b"\x00\x00"
+
+    with patch("gemini_tts_tool.core.batch.synthesize_speech", side_effect=synthesize):
+        results = run_batch(MagicMock(), items)
+
+    assert results[0].ok
+    assert results[1].status == "error"
+    assert results[1].error == "quota exceeded"
+    assert not (tmp_path / "bad.wav").exists()
+
+
+def test_run_batch_continues_after_encoding_failure(tmp_path: Path) -> None:
+    """Test an encoder error fails its rows without stopping the batch."""
+    items = [
+        BatchItem(line=1, text="bad", output=tmp_path / "bad.wav"),
+        BatchItem(line=2, text="good", output=tmp_path / "good.wav"),
+    ]
+    encode_audio = batch.encode_audio
+
+    def encode(audio_data: bytes, outputs: list[Path], postprocess: object) -> object:
+        if outputs[0].stem == "bad":
+            raise RuntimeError("encoder crashed")
+        return encode_audio(audio_data, outputs)
+
+    with (
+        patch("gemini_tts_tool.core.batch.synthesize_speech", return_value=b"\x00\x00"),
+        patch("gemini_tts_tool.core.batch.encode_audio", side_effect=encode),
+    ):
+        results = run_batch(MagicMock(), items)
+
+    assert results[0].error == "encoder crashed"
+    assert results[1].ok
+
+
+def test_run_batch_deduplicates_identical_rows(tmp_path: Path) -> None:
+    """Test identical rows share one request and each output is still written."""
+    items = [
+        BatchItem(line=i, text=text, output=tmp_path / f"{i}.wav")
+        for i, text in enumerate(["Press 1.", "Welcome!", "Press  1.", "Press 1."])
+    ]
+
+    with patch("gemini_tts_tool.core.batch.synthesize_speech") as mock_synth:
+        mock_synth.return_value = b"\x00\x00"
+        results = run_batch(MagicMock(), items)
+
+    assert mock_synth.call_count == 2
+    assert [result.shared for result in results] == [False, False, True, True]
+    assert all(result.ok and item.output.exists() for result, item in zip(results, items))
+    assert len(group_items(items)) == 2
+    assert len(estimate_batch(items).reused) == 2
+
+
+def test_write_report(tmp_path: Path) -> None:
+    """Test write_report writes one JSON object per row."""
+    items = [BatchItem(line=1, text="Hi", output=tmp_path / "hi.wav")]
+    with patch("gemini_tts_tool.core.batch.synthesize_speech", return_value=b"\x00\x00"):
+        results = run_batch(MagicMock(), items)
+
+    report = tmp_path / "report.jsonl"
+    write_report(results, report)
+
+    rows = [json.loads(line) for line in report.read_text().splitlines()]
+    assert rows[0]["line"] == 1
+    assert rows[0]["status"] == "ok"
+    assert rows[0]["output"] == str(tmp_path / "hi.wav")
+
+
+def test_run_batch_encodes_in_worker_processes(tmp_path: Path) -> None:
+    """Test encode workers write every row and report a failing output per row."""
+    items = [
+        BatchItem(line=1, text="Hi", output=tmp_path / "hi.wav"),
+        BatchItem(line=2, text="Hi", output=tmp_path / "copy.wav"),
+        BatchItem(line=3, text="Bye", output=tmp_path / "bye.xyz"),
+    ]
+
+    with patch("gemini_tts_tool.core.batch.synthesize_speech", return_value=b"\x00\x00" * 2400):
+        results = run_batch(MagicMock(), items, encode_workers=2)
+
+    assert [result.ok for result in results] == [True, True, False]
+    assert [result.shared for result in results] == [False, True, False]
+    assert results[0].audio_seconds == 0.1
+    assert (tmp_path / "copy.wav").stat().st_size == 44 + 4800
+    assert results[2].error and "Unsupported" in results[2].error
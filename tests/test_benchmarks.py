@@ -0,0 +1,72 @@
+"""Tests for the offline benchmark harness.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from benchmarks import micro
+from benchmarks.fake_client import FakeClient
+from benchmarks.run import SCENARIOS, Result, find_regressions, main
+from gemini_tts_tool.core.synthesizer import stream_speech, synthesize_speech
+
+
+def test_fake_client_is_deterministic() -> None:
+    """Test audio length follows the text and latencies repeat for a seed."""
+    client = FakeClient(chars_per_second=10)
+
+    audio_data = synthesize_speech(client, "a" * 20)  # type: ignore[arg-type]
+    assert len(audio_data) == 2 * 24000 * 2
+    assert b"".join(stream_speech(client, "a" * 20)) == audio_data  # type: ignore[arg-type]
+    assert client.requests == 2
+
+    first, second = FakeClient(1.0, 0.5, seed=7), FakeClient(1.0, 0.5, seed=7)
+    assert [first.next_latency() for _ in range(3)] == [second.next_latency() for _ in range(3)]
+
+
+def test_fake_client_rejects_malformed_requests() -> None:
+    """Test requests missing required fields fail like the API would."""
+    with pytest.raises(ValueError, match="model, contents and config"):
+        FakeClient().models.generate_content(model="m", contents=["Hi"])
+
+
+def test_all_scenarios_run(tmp_path: Path) -> None:
+    """Test every scenario runs and the results are written as JSON."""
+    output = tmp_path / "bench.json"
+
+    result = CliRunner().invoke(main, ["-n", "1", "--json", str(output)])
+
+    assert result.exit_code == 0, result.output
+    scenarios = json.loads(output.read_text())["scenarios"]
+    assert set(scenarios) == set(SCENARIOS)
+    assert scenarios["chunked"]["requests"] > 1
+    assert scenarios["single"]["audio_seconds"] > 0
+
+
+def test_find_regressions() -> None:
+    """Test only medians slower than the threshold allows are reported."""
+    results = [
+        Result("single", 5, 1, mean=0.2, p50=0.2, p95=0.3, audio_seconds=1.0),
+        Result("batch", 5, 16, mean=1.1, p50=1.1, p95=1.2, audio_seconds=9.0),
+    ]
+    baseline = {"scenarios": {"single": {"p50": 0.1}, "batch": {"p50": 1.0}}}
+
+    regressions = find_regressions(results, baseline, threshold=0.25)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("single:")
+
+
+def test_micro_benchmarks() -> None:
+    """Test the micro-benchmark compares every step and both sides return the same config."""
+    result = CliRunner().invoke(micro.main, ["-n", "10"])
+
+    assert result.exit_code == 0, result.output
+    assert all(comparison.name in result.output for comparison in micro.COMPARISONS)
+    for comparison in micro.COMPARISONS:
+        assert comparison.before() == comparison.after()
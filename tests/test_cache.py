@@ -0,0 +1,125 @@
+"""Tests for gemini_tts_tool.core.cache module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gemini_tts_tool.core.cache import (
+    AudioCache,
+    cache_key,
+    default_cache_dir,
+    format_size,
+    parse_size,
+)
+from gemini_tts_tool.core.synthesizer import synthesize_multi_voice, synthesize_speech
+from tests.test_synthesizer import create_mock_response
+
+
+def test_cache_key_normalizes_whitespace() -> None:
+    """Test whitespace-only differences map to the same key."""
+    model = "gemini-2.5-flash-preview-tts"
+    assert cache_key("Hello   world\n", "Puck", model) == cache_key("  Hello world", "Puck", model)
+
+
+def test_cache_key_distinguishes_parameters() -> None:
+    """Test voice, model, style and line structure change the key."""
+    base = cache_key("Hello", "Puck", "flash-model", None)
+    assert cache_key("Hello", "Kore", "flash-model", None) != base
+    assert cache_key("Hello", "Puck", "pro-model", None) != base
+    assert cache_key("Hello", "Puck", "flash-model", "Cheerful") != base
+    assert cache_key("A: Hi\nB: Yo", "v", "m") != cache_key("A: Hi B: Yo", "v", "m")
+
+
+def test_default_cache_dir_env_override(tmp_path: Path) -> None:
+    """Test GEMINI_TTS_CACHE_DIR overrides the default location."""
+    with patch.dict(os.environ, {"GEMINI_TTS_CACHE_DIR": str(tmp_path)}):
+        assert default_cache_dir() == tmp_path
+
+
+def test_audio_cache_get_put_counts_hits_and_misses(tmp_path: Path) -> None:
+    """Test get/put round trip and hit/miss counters."""
+    audio_cache = AudioCache(tmp_path)
+
+    assert audio_cache.get("ab12") is None
+    audio_cache.put("ab12", b"pcm-data")
+
+    assert audio_cache.get("ab12") == b"pcm-data"
+    assert (audio_cache.hits, audio_cache.misses) == (1, 1)
+    assert audio_cache.stats().entries == 1
+
+
+def test_audio_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """Test entries beyond max_bytes are evicted oldest-use first."""
+    audio_cache = AudioCache(tmp_path, max_bytes=25)
+    audio_cache.put("aa01", b"x" * 10)
+    audio_cache.put("bb02", b"x" * 10)
+    # Make "aa01" the least recently used, then touch "bb02"
+    os.utime(tmp_path / "aa" / "aa01.pcm", (1, 1))
+    audio_cache.get("bb02")
+
+    audio_cache.put("cc03", b"x" * 10)
+
+    assert audio_cache.get("aa01") is None
+    assert audio_cache.get("bb02") is not None
+    assert audio_cache.get("cc03") is not None
+
+
+def test_audio_cache_prune_and_clear(tmp_path: Path) -> None:
+    """Test prune to a target size and clear."""
+    audio_cache = AudioCache(tmp_path)
+    for key in ("aa01", "bb02", "cc03"):
+        audio_cache.put(key, b"x" * 10)
+
+    assert audio_cache.prune(max_bytes=20) == 1
+    assert audio_cache.stats().total_bytes == 20
+    assert audio_cache.clear() == 2
+    assert audio_cache.entries() == []
+
+
+def test_parse_and_format_size() -> None:
+    """Test human-readable size parsing and formatting."""
+    assert parse_size("1024") == 1024
+    assert parse_size("500MB") == 500 * 1024**2
+    assert parse_size("2g") == 2 * 1024**3
+    assert parse_size("1.5 KiB") == 1536
+    assert format_size(512) == "512 B"
+    assert format_size(1536) == "1.5 KB"
+
+    with pytest.raises(ValueError, match="Invalid size"):
+        parse_size("lots")
+
+
+def test_synthesize_speech_served_from_cache(tmp_path: Path) -> None:
+    """Test a repeated request is served without a network call."""
+    audio_cache = AudioCache(tmp_path)
+    mock_client = MagicMock()
+    mock_client.models.generate_content.return_value = create_mock_response(b"cached-audio")
+
+    first = synthesize_speech(mock_client, "Press 1 to continue", voice="Kore", cache=audio_cache)
+    second = synthesize_speech(
+        mock_client, "Press 1  to continue ", voice="Kore", model="flash", cache=audio_cache
+    )
+
+    assert first == second == b"cached-audio"
+    assert mock_client.models.generate_content.call_count == 1
+    assert (audio_cache.hits, audio_cache.misses) == (1, 1)
+
+
+def test_synthesize_multi_voice_served_from_cache(tmp_path: Path) -> None:
+    """Test multi-voice requests are cached by dialogue and speaker voices."""
+    audio_cache = AudioCache(tmp_path)
+    mock_client = MagicMock()
+    mock_client.models.generate_content.return_value = create_mock_response(b"dialogue")
+    dialogue = "Host: Hello\nGuest: Hi there"
+
+    synthesize_multi_voice(mock_client, dialogue, cache=audio_cache)
+    synthesize_multi_voice(mock_client, dialogue, cache=audio_cache)
+    synthesize_multi_voice(mock_client, dialogue, speaker1_voice="Zephyr", cache=audio_cache)
+
+    assert mock_client.models.generate_content.call_count == 2
@@ -0,0 +1,88 @@
+"""Tests for gemini_tts_tool.core.chunker module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import pytest
+
+from gemini_tts_tool.core.chunker import (
+    CHARS_PER_TOKEN,
+    MAX_INPUT_TOKENS,
+    estimate_tokens,
+    split_text,
+)
+
+
+def test_estimate_tokens() -> None:
+    """Test estimate_tokens uses 4 characters per token, rounded up."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+    assert estimate_tokens("x" * 400) == 100
+
+
+def test_split_text_short_text_single_chunk() -> None:
+    """Test short text is returned as a single chunk."""
+    assert split_text("Hello world.") == ["Hello world."]
+
+
+def test_split_text_blank_returns_empty() -> None:
+    """Test blank text produces no chunks."""
+    assert split_text("   \n\n  ") == []
+
+
+def test_split_text_respects_budget() -> None:
+    """Test every chunk stays within the token budget."""
+    text = " ".join(f"This is sentence number {i}." for i in range(200))
+
+    chunks = split_text(text, max_tokens=50)
+
+    assert len(chunks) > 1
+    assert all(estimate_tokens(chunk) <= 50 for chunk in chunks)
+
+
+def test_split_text_breaks_at_sentence_boundaries() -> None:
+    """Test chunks end on sentence boundaries when sentences fit."""
+    text = "First sentence here. Second sentence here! Third sentence here?"
+
+    chunks = split_text(text, max_tokens=6)
+
+    assert chunks == ["First sentence here.", "Second sentence here!", "Third sentence here?"]
+
+
+def test_split_text_packs_paragraphs() -> None:
+    """Test small paragraphs are packed together with paragraph separators."""
+    text = "Para one.\n\nPara two.\n\n\nPara three."
+
+    assert split_text(text, max_tokens=100) == ["Para one.\n\nPara two.\n\nPara three."]
+
+
+def test_split_text_preserves_content_order() -> None:
+    """Test splitting preserves all words in document order."""
+    text = "\n\n".join(
+        " ".join(f"Paragraph {p} sentence {s}, with a clause." for s in range(10)) for p in range(5)
+    )
+
+    chunks = split_text(text, max_tokens=30)
+
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_split_text_long_sentence_split_at_words() -> None:
+    """Test a sentence without punctuation is split at word boundaries."""
+    text = " ".join(["word"] * 100)
+
+    chunks = split_text(text, max_tokens=10)
+
+    assert all(len(chunk) <= 10 * CHARS_PER_TOKEN for chunk in chunks)
+    assert " ".join(chunks) == text
+
+
+def test_split_text_invalid_budget_raises_error() -> None:
+    """Test split_text rejects out-of-range budgets."""
+    with pytest.raises(ValueError, match="Chunk token budget"):
+        split_text("Hello", max_tokens=0)
+
+    with pytest.raises(ValueError, match="Chunk token budget"):
+        split_text("Hello", max_tokens=MAX_INPUT_TOKENS + 1)
@@ -5,11 +5,20 @@ and has been reviewed and tested by a human.
 """
 
 import os
-from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from gemini_tts_tool.core.client import AuthenticationError, create_client
+from gemini_tts_tool.core.client import (
+    POOL_MAX_KEEPALIVE,
+    AuthenticationError,
+    ClientConfig,
+    close_clients,
+    create_client,
+    get_client,
+    resolve_client_config,
+)
 
 
 def test_create_client_with_api_key() -> None:
@@ -116,3 +125,65 @@ def test_create_client_vertex_ai_error_message_helpful() -> None:
         except AuthenticationError as e:
             error_msg = str(e)
             assert "GOOGLE_CLOUD_PROJECT" in error_msg
+
+
+def test_get_client_reuses_client_per_config() -> None:
+    """Test get_client caches one client per authentication configuration."""
+    with patch("gemini_tts_tool.core.client.genai.Client") as mock_client:
+        mock_client.side_effect = lambda **kwargs: MagicMock()
+        try:
+            first = get_client(api_key="key-a")
+            assert get_client(api_key="key-a") is first
+            assert get_client(api_key="key-b") is not first
+            assert mock_client.call_count == 2
+        finally:
+            close_clients()
+
+
+def test_get_client_configures_connection_pool() -> None:
+    """Test pooled clients get keep-alive connection limits."""
+    with patch("gemini_tts_tool.core.client.genai.Client") as mock_client:
+        try:
+            get_client(api_key="pooled-key")
+        finally:
+            close_clients()
+
+    http_options = mock_client.call_args.kwargs["http_options"]
+    limits = http_options.client_args["limits"]
+    assert limits.max_keepalive_connections == POOL_MAX_KEEPALIVE
+    assert http_options.async_client_args["limits"] == limits
+
+
+def test_get_client_is_thread_safe() -> None:
+    """Test concurrent callers share a single client."""
+    with patch("gemini_tts_tool.core.client.genai.Client") as mock_client:
+        mock_client.side_effect = lambda **kwargs: MagicMock()
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                clients = list(executor.map(lambda _: get_client(api_key="shared"), range(32)))
+        finally:
+            close_clients()
+
+    assert mock_client.call_count == 1
+    assert all(client is clients[0] for client in clients)
+
+
+def test_resolve_client_config_vertex() -> None:
+    """Test Vertex AI configuration is keyed by project and location."""
+    with patch.dict(os.environ, {}, clear=True):
+        config = resolve_client_config(use_vertex=True, project="p", location="us-central1")
+
+    assert config == ClientConfig(project="p", location="us-central1")
+    assert config.vertexai
+
+
+def test_close_clients_closes_pooled_clients() -> None:
+    """Test close_clients closes and forgets pooled clients."""
+    with patch("gemini_tts_tool.core.client.genai.Client") as mock_client:
+        client = get_client(api_key="closing")
+        close_clients()
+        client.close.assert_called_once()
+        get_client(api_key="closing")
+        close_clients()
+
+    assert mock_client.call_count == 2
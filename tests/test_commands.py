@@ -4,6 +4,7 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import json
 from pathlib import Path
 from unittest.mock import patch
 
@@ -11,6 +12,7 @@ import pytest
 from click.testing import CliRunner
 
 from gemini_tts_tool.cli import main
+from tests.test_synthesizer import create_mock_response
 
 
 @pytest.fixture
@@ -19,21 +21,43 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
-def test_synthesize_invalid_output_format(runner: CliRunner) -> None:
-    """Test synthesize rejects non-wav output files."""
-    result = runner.invoke(main, ["synthesize", "Hello", "-o", "output.mp3"])
+def test_synthesize_compressed_output_without_encoder(runner: CliRunner) -> None:
+    """Test synthesize fails before calling the API when no encoder is installed."""
+    with (
+        patch("gemini_tts_tool.core.encoders.shutil.which", return_value=None),
+        patch("gemini_tts_tool.commands.synthesize_command.get_client") as mock_get_client,
+    ):
+        result = runner.invoke(main, ["synthesize", "Hello", "-o", "output.mp3"])
 
     assert result.exit_code == 1
-    assert "Output file must end with .wav extension" in result.output
-    assert "Got: output.mp3" in result.output
+    assert "No encoder available for 'mp3' output" in result.output
     assert "What to do:" in result.output
+    mock_get_client.assert_not_called()
+
+
+def test_synthesize_compressed_output(runner: CliRunner, tmp_path: Path) -> None:
+    """Test synthesize routes non-wav output through save_audio."""
+    output_file = tmp_path / "output.mp3"
+
+    with (
+        patch("gemini_tts_tool.commands.synthesize_command.get_client"),
+        patch("gemini_tts_tool.commands.synthesize_command.get_encoder"),
+        patch("gemini_tts_tool.commands.synthesize_command.synthesize_speech") as mock_synth,
+        patch("gemini_tts_tool.commands.synthesize_command.save_audio") as mock_save,
+    ):
+        mock_synth.return_value = b"fake-audio-data"
+
+        result = runner.invoke(main, ["synthesize", "Hello", "-o", str(output_file)])
+
+    assert result.exit_code == 0
+    mock_save.assert_called_once_with(b"fake-audio-data", output_file)
 
 
 def test_synthesize_valid_wav_output(runner: CliRunner, tmp_path: Path) -> None:
     """Test synthesize accepts .wav output files."""
     output_file = tmp_path / "output.wav"
 
-    with patch("gemini_tts_tool.commands.synthesize_command.create_client"):
+    with patch("gemini_tts_tool.commands.synthesize_command.get_client"):
         with patch("gemini_tts_tool.commands.synthesize_command.synthesize_speech") as mock_synth:
             mock_synth.return_value = b"fake-audio-data"
 
@@ -47,7 +71,7 @@ def test_synthesize_case_insensitive_wav(runner: CliRunner, tmp_path: Path) -> N
     """Test synthesize accepts .WAV (uppercase) extension."""
     output_file = tmp_path / "OUTPUT.WAV"
 
-    with patch("gemini_tts_tool.commands.synthesize_command.create_client"):
+    with patch("gemini_tts_tool.commands.synthesize_command.get_client"):
         with patch("gemini_tts_tool.commands.synthesize_command.synthesize_speech") as mock_synth:
             mock_synth.return_value = b"fake-audio-data"
 
@@ -57,18 +81,18 @@ def test_synthesize_case_insensitive_wav(runner: CliRunner, tmp_path: Path) -> N
             assert output_file.exists()
 
 
-def test_multi_voice_invalid_output_format(runner: CliRunner, tmp_path: Path) -> None:
-    """Test multi-voice rejects non-wav output files."""
+def test_multi_voice_compressed_output_without_encoder(runner: CliRunner, tmp_path: Path) -> None:
+    """Test multi-voice reports a missing encoder for compressed output."""
     dialogue_file = tmp_path / "dialogue.txt"
     dialogue_file.write_text("Host: Hello\nGuest: Hi there")
 
-    result = runner.invoke(
-        main, ["multi-voice", "--input-file", str(dialogue_file), "-o", "output.mp3"]
-    )
+    with patch("gemini_tts_tool.core.encoders.shutil.which", return_value=None):
+        result = runner.invoke(
+            main, ["multi-voice", "--input-file", str(dialogue_file), "-o", "output.m4a"]
+        )
 
     assert result.exit_code == 1
-    assert "Output file must end with .wav extension" in result.output
-    assert "Got: output.mp3" in result.output
+    assert "No encoder available for 'm4a' output" in result.output
     assert "What to do:" in result.output
 
 
@@ -78,7 +102,7 @@ def test_multi_voice_valid_wav_output(runner: CliRunner, tmp_path: Path) -> None
     dialogue_file.write_text("Host: Hello\nGuest: Hi there")
     output_file = tmp_path / "output.wav"
 
-    with patch("gemini_tts_tool.commands.multi_voice_command.create_client"):
+    with patch("gemini_tts_tool.commands.multi_voice_command.get_client"):
         with patch(
             "gemini_tts_tool.commands.multi_voice_command.synthesize_multi_voice"
         ) as mock_synth:
@@ -97,8 +121,8 @@ def test_synthesize_txt_extension_rejected(runner: CliRunner) -> None:
     result = runner.invoke(main, ["synthesize", "Hello", "-o", "output.txt"])
 
     assert result.exit_code == 1
-    assert "Output file must end with .wav extension" in result.output
-    assert "only WAV format is supported" in result.output
+    assert "Unsupported audio format 'txt'" in result.output
+    assert "What to do:" in result.output
 
 
 def test_synthesize_no_extension_rejected(runner: CliRunner) -> None:
@@ -106,7 +130,7 @@ def test_synthesize_no_extension_rejected(runner: CliRunner) -> None:
     result = runner.invoke(main, ["synthesize", "Hello", "-o", "output"])
 
     assert result.exit_code == 1
-    assert "Output file must end with .wav extension" in result.output
+    assert "Unsupported audio format" in result.output
 
 
 def test_multi_voice_txt_extension_rejected(runner: CliRunner, tmp_path: Path) -> None:
@@ -119,4 +143,329 @@ def test_multi_voice_txt_extension_rejected(runner: CliRunner, tmp_path: Path) -
     )
 
     assert result.exit_code == 1
-    assert "Output file must end with .wav extension" in result.output
+    assert "Unsupported audio format" in result.output
+
+
+def test_batch_command(runner: CliRunner, tmp_path: Path) -> None:
+    """Test batch synthesizes manifest rows with one client and writes a report."""
+    manifest = tmp_path / "prompts.jsonl"
+    manifest.write_text(
+        '{"text": "Hello", "output": "hello.wav"}\n{"text": "Bye", "output": "bye.wav"}\n'
+    )
+
+    with patch("gemini_tts_tool.commands.batch_command.get_client") as mock_create:
+        with patch("gemini_tts_tool.core.batch.synthesize_speech") as mock_synth:
+            mock_synth.return_value = b"fake-audio-data"
+
+            result = runner.invoke(main, ["batch", str(manifest)])
+
+    assert result.exit_code == 0
+    assert mock_create.call_count == 1
+    assert (tmp_path / "hello.wav").exists()
+    assert (tmp_path / "bye.wav").exists()
+    assert (tmp_path / "prompts.report.jsonl").exists()
+    assert "2 succeeded, 0 failed" in result.output
+
+
+def test_cache_commands(runner: CliRunner, tmp_path: Path) -> None:
+    """Test cache info, prune and clear operate on GEMINI_TTS_CACHE_DIR."""
+    env = {"GEMINI_TTS_CACHE_DIR": str(tmp_path)}
+    (tmp_path / "ab").mkdir()
+    (tmp_path / "ab" / "ab12.pcm").write_bytes(b"x" * 2048)
+
+    result = runner.invoke(main, ["cache", "info"], env=env)
+    assert result.exit_code == 0
+    assert "Entries:   1" in result.output
+    assert "2.0 KB" in result.output
+
+    result = runner.invoke(main, ["cache", "prune", "--max-size", "1KB"], env=env)
+    assert result.exit_code == 0
+    assert "Removed 1 entries" in result.output
+
+    (tmp_path / "ab" / "ab12.pcm").write_bytes(b"x")
+    result = runner.invoke(main, ["cache", "clear", "--yes"], env=env)
+    assert result.exit_code == 0
+    assert not (tmp_path / "ab" / "ab12.pcm").exists()
+
+
+def test_synthesize_stream_to_file(runner: CliRunner, tmp_path: Path) -> None:
+    """Test synthesize --stream writes streamed chunks to a WAV file."""
+    output_file = tmp_path / "stream.wav"
+
+    with patch("gemini_tts_tool.commands.synthesize_command.get_client"):
+        with patch("gemini_tts_tool.commands.synthesize_command.stream_speech") as mock_stream:
+            mock_stream.return_value = iter([b"\x00\x00", b"\x00\x00"])
+
+            result = runner.invoke(
+                main, ["synthesize", "Hello", "-o", str(output_file), "--stream"]
+            )
+
+    assert result.exit_code == 0
+    assert output_file.stat().st_size == 44 + 4
+
+
+def test_synthesize_to_stdout(runner: CliRunner) -> None:
+    """Test synthesize -o - writes WAV audio to stdout."""
+    with patch("gemini_tts_tool.commands.synthesize_command.get_client"):
+        with patch("gemini_tts_tool.commands.synthesize_command.stream_speech") as mock_stream:
+            mock_stream.return_value = iter([b"\x00\x00"])
+
+            result = runner.invoke(main, ["synthesize", "Hello", "-o", "-", "--stream"])
+
+    assert result.exit_code == 0
+    assert result.stdout_bytes.startswith(b"RIFF")
+
+
+def test_synthesize_postprocess_rejects_stream(runner: CliRunner) -> None:
+    """Test post-processing options are rejected with --stream before any API call."""
+    with patch("gemini_tts_tool.commands.synthesize_command.get_client") as mock_get_client:
+        result = runner.invoke(
+            main, ["synthesize", "Hello", "-o", "out.wav", "--stream", "--normalize", "peak"]
+        )
+
+    assert result.exit_code == 1
+    assert "cannot be combined with --stream" in result.output
+    mock_get_client.assert_not_called()
+
+
+def test_synthesize_work_dir_resumes(runner: CliRunner, tmp_path: Path) -> None:
+    """Test synthesize --work-dir reuses saved chunks on a second run."""
+    output_file = tmp_path / "book.wav"
+    work_dir = tmp_path / "book.work"
+    args = ["synthesize", "Hello there", "-o", str(output_file), "--work-dir", str(work_dir)]
+
+    with patch("gemini_tts_tool.commands.synthesize_command.get_client") as mock_get_client:
+        client = mock_get_client.return_value
+        client.models.generate_content.return_value = create_mock_response(b"\x00\x00" * 3)
+
+        first = runner.invoke(main, args)
+        second = runner.invoke(main, args)
+
+    assert first.exit_code == 0
+    assert second.exit_code == 0
+    assert client.models.generate_content.call_count == 1
+    assert output_file.stat().st_size == 44 + 6
+    assert (work_dir / "manifest.json").exists()
+
+
+def test_synthesize_work_dir_rejects_stream(runner: CliRunner, tmp_path: Path) -> None:
+    """Test --work-dir cannot be combined with --stream."""
+    result = runner.invoke(
+        main,
+        ["synthesize", "Hi", "-o", str(tmp_path / "a.wav"), "--stream", "--work-dir", "w"],
+    )
+
+    assert result.exit_code == 1
+    assert "--stream cannot be combined with --work-dir" in result.output
+
+
+def test_multi_voice_more_than_two_speakers(runner: CliRunner, tmp_path: Path) -> None:
+    """Test multi-voice segments dialogues with more than two speakers."""
+    dialogue_file = tmp_path / "panel.txt"
+    dialogue_file.write_text("Host: Hi\nAlice: Hello\nBob: Hey")
+    output_file = tmp_path / "panel.wav"
+
+    with patch("gemini_tts_tool.commands.multi_voice_command.get_client"):
+        with patch(
+            "gemini_tts_tool.commands.multi_voice_command.synthesize_dialogue"
+        ) as mock_dialogue:
+            mock_dialogue.return_value = b"fake-audio-data"
+
+            result = runner.invoke(
+                main,
+                [
+                    "multi-voice",
+                    "--input-file",
+                    str(dialogue_file),
+                    "-o",
+                    str(output_file),
+                    "--speaker-voice",
+                    "Bob=Charon",
+                    "--gap",
+                    "0.5",
+                ],
+            )
+
+    assert result.exit_code == 0, result.output
+    assert output_file.exists()
+    assert mock_dialogue.call_args.kwargs["speaker_voices"] == {"Bob": "Charon"}
+    assert mock_dialogue.call_args.kwargs["gap"] == 0.5
+
+
+def test_multi_voice_numbered_voices_on_segmented_dialogue(
+    runner: CliRunner, tmp_path: Path
+) -> None:
+    """Test --speaker1-voice/--speaker2-voice apply to the first two of 3+ speakers."""
+    dialogue_file = tmp_path / "panel.txt"
+    dialogue_file.write_text("Host: Hi\nAlice: Hello\nBob: Hey")
+
+    with patch("gemini_tts_tool.commands.multi_voice_command.get_client"):
+        with patch(
+            "gemini_tts_tool.commands.multi_voice_command.synthesize_dialogue"
+        ) as mock_dialogue:
+            mock_dialogue.return_value = b"fake-audio-data"
+
+            result = runner.invoke(
+                main,
+                [
+                    "multi-voice",
+                    "--input-file",
+                    str(dialogue_file),
+                    "-o",
+                    str(tmp_path / "panel.wav"),
+                    "--speaker1-voice",
+                    "Zephyr",
+                    "--speaker-voice",
+                    "Host=Charon",
+                    "--speaker2-voice",
+                    "Aoede",
+                ],
+            )
+
+    assert result.exit_code == 0, result.output
+    assert mock_dialogue.call_args.kwargs["speaker_voices"] == {
+        "Host": "Charon",
+        "Alice": "Aoede",
+    }
+
+
+def test_multi_voice_gap_ignored_for_two_speakers(runner: CliRunner, tmp_path: Path) -> None:
+    """Test --gap is ignored with a note when the dialogue is a single request."""
+    dialogue_file = tmp_path / "dialogue.txt"
+    dialogue_file.write_text("Host: Hello\nGuest: Hi there")
+
+    with patch("gemini_tts_tool.commands.multi_voice_command.get_client"):
+        with patch(
+            "gemini_tts_tool.commands.multi_voice_command.synthesize_multi_voice"
+        ) as mock_multi:
+            mock_multi.return_value = b"fake-audio-data"
+            result = runner.invoke(
+                main,
+                [
+                    "multi-voice",
+                    "--input-file",
+                    str(dialogue_file),
+                    "-o",
+                    str(tmp_path / "dialogue.wav"),
+                    "--gap",
+                    "0.5",
+                ],
+            )
+
+    assert result.exit_code == 0, result.output
+    assert "Note: --gap is ignored" in result.output
+    mock_multi.assert_called_once()
+
+
+def test_multi_voice_invalid_speaker_voice(runner: CliRunner, tmp_path: Path) -> None:
+    """Test malformed --speaker-voice values are rejected."""
+    dialogue_file = tmp_path / "dialogue.txt"
+    dialogue_file.write_text("Host: Hello\nGuest: Hi there")
+
+    with patch("gemini_tts_tool.commands.multi_voice_command.get_client"):
+        result = runner.invoke(
+            main,
+            [
+                "multi-voice",
+                "--input-file",
+                str(dialogue_file),
+                "-o",
+                str(tmp_path / "out.wav"),
+                "--speaker-voice",
+                "Kore",
+            ],
+        )
+
+    assert result.exit_code == 1
+    assert "NAME=VOICE" in result.output
+
+
+def test_synthesize_dry_run_makes_no_calls(runner: CliRunner) -> None:
+    """Test --dry-run reports the plan without creating a client."""
+    with patch("gemini_tts_tool.commands.synthesize_command.get_client") as mock_get_client:
+        result = runner.invoke(main, ["synthesize", "Hello world", "-o", "out.wav", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert "Requests:       1" in result.output
+    assert "Estimated cost:" in result.output
+    mock_get_client.assert_not_called()
+
+
+def test_synthesize_markup_dry_run(runner: CliRunner) -> None:
+    """Test --markup --dry-run plans one request per segment and counts pauses."""
+    args = ["synthesize", "Hi. [pause 1.5s] [voice Kore] Bye.", "-o", "out.wav"]
+    result = runner.invoke(main, [*args, "--markup", "--dry-run"])
+
+    assert result.exit_code == 0
+    assert "Requests:       2" in result.output
+    assert "Pauses:         1.5s of silence" in result.output
+
+
+def test_batch_dry_run(runner: CliRunner, tmp_path: Path) -> None:
+    """Test batch --dry-run sums the rows without synthesizing."""
+    manifest = tmp_path / "prompts.jsonl"
+    manifest.write_text(
+        '{"text": "Hello", "output": "hello.wav"}\n{"text": "Bye", "output": "bye.wav"}\n'
+    )
+
+    with patch("gemini_tts_tool.commands.batch_command.get_client") as mock_get_client:
+        result = runner.invoke(main, ["batch", str(manifest), "--dry-run"])
+
+    assert result.exit_code == 0
+    assert "Requests:       2" in result.output
+    mock_get_client.assert_not_called()
+    assert not (tmp_path / "hello.wav").exists()
+
+
+def test_synthesize_metrics(runner: CliRunner, tmp_path: Path) -> None:
+    """Test --metrics prints a JSON summary of the run to stderr."""
+    output_file = tmp_path / "output.wav"
+    with patch("gemini_tts_tool.commands.synthesize_command.get_client") as mock_get_client:
+        client = mock_get_client.return_value
+        client.models.generate_content.return_value = create_mock_response(bytes(4800))
+        result = runner.invoke(main, ["synthesize", "Hello", "-o", str(output_file), "--metrics"])
+
+    assert result.exit_code == 0
+    summary = json.loads(result.stderr[result.stderr.index("{") :])
+    assert summary["requests"] == 1
+    assert summary["audio_seconds"] == 0.1
+    assert summary["bytes_written"] == output_file.stat().st_size
+
+
+def test_audition_command(runner: CliRunner, tmp_path: Path) -> None:
+    """Test audition writes one file per selected voice and caches the audio."""
+    env = {"GEMINI_TTS_CACHE_DIR": str(tmp_path / "cache")}
+    args = ["audition", "Welcome!", "-o", str(tmp_path / "out"), "--voices", "Kore,Puck"]
+    with patch("gemini_tts_tool.commands.audition_command.get_client") as mock_get_client:
+        client = mock_get_client.return_value
+        client.models.generate_content.return_value = create_mock_response(bytes(4800))
+        result = runner.invoke(main, args, env=env)
+        assert runner.invoke(main, args, env=env).exit_code == 0
+
+    assert result.exit_code == 0
+    assert (tmp_path / "out" / "Kore.wav").exists()
+    assert (tmp_path / "out" / "Puck.wav").exists()
+    assert (tmp_path / "out" / "index.json").exists()
+    assert "Kore" in result.output
+    assert "2 voice(s), 0 failed" in result.stderr
+    # The second run is served from the cache
+    assert client.models.generate_content.call_count == 2
+
+
+def test_watch_once(runner: CliRunner, tmp_path: Path) -> None:
+    """Test watch --once renders every script and reuses cached turns on a rerun."""
+    env = {"GEMINI_TTS_CACHE_DIR": str(tmp_path / "cache")}
+    (tmp_path / "ep1.txt").write_text("Host: Hello.\nGuest: Hi.\n")
+    args = ["watch", str(tmp_path), "--once", "--speaker-voice", "Guest=Leda"]
+    with patch("gemini_tts_tool.commands.watch_command.get_client") as mock_get_client:
+        client = mock_get_client.return_value
+        client.models.generate_content.return_value = create_mock_response(bytes(4800))
+        result = runner.invoke(main, args, env=env)
+        rerun = runner.invoke(main, args, env=env)
+
+    assert result.exit_code == 0
+    assert (tmp_path / "ep1.wav").exists()
+    assert "2 turn(s) synthesized, 0 reused" in result.stderr
+    # A new process has no turns in memory, but the cache serves them
+    assert rerun.exit_code == 0
+    assert client.models.generate_content.call_count == 2
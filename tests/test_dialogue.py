@@ -0,0 +1,172 @@
+"""Tests for gemini_tts_tool.core.dialogue module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gemini_tts_tool.core.dialogue import (
+    DEFAULT_SPEAKER_VOICES,
+    Segment,
+    Turn,
+    apply_numbered_voices,
+    assign_voices,
+    detect_speakers,
+    group_turns,
+    parse_dialogue,
+    synthesize_dialogue,
+)
+from gemini_tts_tool.core.synthesizer import SynthesisError
+from gemini_tts_tool.utils import silence
+from tests.test_synthesizer import create_mock_response
+
+PANEL = """
+Host: Welcome to the panel.
+Alice: Thanks for having me.
+Host: Bob, your view?
+Bob: I disagree
+with Alice entirely.
+Carol: So do I.
+Dave: Last word.
+"""
+
+
+def test_parse_dialogue_joins_continuation_lines() -> None:
+    """Test turns are parsed and unlabeled lines continue the previous turn."""
+    turns = parse_dialogue(PANEL)
+
+    assert [turn.speaker for turn in turns] == ["Host", "Alice", "Host", "Bob", "Carol", "Dave"]
+    assert turns[3] == Turn("Bob", "I disagree with Alice entirely.")
+
+
+def test_parse_dialogue_requires_leading_label() -> None:
+    """Test a script must start with a speaker label."""
+    with pytest.raises(ValueError, match="must start with a speaker label"):
+        parse_dialogue("Hello there\nHost: Hi")
+
+
+def test_detect_speakers_in_order_of_appearance() -> None:
+    """Test speaker detection."""
+    assert detect_speakers(PANEL) == ["Host", "Alice", "Bob", "Carol", "Dave"]
+
+
+def test_group_turns_at_most_two_speakers() -> None:
+    """Test segments never exceed two speakers and keep script order."""
+    segments = group_turns(parse_dialogue(PANEL))
+
+    assert [segment.speakers for segment in segments] == [
+        ("Host", "Alice"),
+        ("Bob", "Carol"),
+        ("Dave",),
+    ]
+    assert [turn for segment in segments for turn in segment.turns] == parse_dialogue(PANEL)
+
+
+def test_group_turns_respects_token_budget() -> None:
+    """Test long segments are split by the token budget."""
+    turns = [Turn("Host", "word " * 20)] * 3
+
+    segments = group_turns(turns, max_tokens=60)
+
+    assert [len(segment.turns) for segment in segments] == [2, 1]
+
+
+def test_segment_text() -> None:
+    """Test single-speaker segments drop labels and two-speaker ones keep them."""
+    assert Segment((Turn("A", "One."), Turn("A", "Two."))).text == "One.\nTwo."
+    assert Segment((Turn("A", "One."), Turn("B", "Two."))).text == "A: One.\nB: Two."
+
+
+def test_assign_voices() -> None:
+    """Test explicit voices are kept and others come from the defaults."""
+    voices = assign_voices(["Host", "Alice", "Bob"], {"Alice": "Kore"})
+
+    assert voices == {"Alice": "Kore", "Host": "Puck", "Bob": "Charon"}
+
+
+def test_assign_voices_many_speakers() -> None:
+    """Test more speakers than default voices get distinct catalog voices."""
+    speakers = [f"S{i}" for i in range(len(DEFAULT_SPEAKER_VOICES) + 2)]
+
+    voices = assign_voices(speakers)
+
+    assert len(set(voices.values())) == len(speakers)
+
+
+def test_assign_voices_invalid_voice() -> None:
+    """Test invalid explicit voices are rejected."""
+    with pytest.raises(ValueError):
+        assign_voices(["Host"], {"Host": "NotAVoice"})
+
+
+def test_apply_numbered_voices() -> None:
+    """Test numbered voices go to the first speakers without overriding explicit ones."""
+    speakers = ["Host", "Alice", "Bob"]
+
+    voices = apply_numbered_voices(speakers, {"Host": "Kore"}, "Zephyr", "Aoede")
+
+    assert voices == {"Host": "Kore", "Alice": "Aoede"}
+    assert apply_numbered_voices(speakers, None, None, "Aoede") == {"Alice": "Aoede"}
+
+
+def test_synthesize_dialogue_routes_segments() -> None:
+    """Test segments are routed to single- and multi-voice synthesis and joined in order."""
+    client = MagicMock()
+    with (
+        patch("gemini_tts_tool.core.dialogue.synthesize_multi_voice") as mock_multi,
+        patch("gemini_tts_tool.core.dialogue.synthesize_speech") as mock_single,
+    ):
+        mock_multi.side_effect = lambda **kwargs: kwargs["dialogue"].split(":")[0].encode()
+        mock_single.return_value = b"dave"
+
+        result = synthesize_dialogue(client, PANEL, gap=0.001)
+
+    gap = silence(0.001)
+    assert result == gap.join([b"Host", b"Bob", b"dave"])
+    assert mock_multi.call_count == 2
+    # Voices are passed in sorted speaker order: Alice (Puck), Host (Kore)
+    first_call = mock_multi.call_args_list[0].kwargs
+    assert (first_call["speaker1_voice"], first_call["speaker2_voice"]) == ("Puck", "Kore")
+    assert mock_single.call_args.kwargs["voice"] == "Fenrir"
+    assert mock_single.call_args.kwargs["text"] == "Last word."
+
+
+def test_synthesize_dialogue_keeps_voices_of_unsorted_speakers() -> None:
+    """Test a two-speaker segment whose first speaker sorts last keeps each speaker's voice."""
+    client = MagicMock()
+    client.models.generate_content.return_value = create_mock_response(b"audio")
+
+    synthesize_dialogue(
+        client,
+        "Zed: Hi\nAmy: Hello\nZed: again",
+        speaker_voices={"Zed": "Charon", "Amy": "Kore"},
+    )
+
+    config = client.models.generate_content.call_args.kwargs["config"]
+    speaker_configs = config.speech_config.multi_speaker_voice_config.speaker_voice_configs
+    voices = {c.speaker: c.voice_config.prebuilt_voice_config.voice_name for c in speaker_configs}
+    assert voices == {"Zed": "Charon", "Amy": "Kore"}
+
+
+def test_synthesize_dialogue_segment_failure() -> None:
+    """Test a failing segment fails the dialogue with its position."""
+    with (
+        patch("gemini_tts_tool.core.dialogue.synthesize_multi_voice") as mock_multi,
+        patch("gemini_tts_tool.core.dialogue.synthesize_speech") as mock_single,
+    ):
+        mock_multi.return_value = b"audio"
+        mock_single.side_effect = SynthesisError("boom")
+
+        with pytest.raises(SynthesisError, match="segment 3/3: boom"):
+            synthesize_dialogue(MagicMock(), PANEL)
+
+
+def test_synthesize_dialogue_validation() -> None:
+    """Test invalid parameters are rejected."""
+    with pytest.raises(ValueError, match="cannot be empty"):
+        synthesize_dialogue(MagicMock(), "  ")
+    with pytest.raises(ValueError, match="gap"):
+        synthesize_dialogue(MagicMock(), PANEL, gap=-1)
@@ -0,0 +1,72 @@
+"""Tests for gemini_tts_tool.core.encode_pool module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import wave
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from gemini_tts_tool.core.encode_pool import EncodePool, encode_audio
+from gemini_tts_tool.core.postprocess import PostProcess
+
+
+def test_encode_pool_writes_every_output(tmp_path: Path) -> None:
+    """Test one shared buffer is encoded to each output and bad outputs are reported."""
+    audio = b"\x01\x00" * 2400
+    outputs = [tmp_path / "a.wav", tmp_path / "nested" / "b.wav", tmp_path / "c.xyz"]
+
+    with EncodePool(workers=1) as pool:
+        result = pool.submit(audio, outputs).result()
+
+    assert result.audio_seconds == 0.1
+    assert result.errors[:2] == (None, None)
+    assert result.errors[2] and "Unsupported" in result.errors[2]
+    assert result.bytes_written == 2 * (44 + len(audio))
+    with wave.open(str(outputs[1]), "rb") as f:
+        assert f.readframes(f.getnframes()) == audio
+
+
+def test_encode_pool_bounds_pending_jobs(tmp_path: Path) -> None:
+    """Test more jobs than max_pending complete and every slot is released."""
+    with EncodePool(workers=1, max_pending=1) as pool:
+        futures = [pool.submit(b"", [tmp_path / f"{i}.wav"]) for i in range(3)]
+        results = [future.result() for future in futures]
+
+    assert [result.errors for result in results] == [(None,)] * 3
+    assert pool._slots.acquire(blocking=False)
+
+
+def test_encode_audio_applies_postprocess(tmp_path: Path) -> None:
+    """Test post-processing runs before encoding."""
+    pytest.importorskip("numpy")
+    audio = b"\x00\x00" * 2400 + b"\x00\x10" * 2400
+
+    result = encode_audio(
+        audio, [tmp_path / "out.wav"], PostProcess(trim_silence=True, normalize="peak")
+    )
+
+    assert result.errors == (None,)
+    assert result.audio_seconds < 0.2
+
+
+def test_encode_audio_reports_postprocess_errors(tmp_path: Path) -> None:
+    """Test a post-processing error is reported for every output instead of raised."""
+    outputs = [tmp_path / "a.wav", tmp_path / "b.wav"]
+
+    with patch(
+        "gemini_tts_tool.core.encode_pool.process_audio", side_effect=ValueError("bad audio")
+    ):
+        result = encode_audio(b"\x00\x00", outputs, PostProcess(trim_silence=True))
+
+    assert result.errors == ("bad audio", "bad audio")
+    assert not any(output.exists() for output in outputs)
+
+
+def test_encode_pool_rejects_invalid_sizes() -> None:
+    """Test worker and pending counts must be positive."""
+    with pytest.raises(ValueError, match="at least 1"):
+        EncodePool(workers=-1)
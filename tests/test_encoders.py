@@ -0,0 +1,167 @@
+"""Tests for gemini_tts_tool.core.encoders module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import sys
+import wave
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gemini_tts_tool.core import encoders
+from gemini_tts_tool.core.encoders import (
+    FfmpegEncoder,
+    SoundFileEncoder,
+    WavEncoder,
+    _whole_frames,
+    get_encoder,
+    register_encoder,
+    save_audio,
+    write_audio_stream,
+)
+from gemini_tts_tool.utils import AudioError
+
+
+@pytest.fixture(autouse=True)
+def restore_registry() -> object:
+    """Keep registry changes local to each test."""
+    with patch.dict(encoders.ENCODERS, {k: list(v) for k, v in encoders.ENCODERS.items()}):
+        yield
+
+
+def test_save_audio_wav(tmp_path: Path) -> None:
+    """Test .wav output is written without extra dependencies."""
+    output_path = tmp_path / "out" / "speech.WAV"
+
+    save_audio(b"\x01\x00" * 100, output_path)
+
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.getframerate() == 24000
+        assert wav_file.getnframes() == 100
+
+
+def test_interrupted_wav_write_keeps_previous_file(tmp_path: Path) -> None:
+    """Test an interrupted write leaves the existing output unchanged and no temp file."""
+    output_path = tmp_path / "speech.wav"
+    save_audio(b"\x01\x00" * 100, output_path)
+    original = output_path.read_bytes()
+
+    def chunks() -> Iterator[bytes]:
+        yield b"\x02\x00" * 50
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        write_audio_stream(chunks(), output_path)
+
+    assert output_path.read_bytes() == original
+    assert [path.name for path in tmp_path.iterdir()] == ["speech.wav"]
+
+
+def test_write_audio_stream_rejects_unknown_extension(tmp_path: Path) -> None:
+    """Test unsupported extensions raise ValueError."""
+    with pytest.raises(ValueError, match="Unsupported audio format"):
+        write_audio_stream([b"\x00\x00"], tmp_path / "speech.txt")
+
+
+def test_get_encoder_without_dependencies() -> None:
+    """Test a helpful error when no encoder for a format is installed."""
+    with (
+        patch("gemini_tts_tool.core.encoders.shutil.which", return_value=None),
+        patch("gemini_tts_tool.core.encoders.importlib.util.find_spec", return_value=None),
+        pytest.raises(AudioError, match="No encoder available for 'ogg'") as exc_info,
+    ):
+        get_encoder("ogg")
+
+    message = str(exc_info.value)
+    assert "pip install soundfile" in message
+    assert "install ffmpeg" in message
+
+
+def test_register_encoder_preference() -> None:
+    """Test preferred encoders are tried first and fallbacks last."""
+    first, last = WavEncoder(), WavEncoder()
+
+    register_encoder("mp3", first)
+    register_encoder("mp3", last, preferred=False)
+
+    assert encoders.ENCODERS["mp3"][0] is first
+    assert encoders.ENCODERS["mp3"][-1] is last
+    assert get_encoder("mp3") is first
+
+
+def test_whole_frames() -> None:
+    """Test chunks are re-cut on 16-bit frame boundaries."""
+    assert list(_whole_frames([b"\x01", b"\x02\x03", b"\x04\x05"])) == [
+        b"\x01\x02",
+        b"\x03\x04",
+    ]
+
+
+def test_ffmpeg_encoder_pipes_pcm(tmp_path: Path) -> None:
+    """Test PCM chunks are piped into ffmpeg with the codec options."""
+    process = MagicMock()
+    process.__enter__.return_value = process
+    process.stderr.read.return_value = b""
+    process.wait.return_value = 0
+    encoder = FfmpegEncoder(("-c:a", "libmp3lame"))
+    output_path = tmp_path / "speech.mp3"
+
+    with (
+        patch("gemini_tts_tool.core.encoders.shutil.which", return_value="/usr/bin/ffmpeg"),
+        patch("gemini_tts_tool.core.encoders.subprocess.Popen", return_value=process) as popen,
+    ):
+        written = encoder.encode([b"\x00\x00" * 2, b"\x01\x00"], output_path)
+
+    assert written == 6
+    command = popen.call_args.args[0]
+    assert command[0] == "/usr/bin/ffmpeg"
+    assert command[-4:] == ["-c:a", "libmp3lame", "-y", str(output_path)]
+    assert process.stdin.write.call_count == 2
+    process.stdin.close.assert_called_once()
+
+
+def test_ffmpeg_encoder_failure(tmp_path: Path) -> None:
+    """Test ffmpeg errors surface as AudioError with its message."""
+    process = MagicMock()
+    process.__enter__.return_value = process
+    process.stdin.write.side_effect = BrokenPipeError
+    process.stderr.read.return_value = b"Unknown encoder 'libmp3lame'\n"
+    process.wait.return_value = 1
+
+    with (
+        patch("gemini_tts_tool.core.encoders.shutil.which", return_value="/usr/bin/ffmpeg"),
+        patch("gemini_tts_tool.core.encoders.subprocess.Popen", return_value=process),
+        pytest.raises(AudioError, match="Unknown encoder 'libmp3lame'"),
+    ):
+        FfmpegEncoder(("-c:a", "libmp3lame")).encode([b"\x00\x00"], tmp_path / "speech.mp3")
+
+
+def test_soundfile_encoder(tmp_path: Path) -> None:
+    """Test FLAC/Ogg output is written through soundfile in whole frames."""
+    sound_file = MagicMock()
+    sound_file.__enter__.return_value = sound_file
+    fake_soundfile = SimpleNamespace(
+        SoundFile=MagicMock(return_value=sound_file),
+        available_subtypes=lambda container: {"PCM_16": "Signed 16 bit PCM"},
+    )
+    encoder = SoundFileEncoder("FLAC", "PCM_16")
+    output_path = tmp_path / "speech.flac"
+
+    with (
+        patch.dict(sys.modules, {"soundfile": fake_soundfile}),
+        patch("gemini_tts_tool.core.encoders.importlib.util.find_spec", return_value=object()),
+    ):
+        assert encoder.available()
+        assert not SoundFileEncoder("OGG", "OPUS").available()
+        written = encoder.encode([b"\x00", b"\x00\x01\x00"], output_path)
+
+    assert written == 4
+    kwargs = fake_soundfile.SoundFile.call_args.kwargs
+    assert kwargs["samplerate"] == 24000
+    assert kwargs["format"] == "FLAC"
+    sound_file.buffer_write.assert_called_once_with(b"\x00\x00\x01\x00", dtype="int16")
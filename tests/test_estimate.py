@@ -0,0 +1,106 @@
+"""Tests for gemini_tts_tool.core.estimate module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from gemini_tts_tool.core.estimate import (
+    PRICING,
+    combine_estimates,
+    estimate_dialogue,
+    estimate_speech,
+    format_estimate,
+)
+from gemini_tts_tool.core.voices import MODELS
+
+
+def test_estimate_speech_plans_chunks() -> None:
+    """Test the estimate uses the same chunk plan as synthesis."""
+    text = "\n\n".join(letter * 450 for letter in "abc")
+
+    estimate = estimate_speech(text, max_chunk_tokens=120)
+
+    assert len(estimate.requests) == 3
+    assert [request.input_tokens for request in estimate.requests] == [113, 113, 113]
+    assert estimate.input_tokens == 339
+    assert estimate.audio_seconds == pytest.approx(90.0)
+    assert estimate.output_tokens == 90 * 32
+    assert not estimate.counted
+
+
+def test_estimate_speech_counts_style_tokens() -> None:
+    """Test style instructions are billed with every request."""
+    estimate = estimate_speech("a" * 40, system_instruction="b" * 20)
+
+    assert estimate.input_tokens == 10 + 5
+
+
+def test_estimate_cost_per_model() -> None:
+    """Test costs use each model's input and output prices."""
+    estimate = estimate_speech("a" * 1500, model="pro")
+    request = estimate.requests[0]
+    flash, pro = PRICING[MODELS["flash"]], PRICING[MODELS["pro"]]
+
+    assert estimate.cost() == pytest.approx(
+        (
+            request.input_tokens * pro.input_per_million
+            + request.output_tokens * pro.output_per_million
+        )
+        / 1_000_000
+    )
+    assert estimate.cost("flash") == pytest.approx(
+        (
+            request.input_tokens * flash.input_per_million
+            + request.output_tokens * flash.output_per_million
+        )
+        / 1_000_000
+    )
+
+
+def test_estimate_uses_count_tokens() -> None:
+    """Test API token counts replace the estimate and no synthesis call is made."""
+    client = MagicMock()
+    client.models.count_tokens.return_value.total_tokens = 42
+
+    estimate = estimate_speech("Hello world", client=client)
+
+    assert estimate.input_tokens == 42
+    assert estimate.counted
+    client.models.generate_content.assert_not_called()
+
+
+def test_estimate_falls_back_when_counting_fails() -> None:
+    """Test the 4 chars/token rule is used if count_tokens is unavailable."""
+    client = MagicMock()
+    client.models.count_tokens.side_effect = Exception("not supported")
+
+    estimate = estimate_speech("a" * 40, client=client)
+
+    assert estimate.input_tokens == 10
+    assert not estimate.counted
+
+
+def test_estimate_dialogue() -> None:
+    """Test two-speaker dialogues are one request and larger casts are segmented."""
+    assert len(estimate_dialogue("Host: Hi\nGuest: Hello").requests) == 1
+
+    estimate = estimate_dialogue("Host: Hi\nAlice: Hello\nBob: Hey")
+    assert len(estimate.requests) == 2
+
+    with pytest.raises(ValueError, match="at least 2 speakers"):
+        estimate_dialogue("Host: Hi")
+
+
+def test_combine_and_format() -> None:
+    """Test batch estimates are merged and reported with costs for every model."""
+    estimate = combine_estimates([estimate_speech("Hello"), estimate_speech("Bye", model="pro")])
+
+    assert [request.index for request in estimate.requests] == [0, 1]
+    report = "\n".join(format_estimate(estimate))
+    assert "Requests:       2" in report
+    assert "flash" in report
+    assert "pro" in report
@@ -0,0 +1,124 @@
+"""Tests for gemini_tts_tool.core.job module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gemini_tts_tool.core.job import MANIFEST_NAME, SynthesisJob
+from gemini_tts_tool.core.retry import NO_RETRY
+from gemini_tts_tool.core.synthesizer import SynthesisError
+from tests.test_synthesizer import create_mock_response
+
+# Three paragraphs of ~20 tokens each; a 25 token budget gives one segment each
+DOCUMENT = "\n\n".join(f"Paragraph {name} " + "word " * 14 for name in ("one", "two", "three"))
+
+
+def echo_client() -> MagicMock:
+    """Create a client whose audio is the request text, so order is checkable."""
+    client = MagicMock()
+    client.models.generate_content.side_effect = lambda **kwargs: create_mock_response(
+        kwargs["contents"][0].split()[1].encode()
+    )
+    return client
+
+
+def test_run_synthesizes_segments_and_writes_manifest(tmp_path: Path) -> None:
+    """Test a fresh job synthesizes every segment and records the plan."""
+    client = echo_client()
+    job = SynthesisJob(tmp_path, DOCUMENT, voice="Kore", max_chunk_tokens=25)
+
+    assert job.run(client, retry_policy=NO_RETRY) == 3
+    assert b"".join(job.iter_audio()) == b"onetwothree"
+    assert job.pending() == []
+
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+    assert manifest["voice"] == "Kore"
+    assert [entry["key"] for entry in manifest["segments"]] == [s.key for s in job.segments]
+
+
+def test_rerun_skips_completed_segments(tmp_path: Path) -> None:
+    """Test a restarted job only requests segments that are missing."""
+    job = SynthesisJob(tmp_path, DOCUMENT, max_chunk_tokens=25)
+    job.run(echo_client(), retry_policy=NO_RETRY)
+    job.segment_path(job.segments[1]).unlink()
+
+    client = echo_client()
+    resumed = SynthesisJob(tmp_path, DOCUMENT, max_chunk_tokens=25)
+    assert resumed.run(client, retry_policy=NO_RETRY) == 1
+
+    assert client.models.generate_content.call_count == 1
+    assert b"".join(resumed.iter_audio()) == b"onetwothree"
+
+
+def test_edited_segment_is_resynthesized(tmp_path: Path) -> None:
+    """Test editing one paragraph re-requests only that paragraph and drops the old file."""
+    SynthesisJob(tmp_path, DOCUMENT, max_chunk_tokens=25).run(echo_client(), retry_policy=NO_RETRY)
+
+    client = echo_client()
+    edited = SynthesisJob(
+        tmp_path, DOCUMENT.replace("Paragraph two", "Paragraph TWO"), max_chunk_tokens=25
+    )
+    assert edited.run(client, retry_policy=NO_RETRY) == 1
+
+    assert b"".join(edited.iter_audio()) == b"oneTWOthree"
+    assert len(list(edited.segments_dir.glob("*.pcm"))) == 3
+
+
+def test_changing_voice_invalidates_segments(tmp_path: Path) -> None:
+    """Test segments are keyed by voice as well as text."""
+    SynthesisJob(tmp_path, DOCUMENT, voice="Kore", max_chunk_tokens=25).run(
+        echo_client(), retry_policy=NO_RETRY
+    )
+
+    job = SynthesisJob(tmp_path, DOCUMENT, voice="Puck", max_chunk_tokens=25)
+    assert len(job.pending()) == 3
+
+
+def test_failure_keeps_completed_segments(tmp_path: Path) -> None:
+    """Test a failed run keeps finished segments and explains how to resume."""
+    client = echo_client()
+    responses = {"one": b"one", "three": b"three"}
+
+    def generate(**kwargs: object) -> MagicMock:
+        word = kwargs["contents"][0].split()[1]  # type: ignore[index]
+        if word not in responses:
+            raise Exception("API down")
+        return create_mock_response(responses[word])
+
+    client.models.generate_content.side_effect = generate
+    job = SynthesisJob(tmp_path, DOCUMENT, max_chunk_tokens=25)
+
+    with pytest.raises(SynthesisError, match="Run the same command again"):
+        job.run(client, max_workers=1, retry_policy=NO_RETRY)
+
+    assert job.segment_path(job.segments[0]).is_file()
+    with pytest.raises(SynthesisError, match="has not been synthesized"):
+        b"".join(job.iter_audio())
+
+
+def test_save_wav_and_compressed(tmp_path: Path) -> None:
+    """Test saving splices segment files into WAV and streams them into encoders."""
+    job = SynthesisJob(tmp_path / "work", DOCUMENT, max_chunk_tokens=25)
+    job.run(echo_client(), retry_policy=NO_RETRY)
+
+    job.save(tmp_path / "book.wav")
+    assert (tmp_path / "book.wav").read_bytes()[44:] == b"onetwothree"
+
+    with patch("gemini_tts_tool.core.job.write_audio_stream") as mock_write:
+        job.save(tmp_path / "book.mp3")
+    assert b"".join(mock_write.call_args.args[0]) == b"onetwothree"
+
+
+def test_invalid_parameters(tmp_path: Path) -> None:
+    """Test validation happens before any work is done."""
+    with pytest.raises(ValueError, match="Text cannot be empty"):
+        SynthesisJob(tmp_path, "   ")
+    with pytest.raises(ValueError, match="Invalid voice"):
+        SynthesisJob(tmp_path, "Hello", voice="NotAVoice")
+    assert not (tmp_path / MANIFEST_NAME).exists()
@@ -0,0 +1,103 @@
+"""Tests for gemini_tts_tool.core.markup module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from gemini_tts_tool.core.estimate import estimate_markup
+from gemini_tts_tool.core.markup import (
+    Pause,
+    Speech,
+    compile_markup,
+    has_markup,
+    parse_pause,
+    synthesize_markup,
+)
+from gemini_tts_tool.core.synthesizer import SynthesisError
+from gemini_tts_tool.utils import silence
+from tests.test_synthesizer import create_mock_response
+
+
+def test_compile_markup() -> None:
+    """Test directives split the text and switch voice and style until reset."""
+    plan = compile_markup(
+        "Hello [laughs]. [pause 500ms][Pause 0.25s] [voice Kore][style Whisper] Secret."
+        "[segment] More. [voice][style] Back.",
+        voice="Puck",
+        system_instruction="Cheerful",
+    )
+
+    assert plan == [
+        Speech("Hello [laughs].", "Puck", "Cheerful"),
+        Pause(0.75),
+        Speech("Secret.", "Kore", "Whisper"),
+        Speech("More.", "Kore", "Whisper"),
+        Speech("Back.", "Puck", "Cheerful"),
+    ]
+    assert has_markup("Wait [pause 1s]")
+    assert not has_markup("Just [laughs] text")
+
+
+def test_compile_markup_rejects_invalid_directives() -> None:
+    """Test malformed pauses, unknown voices and documents without text fail."""
+    with pytest.raises(ValueError, match="Invalid pause"):
+        compile_markup("Hi [pause 500]")
+    with pytest.raises(ValueError, match="at most 60s"):
+        parse_pause("2000s")
+    with pytest.raises(ValueError, match="Invalid voice"):
+        compile_markup("Hi [voice Nobody] there")
+    with pytest.raises(ValueError, match="no text to speak"):
+        compile_markup("[pause 1s] [voice Kore]")
+    assert parse_pause("1500 MS") == 1.5
+
+
+def test_synthesize_markup_requests_and_pauses() -> None:
+    """Test each segment is one request with its voice and style and pauses are silence."""
+    client = MagicMock()
+    requests = []
+
+    def generate(**kwargs: object) -> MagicMock:
+        config = kwargs["config"]
+        voice = config.speech_config.voice_config.prebuilt_voice_config.voice_name  # type: ignore[attr-defined]
+        requests.append((kwargs["contents"][0], voice, kwargs.get("system_instruction")))  # type: ignore[index]
+        return create_mock_response(voice.encode())
+
+    client.models.generate_content.side_effect = generate
+
+    audio = synthesize_markup(
+        client,
+        "One. [pause 1ms] [voice Kore] [style Slowly] Two. [voice] One. [style] One.",
+        voice="Puck",
+    )
+
+    assert len(requests) == 3
+    assert set(requests) == {
+        ("One.", "Puck", None),
+        ("Two.", "Kore", "Slowly"),
+        ("One.", "Puck", "Slowly"),
+    }
+    assert audio == b"Puck" + silence(0.001) + b"Kore" + b"Puck" + b"Puck"
+
+
+def test_synthesize_markup_failure() -> None:
+    """Test a failing request fails the document with its position."""
+    client = MagicMock()
+    client.models.generate_content.side_effect = RuntimeError("boom")
+
+    with pytest.raises(SynthesisError, match=r"request 1/2: .*boom"):
+        synthesize_markup(client, "One. [pause 1s] Two.", max_workers=1)
+
+
+def test_estimate_markup() -> None:
+    """Test pauses add duration without requests and repeated segments are reused."""
+    estimate = estimate_markup("Chapter one. [pause 2s] Chapter one. [voice Kore] Chapter one.")
+
+    assert len(estimate.requests) == 2
+    assert len(estimate.reused) == 1
+    assert estimate.silence_seconds == 2.0
+    spoken = sum(request.audio_seconds for request in (*estimate.requests, *estimate.reused))
+    assert estimate.audio_seconds == spoken + 2.0
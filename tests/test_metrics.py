@@ -0,0 +1,123 @@
+"""Tests for gemini_tts_tool.core.metrics module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from gemini_tts_tool.core.cache import AudioCache
+from gemini_tts_tool.core.metrics import MetricsRecorder, RequestMetrics
+from gemini_tts_tool.core.retry import RetryPolicy
+from gemini_tts_tool.core.synthesizer import SynthesisError, stream_speech, synthesize_speech
+from tests.test_synthesizer import create_mock_response
+
+# One second of PCM audio (24kHz, mono, 16-bit)
+ONE_SECOND = bytes(48000)
+
+
+def test_synthesize_records_requests_and_retries() -> None:
+    """Test every request is recorded with its retries and audio duration."""
+    client = MagicMock()
+    client.models.generate_content.side_effect = [
+        ConnectionError("connection reset"),
+        create_mock_response(ONE_SECOND),
+    ]
+    metrics = MetricsRecorder()
+
+    synthesize_speech(
+        client,
+        "Hello",
+        retry_policy=RetryPolicy(max_attempts=2, initial_delay=0, jitter=0),
+        metrics=metrics,
+    )
+
+    summary = metrics.summary()
+    assert summary["requests"] == 1
+    assert summary["retries"] == 1
+    assert summary["errors"] == 0
+    assert summary["audio_seconds"] == 1.0
+    assert summary["api_latency_seconds"]["max"] >= 0
+    assert summary["real_time_factor"] is not None
+
+
+def test_failed_request_is_recorded() -> None:
+    """Test requests that fail after all retries count as errors."""
+    client = MagicMock()
+    client.models.generate_content.side_effect = Exception("API down")
+    metrics = MetricsRecorder()
+
+    with pytest.raises(SynthesisError):
+        synthesize_speech(
+            client, "Hello", retry_policy=RetryPolicy(max_attempts=1), metrics=metrics
+        )
+
+    summary = metrics.summary()
+    assert summary["requests"] == 1
+    assert summary["errors"] == 1
+    assert summary["api_latency_seconds"] is None
+
+
+def test_cache_hits_are_not_api_latency(tmp_path: Path) -> None:
+    """Test cached requests are counted separately from API calls."""
+    client = MagicMock()
+    client.models.generate_content.return_value = create_mock_response(ONE_SECOND)
+    cache = AudioCache(tmp_path)
+    metrics = MetricsRecorder()
+
+    synthesize_speech(client, "Hello", cache=cache, metrics=metrics)
+    synthesize_speech(client, "Hello", cache=cache, metrics=metrics)
+
+    summary = metrics.summary()
+    assert summary["requests"] == 2
+    assert summary["cache_hits"] == 1
+    assert summary["audio_seconds"] == 2.0
+    assert "gemini_tts_api_latency_seconds_count 1" in metrics.prometheus()
+
+
+def test_stream_records_time_to_first_byte() -> None:
+    """Test streamed requests record time to first audio before the total latency."""
+    client = MagicMock()
+    client.models.generate_content_stream.return_value = iter(
+        [create_mock_response(ONE_SECOND[:24000]), create_mock_response(ONE_SECOND[24000:])]
+    )
+    metrics = MetricsRecorder()
+
+    assert b"".join(stream_speech(client, "Hello", metrics=metrics)) == ONE_SECOND
+
+    summary = metrics.summary()
+    assert summary["requests"] == 1
+    assert summary["audio_seconds"] == 1.0
+    assert summary["time_to_first_byte_seconds"]["max"] <= summary["api_latency_seconds"]["max"]
+
+
+def test_writes_and_json(tmp_path: Path) -> None:
+    """Test timed writes record the size of the written file."""
+    metrics = MetricsRecorder()
+    output = tmp_path / "out.wav"
+
+    with metrics.writing(output):
+        output.write_bytes(b"x" * 100)
+
+    summary = json.loads(metrics.to_json())
+    assert summary["bytes_written"] == 100
+    assert summary["requests"] == 0
+    assert summary["real_time_factor"] is None
+
+
+def test_prometheus_histogram() -> None:
+    """Test the latency histogram is cumulative and ends with +Inf."""
+    metrics = MetricsRecorder()
+    for latency in (0.1, 0.4, 3.0, 500.0):
+        metrics.record(RequestMetrics(model="m", latency=latency, first_byte=latency))
+
+    text = metrics.prometheus()
+    assert 'gemini_tts_api_latency_seconds_bucket{le="0.25"} 1' in text
+    assert 'gemini_tts_api_latency_seconds_bucket{le="5"} 3' in text
+    assert 'gemini_tts_api_latency_seconds_bucket{le="+Inf"} 4' in text
+    assert "gemini_tts_requests_total 4" in text
+    assert "# TYPE gemini_tts_api_latency_seconds histogram" in text
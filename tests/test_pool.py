@@ -0,0 +1,227 @@
+"""Tests for gemini_tts_tool.core.pool module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google import genai
+
+from gemini_tts_tool.core.client import (
+    AuthenticationError,
+    ClientConfig,
+    GeminiClientError,
+    close_clients,
+    get_client,
+    resolve_client_configs,
+    validate_client,
+)
+from gemini_tts_tool.core.pool import RATE_LIMIT_COOLDOWN, ClientPool, apply_quota
+from gemini_tts_tool.core.retry import RateLimiter
+from gemini_tts_tool.core.synthesizer import synthesize_speech
+from tests.test_retry import FakeClock, api_error
+from tests.test_synthesizer import create_mock_response
+
+KEYS = [ClientConfig(api_key=f"key-{i}") for i in range(3)]
+
+
+def make_pool(count: int = 3, clock: FakeClock | None = None, **kwargs: float) -> ClientPool:
+    """Create a pool of mock clients that all return one chunk of audio."""
+    clients = {}
+    for config in KEYS[:count]:
+        client = MagicMock()
+        client.models.generate_content.return_value = create_mock_response(b"audio")
+        clients[config] = client
+    return ClientPool(clients, clock=clock or FakeClock(), **kwargs)
+
+
+def calls(pool: ClientPool) -> list[int]:
+    """Number of generate_content calls each backend received."""
+    return [backend.client.models.generate_content.call_count for backend in pool.backends]
+
+
+def test_resolve_client_configs_from_env() -> None:
+    """Test GEMINI_API_KEYS and GEMINI_VERTEX_BACKENDS configure several backends."""
+    env = {
+        "GEMINI_API_KEYS": "key-a, key-b,key-a",
+        "GEMINI_VERTEX_BACKENDS": "proj/us-central1",
+    }
+    with patch.dict(os.environ, env, clear=True):
+        configs = resolve_client_configs()
+        # Explicit parameters still select a single backend
+        assert resolve_client_configs(api_key="explicit") == [ClientConfig(api_key="explicit")]
+
+    assert configs == [
+        ClientConfig(api_key="key-a"),
+        ClientConfig(api_key="key-b"),
+        ClientConfig(project="proj", location="us-central1"),
+    ]
+
+    with patch.dict(os.environ, {"GEMINI_VERTEX_BACKENDS": "proj"}, clear=True):
+        with pytest.raises(AuthenticationError, match="project/location"):
+            resolve_client_configs()
+
+
+def test_get_client_returns_shared_pool() -> None:
+    """Test get_client balances across configured keys with one pool per process."""
+    with patch("gemini_tts_tool.core.client.genai.Client") as mock_client:
+        mock_client.side_effect = lambda **kwargs: MagicMock()
+        try:
+            with patch.dict(os.environ, {"GEMINI_API_KEYS": "key-a,key-b"}, clear=True):
+                pool = get_client()
+                assert get_client() is pool
+            assert isinstance(pool, ClientPool)
+            assert [backend.name for backend in pool.backends] == [
+                "api-key ...ey-a",
+                "api-key ...ey-b",
+            ]
+            # Backends reuse the pooled single-key clients
+            assert pool.backends[0].client is get_client(api_key="key-a")
+            assert mock_client.call_count == 2
+        finally:
+            close_clients()
+
+
+def test_pool_spreads_requests_evenly() -> None:
+    """Test idle backends take turns."""
+    pool = make_pool()
+
+    for _ in range(6):
+        pool.models.generate_content(model="m", contents=["hi"], config=None)
+
+    assert calls(pool) == [2, 2, 2]
+
+
+def test_pool_prefers_backend_with_most_remaining_quota() -> None:
+    """Test requests go to the backend whose quota is least used."""
+    pool = make_pool(2, requests_per_minute=10)
+    pool.backends[0].limiter = RateLimiter(requests_per_minute=10, clock=FakeClock())
+    pool.backends[1].limiter = RateLimiter(requests_per_minute=100, clock=FakeClock())
+
+    for _ in range(10):
+        pool.models.generate_content(model="m", contents=["hi"], config=None)
+
+    # Backend 1 keeps more than 90% of its quota, backend 0 drops 10% per request
+    assert calls(pool) == [1, 9]
+
+
+def test_pool_fails_over_on_rate_limit() -> None:
+    """Test a 429 moves the request to another backend and sidelines the first."""
+    clock = FakeClock()
+    pool = make_pool(2, clock)
+    pool.backends[0].client.models.generate_content.side_effect = api_error(429)
+
+    for _ in range(3):
+        pool.models.generate_content(model="m", contents=["hi"], config=None)
+
+    assert calls(pool) == [1, 3]
+    assert pool.stats()[0]["rate_limited"] == 1
+    assert pool.stats()[0]["cooldown_seconds"] == RATE_LIMIT_COOLDOWN
+
+    # Back in rotation once the cooldown has passed
+    pool.backends[0].client.models.generate_content.side_effect = None
+    clock.now = RATE_LIMIT_COOLDOWN
+    pool.models.generate_content(model="m", contents=["hi"], config=None)
+    assert calls(pool) == [2, 3]
+
+
+def test_pool_honors_retry_after_and_auth_errors() -> None:
+    """Test cooldowns follow retry-after hints and rejected keys stay out longer."""
+    pool = make_pool(3)
+    pool.backends[0].client.models.generate_content.side_effect = api_error(429, "7s")
+    pool.backends[1].client.models.generate_content.side_effect = api_error(403)
+
+    pool.models.generate_content(model="m", contents=["hi"], config=None)
+
+    cooldowns = [stats["cooldown_seconds"] for stats in pool.stats()]
+    assert cooldowns[0] == 7
+    assert cooldowns[1] > RATE_LIMIT_COOLDOWN
+    assert cooldowns[2] == 0
+
+
+def test_pool_waits_for_cooldown_when_every_backend_is_out() -> None:
+    """Test a request waits for the first backend to recover instead of hitting a cooling one."""
+    clock = FakeClock()
+    pool = make_pool(2, clock)
+    pool.backends[0].cooldown_until = 20.0
+    pool.backends[1].cooldown_until = 5.0
+
+    with patch("gemini_tts_tool.core.pool.time.sleep") as mock_sleep:
+        pool.models.generate_content(model="m", contents=["hi"], config=None)
+
+    mock_sleep.assert_called_once_with(5.0)
+    assert calls(pool) == [0, 1]
+
+
+def test_pool_raises_when_every_backend_fails() -> None:
+    """Test the last error surfaces once no healthy backend is left."""
+    pool = make_pool(2)
+    for backend in pool.backends:
+        backend.client.models.generate_content.side_effect = api_error(503)
+
+    with pytest.raises(Exception, match="503"):
+        pool.models.generate_content(model="m", contents=["hi"], config=None)
+    assert calls(pool) == [1, 1]
+
+
+def test_pool_does_not_fail_over_invalid_requests() -> None:
+    """Test errors caused by the request itself are not retried elsewhere."""
+    pool = make_pool(2)
+    for backend in pool.backends:
+        backend.client.models.generate_content.side_effect = api_error(400)
+
+    with pytest.raises(Exception, match="400"):
+        pool.models.generate_content(model="m", contents=["hi"], config=None)
+    assert sum(calls(pool)) == 1
+    assert all(stats["cooldown_seconds"] == 0 for stats in pool.stats())
+
+
+def test_pool_stream_and_async() -> None:
+    """Test streaming fails over before the first response and async calls are balanced."""
+    pool = make_pool(2)
+    pool.backends[0].client.models.generate_content_stream.side_effect = api_error(500)
+    pool.backends[1].client.models.generate_content_stream.return_value = iter(["a", "b"])
+    for backend in pool.backends:
+        backend.client.aio.models.generate_content = AsyncMock(return_value="async")
+
+    assert list(pool.models.generate_content_stream(model="m", contents=["hi"])) == ["a", "b"]
+    assert asyncio.run(pool.aio.models.generate_content(model="m", contents=["hi"])) == "async"
+    # Backend 0 is cooling down after its 500, so the async call went to backend 1
+    assert pool.backends[1].client.aio.models.generate_content.await_count == 1
+
+
+def test_synthesize_speech_with_pool() -> None:
+    """Test the synthesizer accepts a pool in place of a client."""
+    pool = make_pool(2)
+
+    audio = synthesize_speech(pool, "First.\n\nSecond.", max_chunk_tokens=2)  # type: ignore[arg-type]
+
+    assert audio == b"audio" * 2
+    assert calls(pool) == [1, 1]
+
+
+def test_apply_quota() -> None:
+    """Test quotas become per-backend limiters for pools and a shared limiter otherwise."""
+    client = MagicMock()
+    assert apply_quota(client) == (client, None)
+    same, limiter = apply_quota(client, requests_per_minute=10)
+    assert same is client
+    assert isinstance(limiter, RateLimiter)
+
+    pool, limiter = apply_quota(make_pool(2), requests_per_minute=10)  # type: ignore[arg-type]
+    assert limiter is None
+    assert isinstance(pool, ClientPool)
+    assert all(backend.limiter for backend in pool.backends)
+
+
+def test_validate_client_accepts_pool() -> None:
+    """Test a pool validates when every backend is a Gemini client."""
+    clients = {config: genai.Client(api_key=config.api_key) for config in KEYS[:2]}
+    validate_client(ClientPool(clients))  # type: ignore[arg-type]
+
+    with pytest.raises(GeminiClientError, match="Invalid client type"):
+        validate_client(make_pool(2))  # type: ignore[arg-type]
@@ -0,0 +1,149 @@
+"""Tests for gemini_tts_tool.core.postprocess module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gemini_tts_tool.core.dialogue import synthesize_dialogue
+from gemini_tts_tool.core.postprocess import PostProcess, pcm_samples, process_audio
+from gemini_tts_tool.core.synthesizer import synthesize_speech
+from gemini_tts_tool.utils import SAMPLE_RATE, AudioError
+from tests.test_synthesizer import create_mock_client, create_mock_response
+
+np = pytest.importorskip("numpy")
+
+
+def tone(seconds: float, amplitude: int = 8000, frequency: float = 440.0) -> bytes:
+    """A sine tone as PCM bytes."""
+    t = np.arange(round(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype("<i2").tobytes()
+
+
+def quiet(seconds: float) -> bytes:
+    """Digital silence as PCM bytes."""
+    return b"\x00\x00" * round(seconds * SAMPLE_RATE)
+
+
+def test_post_process_validation() -> None:
+    """Test invalid settings are rejected and defaults do nothing."""
+    assert not PostProcess().enabled
+    assert PostProcess(trim_silence=True).enabled
+    with pytest.raises(ValueError, match="Invalid normalization 'lufs'"):
+        PostProcess(normalize="lufs")
+    with pytest.raises(ValueError, match="at most 0"):
+        PostProcess(normalize="peak", target_dbfs=3)
+    with pytest.raises(ValueError, match="must not be negative"):
+        PostProcess(crossfade_ms=-1)
+
+
+def test_pcm_samples_is_a_view() -> None:
+    """Test PCM bytes are read without copying and an odd trailing byte is ignored."""
+    audio = tone(0.01) + b"\x01"
+    samples = pcm_samples(audio)
+
+    assert samples.size == len(audio) // 2
+    assert not samples.flags.owndata
+    assert not samples.flags.writeable
+
+
+def test_process_audio_crossfade_overlaps_segments() -> None:
+    """Test a crossfade shortens the output by the overlap at each join."""
+    segments = [tone(1.0), tone(1.0), tone(1.0)]
+
+    plain = process_audio(segments, PostProcess())
+    faded = process_audio(segments, PostProcess(crossfade_ms=50))
+
+    assert plain == b"".join(segments)
+    assert len(faded) == len(plain) - 2 * round(0.05 * SAMPLE_RATE) * 2
+    # Equal-power fades of the same tone keep the level near the original
+    assert np.max(np.abs(pcm_samples(faded))) <= 8000 * 1.5
+
+
+def test_process_audio_crossfade_with_gap() -> None:
+    """Test with a gap, segments fade around inserted silence instead of overlapping."""
+    fade = round(0.01 * SAMPLE_RATE)
+    result = pcm_samples(process_audio([tone(0.5), tone(0.5)], PostProcess(crossfade_ms=10), 0.2))
+
+    assert result.size == round(1.2 * SAMPLE_RATE)
+    first_end = round(0.5 * SAMPLE_RATE)
+    assert np.all(result[first_end : first_end + round(0.2 * SAMPLE_RATE)] == 0)
+    # The last sample before the gap is faded to (almost) nothing
+    assert abs(int(result[first_end - 1])) < abs(int(pcm_samples(tone(0.5))[first_end - fade]))
+
+
+def test_process_audio_trims_silence() -> None:
+    """Test leading and trailing silence is cut, keeping a short pad."""
+    audio = quiet(1.0) + tone(0.5) + quiet(2.0)
+
+    result = process_audio([audio], PostProcess(trim_silence=True))
+
+    seconds = len(result) / 2 / SAMPLE_RATE
+    assert 0.5 <= seconds <= 0.65
+    # Nothing but silence is left untouched
+    assert process_audio([quiet(0.5)], PostProcess(trim_silence=True)) == quiet(0.5)
+
+
+def test_process_audio_normalizes() -> None:
+    """Test peak and loudness normalization reach their targets."""
+    peak = pcm_samples(process_audio([tone(0.5, 1000)], PostProcess(normalize="peak")))
+    assert np.max(np.abs(peak)) == pytest.approx(32767 * 10 ** (-1 / 20), rel=1e-3)
+
+    loud = process_audio([tone(0.5, 1000)], PostProcess(normalize="loudness", target_dbfs=-20))
+    samples = pcm_samples(loud).astype(np.float64)
+    rms_dbfs = 20 * np.log10(np.sqrt(np.mean(samples**2)) / 32767)
+    assert rms_dbfs == pytest.approx(-20, abs=0.05)
+
+
+def test_process_audio_clips_instead_of_wrapping() -> None:
+    """Test gain beyond full scale saturates rather than overflowing int16."""
+    result = process_audio([tone(0.1, 30000)], PostProcess(normalize="loudness", target_dbfs=0))
+
+    samples = pcm_samples(result)
+    assert samples.max() == 32767
+    assert samples.min() == -32768
+
+
+def test_process_audio_requires_numpy() -> None:
+    """Test a missing NumPy is reported with installation instructions."""
+    with patch("gemini_tts_tool.core.postprocess.importlib.util.find_spec", return_value=None):
+        with pytest.raises(AudioError, match=r"gemini-tts-tool\[dsp\]"):
+            process_audio([tone(0.1)], PostProcess(trim_silence=True))
+
+
+def test_synthesize_speech_crossfades_chunks() -> None:
+    """Test chunked synthesis is joined with crossfades when postprocess is set."""
+    mock_client = create_mock_client()
+    mock_client.models.generate_content.side_effect = lambda **kwargs: create_mock_response(
+        tone(0.5, frequency=len(kwargs["contents"][0]))
+    )
+    text = "Alpha one two three. Bravo one two three."
+
+    result = synthesize_speech(
+        mock_client, text, max_chunk_tokens=6, postprocess=PostProcess(crossfade_ms=20)
+    )
+
+    assert len(result) == (2 * round(0.5 * SAMPLE_RATE) - round(0.02 * SAMPLE_RATE)) * 2
+
+
+def test_synthesize_dialogue_postprocess_uses_gap() -> None:
+    """Test dialogue segments are processed together with the gap between them."""
+    with (
+        patch("gemini_tts_tool.core.dialogue.synthesize_multi_voice") as mock_multi,
+        patch("gemini_tts_tool.core.dialogue.synthesize_speech") as mock_single,
+    ):
+        mock_multi.return_value = tone(0.5)
+        mock_single.return_value = tone(0.5)
+
+        result = synthesize_dialogue(
+            MagicMock(),
+            "Host: Hi.\nAlice: Hello.\nHost: Bob?\nBob: Yes.",
+            gap=0.1,
+            postprocess=PostProcess(normalize="peak", crossfade_ms=10),
+        )
+
+    assert len(result) == (2 * round(0.5 * SAMPLE_RATE) + round(0.1 * SAMPLE_RATE)) * 2
+    assert np.max(np.abs(pcm_samples(result))) == pytest.approx(32767 * 10 ** (-1 / 20), rel=1e-3)
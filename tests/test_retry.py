@@ -0,0 +1,215 @@
+"""Tests for retry policy and rate limiting.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from google.genai import errors
+
+from gemini_tts_tool.core.retry import (
+    NO_RETRY,
+    RateLimiter,
+    RetryPolicy,
+    async_call_with_retry,
+    call_with_retry,
+    is_retryable,
+    retry_after,
+)
+from gemini_tts_tool.core.synthesizer import SynthesisError, synthesize_speech
+from tests.test_synthesizer import create_mock_response
+
+# Retry immediately so tests don't sleep
+FAST_POLICY = RetryPolicy(max_attempts=3, initial_delay=0, jitter=0)
+
+
+def api_error(code: int, retry_delay: str | None = None, headers: dict[str, str] | None = None):
+    """Create an APIError like the ones raised by the Gemini SDK."""
+    details = [{"retryDelay": retry_delay}] if retry_delay else []
+    response = httpx.Response(code, headers=headers or {})
+    return errors.APIError(
+        code, {"error": {"code": code, "status": "ERROR", "details": details}}, response
+    )
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_backoff_grows_exponentially_up_to_max_delay() -> None:
+    """Test backoff without jitter."""
+    policy = RetryPolicy(initial_delay=1, multiplier=2, max_delay=5, jitter=0)
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+
+def test_backoff_jitter_stays_within_bounds() -> None:
+    """Test jittered backoff never exceeds the base delay."""
+    policy = RetryPolicy(initial_delay=4, jitter=0.5)
+    for _ in range(100):
+        assert 2 <= policy.backoff(1) <= 4
+
+
+def test_backoff_honors_retry_after() -> None:
+    """Test server hint is a lower bound for the delay."""
+    policy = RetryPolicy(initial_delay=1, jitter=0)
+    assert policy.backoff(1, retry_after=12) == 12
+    assert policy.backoff(1, retry_after=0.5) == 1
+
+
+def test_retry_policy_validation() -> None:
+    """Test invalid policies are rejected."""
+    with pytest.raises(ValueError, match="max_attempts"):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError, match="jitter"):
+        RetryPolicy(jitter=2)
+
+
+def test_is_retryable() -> None:
+    """Test classification of API and network errors."""
+    assert is_retryable(api_error(429))
+    assert is_retryable(api_error(503))
+    assert not is_retryable(api_error(400))
+    assert not is_retryable(api_error(403))
+    assert is_retryable(httpx.ConnectError("connection refused"))
+    assert not is_retryable(ValueError("bad input"))
+
+
+def test_retry_after_from_retry_info() -> None:
+    """Test retry delay is read from the RetryInfo error detail."""
+    assert retry_after(api_error(429, retry_delay="12s")) == 12.0
+
+
+def test_retry_after_from_header() -> None:
+    """Test retry delay is read from the Retry-After header."""
+    assert retry_after(api_error(503, headers={"Retry-After": "7"})) == 7.0
+
+
+def test_retry_after_missing() -> None:
+    """Test errors without hints."""
+    assert retry_after(api_error(503)) is None
+    assert retry_after(RuntimeError("boom")) is None
+
+
+def test_rate_limiter_requests_per_minute() -> None:
+    """Test requests beyond the RPM burst wait for the bucket to refill."""
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=2, clock=clock)
+
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    # Third request must wait for one slot: 60s / 2 requests
+    assert limiter.reserve() == pytest.approx(30)
+    # Reservations queue behind each other
+    assert limiter.reserve() == pytest.approx(60)
+
+
+def test_rate_limiter_tokens_per_minute() -> None:
+    """Test token quota is reserved per request."""
+    clock = FakeClock()
+    limiter = RateLimiter(tokens_per_minute=600, clock=clock)
+
+    assert limiter.reserve(tokens=600) == 0
+    assert limiter.reserve(tokens=100) == pytest.approx(10)
+    clock.now = 60
+    assert limiter.reserve(tokens=100) == 0
+
+
+def test_rate_limiter_pause() -> None:
+    """Test a pause holds back all callers."""
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock)
+
+    limiter.pause(5)
+    assert limiter.reserve() == 5
+    clock.now = 5
+    assert limiter.reserve() == 0
+
+
+def test_rate_limiter_validation() -> None:
+    """Test non-positive quotas are rejected."""
+    with pytest.raises(ValueError, match="requests_per_minute"):
+        RateLimiter(requests_per_minute=0)
+
+
+def test_call_with_retry_recovers_from_transient_error() -> None:
+    """Test transient failures are retried until success."""
+    fn = MagicMock(side_effect=[api_error(503), api_error(429), "ok"])
+    on_retry = MagicMock()
+
+    assert call_with_retry(fn, FAST_POLICY, on_retry=on_retry) == "ok"
+    assert fn.call_count == 3
+    assert on_retry.call_count == 2
+
+
+def test_call_with_retry_gives_up_after_max_attempts() -> None:
+    """Test the last error is raised when attempts are exhausted."""
+    fn = MagicMock(side_effect=api_error(503))
+
+    with pytest.raises(errors.APIError):
+        call_with_retry(fn, FAST_POLICY)
+    assert fn.call_count == 3
+
+
+def test_call_with_retry_does_not_retry_client_errors() -> None:
+    """Test non-retryable errors are raised immediately."""
+    fn = MagicMock(side_effect=api_error(400))
+
+    with pytest.raises(errors.APIError):
+        call_with_retry(fn, FAST_POLICY)
+    assert fn.call_count == 1
+
+
+def test_call_with_retry_pauses_limiter_on_429() -> None:
+    """Test a 429 pauses the shared limiter for the retry-after delay."""
+    limiter = MagicMock()
+    fn = MagicMock(side_effect=[api_error(429, retry_delay="3s"), "ok"])
+
+    with patch("gemini_tts_tool.core.retry.time.sleep") as mock_sleep:
+        assert call_with_retry(fn, FAST_POLICY, limiter, tokens=10) == "ok"
+
+    limiter.pause.assert_called_once_with(3.0)
+    limiter.acquire.assert_called_with(10)
+    mock_sleep.assert_called_once_with(3.0)
+
+
+def test_async_call_with_retry() -> None:
+    """Test async retries."""
+    fn = AsyncMock(side_effect=[api_error(500), "ok"])
+
+    assert asyncio.run(async_call_with_retry(fn, FAST_POLICY)) == "ok"
+    assert fn.await_count == 2
+
+
+def test_synthesize_speech_retries_transient_errors() -> None:
+    """Test synthesize_speech retries a 503 and returns the audio."""
+    mock_client = MagicMock()
+    mock_client.models.generate_content.side_effect = [
+        api_error(503),
+        create_mock_response(b"audio"),
+    ]
+
+    result = synthesize_speech(mock_client, "Hello", retry_policy=FAST_POLICY)
+
+    assert result == b"audio"
+    assert mock_client.models.generate_content.call_count == 2
+
+
+def test_synthesize_speech_no_retry() -> None:
+    """Test NO_RETRY surfaces the first failure."""
+    mock_client = MagicMock()
+    mock_client.models.generate_content.side_effect = api_error(503)
+
+    with pytest.raises(SynthesisError, match="503"):
+        synthesize_speech(mock_client, "Hello", retry_policy=NO_RETRY)
+
+    assert mock_client.models.generate_content.call_count == 1
@@ -0,0 +1,155 @@
+"""Tests for gemini_tts_tool.core.scheduler module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+import pytest
+
+from gemini_tts_tool.core.scheduler import (
+    BULK,
+    INTERACTIVE,
+    NORMAL,
+    DeadlineExceededError,
+    Scheduler,
+    format_scheduler_stats,
+    parse_priority,
+)
+from tests.test_synthesizer import create_mock_response
+
+
+def blocker(scheduler: Scheduler, priority: int = NORMAL) -> threading.Event:
+    """Occupy one worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def hold() -> None:
+        started.set()
+        release.wait(5)
+
+    scheduler.submit(hold, priority)
+    assert started.wait(5)
+    return release
+
+
+def recorder(order: list[str], name: str) -> Callable[[], str]:
+    def record() -> str:
+        order.append(name)
+        return name
+
+    return record
+
+
+def test_dispatches_by_priority_then_deadline() -> None:
+    """Test queued work runs interactive first, earliest deadline first within a priority."""
+    order: list[str] = []
+    with Scheduler(max_workers=1) as scheduler:
+        release = blocker(scheduler)
+        futures = [
+            scheduler.submit(recorder(order, "bulk"), BULK),
+            scheduler.submit(recorder(order, "normal"), NORMAL),
+            scheduler.submit(recorder(order, "normal-soon"), NORMAL, deadline=30),
+            scheduler.submit(recorder(order, "interactive"), INTERACTIVE),
+        ]
+        release.set()
+        for future in futures:
+            future.result(5)
+
+    assert order == ["interactive", "normal-soon", "normal", "bulk"]
+
+
+def test_expired_work_is_dropped() -> None:
+    """Test work whose deadline passes in the queue fails without running."""
+    ran: list[str] = []
+    with Scheduler(max_workers=1) as scheduler:
+        release = blocker(scheduler)
+        future = scheduler.submit(recorder(ran, "late"), INTERACTIVE, deadline=0.01)
+        time.sleep(0.05)
+        release.set()
+
+        with pytest.raises(DeadlineExceededError):
+            future.result(5)
+        stats = scheduler.stats()
+
+    assert ran == []
+    assert stats["priorities"][INTERACTIVE]["expired"] == 1
+
+
+def test_add_waiter_raises_queued_calls() -> None:
+    """Test a caller joining shared calls moves them up and keeps them past the first deadline."""
+    order: list[str] = []
+    with Scheduler(max_workers=1) as scheduler:
+        release = blocker(scheduler)
+        urgency = scheduler.urgency(BULK, deadline=0.01)
+        shared = scheduler.submit(recorder(order, "shared"), urgency=urgency)
+        normal = scheduler.submit(recorder(order, "normal"), NORMAL)
+        scheduler.add_waiter(urgency, INTERACTIVE)
+        time.sleep(0.05)
+        release.set()
+
+        assert shared.result(5) == "shared"
+        normal.result(5)
+
+    assert order == ["shared", "normal"]
+    assert urgency.priority == INTERACTIVE
+    assert urgency.expires is None
+
+
+def test_bulk_leaves_a_worker_and_headroom() -> None:
+    """Test bulk never takes the last worker and waits while the quota is low."""
+    quota = [1.0]
+    with Scheduler(max_workers=2, capacity=lambda: quota[0]) as scheduler:
+        release = blocker(scheduler, BULK)
+        second_bulk = scheduler.submit(lambda: "bulk", BULK)
+        assert scheduler.submit(lambda: "now", INTERACTIVE).result(5) == "now"
+
+        release.set()
+        assert second_bulk.result(5) == "bulk"
+
+        quota[0] = 0.1
+        held = scheduler.submit(lambda: "held", BULK)
+        time.sleep(0.1)
+        assert not held.done()
+        assert scheduler.stats()["priorities"][BULK]["queued"] == 1
+        quota[0] = 0.5
+        assert held.result(5) == "held"
+
+
+def test_synthesize_speech_queues_chunks() -> None:
+    """Test each distinct chunk is one scheduled request and the audio keeps text order."""
+    client = MagicMock()
+    client.models.generate_content.side_effect = lambda **kwargs: create_mock_response(
+        kwargs["contents"][0][:1].encode()
+    )
+
+    with Scheduler(max_workers=2) as scheduler:
+        audio = scheduler.synthesize_speech(
+            client, "Alpha one. Beta two. Alpha one.", max_chunk_tokens=3, priority=BULK
+        )
+        stats = scheduler.stats()
+
+    assert audio == b"ABA"
+    assert client.models.generate_content.call_count == 2
+    assert stats["priorities"][BULK]["dispatched"] == 2
+    assert format_scheduler_stats(stats)[0].startswith("Queue bulk: 2 dispatched, wait p50")
+
+
+def test_run_times_out_at_deadline() -> None:
+    """Test a caller waiting past its deadline gets DeadlineExceededError."""
+    with Scheduler(max_workers=1) as scheduler:
+        release = blocker(scheduler)
+        with pytest.raises(DeadlineExceededError, match="0.05s"):
+            scheduler.run(lambda: "late", deadline=0.05)
+        release.set()
+
+
+def test_parse_priority() -> None:
+    """Test priority names are case-insensitive and unknown ones are rejected."""
+    assert parse_priority(" Interactive ") == INTERACTIVE
+    with pytest.raises(ValueError, match="interactive, normal, bulk"):
+        parse_priority("urgent")
@@ -0,0 +1,275 @@
+"""Tests for gemini_tts_tool.core.server module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import http.client
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gemini_tts_tool.core.retry import NO_RETRY
+from gemini_tts_tool.core.scheduler import INTERACTIVE, DeadlineExceededError, Scheduler, Urgency
+from gemini_tts_tool.core.server import Coalescer, SynthesisServer
+from gemini_tts_tool.utils import wav_header
+from tests.test_synthesizer import create_mock_response
+
+
+@pytest.fixture
+def stub_client() -> MagicMock:
+    """Create a stub Gemini client returning fixed audio."""
+    client = MagicMock()
+    client.models.generate_content.return_value = create_mock_response(b"pcm-audio")
+    return client
+
+
+@pytest.fixture
+def server(stub_client: MagicMock) -> Iterator[SynthesisServer]:
+    """Run a server on a free port in a background thread."""
+    server = SynthesisServer(stub_client, port=0, retry_policy=NO_RETRY)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def post(server: SynthesisServer, path: str, body: object) -> tuple[int, str, bytes]:
+    """POST a JSON body and return (status, content type, body)."""
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{server.server_port}{path}",
+        data=json.dumps(body).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, response.headers["Content-Type"], response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers["Content-Type"], e.read()
+
+
+def test_synthesize_returns_wav(server: SynthesisServer, stub_client: MagicMock) -> None:
+    """Test /synthesize returns WAV audio from the shared client."""
+    status, content_type, body = post(server, "/synthesize", {"text": "Hello", "voice": "Kore"})
+
+    assert status == 200
+    assert content_type == "audio/wav"
+    assert body == wav_header(len(b"pcm-audio")) + b"pcm-audio"
+    assert stub_client.models.generate_content.call_count == 1
+
+
+def test_multi_voice_returns_wav(server: SynthesisServer) -> None:
+    """Test /multi-voice returns WAV audio, ignoring gap for a single request."""
+    status, _, body = post(server, "/multi-voice", {"dialogue": "Host: Hi\nGuest: Hello"})
+    assert status == 200
+    assert body.endswith(b"pcm-audio")
+
+    status, _, _ = post(server, "/multi-voice", {"dialogue": "Host: Hi\nGuest: Hey", "gap": 1})
+    assert status == 200
+
+
+def test_invalid_requests(server: SynthesisServer) -> None:
+    """Test validation errors map to 400 and unknown paths to 404."""
+    status, content_type, body = post(server, "/synthesize", {"voice": "Kore"})
+    assert status == 400
+    assert content_type == "application/json"
+    assert json.loads(body)["error"] == "Missing required field: text"
+
+    status, _, _ = post(server, "/synthesize", {"text": "Hi", "voice": "NotAVoice"})
+    assert status == 400
+
+    status, _, body = post(server, "/synthesize", {"text": "Hi", "priority": "urgent"})
+    assert status == 400
+    assert "Invalid priority" in json.loads(body)["error"]
+
+    status, _, _ = post(server, "/synthesize", {"text": "Hi", "deadline": -1})
+    assert status == 400
+
+    status, _, _ = post(server, "/nope", {})
+    assert status == 404
+
+
+@pytest.mark.parametrize("length", ["abc", "-1"])
+def test_malformed_content_length(server: SynthesisServer, length: str) -> None:
+    """Test a non-numeric or negative Content-Length gets 400 instead of a hang."""
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=10)
+    connection.putrequest("POST", "/synthesize")
+    connection.putheader("Content-Length", length)
+    connection.endheaders()
+    response = connection.getresponse()
+
+    assert response.status == 400
+    assert "Invalid Content-Length" in json.loads(response.read())["error"]
+    connection.close()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"gap": [1]},
+        {"gap": True},
+        {"speaker_voices": {"A": ["Kore"]}},
+        {"speaker1_voice": {"name": "Kore"}},
+        {"style": 1},
+    ],
+)
+def test_multi_voice_rejects_mistyped_fields(server: SynthesisServer, body: dict) -> None:
+    """Test fields of the wrong type get 400 instead of failing inside synthesis."""
+    status, _, response = post(server, "/multi-voice", {"dialogue": "A: Hi\nB: Hey\nC: Yo", **body})
+
+    assert status == 400
+    assert "must be" in json.loads(response)["error"]
+
+
+def test_unexpected_error_maps_to_internal_error(server: SynthesisServer) -> None:
+    """Test an unhandled exception still returns a JSON 500 response."""
+    with patch("gemini_tts_tool.core.server.synthesize_multi_voice", side_effect=TypeError("boom")):
+        status, content_type, body = post(server, "/multi-voice", {"dialogue": "A: Hi\nB: Hello"})
+
+    assert status == 500
+    assert content_type == "application/json"
+    assert "error" in json.loads(body)
+
+
+def test_synthesis_error_maps_to_bad_gateway(
+    server: SynthesisServer, stub_client: MagicMock
+) -> None:
+    """Test upstream failures map to 502."""
+    stub_client.models.generate_content.side_effect = Exception("API down")
+
+    status, _, body = post(server, "/synthesize", {"text": "Hello"})
+
+    assert status == 502
+    assert "API down" in json.loads(body)["error"]
+
+
+def test_health(server: SynthesisServer) -> None:
+    """Test the health endpoint."""
+    url = f"http://127.0.0.1:{server.server_port}/health"
+    with urllib.request.urlopen(url, timeout=10) as response:
+        assert json.loads(response.read()) == {"status": "ok"}
+
+
+def test_identical_requests_are_coalesced(server: SynthesisServer, stub_client: MagicMock) -> None:
+    """Test concurrent identical requests share one upstream call."""
+    release = threading.Event()
+
+    def slow_generate(**kwargs: object) -> MagicMock:
+        release.wait(timeout=10)
+        return create_mock_response(b"pcm-audio")
+
+    stub_client.models.generate_content.side_effect = slow_generate
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(post, server, "/synthesize", {"text": "Same"}) for _ in range(4)]
+        deadline = time.monotonic() + 10
+        while server.coalescer.coalesced < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert all(status == 200 for status, _, _ in results)
+    assert stub_client.models.generate_content.call_count == 1
+    assert server.coalescer.coalesced == 3
+
+
+def test_requests_differing_in_urgency_are_coalesced(
+    server: SynthesisServer, stub_client: MagicMock
+) -> None:
+    """Test priority and deadline don't split requests, and the shared call is raised."""
+    release = threading.Event()
+
+    def slow_generate(**kwargs: object) -> MagicMock:
+        release.wait(timeout=10)
+        return create_mock_response(b"pcm-audio")
+
+    stub_client.models.generate_content.side_effect = slow_generate
+    bodies = [
+        {"text": "Same", "priority": "bulk"},
+        {"text": "Same", "priority": "interactive", "deadline": 30},
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(post, server, "/synthesize", bodies[0])
+        while stub_client.models.generate_content.call_count < 1:
+            time.sleep(0.01)
+        follower = executor.submit(post, server, "/synthesize", bodies[1])
+        while server.coalescer.coalesced < 1:
+            time.sleep(0.01)
+        release.set()
+        results = [leader.result(), follower.result()]
+
+    assert all(status == 200 for status, _, _ in results)
+    assert stub_client.models.generate_content.call_count == 1
+
+
+def test_coalescer_shares_exceptions() -> None:
+    """Test waiters receive the leader's exception and keys are released afterwards."""
+    scheduler = Scheduler(max_workers=1)
+    coalescer = Coalescer(scheduler)
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail(urgency: Urgency) -> bytes:
+        started.set()
+        release.wait(timeout=10)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(coalescer.run, "key", fail)
+        started.wait(timeout=10)
+        follower = executor.submit(coalescer.run, "key", lambda urgency: b"unused")
+        while coalescer.coalesced < 1:
+            time.sleep(0.01)
+        release.set()
+
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match="boom"):
+                future.result()
+
+    assert coalescer.run("key", lambda urgency: b"fresh") == b"fresh"
+    scheduler.close()
+
+
+def test_coalesced_waiters_keep_their_own_deadline() -> None:
+    """Test a waiter times out at its deadline while the shared call serves the others."""
+    with Scheduler(max_workers=1) as scheduler:
+        coalescer = Coalescer(scheduler)
+        release = threading.Event()
+
+        def slow(urgency: Urgency) -> bytes:
+            return scheduler.run(lambda: release.wait(10) and b"audio", urgency=urgency)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            patient = executor.submit(coalescer.run, "key", slow)
+            while not scheduler.stats()["running"]:
+                time.sleep(0.01)
+            with pytest.raises(DeadlineExceededError, match="0.05s"):
+                coalescer.run("key", slow, INTERACTIVE, deadline=0.05)
+            release.set()
+
+            assert patient.result(10) == b"audio"
+
+
+def test_metrics_endpoint(server: SynthesisServer) -> None:
+    """Test /metrics exposes request counters in Prometheus text format."""
+    post(server, "/synthesize", {"text": "Hello"})
+
+    url = f"http://127.0.0.1:{server.server_port}/metrics"
+    with urllib.request.urlopen(url, timeout=10) as response:
+        assert response.headers["Content-Type"].startswith("text/plain")
+        text = response.read().decode()
+
+    assert "gemini_tts_requests_total 1" in text
+    assert 'gemini_tts_api_latency_seconds_bucket{le="+Inf"} 1' in text
+    assert f"gemini_tts_bytes_written_total {len(wav_header(0)) + len(b'pcm-audio')}" in text
+    assert "gemini_tts_coalesced_total 0" in text
+    assert 'gemini_tts_queue_wait_seconds_count{priority="normal"} 1' in text
@@ -0,0 +1,82 @@
+"""Tests guarding CLI startup time.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that only synthesis needs; importing the SDK alone takes ~0.5s
+HEAVY_MODULES = ("google.genai", "httpx")
+
+# Cumulative import budget for gemini_tts_tool.cli, in microseconds
+IMPORT_BUDGET_US = 300_000
+
+_PROBE = """
+import sys
+from gemini_tts_tool.cli import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+print(",".join(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)
+"""
+
+
+def run_cli(*args: str) -> list[str]:
+    """Run the CLI in a fresh interpreter and return the heavy modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(heavy=HEAVY_MODULES), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+    return [module for module in loaded.split(",") if module]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--help"],
+        ["--version"],
+        ["list-voices"],
+        ["list-models"],
+        ["synthesize", "--help"],
+        ["batch", "--help"],
+    ],
+)
+def test_cli_does_not_import_sdk(args: list[str]) -> None:
+    """Test commands that never call the API don't import the SDK."""
+    assert run_cli(*args) == []
+
+
+def test_cli_import_time_budget() -> None:
+    """Test importing the CLI stays within the startup budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import gemini_tts_tool.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like: "import time:  self [us] | cumulative | module"
+    cumulative = {
+        line.split("|")[2].strip(): int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+    }
+    elapsed = cumulative["gemini_tts_tool.cli"] + cumulative.get("gemini_tts_tool", 0)
+    assert elapsed < IMPORT_BUDGET_US, f"CLI import took {elapsed / 1000:.0f} ms"
+
+
+def test_package_exports_are_lazy() -> None:
+    """Test public API names resolve on first access."""
+    import gemini_tts_tool
+
+    assert gemini_tts_tool.synthesize_speech.__name__ == "synthesize_speech"
+    assert "Puck" in gemini_tts_tool.VOICES
+    with pytest.raises(AttributeError):
+        gemini_tts_tool.does_not_exist  # noqa: B018
@@ -4,16 +4,24 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from gemini_tts_tool.core.metrics import MetricsRecorder
 from gemini_tts_tool.core.synthesizer import (
     SynthesisError,
+    async_synthesize_multi_voice,
+    async_synthesize_speech,
+    plan_multi_voice,
+    plan_speech,
     read_stdin,
+    stream_speech,
     synthesize_multi_voice,
     synthesize_speech,
 )
+from gemini_tts_tool.core.voices import DEFAULT_MODEL
 
 
 def create_mock_client() -> MagicMock:
@@ -140,6 +148,35 @@ def test_synthesize_speech_no_audio_data_raises_error() -> None:
         synthesize_speech(mock_client, "Hello")
 
 
+def test_plan_speech_matches_synthesis_requests() -> None:
+    """Test plan_speech returns the chunks synthesize_speech sends, without API calls."""
+    text = "First sentence here. " * 40
+    mock_client = create_mock_client()
+    mock_client.models.generate_content.return_value = create_mock_response()
+
+    voice, model, chunks = plan_speech(text, "Kore", "flash", max_chunk_tokens=50)
+    synthesize_speech(mock_client, text, voice="Kore", max_chunk_tokens=50)
+
+    sent = [
+        call.kwargs["contents"][0] for call in mock_client.models.generate_content.call_args_list
+    ]
+    assert voice == "Kore"
+    assert model == DEFAULT_MODEL
+    assert set(sent) == set(chunks)
+    assert len(chunks) > 1
+
+
+def test_plan_multi_voice() -> None:
+    """Test plan_multi_voice validates and maps speakers in sorted order."""
+    assert plan_multi_voice("Zed: Hi\nAmy: Hello") == (
+        {"Amy": "Kore", "Zed": "Puck"},
+        DEFAULT_MODEL,
+    )
+
+    with pytest.raises(ValueError, match="at least 2 speakers"):
+        plan_multi_voice("Zed: Hi")
+
+
 def test_synthesize_multi_voice_basic() -> None:
     """Test basic multi-voice synthesis."""
     mock_client = create_mock_client()
@@ -148,20 +185,10 @@ def test_synthesize_multi_voice_basic() -> None:
 
     dialogue = "Host: Hello\nGuest: Hi there"
 
-    # Mock the types module to avoid SDK validation errors
-    with patch("gemini_tts_tool.core.synthesizer.types") as mock_types:
-        # Configure mocks to return mock objects
-        mock_types.GenerateContentConfig.return_value = MagicMock()
-        mock_types.SpeechConfig.return_value = MagicMock()
-        mock_types.VoiceConfig.return_value = MagicMock()
-        mock_types.MultiSpeakerVoiceConfig.return_value = MagicMock()
-        mock_types.SpeakerVoiceConfig.return_value = MagicMock()
-        mock_types.PrebuiltVoiceConfig.return_value = MagicMock()
-
-        result = synthesize_multi_voice(mock_client, dialogue)
+    result = synthesize_multi_voice(mock_client, dialogue)
 
-        assert result == b"multi-voice-audio"
-        mock_client.models.generate_content.assert_called_once()
+    assert result == b"multi-voice-audio"
+    mock_client.models.generate_content.assert_called_once()
 
 
 def test_synthesize_multi_voice_custom_voices() -> None:
@@ -172,21 +199,22 @@ def test_synthesize_multi_voice_custom_voices() -> None:
 
     dialogue = "Alice: Hello\nBob: Hi"
 
-    # Mock the types module to avoid SDK validation errors
-    with patch("gemini_tts_tool.core.synthesizer.types") as mock_types:
-        # Configure mocks to return mock objects
-        mock_types.GenerateContentConfig.return_value = MagicMock()
-        mock_types.SpeechConfig.return_value = MagicMock()
-        mock_types.VoiceConfig.return_value = MagicMock()
-        mock_types.MultiSpeakerVoiceConfig.return_value = MagicMock()
-        mock_types.SpeakerVoiceConfig.return_value = MagicMock()
-        mock_types.PrebuiltVoiceConfig.return_value = MagicMock()
+    synthesize_multi_voice(mock_client, dialogue, speaker1_voice="Zephyr", speaker2_voice="Aoede")
+
+    mock_client.models.generate_content.assert_called_once()
+
+
+def test_synthesize_multi_voice_voices_follow_sorted_names() -> None:
+    """Test speaker1_voice goes to the first speaker name in sorted order."""
+    mock_client = create_mock_client()
+    mock_client.models.generate_content.return_value = create_mock_response()
 
-        synthesize_multi_voice(
-            mock_client, dialogue, speaker1_voice="Zephyr", speaker2_voice="Aoede"
-        )
+    synthesize_multi_voice(mock_client, "Zed: Hi\nAmy: Hello", "Zephyr", "Aoede")
 
-        mock_client.models.generate_content.assert_called_once()
+    config = mock_client.models.generate_content.call_args.kwargs["config"]
+    speaker_configs = config.speech_config.multi_speaker_voice_config.speaker_voice_configs
+    voices = {c.speaker: c.voice_config.prebuilt_voice_config.voice_name for c in speaker_configs}
+    assert voices == {"Amy": "Zephyr", "Zed": "Aoede"}
 
 
 def test_synthesize_multi_voice_empty_dialogue_raises_error() -> None:
@@ -254,3 +282,193 @@ def test_read_stdin_empty_input_raises_error() -> None:
 
         with pytest.raises(ValueError, match="Empty input from stdin"):
             read_stdin()
+
+
+def test_synthesize_speech_chunks_long_text() -> None:
+    """Test long text is split into chunks and audio is joined in order."""
+    mock_client = create_mock_client()
+
+    def generate_content(**kwargs: object) -> MagicMock:
+        text = kwargs["contents"][0]  # type: ignore[index]
+        return create_mock_response(text.split()[0].encode())
+
+    mock_client.models.generate_content.side_effect = generate_content
+    text = "Alpha one two three. Bravo one two three. Charlie one two three."
+
+    result = synthesize_speech(mock_client, text, max_chunk_tokens=6, max_workers=3)
+
+    assert result == b"AlphaBravoCharlie"
+    assert mock_client.models.generate_content.call_count == 3
+
+
+def test_synthesize_speech_reuses_repeated_chunks() -> None:
+    """Test identical chunks are synthesized once and spliced into every position."""
+    mock_client = create_mock_client()
+
+    def generate_content(**kwargs: object) -> MagicMock:
+        text = kwargs["contents"][0]  # type: ignore[index]
+        return create_mock_response(text.split()[0].encode())
+
+    mock_client.models.generate_content.side_effect = generate_content
+    mock_client.models.generate_content_stream.side_effect = lambda **kwargs: iter(
+        [generate_content(**kwargs)]
+    )
+    text = "\n\n".join(["Alpha one two three.", "Press one.", "Bravo one two three."] * 2)
+    metrics = MetricsRecorder()
+
+    result = synthesize_speech(mock_client, text, max_chunk_tokens=6, metrics=metrics)
+    streamed = b"".join(stream_speech(mock_client, text, max_chunk_tokens=6))
+
+    assert result == streamed == b"AlphaPressBravoAlphaPressBravo"
+    assert mock_client.models.generate_content.call_count == 3
+    assert metrics.requests_saved == 3
+
+
+def test_synthesize_speech_chunk_failure_raises_error() -> None:
+    """Test a failing chunk surfaces as SynthesisError with its position."""
+    mock_client = create_mock_client()
+    mock_client.models.generate_content.side_effect = RuntimeError("boom")
+    text = "Alpha one two three. Bravo one two three."
+
+    with pytest.raises(SynthesisError, match=r"Failed to synthesize chunk \d/2"):
+        synthesize_speech(mock_client, text, max_chunk_tokens=6, max_workers=1)
+
+
+def test_synthesize_speech_invalid_workers_raises_error() -> None:
+    """Test synthesize_speech validates max_workers."""
+    mock_client = create_mock_client()
+
+    with pytest.raises(ValueError, match="max_workers"):
+        synthesize_speech(mock_client, "Hello", max_workers=0)
+
+
+def test_async_synthesize_speech_basic() -> None:
+    """Test async speech synthesis uses the client.aio surface."""
+    mock_client = create_mock_client()
+    mock_client.aio.models.generate_content = AsyncMock(
+        return_value=create_mock_response(b"async-audio")
+    )
+
+    result = asyncio.run(async_synthesize_speech(mock_client, "Hello world"))
+
+    assert result == b"async-audio"
+    mock_client.aio.models.generate_content.assert_awaited_once()
+    mock_client.models.generate_content.assert_not_called()
+
+
+def test_async_synthesize_speech_chunks_long_text() -> None:
+    """Test async synthesis joins chunk audio in document order."""
+    mock_client = create_mock_client()
+
+    async def generate_content(**kwargs: object) -> MagicMock:
+        text = kwargs["contents"][0]  # type: ignore[index]
+        # Finish later chunks first to prove ordering does not depend on timing
+        await asyncio.sleep(0.01 if text.startswith("Alpha") else 0)
+        return create_mock_response(text.split()[0].encode())
+
+    mock_client.aio.models.generate_content = AsyncMock(side_effect=generate_content)
+    text = "Alpha one two three. Bravo one two three. Charlie one two three."
+
+    result = asyncio.run(async_synthesize_speech(mock_client, text, max_chunk_tokens=6))
+
+    assert result == b"AlphaBravoCharlie"
+
+
+def test_async_synthesize_speech_validation_errors() -> None:
+    """Test async synthesis raises the same validation errors."""
+    mock_client = create_mock_client()
+
+    with pytest.raises(ValueError, match="Text cannot be empty"):
+        asyncio.run(async_synthesize_speech(mock_client, "  "))
+
+    with pytest.raises(ValueError, match="Invalid voice"):
+        asyncio.run(async_synthesize_speech(mock_client, "Hello", voice="InvalidVoice"))
+
+
+def test_async_synthesize_speech_api_error_raises_synthesis_error() -> None:
+    """Test async synthesis wraps API failures in SynthesisError."""
+    mock_client = create_mock_client()
+    mock_client.aio.models.generate_content = AsyncMock(side_effect=RuntimeError("boom"))
+
+    with pytest.raises(SynthesisError, match="Failed to synthesize speech: boom"):
+        asyncio.run(async_synthesize_speech(mock_client, "Hello"))
+
+
+def test_async_synthesize_multi_voice_basic() -> None:
+    """Test async multi-voice synthesis."""
+    mock_client = create_mock_client()
+    mock_client.aio.models.generate_content = AsyncMock(
+        return_value=create_mock_response(b"async-dialogue")
+    )
+
+    result = asyncio.run(async_synthesize_multi_voice(mock_client, "Host: Hello\nGuest: Hi there"))
+
+    assert result == b"async-dialogue"
+    mock_client.aio.models.generate_content.assert_awaited_once()
+
+
+def test_async_synthesize_multi_voice_too_many_speakers_raises_error() -> None:
+    """Test async multi-voice applies the same speaker validation."""
+    mock_client = create_mock_client()
+    dialogue = "Alice: Hi\nBob: Hello\nCharlie: Hey there"
+
+    with pytest.raises(ValueError, match="supports up to 2 speakers"):
+        asyncio.run(async_synthesize_multi_voice(mock_client, dialogue))
+
+
+def test_stream_speech_yields_chunks_as_they_arrive() -> None:
+    """Test stream_speech yields each streamed audio part in order."""
+    mock_client = create_mock_client()
+    mock_client.models.generate_content_stream.return_value = iter(
+        [create_mock_response(b"part-1"), create_mock_response(b"part-2")]
+    )
+
+    chunks = stream_speech(mock_client, "Hello world")
+
+    assert next(chunks) == b"part-1"
+    assert list(chunks) == [b"part-2"]
+    mock_client.models.generate_content.assert_not_called()
+
+
+def test_stream_speech_streams_long_text_chunks_in_order() -> None:
+    """Test long text is streamed one chunk request after another."""
+    mock_client = create_mock_client()
+
+    def generate_content_stream(**kwargs: object) -> object:
+        text = kwargs["contents"][0]  # type: ignore[index]
+        return iter([create_mock_response(text.split()[0].encode())])
+
+    mock_client.models.generate_content_stream.side_effect = generate_content_stream
+    text = "Alpha one two three. Bravo one two three."
+
+    assert list(stream_speech(mock_client, text, max_chunk_tokens=6)) == [b"Alpha", b"Bravo"]
+
+
+def test_stream_speech_errors_raise_synthesis_error() -> None:
+    """Test streaming failures and empty streams raise SynthesisError."""
+    mock_client = create_mock_client()
+    mock_client.models.generate_content_stream.side_effect = RuntimeError("boom")
+
+    with pytest.raises(SynthesisError, match="Failed to stream speech: boom"):
+        list(stream_speech(mock_client, "Hello"))
+
+    mock_client.models.generate_content_stream.side_effect = None
+    mock_client.models.generate_content_stream.return_value = iter([])
+
+    with pytest.raises(SynthesisError, match="No audio data found"):
+        list(stream_speech(mock_client, "Hello"))
+
+
+def test_requests_share_config_per_voice() -> None:
+    """Test repeated requests for a voice reuse one prebuilt config."""
+    mock_client = create_mock_client()
+    mock_client.models.generate_content.return_value = create_mock_response()
+
+    synthesize_speech(mock_client, "First", voice="Kore")
+    synthesize_speech(mock_client, "Second", voice="Kore")
+    synthesize_speech(mock_client, "Third", voice="Puck")
+
+    configs = [call.kwargs["config"] for call in mock_client.models.generate_content.call_args_list]
+    assert configs[0] is configs[1]
+    assert configs[2] is not configs[0]
+    assert configs[2].speech_config.voice_config.prebuilt_voice_config.voice_name == "Puck"
@@ -6,16 +6,22 @@ and has been reviewed and tested by a human.
 
 import os
 import wave
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from gemini_tts_tool.utils import (
     AudioError,
+    WavStreamWriter,
     expand_path,
+    pcm_duration,
     read_file,
     save_audio_wav,
     validate_output_format,
+    wav_header,
+    write_wav_stream,
 )
 
 
@@ -115,3 +121,117 @@ def test_save_audio_wav_error(tmp_path: Path) -> None:
     # Try to save with invalid path (directory instead of file)
     with pytest.raises(AudioError, match="Failed to save WAV file"):
         save_audio_wav(b"test", invalid_path)
+
+
+def test_pcm_duration() -> None:
+    """Test pcm_duration for 24kHz 16-bit mono audio."""
+    assert pcm_duration(b"\x00\x00" * 24000) == 1.0
+    assert pcm_duration(b"") == 0.0
+
+
+def test_write_wav_stream_patches_header(tmp_path: Path) -> None:
+    """Test write_wav_stream writes chunks and a header with the final size."""
+    output_path = tmp_path / "stream.wav"
+
+    written = write_wav_stream(iter([b"\x01\x00" * 100, b"\x02\x00" * 50]), output_path)
+
+    assert written == 300
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.getframerate() == 24000
+        assert wav_file.getnframes() == 150
+        assert wav_file.readframes(150) == b"\x01\x00" * 100 + b"\x02\x00" * 50
+
+
+def test_write_wav_stream_interrupted_leaves_valid_file(tmp_path: Path) -> None:
+    """Test the header is patched even when the chunk source fails."""
+    output_path = tmp_path / "partial.wav"
+
+    def chunks() -> Iterator[bytes]:
+        yield b"\x00\x00" * 10
+        raise RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        write_wav_stream(chunks(), output_path)
+
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.getnframes() == 10
+
+
+def test_write_wav_stream_stdout(capsysbinary: pytest.CaptureFixture[bytes]) -> None:
+    """Test write_wav_stream writes a streaming header and PCM to stdout."""
+    write_wav_stream([b"\x00\x00" * 4], None)
+
+    output = capsysbinary.readouterr().out
+    assert output[:4] == b"RIFF"
+    assert output[36:40] == b"data"
+    assert output[44:] == b"\x00\x00" * 4
+
+
+def test_wav_stream_writer_is_atomic(tmp_path: Path) -> None:
+    """Test the output appears only on close and is discarded on errors."""
+    output_path = tmp_path / "out.wav"
+
+    with WavStreamWriter(output_path) as writer:
+        writer.write(b"\x01\x00" * 5)
+        writer.write(memoryview(b"\x02\x00" * 5))
+        assert not output_path.exists()
+
+    assert writer.bytes_written == 20
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.readframes(10) == b"\x01\x00" * 5 + b"\x02\x00" * 5
+
+    with pytest.raises(RuntimeError), WavStreamWriter(tmp_path / "failed.wav") as writer:
+        writer.write(b"\x00\x00")
+        raise RuntimeError("connection lost")
+
+    assert os.listdir(tmp_path) == ["out.wav"]
+
+
+def test_wav_stream_writers_in_threads_use_separate_temp_files(tmp_path: Path) -> None:
+    """Test two threads writing the same target don't share a temporary file."""
+    output_path = tmp_path / "out.wav"
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(WavStreamWriter, output_path).result()
+
+    with other, WavStreamWriter(output_path) as writer:
+        other.write(b"\x01\x00" * 5)
+        writer.write(b"\x02\x00" * 3)
+
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.readframes(10) == b"\x01\x00" * 5
+    assert os.listdir(tmp_path) == ["out.wav"]
+
+
+def test_wav_stream_writer_splices_pcm_and_wav(tmp_path: Path) -> None:
+    """Test raw PCM, WAV and streamed WAV files are spliced without their headers."""
+    pcm_path = tmp_path / "a.pcm"
+    pcm_path.write_bytes(b"\x01\x00" * 3)
+    wav_path = tmp_path / "b.wav"
+    save_audio_wav(b"\x02\x00" * 2, wav_path)
+    streamed_path = tmp_path / "c.wav"
+    streamed_path.write_bytes(wav_header(0xFFFFFFFF) + b"\x03\x00")
+    (tmp_path / "empty.pcm").write_bytes(b"")
+    output_path = tmp_path / "out.wav"
+
+    with WavStreamWriter(output_path) as writer:
+        for name in ("a.pcm", "b.wav", "empty.pcm", "c.wav"):
+            writer.splice(tmp_path / name)
+
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.readframes(10) == b"\x01\x00" * 3 + b"\x02\x00" * 2 + b"\x03\x00"
+
+
+def test_wav_stream_writer_rejects_other_formats(tmp_path: Path) -> None:
+    """Test splicing a WAV file with a different sample rate fails."""
+    other_path = tmp_path / "other.wav"
+    with wave.open(str(other_path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(44100)
+        wav_file.writeframes(b"\x00\x00")
+
+    with (
+        pytest.raises(AudioError, match="24000 Hz"),
+        WavStreamWriter(tmp_path / "out.wav") as writer,
+    ):
+        writer.splice(other_path)
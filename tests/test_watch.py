@@ -0,0 +1,151 @@
+"""Tests for gemini_tts_tool.core.watch module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from gemini_tts_tool.core.synthesizer import SynthesisError
+from gemini_tts_tool.core.watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    RenderResult,
+    ScriptRenderer,
+    iter_changes,
+    watch_scripts,
+)
+from tests.test_synthesizer import create_mock_response
+
+EPISODE = "Host: Welcome back.\nGuest: Glad to be here.\nHost: Let's begin.\n"
+
+
+def create_client(calls: list[str]) -> MagicMock:
+    """Mock client returning one sample per request and recording each text."""
+    client = MagicMock()
+
+    def generate(**kwargs: object) -> MagicMock:
+        text = kwargs["contents"][0]  # type: ignore[index]
+        calls.append(text)
+        if "fail" in text:
+            raise RuntimeError("bad turn")
+        return create_mock_response(b"\x01\x00")
+
+    client.models.generate_content.side_effect = generate
+    return client
+
+
+def test_render_synthesizes_only_changed_turns(tmp_path: Path) -> None:
+    """Test an edit re-synthesizes the edited turn and reuses the others."""
+    calls: list[str] = []
+    renderer = ScriptRenderer(create_client(calls), gap=0)
+    script = tmp_path / "episode.txt"
+    script.write_text(EPISODE)
+
+    first = renderer.render(script, tmp_path / "episode.wav")
+    script.write_text(EPISODE.replace("Let's begin.", "Let's get started."))
+    second = renderer.render(script, tmp_path / "episode.wav")
+
+    assert (first.turns, first.synthesized) == (3, 3)
+    assert (second.synthesized, second.reused) == (1, 2)
+    assert calls[3:] == ["Let's get started."]
+    assert (tmp_path / "episode.wav").stat().st_size == 44 + 3 * 2
+
+
+def test_render_reuses_moved_and_repeated_turns(tmp_path: Path) -> None:
+    """Test reordering and repeating turns needs no request."""
+    calls: list[str] = []
+    renderer = ScriptRenderer(create_client(calls))
+    script = tmp_path / "episode.txt"
+    script.write_text(EPISODE)
+    renderer.render(script, tmp_path / "episode.wav")
+
+    lines = EPISODE.splitlines()
+    script.write_text("\n".join([lines[2], lines[1], lines[0], lines[2]]))
+    result = renderer.render(script, tmp_path / "episode.wav")
+
+    assert result.synthesized == 0
+    assert len(calls) == 3
+
+
+def test_render_keeps_turns_that_succeeded(tmp_path: Path) -> None:
+    """Test a failing turn fails the render, but the next render only retries it."""
+    calls: list[str] = []
+    renderer = ScriptRenderer(create_client(calls), max_workers=1)
+    script = tmp_path / "episode.txt"
+    script.write_text(EPISODE + "Guest: fail\n")
+
+    with pytest.raises(SynthesisError, match="turn 'fail' \\(Puck\\)"):
+        renderer.render(script, tmp_path / "episode.wav")
+    assert not (tmp_path / "episode.wav").exists()
+
+    script.write_text(EPISODE + "Guest: fixed\n")
+    result = renderer.render(script, tmp_path / "episode.wav")
+
+    assert result.synthesized == 1
+    assert calls[-1] == "fixed"
+
+
+def test_polling_watcher_reports_changed_scripts(tmp_path: Path) -> None:
+    """Test new and modified scripts are reported once; other files are ignored."""
+    (tmp_path / "a.txt").write_text("Host: one")
+    watcher = PollingWatcher(tmp_path, "*.txt")
+
+    assert watcher.changes(0) == set()
+    (tmp_path / "a.txt").write_text("Host: one two")
+    (tmp_path / "b.txt").write_text("Host: new")
+    (tmp_path / "a.wav").write_bytes(b"audio")
+
+    assert watcher.changes(0) == {tmp_path / "a.txt", tmp_path / "b.txt"}
+    assert watcher.changes(0) == set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_inotify_watcher_reports_saves_and_renames(tmp_path: Path) -> None:
+    """Test in-place saves and atomic renames are reported for matching names."""
+    watcher = InotifyWatcher(tmp_path, "*.txt")
+    try:
+        assert watcher.changes(0) == set()
+        (tmp_path / "a.txt").write_text("Host: one")
+        (tmp_path / ".b.txt.tmp").write_text("Host: two")
+        (tmp_path / ".b.txt.tmp").rename(tmp_path / "b.txt")
+        (tmp_path / "a.wav").write_bytes(b"audio")
+
+        assert watcher.changes(1) == {tmp_path / "a.txt", tmp_path / "b.txt"}
+    finally:
+        watcher.close()
+
+
+def test_iter_changes_debounces_bursts() -> None:
+    """Test changes arriving in quick succession are yielded together."""
+    watcher = MagicMock()
+    watcher.changes.side_effect = [set(), {Path("a.txt")}, {Path("b.txt")}, set(), {Path("c")}]
+
+    changes = iter_changes(watcher, interval=0)
+
+    assert next(changes) == {Path("a.txt"), Path("b.txt")}
+
+
+def test_watch_scripts_once(tmp_path: Path) -> None:
+    """Test every script is rendered into the output directory and failures are reported."""
+    (tmp_path / "ep1.txt").write_text(EPISODE)
+    (tmp_path / "ep2.txt").write_text("No speaker label here")
+    rendered: list[RenderResult] = []
+    errors: list[Path] = []
+
+    watch_scripts(
+        ScriptRenderer(create_client([])),
+        tmp_path,
+        output_dir=tmp_path / "out",
+        audio_format="wav",
+        once=True,
+        on_render=rendered.append,
+        on_error=lambda script, error: errors.append(script),
+    )
+
+    assert [result.output for result in rendered] == [str(tmp_path / "out" / "ep1.wav")]
+    assert errors == [tmp_path / "ep2.txt"]